@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Batch Formatting Benchmark for specter
+Formats a synthetic DOCX corpus through the Document Studio batch worker
+and reports throughput for one worker against a process pool.
+
+Usage:
+    python scripts/benchmark_batch_formatting.py                      # 40 docs, all cores
+    python scripts/benchmark_batch_formatting.py --docs 200 --workers 1 4 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import docx
+from PyQt6.QtCore import QCoreApplication
+
+from specter.src.presentation.widgets.document_studio.batch_processor import BatchWorker
+from specter.src.presentation.widgets.document_studio.studio_state import Recipe
+
+OPERATIONS = ["standardize_fonts", "normalize_spacing", "fix_bullets", "fix_case",
+              "normalize_headings", "set_alignment", "set_indent"]
+
+
+def synthetic_corpus(directory, docs, paragraphs):
+    """Write ``docs`` reports with headings, mixed-case body text and bullets"""
+    paths = []
+    for i in range(docs):
+        doc = docx.Document()
+        for p in range(paragraphs):
+            if p % 25 == 0:
+                doc.add_heading(f"SECTION {p // 25} of report {i}", level=1 + p % 3)
+            elif p % 7 == 0:
+                doc.add_paragraph(f"Action item {p}", style="List Bullet")
+            else:
+                para = doc.add_paragraph(f"Paragraph {p} of the QUARTERLY summary with a tYPO ")
+                para.add_run("and a bold run").bold = True
+        path = directory / f"report_{i:04d}.docx"
+        doc.save(str(path))
+        paths.append(str(path))
+    return paths
+
+
+def run_batch(paths, output_directory, workers):
+    recipe = Recipe(recipe_id="bench", name="Benchmark", description="",
+                    operations=list(OPERATIONS), parameters={"alignment": "left", "indent_inches": 0.3})
+    worker = BatchWorker(paths, recipe, output_directory=output_directory, max_workers=workers)
+    finished = []
+    worker.batch_finished.connect(lambda ok, total: finished.append((ok, total)))
+
+    start = time.perf_counter()
+    worker.run()
+    return time.perf_counter() - start, finished[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Document Studio batch formatting throughput")
+    parser.add_argument("--docs", type=int, default=40, help="Documents in the synthetic corpus")
+    parser.add_argument("--paragraphs", type=int, default=300, help="Paragraphs per document")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1],
+                        help="Worker counts to compare")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    with tempfile.TemporaryDirectory(prefix="specter_batch_bench_") as tmp:
+        corpus_dir = Path(tmp) / "corpus"
+        corpus_dir.mkdir()
+        paths = synthetic_corpus(corpus_dir, args.docs, args.paragraphs)
+        print(f"corpus: {args.docs} documents x {args.paragraphs} paragraphs, {os.cpu_count()} core(s)")
+
+        baseline = None
+        for workers in dict.fromkeys(args.workers):
+            elapsed, (ok, total) = run_batch(paths, str(Path(tmp) / f"out_{workers}"), workers)
+            baseline = baseline or elapsed
+            print(f"  {workers:>2} worker(s): {elapsed:>7.2f} s  {total / elapsed:>7.2f} docs/s  "
+                  f"({baseline / elapsed:.1f}x)  {ok}/{total} ok")
+
+
+if __name__ == "__main__":
+    main()
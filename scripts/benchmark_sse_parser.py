@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+SSE Parser Benchmark for specter
+Replays recorded chat-completion SSE transcripts through the stream parser
+and reports parsing throughput against the previous line-based parser.
+
+Usage:
+    python scripts/benchmark_sse_parser.py                    # synthetic transcript
+    python scripts/benchmark_sse_parser.py recording.sse ...  # recorded transcripts
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from specter.src.infrastructure.ai.sse_stream import ChatStreamParser
+
+
+def synthetic_transcript(tokens=5000):
+    """Build an OpenAI-style transcript with one token per chunk"""
+    words = ["The", " quick", " brown", " fox", " jumps", " over", " the", " lazy",
+             " dog", ".", "\n", " \"quoted\"", " café", " naïve", " 🚀"]
+    lines = []
+    base = {"id": "chatcmpl-bench", "object": "chat.completion.chunk",
+            "created": 1700000000, "model": "gpt-4o-mini", "system_fingerprint": "fp_bench"}
+    first = dict(base, choices=[{"index": 0, "delta": {"role": "assistant", "content": ""},
+                                 "logprobs": None, "finish_reason": None}])
+    lines.append(first)
+    for i in range(tokens):
+        lines.append(dict(base, choices=[{"index": 0, "delta": {"content": words[i % len(words)]},
+                                          "logprobs": None, "finish_reason": None}]))
+    lines.append(dict(base, choices=[{"index": 0, "delta": {}, "logprobs": None, "finish_reason": "stop"}]))
+    lines.append(dict(base, choices=[], usage={"prompt_tokens": 100, "completion_tokens": tokens,
+                                               "total_tokens": tokens + 100}))
+    body = "".join(f"data: {json.dumps(line, ensure_ascii=False, separators=(',', ':'))}\n\n" for line in lines)
+    return (body + "data: [DONE]\n\n").encode("utf-8")
+
+
+def network_chunks(transcript, size):
+    """Split a transcript into fixed-size reads, as a socket would deliver it"""
+    return [transcript[i:i + size] for i in range(0, len(transcript), size)]
+
+
+class ReplayRaw:
+    """Stands in for urllib3's response stream, replaying recorded reads"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def stream(self, chunk_size, decode_content=True):
+        yield from self.chunks
+
+
+def replay_response(chunks):
+    response = requests.Response()
+    response.raw = ReplayRaw(chunks)
+    response.encoding = "utf-8"
+    response.status_code = 200
+    return response
+
+
+def legacy_parse(chunks):
+    """The previous parser: iter_lines(decode_unicode), json.loads per line, string +=, per-token callback"""
+    deliveries = []
+    full_content = ""
+    count = 0
+    for raw_line in replay_response(chunks).iter_lines(decode_unicode=True):
+        if not raw_line:
+            continue
+        line = raw_line.strip()
+        if not line.startswith("data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            break
+        chunk = json.loads(payload)
+        for choice in chunk.get("choices", [])[:1]:
+            piece = choice.get("delta", {}).get("content")
+            if piece:
+                full_content += piece
+                deliveries.append(piece)
+            count += 1
+    return full_content, count
+
+
+def stream_parse(chunks):
+    """The byte-level parser with coalesced callbacks"""
+    deliveries = []
+    parser = ChatStreamParser("bench", stream_callback=deliveries.append)
+    for chunk in replay_response(chunks).iter_content(chunk_size=None):
+        if parser.feed(chunk):
+            break
+    data = parser.finish()
+    return data["choices"][0]["message"]["content"], parser.chunks_parsed
+
+
+def bench(name, func, chunks, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SSE stream parsing throughput")
+    parser.add_argument("transcripts", nargs="*", help="Recorded SSE transcript files")
+    parser.add_argument("--tokens", type=int, default=5000, help="Synthetic transcript length")
+    parser.add_argument("--read-size", type=int, default=1024, help="Bytes per simulated network read")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per parser (best is reported)")
+    args = parser.parse_args()
+
+    if args.transcripts:
+        transcripts = [(path, Path(path).read_bytes()) for path in args.transcripts]
+    else:
+        transcripts = [("synthetic", synthetic_transcript(args.tokens))]
+
+    for label, transcript in transcripts:
+        chunks = network_chunks(transcript, args.read_size)
+        legacy_time, (legacy_text, _) = bench("legacy", legacy_parse, chunks, args.repeat)
+        stream_time, (stream_text, events) = bench("stream", stream_parse, chunks, args.repeat)
+        if legacy_text != stream_text:
+            print(f"{label}: WARNING parsed content differs between parsers")
+
+        print(f"{label}: {len(transcript) / 1024:.0f} KiB, {events} events")
+        print(f"  legacy line parser : {events / legacy_time:>12,.0f} events/s")
+        print(f"  byte stream parser : {events / stream_time:>12,.0f} events/s "
+              f"({legacy_time / stream_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,11 @@ Entry point for running Specter as a module.
 Allows running the application with: python -m specter
 """
 
+import multiprocessing
+
 from specter.src.main import main
 
 if __name__ == "__main__":
+    # Lets Document Studio's batch worker processes start in frozen builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -15,7 +15,7 @@ from ..domain.models.app_state import AppState, StateChangeEvent
 from ..domain.services.state_machine import TwoStateMachine
 from ..infrastructure.storage.settings_manager import settings
 from .single_instance import SingleInstanceDetector, SingleInstanceError
-from ..infrastructure.rag_coordinator import initialize_rag_coordinator, cleanup_rag_coordinator, get_rag_coordinator
+from .startup_scheduler import StartupScheduler, initialize_startup_scheduler
 # UI imports - will be available after implementation
 # from ..presentation.ui.main_window import MainWindow
 # from ..presentation.ui.system_tray import EnhancedSystemTray
@@ -49,6 +49,7 @@ class AppCoordinator(QObject):
         self._single_instance: Optional[SingleInstanceDetector] = None
         self._rag_coordinator = None  # RAG coordinator instance
         self._api_validator = None  # Periodic API validator instance
+        self._startup: Optional[StartupScheduler] = None  # Staged startup scheduler
 
         logger.info("AppCoordinator created")
     
@@ -73,31 +74,36 @@ class AppCoordinator(QObject):
         try:
             logger.info("Initializing Specter application...")
 
+            # Only what the window needs runs synchronously; RAG, skills and
+            # API validation are deferred until the window is interactive
+            self._startup = initialize_startup_scheduler()
+
             _progress(5, "Loading settings...")
 
-            # Initialize single instance detection first
-            self._single_instance = SingleInstanceDetector(app_name="Specter")
-            
-            _progress(10, "Checking instances...")
+            with self._startup.stage("single_instance"):
+                # Initialize single instance detection first
+                self._single_instance = SingleInstanceDetector(app_name="Specter")
+
+                _progress(10, "Checking instances...")
+
+                # Check if another instance is already running
+                logger.info("Checking for existing instances...")
+                try:
+                    detection_result = self._single_instance.detect_running_instance()
+                    if detection_result.is_running:
+                        logger.error(f"Another instance of Specter is already running (detected via {detection_result.detection_method})")
+                        return False
+                    logger.info("No existing instance detected")
+
+                    # Acquire instance lock
+                    if not self._single_instance.acquire_instance_lock():
+                        logger.error("Failed to acquire single instance lock")
+                        return False
+                    logger.info("Single instance lock acquired successfully")
+                except Exception as e:
+                    logger.warning(f"Single instance detection failed: {e} - continuing anyway")
+                    self._single_instance = None
 
-            # Check if another instance is already running
-            logger.info("Checking for existing instances...")
-            try:
-                detection_result = self._single_instance.detect_running_instance()
-                if detection_result.is_running:
-                    logger.error(f"Another instance of Specter is already running (detected via {detection_result.detection_method})")
-                    return False
-                logger.info("No existing instance detected")
-                
-                # Acquire instance lock
-                if not self._single_instance.acquire_instance_lock():
-                    logger.error("Failed to acquire single instance lock")
-                    return False
-                logger.info("Single instance lock acquired successfully")
-            except Exception as e:
-                logger.warning(f"Single instance detection failed: {e} - continuing anyway")
-                self._single_instance = None
-            
             # Get current QApplication instance
             self._app = QApplication.instance()
             if not self._app:
@@ -124,34 +130,31 @@ class AppCoordinator(QObject):
                 pass
 
             # Initialize UI components (triggers ThemeManager → loads all themes)
-            self._initialize_ui_components()
-
-            _progress(35, "Building interface...")
-
-            # Initialize periodic API validator
-            self._initialize_api_validator()
+            with self._startup.stage("ui"):
+                self._initialize_ui_components()
 
-            _progress(45, "Validating API...")
+            _progress(45, "Building interface...")
 
             # Wire up settings-change listener so session_manager auto-reconfigures
             # when SSL/PKI settings are modified at runtime.
-            try:
-                from ..infrastructure.ai.session_manager import session_manager
-                settings.on_change(session_manager._on_settings_changed)
-                logger.info("Settings change listener wired to session manager")
-            except Exception as e:
-                logger.warning(f"Failed to wire settings change listener: {e}")
-
-            _progress(55, "Initializing RAG pipeline...")
-
-            # Initialize RAG coordinator
-            self._initialize_rag_system()
+            with self._startup.stage("session_manager"):
+                try:
+                    from ..infrastructure.ai.session_manager import session_manager
+                    settings.on_change(session_manager._on_settings_changed)
+                    logger.info("Settings change listener wired to session manager")
+                except Exception as e:
+                    logger.warning(f"Failed to wire settings change listener: {e}")
 
-            _progress(70, "Registering skills...")
+            _progress(70, "Preparing services...")
 
-            # Initialize skills system
+            # Skills register on first registry use, or in idle time after startup
             self._initialize_skills_system()
 
+            # Deferred until the window is interactive
+            self._startup.defer("api_validator", self._initialize_api_validator)
+            self._startup.defer("rag", self._initialize_rag_system)
+            self._startup.defer("skills", self._load_skills)
+
             _progress(85, "Applying settings...")
 
             # Apply interface settings (opacity, always on top) immediately
@@ -170,14 +173,15 @@ class AppCoordinator(QObject):
             initial_state = AppState(settings.get('app.current_state', 'tray'))
             logger.info(f"🎯 Setting initial app state: {initial_state.value}")
 
-            if initial_state == AppState.AVATAR:
-                logger.info("📍 BEFORE: Calling _show_avatar_mode()")
-                self._show_avatar_mode()
-                logger.info("✓ AFTER: _show_avatar_mode() returned")
-            else:
-                logger.info("📍 BEFORE: Calling _show_tray_mode()")
-                self._show_tray_mode()
-                logger.info("✓ AFTER: _show_tray_mode() returned")
+            with self._startup.stage("show"):
+                if initial_state == AppState.AVATAR:
+                    logger.info("📍 BEFORE: Calling _show_avatar_mode()")
+                    self._show_avatar_mode()
+                    logger.info("✓ AFTER: _show_avatar_mode() returned")
+                else:
+                    logger.info("📍 BEFORE: Calling _show_tray_mode()")
+                    self._show_tray_mode()
+                    logger.info("✓ AFTER: _show_tray_mode() returned")
 
             logger.info("📍 BEFORE: Setting _initialized = True")
             self._initialized = True
@@ -223,6 +227,9 @@ class AppCoordinator(QObject):
                             str(_resolve_log_dir()))
             except Exception:
                 pass
+
+            # The window is usable; deferred stages run from the event loop
+            self._startup.start()
             return True
             
         except Exception as e:
@@ -314,6 +321,7 @@ class AppCoordinator(QObject):
             # Import conversation service
             from ..infrastructure.conversation_management.services.conversation_service import ConversationService
             from ..infrastructure.conversation_management.repositories.conversation_repository import ConversationRepository
+            from ..infrastructure.rag_coordinator import initialize_rag_coordinator
 
             # Initialize conversation service (if not already available)
             if not hasattr(self, '_conversation_service'):
@@ -336,9 +344,23 @@ class AppCoordinator(QObject):
             logger.error(f"Failed to initialize RAG system: {e}")
 
     def _initialize_skills_system(self):
-        """Initialize skills system and register all built-in skills."""
+        """Initialize skills system, deferring built-in skill registration to first use."""
         try:
-            logger.info("Initializing skills system...")
+            from ..infrastructure.skills.core.skill_manager import skill_manager
+            skill_manager.set_skill_loader(self._register_builtin_skills)
+            logger.info("Skills system initialized (built-in skills load on first use)")
+        except Exception as e:
+            logger.error(f"Failed to initialize skills system: {e}", exc_info=True)
+
+    def _load_skills(self):
+        """Register built-in skills now unless first use already did."""
+        from ..infrastructure.skills.core.skill_manager import skill_manager
+        skill_manager.ensure_skills_loaded()
+
+    def _register_builtin_skills(self):
+        """Import and register all built-in skills."""
+        try:
+            logger.info("Registering built-in skills...")
 
             # Import skill manager and all built-in skills
             from ..infrastructure.skills.core.skill_manager import skill_manager
@@ -372,10 +394,10 @@ class AppCoordinator(QObject):
                 except Exception as e:
                     logger.error(f"Failed to register {skill_class.__name__}: {e}")
 
-            logger.info(f"✓ Skills system initialized: {registered_count}/{len(skills_to_register)} skills registered")
+            logger.info(f"✓ Built-in skills registered: {registered_count}/{len(skills_to_register)}")
 
         except Exception as e:
-            logger.error(f"Failed to initialize skills system: {e}", exc_info=True)
+            logger.error(f"Failed to register built-in skills: {e}", exc_info=True)
 
     def _enhance_main_window_rag(self):
         """Enhance main window REPL with RAG capabilities."""
@@ -426,6 +448,7 @@ class AppCoordinator(QObject):
         # Save final state
         if self._state_machine:
             settings.set('app.current_state', self._state_machine.current_state.value)
+        settings.flush()
         
         # Final emergency cleanup for single instance lock 
         try:
@@ -557,6 +580,7 @@ class AppCoordinator(QObject):
 
             # Cleanup RAG system first
             if self._rag_coordinator:
+                from ..infrastructure.rag_coordinator import cleanup_rag_coordinator
                 cleanup_rag_coordinator()
                 logger.info("RAG system cleaned up")
             
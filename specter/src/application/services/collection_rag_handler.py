@@ -14,7 +14,10 @@ from typing import List, Optional, Dict, Any
 
 from ...domain.models.collection import FileCollection, FileCollectionItem
 from ...infrastructure.conversation_management.repositories.collection_repository import CollectionRepository
-from ...infrastructure.storage.collection_storage import CollectionStorageService
+from ...infrastructure.storage.collection_storage import (
+    CollectionStorageService,
+    IntegrityProgressCallback,
+)
 from ...infrastructure.conversation_management.repositories.database import DatabaseManager
 
 logger = logging.getLogger("specter.application.collection_rag")
@@ -39,6 +42,11 @@ class CollectionRAGHandler:
 
     _instance = None  # Singleton
 
+    # Files handed to the pipeline per ingestion batch, and concurrent
+    # ingestions within a batch
+    INGEST_BATCH_SIZE = 32
+    INGEST_CONCURRENCY = 4
+
     def __new__(cls, db_manager: Optional[DatabaseManager] = None):
         """Singleton pattern to ensure single instance."""
         if cls._instance is None:
@@ -84,9 +92,12 @@ class CollectionRAGHandler:
 
         This method:
         1. Gets all files from the collection
-        2. Calls RAGPipeline.ingest_documents() with collection metadata
-        3. Tags embeddings with collection_id and collection_name
-        4. Updates conversation_collections association in database
+        2. Looks up file checksums that are already indexed; files already
+           loaded for this conversation/collection are skipped, and files
+           indexed elsewhere reuse their stored vectors without re-embedding
+        3. Calls RAGPipeline.ingest_documents() in batches for the rest
+        4. Tags embeddings with collection_id and collection_name
+        5. Updates conversation_collections association in database
 
         Args:
             collection_id: Collection UUID
@@ -111,16 +122,6 @@ class CollectionRAGHandler:
                 logger.info(f"⚠ Collection {collection.name} has no files to load")
                 return True, None  # Success but nothing to do
 
-            # Check for duplicate files if requested
-            if check_duplicates:
-                # Get files already in RAG for this conversation
-                # (This would require querying the vector store metadata)
-                # For now, we'll rely on RAG pipeline's own duplicate detection
-                pass
-
-            # Prepare file paths
-            file_paths = [f.file_path for f in files]
-
             # Verify all files exist
             missing_files = []
             for file_item in files:
@@ -154,22 +155,68 @@ class CollectionRAGHandler:
                 for f in files
             }
 
-            # Call existing RAG pipeline with metadata tagging
             logger.info(
                 f"📚 Loading collection '{collection.name}' into RAG "
                 f"({len(files)} files)"
             )
 
-            # Note: RAGPipeline.ingest_documents() should be called here
-            # For now, we'll prepare the call structure
-            # The actual implementation will depend on the RAG pipeline's interface
-            #
-            # await self.rag_pipeline.ingest_documents(
-            #     sources=file_paths,
-            #     metadata_override=metadata_override,
-            #     file_metadata=file_metadata,
-            #     conversation_id=conversation_id
-            # )
+            # Content-addressed lookup: files whose checksum is already indexed
+            # are either skipped (already loaded here) or copied from their
+            # existing vectors instead of being re-embedded
+            indexed: Dict[str, List[Dict[str, Any]]] = {}
+            if check_duplicates:
+                checksums = list({f.checksum for f in files if f.checksum})
+                indexed = await self.rag_pipeline.find_indexed_documents(checksums)
+
+            to_ingest: List[FileCollectionItem] = []
+            to_reuse: List[FileCollectionItem] = []
+            reuse_requests = []
+            already_loaded = 0
+            for file_item in files:
+                stored = indexed.get(file_item.checksum, [])
+                if any(
+                    doc.get('conversation_id') == conversation_id
+                    and doc.get('collection_id') == collection_id
+                    for doc in stored
+                ):
+                    already_loaded += 1
+                elif stored:
+                    to_reuse.append(file_item)
+                    reuse_requests.append((
+                        stored[0]['document_id'],
+                        {**metadata_override, **file_metadata[file_item.file_path]}
+                    ))
+                else:
+                    to_ingest.append(file_item)
+
+            failed_files = []
+            reused = 0
+            if reuse_requests:
+                new_ids = await self.rag_pipeline.reuse_documents(reuse_requests)
+                reused = len([doc_id for doc_id in new_ids if doc_id])
+                # Anything that could not be copied falls back to full ingestion
+                to_ingest.extend(
+                    file_item for file_item, doc_id in zip(to_reuse, new_ids) if not doc_id
+                )
+
+            for start in range(0, len(to_ingest), self.INGEST_BATCH_SIZE):
+                batch = to_ingest[start:start + self.INGEST_BATCH_SIZE]
+                document_ids = await self.rag_pipeline.ingest_documents(
+                    sources=[f.file_path for f in batch],
+                    max_concurrent=self.INGEST_CONCURRENCY,
+                    metadata_override=metadata_override,
+                    file_metadata=file_metadata
+                )
+                failed_files.extend(
+                    file_item.file_name
+                    for file_item, doc_id in zip(batch, document_ids) if not doc_id
+                )
+
+            logger.info(
+                f"📚 Collection '{collection.name}': "
+                f"{len(to_ingest) - len(failed_files)} ingested, {reused} reused, "
+                f"{already_loaded} already loaded, {len(failed_files)} failed"
+            )
 
             # Update conversation-collection association
             success = await self.repository.attach_collection_to_conversation(
@@ -180,6 +227,12 @@ class CollectionRAGHandler:
             if not success:
                 logger.warning(f"⚠ Failed to track collection attachment in database")
 
+            if failed_files:
+                return False, (
+                    f"Failed to ingest: {', '.join(failed_files[:5])}"
+                    + ("..." if len(failed_files) > 5 else "")
+                )
+
             logger.info(
                 f"✓ Collection '{collection.name}' loaded into RAG for conversation "
                 f"{conversation_id[:8]}..."
@@ -299,13 +352,19 @@ class CollectionRAGHandler:
 
     async def verify_collection_files_integrity(
         self,
-        collection_id: str
+        collection_id: str,
+        progress_callback: Optional[IntegrityProgressCallback] = None
     ) -> tuple[bool, List[str]]:
         """
         Verify that all files in a collection still exist and haven't been modified.
 
+        Files whose size, mtime and inode are unchanged since their checksum
+        was recorded are not re-hashed; the rest are hashed in parallel.
+
         Args:
             collection_id: Collection UUID
+            progress_callback: Optional callback(done, total, result) invoked
+                as each file is verified (from a worker thread)
 
         Returns:
             Tuple of (all_valid, error_messages)
@@ -313,27 +372,27 @@ class CollectionRAGHandler:
         try:
             # Get collection files
             files = await self.repository.get_collection_files(collection_id)
-            errors = []
 
-            for file_item in files:
-                # Check file exists
-                if not self.storage.validate_file_exists(file_item.file_path):
-                    errors.append(f"{file_item.file_name}: File no longer exists")
-                    continue
-
-                # Verify checksum
-                is_valid = self.storage.verify_file_integrity(
-                    file_item.file_path,
-                    file_item.checksum
-                )
+            results = await asyncio.to_thread(
+                self.storage.verify_files_integrity,
+                files,
+                progress_callback
+            )
 
-                if not is_valid:
+            errors = []
+            for file_item, result in zip(files, results):
+                if result.status == 'missing':
+                    errors.append(f"{file_item.file_name}: File no longer exists")
+                elif result.status == 'modified':
                     errors.append(f"{file_item.file_name}: File has been modified")
+                elif result.status == 'error':
+                    errors.append(f"{file_item.file_name}: {result.error or 'Verification failed'}")
 
             all_valid = len(errors) == 0
+            hashed = len([r for r in results if r.hashed])
 
             if all_valid:
-                logger.info(f"✓ All {len(files)} file(s) verified")
+                logger.info(f"✓ All {len(files)} file(s) verified ({hashed} re-hashed)")
             else:
                 logger.warning(f"⚠ {len(errors)} file(s) failed verification")
 
@@ -8,11 +8,16 @@ and can be tagged into groups for reuse across conversations.
 import asyncio
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from uuid import uuid4
 
+from ...domain.models.collection import FileCollectionItem
 from ...infrastructure.conversation_management.repositories.collection_repository import CollectionRepository
 from ...infrastructure.conversation_management.repositories.database import DatabaseManager
+from ...infrastructure.storage.collection_storage import (
+    IntegrityProgressCallback,
+    collection_storage_service,
+)
 
 logger = logging.getLogger("specter.application.collection_service")
 
@@ -28,6 +33,7 @@ class CollectionService:
             db_manager: Optional database manager (uses singleton if not provided)
         """
         self.repository = CollectionRepository(db_manager)
+        self.storage = collection_storage_service
         logger.info("✓ CollectionService initialized (tag-based)")
 
     async def list_collection_tags(self) -> List[str]:
@@ -168,3 +174,83 @@ class CollectionService:
         except Exception as e:
             logger.error(f"✗ Error getting all files: {e}")
             return []
+
+    async def verify_tag_integrity(
+        self,
+        tag: str,
+        progress_callback: Optional[IntegrityProgressCallback] = None
+    ) -> Tuple[bool, List[str]]:
+        """
+        Verify that the files in a collection haven't changed since upload.
+
+        Files whose size, mtime and inode match the fingerprint recorded with
+        their checksum are not re-hashed. Fingerprints of files that had to
+        be hashed and still match are saved so the next check skips them,
+        and files uploaded before checksums were recorded get one now.
+
+        Args:
+            tag: Collection tag name
+            progress_callback: Optional callback(done, total, result) invoked
+                as each recorded file is verified (from a worker thread)
+
+        Returns:
+            Tuple of (all_valid, error_messages)
+        """
+        try:
+            files = [f for f in await self.repository.get_files_by_tag(tag) if f['file_path']]
+            tracked = [f for f in files if f['checksum']]
+            untracked = [f for f in files if not f['checksum']]
+
+            items = [
+                FileCollectionItem(
+                    file_path=f['file_path'],
+                    file_name=f['filename'],
+                    file_size=f['file_size'] or 0,
+                    file_type=f['file_type'] or '',
+                    added_at=f['upload_timestamp'],
+                    checksum=f['checksum'],
+                    id=f['id'],
+                    mtime_ns=f['mtime_ns'],
+                    inode=f['inode']
+                )
+                for f in tracked
+            ]
+            results = await asyncio.to_thread(
+                self.storage.verify_files_integrity, items, progress_callback
+            )
+            baselines = await asyncio.to_thread(
+                lambda: [self.storage.calculate_file_checksum(f['file_path']) for f in untracked]
+            )
+
+            errors = []
+            fingerprints = {}
+            for file, result in zip(tracked, results):
+                if result.is_valid:
+                    fingerprint = self.storage.recorded_fingerprint(file['file_path'])
+                    if (fingerprint and fingerprint['checksum'] == file['checksum']
+                            and any(fingerprint[key] != file[key] for key in ('file_size', 'mtime_ns', 'inode'))):
+                        fingerprints[file['id']] = fingerprint
+                elif result.status == 'missing':
+                    errors.append(f"{file['filename']}: File no longer exists")
+                elif result.status == 'modified':
+                    errors.append(f"{file['filename']}: File has been modified")
+                elif result.status == 'error':
+                    errors.append(f"{file['filename']}: {result.error or 'Verification failed'}")
+            for file, checksum in zip(untracked, baselines):
+                fingerprint = self.storage.recorded_fingerprint(file['file_path']) if checksum else None
+                if fingerprint:
+                    fingerprints[file['id']] = fingerprint
+                else:
+                    errors.append(f"{file['filename']}: File no longer exists")
+
+            await self.repository.update_file_fingerprints(fingerprints)
+
+            hashed = len([r for r in results if r.hashed]) + len(untracked)
+            if errors:
+                logger.warning(f"⚠ {len(errors)} file(s) in '{tag}' failed verification")
+            else:
+                logger.info(f"✓ All {len(files)} file(s) in '{tag}' verified ({hashed} re-hashed)")
+            return not errors, errors
+        except Exception as e:
+            logger.error(f"✗ Error verifying collection '{tag}': {e}")
+            return False, [str(e)]
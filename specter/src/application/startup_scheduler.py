@@ -0,0 +1,321 @@
+"""
+Staged Startup Scheduler for Specter.
+
+Startup is split into stages. Stages the window needs (settings, theme, UI)
+run synchronously; everything else (RAG, skills, API validation) is deferred
+and run one stage per event-loop turn once the window is interactive. A
+caller that needs a deferred subsystem before then can pull its stage
+forward with ``ensure``.
+
+When profiling is enabled (``--profile-startup``) every stage records its
+wall time and the time spent executing module imports, and ``report`` renders
+both as a table.
+"""
+
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+logger = logging.getLogger("specter.startup")
+
+
+@dataclass
+class StageTiming:
+    """Wall time and import cost of one startup stage."""
+    name: str
+    wall_time: float
+    import_time: float = 0.0
+    modules_imported: int = 0
+    deferred: bool = False
+    error: Optional[str] = None
+
+
+class _TimedLoader:
+    """Loader proxy that reports how long a module body takes to execute."""
+
+    def __init__(self, loader, spec, tracker: "ImportCostTracker"):
+        self._loader = loader
+        self._spec = spec
+        self._tracker = tracker
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        return create_module(spec) if create_module else None
+
+    def exec_module(self, module):
+        self._tracker._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._tracker._leave(self._spec.name, time.perf_counter() - start)
+            # Leave no trace of the proxy on the imported module
+            self._spec.loader = self._loader
+            module.__loader__ = self._loader
+
+
+class ImportCostTracker:
+    """
+    Meta path hook that measures import cost while installed.
+
+    Only the outermost import of a chain is added to the total, so nested
+    imports are not counted twice; every executed module counts towards
+    ``modules_imported``.
+    """
+
+    def __init__(self):
+        self.import_time = 0.0
+        self.modules_imported = 0
+        self._top_level: List[Tuple[float, str]] = []
+        self._local = threading.local()
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def snapshot(self) -> Tuple[float, int]:
+        return self.import_time, self.modules_imported
+
+    def slowest(self, count: int = 10) -> List[Tuple[float, str]]:
+        """Return the slowest top-level imports as (seconds, module) pairs."""
+        return sorted(self._top_level, reverse=True)[:count]
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, spec, self)
+        return spec
+
+    def _enter(self):
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+
+    def _leave(self, name: str, elapsed: float):
+        self._local.depth -= 1
+        self.modules_imported += 1
+        if self._local.depth == 0:
+            self.import_time += elapsed
+            self._top_level.append((elapsed, name))
+
+
+class StartupScheduler(QObject):
+    """
+    Runs startup in timed stages and defers non-essential ones to idle time.
+
+    Example:
+        >>> scheduler = StartupScheduler(profile=True)
+        >>> with scheduler.stage("ui"):
+        ...     build_window()
+        >>> scheduler.defer("skills", load_skills)
+        >>> scheduler.start()  # Window is interactive; drain deferred stages
+    """
+
+    # Emitted once every deferred stage has run
+    deferred_finished = pyqtSignal()
+
+    # Pause between deferred stages so queued input and paint events run
+    IDLE_INTERVAL_MS = 30
+
+    def __init__(self, profile: bool = False, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.profile = profile
+        self._created_at = time.perf_counter()
+        self._timings: List[StageTiming] = []
+        self._pending: Dict[str, Callable[[], object]] = {}
+        self._started = False
+        self._finished = False
+        self.interactive_after: Optional[float] = None
+
+        self._tracker: Optional[ImportCostTracker] = None
+        if profile:
+            self._tracker = ImportCostTracker()
+            self._tracker.install()
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(self.IDLE_INTERVAL_MS)
+        self._idle_timer.timeout.connect(self._run_next_deferred)
+
+    @contextmanager
+    def stage(self, name: str, deferred: bool = False):
+        """Time the enclosed block as a startup stage."""
+        imports_before = self._tracker.snapshot() if self._tracker else (0.0, 0)
+        timing = StageTiming(name=name, wall_time=0.0, deferred=deferred)
+        start = time.perf_counter()
+        try:
+            yield timing
+        except Exception as e:
+            timing.error = str(e)
+            raise
+        finally:
+            timing.wall_time = time.perf_counter() - start
+            if self._tracker:
+                import_time, modules = self._tracker.snapshot()
+                timing.import_time = import_time - imports_before[0]
+                timing.modules_imported = modules - imports_before[1]
+            self._timings.append(timing)
+            logger.debug(f"Startup stage '{name}' took {timing.wall_time * 1000:.1f} ms")
+
+    def defer(self, name: str, func: Callable[[], object]) -> None:
+        """
+        Queue a stage to run after the window is interactive.
+
+        Args:
+            name: Stage name, used by ``ensure`` and in the report
+            func: Callable run on the GUI thread with no arguments
+        """
+        if name in self._pending:
+            logger.debug(f"Startup stage '{name}' already deferred")
+            return
+        self._pending[name] = func
+        if self._started and not self._idle_timer.isActive():
+            self._idle_timer.start()
+
+    def is_finished(self) -> bool:
+        """Check whether every deferred stage has run."""
+        return self._finished
+
+    def is_pending(self, name: str) -> bool:
+        """Check whether a deferred stage has yet to run."""
+        return name in self._pending
+
+    def ensure(self, name: str) -> bool:
+        """
+        Run a deferred stage now if it has not run yet.
+
+        Used on first use of a subsystem whose stage is still queued.
+
+        Returns:
+            True if the stage ran as a result of this call
+        """
+        func = self._pending.pop(name, None)
+        if func is None:
+            return False
+        logger.info(f"Startup stage '{name}' needed early - running now")
+        self._run_deferred(name, func)
+        return True
+
+    def start(self) -> None:
+        """Mark the application interactive and begin draining deferred stages."""
+        if self._started:
+            return
+        self._started = True
+        self.interactive_after = time.perf_counter() - self._created_at
+        logger.info(f"Interactive after {self.interactive_after * 1000:.0f} ms "
+                    f"({len(self._pending)} stages deferred)")
+        if self._pending:
+            self._idle_timer.start()
+        else:
+            self._finish()
+
+    def timings(self) -> List[StageTiming]:
+        return list(self._timings)
+
+    def report(self) -> str:
+        """Render per-stage wall time and import cost as a text table."""
+        lines = []
+        if self.interactive_after is not None:
+            lines.append(f"Startup profile: interactive after {self.interactive_after * 1000:.0f} ms")
+        else:
+            lines.append("Startup profile")
+        lines.append(f"  {'stage':<28}{'wall ms':>10}{'import ms':>12}{'modules':>10}")
+        for timing in self._timings:
+            name = f"{timing.name} (deferred)" if timing.deferred else timing.name
+            if timing.error:
+                name += " [failed]"
+            lines.append(f"  {name:<28}{timing.wall_time * 1000:>10.1f}"
+                         f"{timing.import_time * 1000:>12.1f}{timing.modules_imported:>10}")
+        if self._tracker:
+            lines.append("  Slowest imports:")
+            for elapsed, module in self._tracker.slowest():
+                lines.append(f"    {elapsed * 1000:>8.1f} ms  {module}")
+        return "\n".join(lines)
+
+    def _run_next_deferred(self):
+        if not self._pending:
+            self._finish()
+            return
+        name = next(iter(self._pending))
+        self._run_deferred(name, self._pending.pop(name))
+        if self._pending:
+            self._idle_timer.start()
+        else:
+            self._finish()
+
+    def _run_deferred(self, name: str, func: Callable[[], object]):
+        try:
+            with self.stage(name, deferred=True):
+                func()
+        except Exception as e:
+            logger.error(f"Deferred startup stage '{name}' failed: {e}", exc_info=True)
+
+    def _finish(self):
+        if self._finished:
+            return
+        self._finished = True
+        if self._tracker:
+            self._tracker.uninstall()
+        logger.info("All deferred startup stages complete")
+        self.deferred_finished.emit()
+
+
+# Global startup scheduler instance
+_startup_scheduler: Optional[StartupScheduler] = None
+
+
+def get_startup_scheduler() -> Optional[StartupScheduler]:
+    """Get the global startup scheduler instance."""
+    return _startup_scheduler
+
+
+def initialize_startup_scheduler(profile: bool = False) -> StartupScheduler:
+    """Initialize the global startup scheduler."""
+    global _startup_scheduler
+
+    if _startup_scheduler is None:
+        _startup_scheduler = StartupScheduler(profile=profile)
+
+    return _startup_scheduler
+
+
+def defer_startup_task(name: str, func: Callable[[], object]) -> None:
+    """
+    Defer a task to idle time if startup is still in progress.
+
+    Without a running scheduler (startup finished, or a widget built outside
+    the application) the task runs immediately.
+    """
+    scheduler = _startup_scheduler
+    if scheduler is not None and not scheduler.is_finished():
+        scheduler.defer(name, func)
+    else:
+        func()
+
+
+def ensure_startup_task(name: str) -> None:
+    """Run a deferred startup task now if it is still queued."""
+    if _startup_scheduler is not None:
+        _startup_scheduler.ensure(name)
@@ -30,7 +30,7 @@ def save_window_state(window_type: str, x: int, y: int, width: int, height: int)
             settings.set('ui.repl_width', width)
             settings.set('ui.repl_height', height)
         
-        settings.save()
+        # Written by the settings manager's debounced save
         logger.debug(f"Saved {window_type} window state: pos=({x}, {y}), size=({width}, {height})")
         
     except Exception as e:
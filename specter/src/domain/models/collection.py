@@ -31,6 +31,10 @@ class FileCollectionItem:
     added_at: datetime  # When file was added to collection
     checksum: str  # SHA256 hash for integrity checking
     id: str = field(default_factory=lambda: str(uuid4()))  # Unique identifier
+    # Stat fingerprint taken when the checksum was computed; lets integrity
+    # checks skip re-hashing files that haven't changed since
+    mtime_ns: Optional[int] = None
+    inode: Optional[int] = None
 
     @classmethod
     def create(
@@ -79,7 +83,9 @@ class FileCollectionItem:
             file_size=file_size,
             file_type=file_type,
             added_at=datetime.now(),
-            checksum=checksum
+            checksum=checksum,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino
         )
 
     @staticmethod
@@ -97,7 +103,7 @@ class FileCollectionItem:
 
         with open(file_path, 'rb') as f:
             # Read in chunks for large files
-            for chunk in iter(lambda: f.read(8192), b''):
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
                 sha256.update(chunk)
 
         return sha256.hexdigest()
@@ -111,7 +117,9 @@ class FileCollectionItem:
             'file_size': self.file_size,
             'file_type': self.file_type,
             'added_at': self.added_at.isoformat(),
-            'checksum': self.checksum
+            'checksum': self.checksum,
+            'mtime_ns': self.mtime_ns,
+            'inode': self.inode
         }
 
     @classmethod
@@ -124,7 +132,9 @@ class FileCollectionItem:
             file_size=data['file_size'],
             file_type=data['file_type'],
             added_at=datetime.fromisoformat(data['added_at']),
-            checksum=data['checksum']
+            checksum=data['checksum'],
+            mtime_ns=data.get('mtime_ns'),
+            inode=data.get('inode')
         )
 
 
@@ -6,11 +6,13 @@ and integrates with the OpenAI-compatible API client.
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
 
-from .api_client import OpenAICompatibleClient, APIResponse
+from .api_client import OpenAICompatibleClient, APIResponse, retry_after_from_headers
+from .prompt_composer import PromptCacheStats, PromptComposer
 from ...infrastructure.storage.settings_manager import settings
 
 logger = logging.getLogger("specter.ai_service")
@@ -26,6 +28,29 @@ class AIConfigurationError(AIServiceError):
     pass
 
 
+# Fixed per-message overhead (role, separators) added to content tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Headroom left when the context window slides, so it slides rarely
+FOLD_SLACK = 0.25
+
+_token_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, else estimate ~4 chars per token."""
+    global _token_encoding
+    if _token_encoding is None:
+        try:
+            import tiktoken
+            _token_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _token_encoding = False
+    if _token_encoding:
+        return len(_token_encoding.encode(text, disallowed_special=()))
+    return len(text) // 4 + 1
+
+
 @dataclass
 class ConversationMessage:
     """A single message in a conversation."""
@@ -33,14 +58,30 @@ class ConversationMessage:
     content: str
     timestamp: datetime = field(default_factory=datetime.now)
     token_count: Optional[int] = None
+    
+    def get_token_count(self) -> int:
+        """Token cost of this message, counted once and cached."""
+        if self.token_count is None:
+            self.token_count = count_tokens(self.content) + MESSAGE_OVERHEAD_TOKENS
+        return self.token_count
 
 
 @dataclass 
 class ConversationContext:
-    """Manages conversation history and context."""
+    """
+    Manages conversation history and context.
+    
+    History sent to the API is selected newest-first within `max_tokens`
+    (minus any tokens reserved for tools). System messages are always sent;
+    turns that no longer fit are folded into a summary message.
+    """
     messages: List[ConversationMessage] = field(default_factory=list)
-    max_messages: int = 50  # Maximum messages to keep in context
-    max_tokens: int = 32768  # Increased token limit for context (suitable for modern models)
+    max_messages: int = 200  # Maximum messages to keep in history
+    max_tokens: int = 32768  # Token budget for the assembled request context
+    summary_max_tokens: int = 1024  # Budget for the folded-history summary
+    summary: str = ""  # Turns already dropped from history by _trim_context
+    _fold_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _window_first: Optional[ConversationMessage] = field(default=None, init=False, repr=False, compare=False)
     
     def add_message(self, role: str, content: str) -> ConversationMessage:
         """Add a message to the conversation."""
@@ -53,7 +94,7 @@ class ConversationContext:
         return message
     
     def _trim_context(self):
-        """Trim conversation context to stay within limits."""
+        """Trim conversation history to stay within max_messages."""
         if len(self.messages) <= self.max_messages:
             return  # No trimming needed
             
@@ -62,32 +103,142 @@ class ConversationContext:
         other_messages = [msg for msg in self.messages if msg.role != 'system']
         
         # Calculate how many non-system messages we can keep
-        available_slots = self.max_messages - len(system_messages)
+        available_slots = max(0, self.max_messages - len(system_messages))
         
         # Trim other messages if needed, keeping the most recent ones
         if len(other_messages) > available_slots:
+            dropped = other_messages[:len(other_messages) - available_slots]
+            self.summary = self._fold(self.summary, dropped)
             # Keep most recent messages (preserve conversation flow)
-            other_messages = other_messages[-available_slots:]
+            other_messages = other_messages[len(dropped):]
         
         # Rebuild messages list with system messages first
         self.messages = system_messages + other_messages
         
-        # Log the trimming operation
-        from datetime import datetime
-        import logging
-        logger = logging.getLogger("specter.ai_service")
         logger.info(f"🔄 Context trimmed to {len(self.messages)} messages (max: {self.max_messages})")
     
-    def to_api_format(self) -> List[Dict[str, str]]:
-        """Convert messages to API format."""
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in self.messages
-        ]
+    def to_api_format(self, reserved_tokens: int = 0) -> List[Dict[str, str]]:
+        """
+        Assemble messages in API format within the token budget.
+        
+        Args:
+            reserved_tokens: Tokens to keep free for content sent alongside
+                the messages (tool definitions, injected prompts)
+        
+        Returns:
+            System messages, an optional summary of older turns, then the
+            most recent turns that fit, in conversation order
+        """
+        system_messages = [msg for msg in self.messages if msg.role == 'system']
+        other_messages = [msg for msg in self.messages if msg.role != 'system']
+        
+        budget = self.max_tokens - reserved_tokens - sum(m.get_token_count() for m in system_messages)
+        
+        costs = [msg.get_token_count() for msg in other_messages]
+        total = sum(costs)
+        summary = self.summary
+        start = 0
+        
+        if total > budget and len(other_messages) > 1:
+            reserve = min(self.summary_max_tokens, max(0, budget // 4))
+            target = budget - reserve
+            start = self._window_start(other_messages, costs, total, target)
+            # The summary header and message framing come out of the reserve
+            if start:
+                summary = self._folded_summary(
+                    other_messages[:start], max(0, reserve - 2 * MESSAGE_OVERHEAD_TOKENS)
+                )
+        else:
+            self._window_first = None
+        
+        api_messages = [{"role": msg.role, "content": msg.content} for msg in system_messages]
+        if summary:
+            api_messages.append({
+                "role": "system",
+                "content": "Summary of earlier conversation:\n" + summary
+            })
+        api_messages.extend(
+            {"role": msg.role, "content": msg.content} for msg in other_messages[start:]
+        )
+        
+        if start > 0:
+            logger.debug(
+                f"Context assembled: {len(other_messages) - start} recent messages, "
+                f"{start} folded into summary"
+            )
+        return api_messages
+    
+    def _window_start(self, messages: List[ConversationMessage], costs: List[int],
+                      total: int, target: int) -> int:
+        """
+        Index of the oldest message sent when history exceeds the budget.
+        
+        The window start only moves when the current window no longer fits,
+        and then jumps forward with FOLD_SLACK headroom, so the request prefix
+        (and the folded summary) stays identical across most turns and
+        remains cacheable by the provider.
+        """
+        if self._window_first is not None:
+            for index, msg in enumerate(messages):
+                if msg is self._window_first:
+                    if total - sum(costs[:index]) <= target:
+                        return index
+                    break
+        
+        # Newest first up to the slack-adjusted target; the latest message is always sent
+        limit = target * (1 - FOLD_SLACK)
+        start = len(messages) - 1
+        used = costs[start]
+        while start > 0 and used + costs[start - 1] <= limit:
+            start -= 1
+            used += costs[start]
+        
+        self._window_first = messages[start]
+        return start
+    
+    def _folded_summary(self, folded: List[ConversationMessage], max_tokens: int) -> str:
+        """Summary of trimmed history plus the given folded turns (cached)."""
+        key = (self.summary, len(folded), id(folded[0]), id(folded[-1]), max_tokens)
+        if self._fold_cache is None or self._fold_cache[0] != key:
+            self._fold_cache = (key, self._fold(self.summary, folded, max_tokens))
+        return self._fold_cache[1]
+    
+    def _fold(self, summary: str, messages: List[ConversationMessage],
+              max_tokens: Optional[int] = None) -> str:
+        """
+        Fold messages into an extractive summary of at most max_tokens
+        (default summary_max_tokens).
+        
+        Each turn contributes its opening line; the oldest lines are dropped
+        first when the summary outgrows its budget.
+        """
+        def lines():
+            for msg in reversed(messages):
+                text = " ".join(msg.content.split())
+                if len(text) > 200:
+                    text = text[:200].rstrip() + "…"
+                yield f"{msg.role}: {text}"
+            if summary:
+                yield from reversed(summary.splitlines())
+        
+        limit = self.summary_max_tokens if max_tokens is None else max_tokens
+        
+        # Walk newest-first so only lines that survive are tokenized
+        kept = []
+        total = 0
+        for line in lines():
+            total += count_tokens(line) + 1
+            if total > limit:
+                break
+            kept.append(line)
+        return "\n".join(reversed(kept))
     
     def clear(self):
         """Clear all messages."""
         self.messages.clear()
+        self.summary = ""
+        self._fold_cache = None
+        self._window_first = None
 
 
 class AIService:
@@ -106,6 +257,17 @@ class AIService:
         # Response callbacks
         self._response_callbacks: List[Callable[[str], None]] = []
         
+        # Tool-call execution engine (created on first tool call)
+        self._tool_engine = None
+        self._tool_reserve_cache = None
+        
+        # Prompt-cache request composition and usage accounting
+        self._prompt_composer: Optional[PromptComposer] = None
+        self.prompt_cache_stats = PromptCacheStats()
+        
+        # Guards creating and swapping the async request executor
+        self._executor_lock = threading.Lock()
+        
         logger.info("AIService created")
     
     def initialize(self, config: Optional[Dict[str, Any]] = None) -> bool:
@@ -272,19 +434,36 @@ class AIService:
         """
         # Run the synchronous send_message in an executor to avoid blocking the event loop
         import asyncio
-        import concurrent.futures
         
-        # Create executor if not exists
-        if not hasattr(self, '_executor'):
-            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-        
-        # Run sync method in executor
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
-            self._executor,
+            self._get_async_executor(),
             lambda: self.send_message(message, stream=stream)
         )
     
+    def _get_async_executor(self):
+        """Return the executor that runs requests for the async send methods."""
+        import concurrent.futures
+        
+        with self._executor_lock:
+            # Create executor if not exists
+            if not hasattr(self, '_executor'):
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=getattr(self, '_async_workers', 2)
+                )
+            return self._executor
+    
+    def ensure_async_workers(self, workers: int) -> None:
+        """Allow at least `workers` async requests to run at the same time."""
+        with self._executor_lock:
+            if workers <= getattr(self, '_async_workers', 2):
+                return
+            self._async_workers = workers
+            if hasattr(self, '_executor'):
+                # Callers may already hold the old executor, so it is not
+                # shut down; its idle threads exit once it is released
+                delattr(self, '_executor')
+    
     def send_message(
         self,
         message: str,
@@ -325,14 +504,62 @@ class AIService:
             # Add user message to conversation
             self.conversation.add_message('user', message)
             
-            # Prepare API request
-            api_messages = self.conversation.to_api_format()
+            # Get tool definitions if tools are enabled; they are fetched
+            # first so the context budget can reserve room for them
+            provider_format = None
+            tool_definitions = None
+            tool_awareness = None
+            if settings.get('tools.enabled', True):
+                try:
+                    from ..skills.core.tool_bridge import tool_bridge
+                    from ..skills.core.skill_manager import skill_manager
+                    provider_format = tool_bridge.detect_provider(
+                        self._config.get('base_url', '')
+                    )
+                    tool_definitions = tool_bridge.get_tool_definitions(
+                        skill_manager.registry, provider_format
+                    )
+                    if tool_definitions:
+                        # Tool awareness goes into the system prompt so the AI
+                        # knows it has tools and won't refuse file paths
+                        tool_awareness = tool_bridge.build_tool_awareness_prompt(
+                            skill_manager.registry
+                        )
+                except Exception as e:
+                    logger.warning(f"Could not load tool definitions: {e}")
+            
+            # ── MemGPT integration ──────────────────────────────────────
+            # When enabled, core memory is injected into the system prompt,
+            # so it is built before the history and its tokens reserved.
+            _memgpt_active = False
+            memgpt_prompt = ""
+            try:
+                if settings.get('memgpt.enabled', False):
+                    from ..memory.memory_orchestrator import MemoryOrchestrator
+                    # Reuse orchestrator across calls to preserve summary state
+                    if not hasattr(self, '_memgpt_orchestrator') or self._memgpt_orchestrator is None:
+                        self._memgpt_orchestrator = MemoryOrchestrator()
+                    _memgpt_orch = self._memgpt_orchestrator
+                    memgpt_prompt = _memgpt_orch.build_system_prompt()
+                    _memgpt_active = True
+            except Exception as e:
+                logger.warning(f"MemGPT initialization failed, using normal mode: {e}")
+                _memgpt_active = False
+                memgpt_prompt = ""
+            
+            # Prepare API request: recent history within the token budget,
+            # after tools and core memory
+            reserved_tokens = self._tool_token_reserve(tool_definitions, tool_awareness)
+            if memgpt_prompt:
+                reserved_tokens += count_tokens(memgpt_prompt)
+            api_messages = self.conversation.to_api_format(reserved_tokens=reserved_tokens)
             
             # Log the full context being sent
-            logger.debug(f"Full conversation context ({len(api_messages)} messages):")
-            for i, msg in enumerate(api_messages):
-                preview = msg['content'][:100] + "..." if len(msg['content']) > 100 else msg['content']
-                logger.debug(f"  Message {i+1} [{msg['role']}]: {preview}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Full conversation context ({len(api_messages)} messages):")
+                for i, msg in enumerate(api_messages):
+                    preview = msg['content'][:100] + "..." if len(msg['content']) > 100 else msg['content']
+                    logger.debug(f"  Message {i+1} [{msg['role']}]: {preview}")
             
             # Prepare parameters for API request
             model_name = self._config['model_name']
@@ -371,78 +598,51 @@ class AIService:
                             logger.info(f"Using user-specified max_tokens {current_max_tokens} for {model_name} (no artificial cap)")
                             # Keep the original max_tokens value - don't cap it
             
-            # Get tool definitions if tools are enabled
-            provider_format = None
-            tool_definitions = None
-            if settings.get('tools.enabled', True):
-                try:
-                    from ..skills.core.tool_bridge import tool_bridge
-                    from ..skills.core.skill_manager import skill_manager
-                    provider_format = tool_bridge.detect_provider(
-                        self._config.get('base_url', '')
-                    )
-                    tool_definitions = tool_bridge.get_tool_definitions(
-                        skill_manager.registry, provider_format
-                    )
-                    if tool_definitions:
-                        api_params['tools'] = tool_definitions
-                        logger.info(
-                            f"Attached {len(tool_definitions)} tool definitions "
-                            f"({provider_format} format)"
-                        )
-
-                        # Inject tool awareness into system prompt so the AI
-                        # knows it has tools and won't refuse file paths
-                        tool_awareness = tool_bridge.build_tool_awareness_prompt(
-                            skill_manager.registry
-                        )
-                        if tool_awareness:
-                            for msg in api_messages:
-                                if msg.get("role") == "system":
-                                    msg["content"] = tool_awareness + "\n\n" + msg["content"]
-                                    break
-                            else:
-                                api_messages.insert(0, {
-                                    "role": "system",
-                                    "content": tool_awareness,
-                                })
-                except Exception as e:
-                    logger.warning(f"Could not load tool definitions: {e}")
+            # Attach tool definitions
+            if tool_definitions:
+                api_params['tools'] = tool_definitions
+                logger.info(
+                    f"Attached {len(tool_definitions)} tool definitions "
+                    f"({provider_format} format)"
+                )
+            
+            # System content that is identical every turn (cacheable prefix)
+            # and content that changes per turn (appended after it)
+            stable_blocks = [tool_awareness] if tool_definitions and tool_awareness else []
+            volatile_blocks = []
 
-            # ── MemGPT integration ──────────────────────────────────────
-            # When enabled, inject core memory into system prompt and
-            # require function calling on every turn.
-            _memgpt_active = False
-            try:
-                if settings.get('memgpt.enabled', False):
-                    from ..memory.memory_orchestrator import MemoryOrchestrator
-                    # Reuse orchestrator across calls to preserve summary state
-                    if not hasattr(self, '_memgpt_orchestrator') or self._memgpt_orchestrator is None:
-                        self._memgpt_orchestrator = MemoryOrchestrator()
-                    _memgpt_orch = self._memgpt_orchestrator
-                    _memgpt_active = True
+            if _memgpt_active:
+                # Core memory blocks follow the stable system prompt
+                volatile_blocks.append(memgpt_prompt)
 
-                    # Rebuild system prompt with core memory blocks
-                    for msg in api_messages:
-                        if msg.get("role") == "system":
-                            msg["content"] = _memgpt_orch.build_system_prompt(msg["content"])
-                            break
+                # Let the model decide when to use tools (auto) rather than
+                # forcing a tool call on every message — 'required' caused
+                # spurious web_search / outlook calls for casual messages.
+                if tool_definitions:
+                    api_params['tool_choice'] = 'auto'
+                    logger.info("MemGPT mode active: tool_choice=auto, core memory injected")
 
-                    # Let the model decide when to use tools (auto) rather than
-                    # forcing a tool call on every message — 'required' caused
-                    # spurious web_search / outlook calls for casual messages.
-                    if tool_definitions:
-                        api_params['tool_choice'] = 'auto'
-                        logger.info("MemGPT mode active: tool_choice=auto, core memory injected")
+            # Order the request as stable prefix + volatile suffix and add
+            # provider prompt-cache hints; only the configured system prompt
+            # belongs to the stable prefix
+            composer = self._get_prompt_composer()
+            system_prompt = self._config.get('system_prompt', '')
+            composed = composer.compose(api_messages, stable_blocks, volatile_blocks, system_prompt)
 
-                    # Check context eviction before sending
-                    if _memgpt_orch.should_evict(api_messages):
+            if _memgpt_active:
+                # Check context eviction on the request as it will be sent
+                try:
+                    if _memgpt_orch.should_evict(composed):
                         _, api_messages = _memgpt_orch.summarize_and_evict(api_messages)
-                        api_params['messages'] = api_messages
+                        volatile_blocks = [_memgpt_orch.build_system_prompt()]
+                        composed = composer.compose(api_messages, stable_blocks, volatile_blocks, system_prompt)
                         logger.info("MemGPT: context eviction triggered")
-            except Exception as e:
-                logger.warning(f"MemGPT initialization failed, using normal mode: {e}")
-                _memgpt_active = False
+                except Exception as e:
+                    logger.warning(f"MemGPT eviction failed, sending without eviction: {e}")
+
+            api_messages = composed
+            api_params['messages'] = api_messages
+            api_params.update(composer.request_params(tool_definitions))
 
             # Make API request — use streaming path when callback is provided
             use_streaming = stream_callback is not None or stream
@@ -452,11 +652,15 @@ class AIService:
                 response = self.client.chat_completion_stream(
                     **api_params,
                     stream_callback=stream_callback,
-                    thinking_callback=thinking_callback
+                    thinking_callback=thinking_callback,
+                    flush_interval=settings.get('ai_model.stream_flush_interval_ms', 30) / 1000.0
                 )
             else:
                 response = self.client.chat_completion(**api_params)
             
+            if response.success:
+                self._record_prompt_cache_usage(response.data)
+            
             # Log raw response for debugging gpt-5-nano
             if model_name.startswith('gpt-5'):
                 logger.info(f"🔍 GPT-5 RAW RESPONSE - Success: {response.success}")
@@ -468,7 +672,6 @@ class AIService:
             # and feed results back until the model produces a final text reply.
             if response.success and tool_definitions and provider_format:
                 from ..skills.core.tool_bridge import tool_bridge
-                from ..skills.core.skill_manager import skill_manager
                 max_iterations = settings.get('tools.max_tool_iterations', 5)
                 iteration = 0
 
@@ -537,58 +740,11 @@ class AIService:
                     )
                     api_messages.append(assistant_msg)
 
-                    # Execute each tool call and collect results
-                    import asyncio
-                    tool_results = []
-                    loop = asyncio.new_event_loop()
-                    try:
-                        for tc in tool_calls:
-                            logger.info(
-                                f"Executing tool: {tc['skill_id']} "
-                                f"(call_id: {tc['id']})"
-                            )
-                            # Notify callback: tool is starting
-                            if tool_status_callback:
-                                try:
-                                    tool_status_callback(
-                                        "executing", tc['skill_id'],
-                                        tc.get('arguments', {})
-                                    )
-                                except Exception:
-                                    pass
-                            try:
-                                result = loop.run_until_complete(
-                                    skill_manager.execute_skill(
-                                        tc['skill_id'],
-                                        skip_confirmation=True,
-                                        **tc['arguments']
-                                    )
-                                )
-                                logger.info(
-                                    f"Tool result: success={result.success}, "
-                                    f"message={result.message}"
-                                )
-                            except Exception as e:
-                                logger.error(f"Tool execution failed: {e}")
-                                from ..skills.interfaces.base_skill import SkillResult
-                                result = SkillResult(
-                                    success=False,
-                                    message=f"Tool execution failed: {str(e)}",
-                                    error=str(e)
-                                )
-                            # Notify callback: tool finished
-                            if tool_status_callback:
-                                try:
-                                    tool_status_callback(
-                                        "completed", tc['skill_id'],
-                                        {"success": result.success,
-                                         "message": result.message}
-                                    )
-                                except Exception:
-                                    pass
-                            tool_results.append((tc, result))
-                    finally:
-                        loop.close()
+                    # Execute tool calls; independent (parallel-safe) calls
+                    # run concurrently, results come back in call order
+                    tool_results = self._get_tool_engine().execute(
+                        tool_calls, tool_status_callback
+                    )
 
                     # Append tool results to conversation
                     if provider_format == "anthropic" and len(tool_results) > 1:
@@ -622,10 +778,13 @@ class AIService:
                         response = self.client.chat_completion_stream(
                             **api_params,
                             stream_callback=stream_callback,
-                            thinking_callback=thinking_callback
+                            thinking_callback=thinking_callback,
+                            flush_interval=settings.get('ai_model.stream_flush_interval_ms', 30) / 1000.0
                         )
                     else:
                         response = self.client.chat_completion(**api_params)
+                    if response.success:
+                        self._record_prompt_cache_usage(response.data)
 
                 if iteration > 0:
                     logger.info(
@@ -685,6 +844,56 @@ class AIService:
                 'error': str(e)
             }
     
+    def _get_prompt_composer(self) -> PromptComposer:
+        """Get the prompt composer for the current endpoint and model."""
+        base_url = self._config.get('base_url', '')
+        model = self._config.get('model_name', '')
+        enabled = settings.get('ai_model.prompt_caching', True)
+        composer = self._prompt_composer
+        if (composer is None or composer.base_url != base_url.lower()
+                or composer.model != model.lower() or composer.enabled != enabled):
+            composer = PromptComposer(base_url, model, enabled=enabled)
+            self._prompt_composer = composer
+        return composer
+    
+    def _record_prompt_cache_usage(self, response_data: Optional[Dict[str, Any]]):
+        """Accumulate cached-token usage from a response."""
+        usage = (response_data or {}).get('usage')
+        cached = self.prompt_cache_stats.record(usage)
+        if cached:
+            logger.debug(
+                f"Prompt cache hit: {cached} cached tokens "
+                f"(session hit rate {self.prompt_cache_stats.hit_rate:.0%})"
+            )
+    
+    def _tool_token_reserve(self, tool_definitions: Optional[List[Dict[str, Any]]],
+                            tool_awareness: Optional[str]) -> int:
+        """Tokens taken by tool definitions and the tool awareness prompt (cached)."""
+        if not tool_definitions:
+            return 0
+        key = (id(tool_definitions), tool_awareness)
+        cached = self._tool_reserve_cache
+        if cached is None or cached[0] != key:
+            import json
+            tokens = count_tokens(json.dumps(tool_definitions))
+            if tool_awareness:
+                tokens += count_tokens(tool_awareness)
+            self._tool_reserve_cache = (key, tokens)
+            cached = self._tool_reserve_cache
+        return cached[1]
+    
+    def _get_tool_engine(self):
+        """Get the tool execution engine, creating it on first use."""
+        if self._tool_engine is None:
+            from ..skills.core.tool_execution import ToolExecutionEngine
+            from ..skills.core.skill_manager import skill_manager
+            self._tool_engine = ToolExecutionEngine(
+                skill_manager,
+                max_workers=settings.get('tools.max_parallel_tool_calls', 4),
+                default_timeout=settings.get('tools.execution_timeout_seconds', 120)
+            )
+        return self._tool_engine
+    
     def _extract_response_content(self, api_response: Dict[str, Any]) -> str:
         """Extract the text content from an API response."""
         try:
@@ -847,7 +1056,8 @@ class AIService:
                 'model': self._config.get('model_name'),
                 'base_url': self._config.get('base_url'),
                 'has_api_key': bool(self._config.get('api_key'))
-            }
+            },
+            'prompt_cache': self.prompt_cache_stats.to_dict()
         }
     
     def add_response_callback(self, callback: Callable[[str], None]):
@@ -865,10 +1075,17 @@ class AIService:
             self.client.close()
             self.client = None
         
+        if self._tool_engine is not None:
+            self._tool_engine.shutdown()
+            self._tool_engine = None
+        
         # Shutdown executor if it exists
-        if hasattr(self, '_executor'):
-            self._executor.shutdown(wait=True)
-            delattr(self, '_executor')
+        with self._executor_lock:
+            executor = getattr(self, '_executor', None)
+            if executor is not None:
+                delattr(self, '_executor')
+        if executor is not None:
+            executor.shutdown(wait=True)
         
         self._initialized = False
         self._response_callbacks.clear()
@@ -877,7 +1094,8 @@ class AIService:
     async def send_message_without_system_prompt_async(
         self, 
         message: str,
-        stream: bool = False
+        stream: bool = False,
+        max_tokens: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Send a message to the AI without system prompt (for title generation).
@@ -885,29 +1103,25 @@ class AIService:
         Args:
             message: User message to send
             stream: Whether to stream the response
+            max_tokens: Optional response budget (see send_message_without_system_prompt)
             
         Returns:
             Dict with response information
         """
         # Run the synchronous method in an executor
         import asyncio
-        import concurrent.futures
         
-        # Create executor if not exists
-        if not hasattr(self, '_executor'):
-            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-        
-        # Run sync method in executor
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
-            self._executor,
-            lambda: self.send_message_without_system_prompt(message, stream=stream)
+            self._get_async_executor(),
+            lambda: self.send_message_without_system_prompt(message, stream=stream, max_tokens=max_tokens)
         )
     
     def send_message_without_system_prompt(
         self, 
         message: str,
-        stream: bool = False
+        stream: bool = False,
+        max_tokens: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Send a message to the AI without system prompt (for title generation).
@@ -915,6 +1129,8 @@ class AIService:
         Args:
             message: User message to send
             stream: Whether to stream the response
+            max_tokens: Optional response budget for longer stateless
+                requests (e.g. summaries); replaces the short title cap
             
         Returns:
             Dict with response information including 'success', 'response', 'error'
@@ -940,7 +1156,7 @@ class AIService:
                 "model": model_name,
                 "messages": messages,
                 "temperature": self._config.get('temperature', 0.7),
-                "max_tokens": self._config.get('max_tokens', 16384),  # Updated default
+                "max_tokens": max_tokens or self._config.get('max_tokens', 16384),  # Updated default
                 "stream": stream
             }
             
@@ -957,7 +1173,7 @@ class AIService:
                     
                     # Limit max_tokens for gpt-5-nano to avoid issues (titles should be short anyway)
                     current_max_tokens = api_params.get('max_tokens', 16384)
-                    if current_max_tokens and current_max_tokens > 100:
+                    if max_tokens is None and current_max_tokens and current_max_tokens > 100:
                         api_params['max_tokens'] = 100
                         logger.info(f"Reduced max_tokens from {current_max_tokens} to 100 for {model_name} title generation")
             
@@ -981,7 +1197,9 @@ class AIService:
                 logger.error(f"Title generation API request failed: {response.error}")
                 return {
                     'success': False,
-                    'error': response.error
+                    'error': response.error,
+                    'status_code': response.status_code,
+                    'retry_after': retry_after_from_headers(response.headers)
                 }
                     
         except Exception as e:
@@ -8,16 +8,44 @@ with proper error handling, authentication, and retry logic.
 import json
 import logging
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, Any, Optional, List, AsyncIterator, Iterator
 from urllib.parse import urljoin
 import requests
 from dataclasses import dataclass
 
 from .session_manager import session_manager
+from .sse_stream import ChatStreamParser, DEFAULT_FLUSH_INTERVAL
 
 logger = logging.getLogger("specter.api_client")
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_from_headers(headers: Optional[Dict[str, str]]) -> Optional[float]:
+    """Return the Retry-After delay from a response header dict, matching the name case-insensitively."""
+    for name, value in (headers or {}).items():
+        if name.lower() == "retry-after":
+            return parse_retry_after(value)
+    return None
+
+
 @dataclass
 class APIResponse:
     """Standard API response wrapper."""
@@ -40,7 +68,7 @@ class AuthenticationError(APIClientError):
 
 class RateLimitError(APIClientError):
     """Rate limit exceeded."""
-    def __init__(self, message: str, retry_after: Optional[int] = None):
+    def __init__(self, message: str, retry_after: Optional[float] = None):
         super().__init__(message)
         self.retry_after = retry_after
 
@@ -139,12 +167,7 @@ class OpenAICompatibleClient:
         if response.status_code == 401:
             return AuthenticationError(f"Authentication failed: {error_message}")
         elif response.status_code == 429:
-            retry_after = None
-            if "retry-after" in response.headers:
-                try:
-                    retry_after = int(response.headers["retry-after"])
-                except ValueError:
-                    pass
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
             return RateLimitError(f"Rate limit exceeded: {error_message}", retry_after)
         elif response.status_code >= 500:
             return APIServerError(f"Server error: {error_message}")
@@ -402,6 +425,7 @@ class OpenAICompatibleClient:
         thinking_callback: Optional[callable] = None,
         verbosity: Optional[str] = None,
         reasoning_effort: Optional[str] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
         **kwargs
     ) -> APIResponse:
         """
@@ -416,10 +440,14 @@ class OpenAICompatibleClient:
             model: Model name
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
-            stream_callback: Called with each text chunk as it arrives
-            thinking_callback: Called with each reasoning/thinking chunk
+            stream_callback: Called with text as it arrives, in batches
+                coalesced over flush_interval
+            thinking_callback: Called with reasoning/thinking text, batched
+                the same way
             verbosity: GPT-5 verbosity level
             reasoning_effort: GPT-5 reasoning effort
+            flush_interval: Seconds between batched callback deliveries
+                (0 delivers every chunk immediately)
             **kwargs: Additional API parameters
 
         Returns:
@@ -449,6 +477,10 @@ class OpenAICompatibleClient:
             if reasoning_effort is not None:
                 data["reasoning_effort"] = reasoning_effort
 
+        # Ask for the usage block (incl. cached tokens) in the final chunk
+        if self.base_url and ('openai.com' in self.base_url or 'openrouter.ai' in self.base_url):
+            data.setdefault("stream_options", {"include_usage": True})
+
         url = urljoin(f"{self.base_url}/", "chat/completions")
         headers = {
             "Content-Type": "application/json",
@@ -483,153 +515,17 @@ class OpenAICompatibleClient:
                     headers=dict(response.headers)
                 )
 
-            # Parse SSE stream
-            full_content = ""
-            full_reasoning = ""
-            tool_calls_accum: Dict[int, Dict[str, Any]] = {}
-            finish_reason = None
-            model_name = model
-            usage = {}
-
-            for raw_line in response.iter_lines(decode_unicode=True):
-                if not raw_line:
-                    continue
-
-                line = raw_line.strip()
-                if not line.startswith("data:"):
-                    continue
-
-                payload = line[5:].strip()
-                if payload == "[DONE]":
+            # Parse the SSE stream from raw bytes as they arrive
+            parser = ChatStreamParser(
+                model,
+                stream_callback=stream_callback,
+                thinking_callback=thinking_callback,
+                flush_interval=flush_interval
+            )
+            for raw_chunk in response.iter_content(chunk_size=None):
+                if parser.feed(raw_chunk):
                     break
-
-                try:
-                    chunk = json.loads(payload)
-                except json.JSONDecodeError:
-                    logger.debug(f"Skipping malformed SSE chunk: {payload[:80]}")
-                    continue
-
-                # Extract model name from first chunk
-                if "model" in chunk:
-                    model_name = chunk["model"]
-
-                # OpenAI format: choices[0].delta
-                choices = chunk.get("choices", [])
-                if choices:
-                    delta = choices[0].get("delta", {})
-                    fr = choices[0].get("finish_reason")
-                    if fr:
-                        finish_reason = fr
-
-                    # Text content
-                    content_piece = delta.get("content")
-                    if content_piece:
-                        full_content += content_piece
-                        if stream_callback:
-                            try:
-                                stream_callback(content_piece)
-                            except Exception as cb_err:
-                                logger.debug(f"Stream callback error: {cb_err}")
-
-                    # Reasoning/thinking tokens (OpenAI o-series, DeepSeek R1)
-                    reasoning_piece = delta.get("reasoning_content")
-                    if reasoning_piece:
-                        full_reasoning += reasoning_piece
-                        if thinking_callback:
-                            try:
-                                thinking_callback(reasoning_piece)
-                            except Exception as cb_err:
-                                logger.debug(f"Thinking callback error: {cb_err}")
-
-                    # OpenRouter reasoning_details array
-                    reasoning_details = delta.get("reasoning_details")
-                    if reasoning_details and isinstance(reasoning_details, list):
-                        for rd in reasoning_details:
-                            if isinstance(rd, dict) and rd.get("type") in (
-                                "reasoning.text", "reasoning.summary"
-                            ):
-                                rd_text = rd.get("text", "")
-                                if rd_text:
-                                    full_reasoning += rd_text
-                                    if thinking_callback:
-                                        try:
-                                            thinking_callback(rd_text)
-                                        except Exception as cb_err:
-                                            logger.debug(f"Thinking callback error: {cb_err}")
-
-                    # Tool call deltas (accumulate across chunks)
-                    tc_deltas = delta.get("tool_calls", [])
-                    for tc_delta in tc_deltas:
-                        idx = tc_delta.get("index", 0)
-                        if idx not in tool_calls_accum:
-                            tool_calls_accum[idx] = {
-                                "id": tc_delta.get("id", ""),
-                                "type": "function",
-                                "function": {"name": "", "arguments": ""}
-                            }
-                        tc = tool_calls_accum[idx]
-                        if tc_delta.get("id"):
-                            tc["id"] = tc_delta["id"]
-                        fn = tc_delta.get("function", {})
-                        if fn.get("name"):
-                            tc["function"]["name"] = fn["name"]
-                        if fn.get("arguments"):
-                            tc["function"]["arguments"] += fn["arguments"]
-
-                # Anthropic format: content_block_delta
-                if chunk.get("type") == "content_block_delta":
-                    delta = chunk.get("delta", {})
-                    if delta.get("type") == "text_delta":
-                        text = delta.get("text", "")
-                        if text:
-                            full_content += text
-                            if stream_callback:
-                                try:
-                                    stream_callback(text)
-                                except Exception as cb_err:
-                                    logger.debug(f"Stream callback error: {cb_err}")
-                    # Anthropic thinking/reasoning delta
-                    elif delta.get("type") == "thinking_delta":
-                        thinking_text = delta.get("thinking", "")
-                        if thinking_text:
-                            full_reasoning += thinking_text
-                            if thinking_callback:
-                                try:
-                                    thinking_callback(thinking_text)
-                                except Exception as cb_err:
-                                    logger.debug(f"Thinking callback error: {cb_err}")
-
-                # Anthropic usage
-                if chunk.get("type") == "message_delta":
-                    usage = chunk.get("usage", usage)
-                    if chunk.get("delta", {}).get("stop_reason"):
-                        finish_reason = chunk["delta"]["stop_reason"]
-
-                # OpenAI usage in final chunk
-                if "usage" in chunk and chunk["usage"]:
-                    usage = chunk["usage"]
-
-            # Build assembled response matching non-streaming shape
-            assembled_message = {"role": "assistant", "content": full_content}
-            if full_reasoning:
-                assembled_message["reasoning_content"] = full_reasoning
-            if tool_calls_accum:
-                assembled_message["tool_calls"] = [
-                    tool_calls_accum[i]
-                    for i in sorted(tool_calls_accum.keys())
-                ]
-
-            assembled = {
-                "id": f"stream-{id(response)}",
-                "object": "chat.completion",
-                "model": model_name,
-                "choices": [{
-                    "index": 0,
-                    "message": assembled_message,
-                    "finish_reason": finish_reason or "stop"
-                }],
-                "usage": usage
-            }
+            assembled = parser.finish(f"stream-{id(response)}")
 
             return APIResponse(
                 success=True,
@@ -0,0 +1,180 @@
+"""
+Prompt Composer for Specter.
+
+Assembles chat requests so that content which rarely changes forms a stable
+prefix that providers can cache between turns:
+
+    system prompt -> tool awareness (tool schemas travel in ``tools``)
+    -> volatile system content (e.g. MemGPT core memory and stats)
+    -> conversation history -> latest message
+
+Anthropic-family models get ``cache_control`` breakpoints on the end of the
+stable system prefix and on the latest message. OpenAI applies prefix caching
+automatically; requests there carry a ``prompt_cache_key`` derived from the
+stable prefix to improve cache routing. Cached-token usage reported in the
+response ``usage`` block is accumulated in PromptCacheStats.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("specter.prompt_composer")
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+@dataclass
+class PromptCacheStats:
+    """Accumulated prompt-cache usage across requests."""
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of prompt tokens served from the provider cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def record(self, usage: Optional[Dict[str, Any]]) -> int:
+        """
+        Record one response's usage block.
+
+        Understands OpenAI (``prompt_tokens_details.cached_tokens``) and
+        Anthropic (``cache_read_input_tokens``/``cache_creation_input_tokens``)
+        shapes.
+
+        Returns:
+            Cached prompt tokens for this response
+        """
+        if not usage:
+            return 0
+
+        details = usage.get("prompt_tokens_details") or {}
+        cached = details.get("cached_tokens") or usage.get("cache_read_input_tokens") or 0
+        written = usage.get("cache_creation_input_tokens") or details.get("cache_write_tokens") or 0
+        if "prompt_tokens" in usage:
+            prompt = usage.get("prompt_tokens") or 0
+        else:
+            # Anthropic reports uncached input separately from cache reads/writes
+            prompt = (usage.get("input_tokens") or 0) + cached + written
+
+        self.requests += 1
+        self.prompt_tokens += prompt
+        self.cached_tokens += cached
+        self.cache_write_tokens += written
+        return cached
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class PromptComposer:
+    """
+    Orders request content as a stable prefix plus volatile suffix and adds
+    provider cache hints.
+
+    Example:
+        >>> composer = PromptComposer("https://openrouter.ai/api/v1", "anthropic/claude-sonnet-4")
+        >>> messages = composer.compose(history, [tool_awareness], system_prompt=system_prompt)
+        >>> params = composer.request_params(tools)
+    """
+
+    def __init__(self, base_url: str, model: str, enabled: bool = True):
+        self.base_url = (base_url or "").lower()
+        self.model = (model or "").lower()
+        self.enabled = enabled
+        self._stable_prefix = ""
+        self._key_cache: Optional[tuple] = None
+
+    @property
+    def uses_cache_control(self) -> bool:
+        """Whether the model takes explicit cache_control breakpoints (Anthropic family)."""
+        return self.enabled and ("claude" in self.model or self.model.startswith("anthropic/"))
+
+    @property
+    def uses_cache_key(self) -> bool:
+        """Whether the endpoint accepts prompt_cache_key (OpenAI)."""
+        return self.enabled and "api.openai.com" in self.base_url
+
+    def compose(
+        self,
+        messages: List[Dict[str, Any]],
+        stable_blocks: Sequence[str] = (),
+        volatile_blocks: Sequence[str] = (),
+        system_prompt: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the request message list.
+
+        A leading system message that is the configured `system_prompt` is
+        extended with `stable_blocks`, then `volatile_blocks`; other messages,
+        including other system messages such as the folded-history summary,
+        keep their order after it.
+
+        Args:
+            messages: Plain-text messages, system messages first
+            stable_blocks: System content identical across turns
+            volatile_blocks: System content that may change every turn
+            system_prompt: The configured system prompt, if any
+
+        Returns:
+            New message list; input dicts are not modified
+        """
+        stable = []
+        rest = list(messages)
+        if (system_prompt and rest and rest[0].get("role") == "system"
+                and rest[0].get("content") == system_prompt):
+            stable.append(rest.pop(0)["content"])
+        stable.extend(block for block in stable_blocks if block)
+        volatile = [block for block in volatile_blocks if block]
+        self._stable_prefix = "\n\n".join(stable)
+
+        composed: List[Dict[str, Any]] = []
+        if stable or volatile:
+            composed.append({"role": "system", "content": self._system_content(stable, volatile)})
+        composed.extend(dict(msg) for msg in rest)
+
+        if self.uses_cache_control and len(composed) > 1:
+            last = composed[-1]
+            if isinstance(last.get("content"), str) and last["content"]:
+                last["content"] = [{"type": "text", "text": last["content"], "cache_control": CACHE_CONTROL}]
+
+        return composed
+
+    def _system_content(self, stable: List[str], volatile: List[str]):
+        if not self.uses_cache_control:
+            return "\n\n".join(stable + volatile)
+
+        blocks = [{"type": "text", "text": text} for text in stable]
+        if blocks:
+            blocks[-1]["cache_control"] = CACHE_CONTROL
+        blocks.extend({"type": "text", "text": text} for text in volatile)
+        return blocks
+
+    def request_params(self, tools: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Extra request parameters carrying cache hints for the last composed
+        request (the cache key covers only the stable prefix and tools).
+        """
+        if not self.uses_cache_key or not self._stable_prefix:
+            return {}
+
+        key = (self._stable_prefix, id(tools))
+        if self._key_cache is None or self._key_cache[0] != key:
+            digest = hashlib.sha256()
+            digest.update(self.model.encode("utf-8"))
+            digest.update(self._stable_prefix.encode("utf-8"))
+            if tools:
+                digest.update(json.dumps(tools, sort_keys=True).encode("utf-8"))
+            self._key_cache = (key, f"specter-{digest.hexdigest()[:24]}")
+        return {"prompt_cache_key": self._key_cache[1]}
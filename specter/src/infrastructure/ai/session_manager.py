@@ -283,20 +283,17 @@ class SessionManager:
             logger.warning("Cannot import SettingsManager — using safe defaults")
             return {'verify': True, 'cert': None, 'thumbprint': None}
 
-        all_settings = settings.get_all()
-
         # --- SSL verification ---
-        ignore_ssl = all_settings.get('advanced', {}).get('ignore_ssl_verification', False)
+        ignore_ssl = settings.get_bool('advanced.ignore_ssl_verification', False)
 
         # --- PKI configuration ---
-        pki = all_settings.get('pki', {})
-        pki_enabled = pki.get('enabled', False)
-        auto_detect = pki.get('auto_detect', True)
-        thumbprint = pki.get('thumbprint') or None
+        pki_enabled = settings.get_bool('pki.enabled', False)
+        auto_detect = settings.get_bool('pki.auto_detect', True)
+        thumbprint = settings.get('pki.thumbprint') or None
         # Legacy PEM paths (backwards compat with old P12-extracted files)
-        cert_path = pki.get('client_cert_path')
-        key_path = pki.get('client_key_path')
-        ca_path = pki.get('ca_chain_path')
+        cert_path = settings.get('pki.client_cert_path')
+        key_path = settings.get('pki.client_key_path')
+        ca_path = settings.get('pki.ca_chain_path')
 
         # Compute verify parameter
         if ignore_ssl:
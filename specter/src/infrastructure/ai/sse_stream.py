@@ -0,0 +1,397 @@
+"""
+Server-Sent Events stream parsing for chat completions.
+
+Parses raw response bytes incrementally (no per-line decoding), decodes the
+common ``delta.content`` chunk without a full JSON parse, accumulates text in
+list buffers, and delivers stream callbacks in coalesced batches.
+
+Handles OpenAI-style ``choices[0].delta`` chunks (content, reasoning,
+OpenRouter reasoning_details, tool-call deltas, usage) and Anthropic-style
+``content_block_delta``/``message_delta`` events.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+logger = logging.getLogger("specter.sse_stream")
+
+# Default interval between coalesced stream callback deliveries (seconds)
+DEFAULT_FLUSH_INTERVAL = 0.03
+
+_DATA = b"data:"
+_DONE = b"[DONE]"
+_CONTENT_DELTA = b'"delta":{"content":"'
+_NULL_FINISH = b'"finish_reason":null'
+_USAGE = b'"usage":{'
+
+
+class SSEFramer:
+    """
+    Incremental SSE framer over raw byte chunks.
+
+    Returns the payload of each complete ``data:`` event. Multi-line data
+    fields are joined per the SSE spec; for servers that omit the blank line
+    between events, a new JSON object (or ``[DONE]``) line also completes the
+    previous one, and framing switches to line by line for the rest of the
+    stream so events are still delivered as they arrive.
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self._data: List[bytes] = []
+        # Set once the server is seen ending events with a single newline
+        self._line_mode = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Consume a chunk of bytes and return the completed event payloads."""
+        buffer = self._buffer + chunk if self._buffer else chunk
+        events: List[bytes] = []
+
+        if not self._line_mode and not self._data and b"\r" not in buffer:
+            # Common case: "data: {...}\n\n" events, one line each
+            blocks = buffer.split(b"\n\n")
+            rest = blocks.pop()
+            for block in blocks:
+                if block.startswith(b"data: ") and b"\n" not in block:
+                    events.append(block[6:])
+                else:
+                    self._feed_lines(block.split(b"\n"), events)
+                    self._end_event(events)
+            if b"\n" + _DATA not in rest:
+                self._buffer = rest
+                return events
+            # A new data line started without a blank line: this server
+            # separates events with single newlines, so frame by line from now
+            # on rather than waiting (and rescanning) for a "\n\n" that never comes
+            self._line_mode = True
+            buffer = rest
+
+        lines = buffer.split(b"\n")
+        self._buffer = lines.pop()
+        self._feed_lines(lines, events)
+        return events
+
+    def _feed_lines(self, lines: List[bytes], events: List[bytes]):
+        data = self._data
+        for line in lines:
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                self._end_event(events)
+                continue
+            if line.startswith(_DATA):
+                payload = line[6:] if line[5:6] == b" " else line[5:]
+                if data and (payload[:1] == b"{" or payload == _DONE) and data[-1].endswith(b"}"):
+                    self._end_event(events)
+                data.append(payload)
+            # Other fields (event:, id:, retry:) and comments are not used
+
+    def _end_event(self, events: List[bytes]):
+        data = self._data
+        if data:
+            events.append(data[0] if len(data) == 1 else b"\n".join(data))
+            data.clear()
+
+    def close(self) -> List[bytes]:
+        """Flush any event left without a terminating blank line."""
+        events = self.feed(b"\n\n") if self._buffer or self._data else []
+        self._buffer = b""
+        return events
+
+
+def fast_content_delta(payload: bytes) -> Optional[str]:
+    """
+    Extract delta.content from a plain content chunk without parsing JSON.
+
+    Only matches chunks whose delta holds nothing but content and whose
+    finish_reason is null, with no usage object. Returns None for anything
+    else (or content that cannot be isolated cheaply); callers then fall
+    back to a full parse.
+    """
+    start = payload.find(_CONTENT_DELTA)
+    if start < 0:
+        return None
+    start += len(_CONTENT_DELTA)
+    end = payload.find(b'"}', start)
+    if end < 0:
+        return None
+
+    raw = payload[start:end]
+    if b'"' in raw:
+        # Escaped quotes or more keys after content in the delta
+        return None
+    if payload.find(_NULL_FINISH, end, end + 48) < 0 or payload.find(_USAGE, end) >= 0:
+        return None
+    if b"\\" not in raw:
+        return raw.decode("utf-8")
+    if (len(raw) - len(raw.rstrip(b"\\"))) % 2:
+        return None  # The closing quote is escaped
+    return _loads(b'"' + raw + b'"')
+
+
+class CallbackBatcher:
+    """
+    Coalesces stream pieces into batched callback deliveries.
+
+    Pieces are delivered at most once per `flush_interval`; a timer makes
+    sure pending text is delivered even if the stream pauses. An interval
+    of 0 delivers every piece immediately.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str], None]], flush_interval: float):
+        self.callback = callback
+        self.flush_interval = flush_interval
+        self._pending: List[str] = []
+        self._last_flush = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def add(self, piece: str):
+        if self.callback is None:
+            return
+        if self.flush_interval <= 0:
+            self._deliver(piece)
+            return
+        with self._lock:
+            self._pending.append(piece)
+            elapsed = time.monotonic() - self._last_flush
+            if elapsed < self.flush_interval:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_interval - elapsed, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        """Deliver everything pending now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+            # Delivered under the lock so timer and stream flushes stay ordered
+            self._deliver(text)
+
+    def _deliver(self, text: str):
+        try:
+            self.callback(text)
+        except Exception as cb_err:
+            logger.debug(f"Stream callback error: {cb_err}")
+
+
+class ChatStreamParser:
+    """
+    Incremental parser turning an SSE chat-completion stream into the
+    assembled (non-streaming shaped) response.
+
+    Example:
+        >>> parser = ChatStreamParser(model, stream_callback=print)
+        >>> for chunk in response.iter_content(chunk_size=None):
+        ...     if parser.feed(chunk):
+        ...         break
+        >>> data = parser.finish()
+    """
+
+    def __init__(
+        self,
+        model: str,
+        stream_callback: Optional[Callable[[str], None]] = None,
+        thinking_callback: Optional[Callable[[str], None]] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
+        self.model_name = model
+        self._model_seen = False
+        self._framer = SSEFramer()
+        self._content = CallbackBatcher(stream_callback, flush_interval)
+        self._thinking = CallbackBatcher(thinking_callback, flush_interval)
+        self._content_parts: List[str] = []
+        self._reasoning_parts: List[str] = []
+        self._tool_calls: Dict[int, Dict[str, Any]] = {}
+        self.finish_reason: Optional[str] = None
+        self.usage: Dict[str, Any] = {}
+        self.done = False
+        self.chunks_parsed = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Consume raw response bytes.
+
+        Returns:
+            True once the ``[DONE]`` sentinel has been seen
+        """
+        for payload in self._framer.feed(chunk):
+            self._handle(payload)
+            if self.done:
+                break
+        return self.done
+
+    def _handle(self, payload: bytes):
+        if payload.startswith(_DONE):
+            self.done = True
+            return
+        self.chunks_parsed += 1
+
+        if self._model_seen:
+            text = fast_content_delta(payload)
+            if text is not None:
+                if text:
+                    self._add_content(text)
+                return
+
+        try:
+            chunk = _loads(payload)
+        except ValueError:
+            logger.debug(f"Skipping malformed SSE chunk: {payload[:80]!r}")
+            return
+        if isinstance(chunk, dict):
+            self._handle_chunk(chunk)
+
+    def _handle_chunk(self, chunk: Dict[str, Any]):
+        # Extract model name from first chunk
+        if "model" in chunk:
+            self.model_name = chunk["model"]
+            self._model_seen = True
+
+        # OpenAI format: choices[0].delta
+        choices = chunk.get("choices")
+        if choices:
+            delta = choices[0].get("delta") or {}
+            fr = choices[0].get("finish_reason")
+            if fr:
+                self.finish_reason = fr
+
+            # Text content
+            content_piece = delta.get("content")
+            if content_piece:
+                self._add_content(content_piece)
+
+            # Reasoning/thinking tokens (OpenAI o-series, DeepSeek R1)
+            reasoning_piece = delta.get("reasoning_content")
+            if reasoning_piece:
+                self._add_reasoning(reasoning_piece)
+
+            # OpenRouter reasoning_details array
+            reasoning_details = delta.get("reasoning_details")
+            if reasoning_details and isinstance(reasoning_details, list):
+                for rd in reasoning_details:
+                    if isinstance(rd, dict) and rd.get("type") in (
+                        "reasoning.text", "reasoning.summary"
+                    ):
+                        rd_text = rd.get("text", "")
+                        if rd_text:
+                            self._add_reasoning(rd_text)
+
+            # Tool call deltas (accumulate across chunks)
+            for tc_delta in delta.get("tool_calls") or ():
+                idx = tc_delta.get("index", 0)
+                if idx not in self._tool_calls:
+                    self._tool_calls[idx] = {
+                        "id": tc_delta.get("id", ""),
+                        "type": "function",
+                        "function": {"name": "", "arguments": []}
+                    }
+                tc = self._tool_calls[idx]
+                if tc_delta.get("id"):
+                    tc["id"] = tc_delta["id"]
+                fn = tc_delta.get("function") or {}
+                if fn.get("name"):
+                    tc["function"]["name"] = fn["name"]
+                if fn.get("arguments"):
+                    tc["function"]["arguments"].append(fn["arguments"])
+
+        chunk_type = chunk.get("type")
+
+        # Anthropic format: content_block_delta
+        if chunk_type == "content_block_delta":
+            delta = chunk.get("delta", {})
+            if delta.get("type") == "text_delta":
+                text = delta.get("text", "")
+                if text:
+                    self._add_content(text)
+            # Anthropic thinking/reasoning delta
+            elif delta.get("type") == "thinking_delta":
+                thinking_text = delta.get("thinking", "")
+                if thinking_text:
+                    self._add_reasoning(thinking_text)
+
+        # Anthropic usage
+        elif chunk_type == "message_delta":
+            self.usage = chunk.get("usage", self.usage)
+            if chunk.get("delta", {}).get("stop_reason"):
+                self.finish_reason = chunk["delta"]["stop_reason"]
+
+        # OpenAI usage in final chunk
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+
+    def _add_content(self, text: str):
+        self._content_parts.append(text)
+        if self._reasoning_parts:
+            # Reasoning shown so far is delivered before the answer text
+            self._thinking.flush()
+        self._content.add(text)
+
+    def _add_reasoning(self, text: str):
+        self._reasoning_parts.append(text)
+        self._thinking.add(text)
+
+    @property
+    def content(self) -> str:
+        return "".join(self._content_parts)
+
+    def finish(self, response_id: str = "stream") -> Dict[str, Any]:
+        """
+        Flush pending callbacks and build the assembled response.
+
+        Returns:
+            Response data in the non-streaming chat.completion shape
+        """
+        for payload in self._framer.close():
+            if self.done:
+                break
+            self._handle(payload)
+        self._content.flush()
+        self._thinking.flush()
+
+        # Build assembled response matching non-streaming shape
+        assembled_message = {"role": "assistant", "content": self.content}
+        if self._reasoning_parts:
+            assembled_message["reasoning_content"] = "".join(self._reasoning_parts)
+        if self._tool_calls:
+            tool_calls = []
+            for i in sorted(self._tool_calls):
+                tc = self._tool_calls[i]
+                tool_calls.append({
+                    **tc,
+                    "function": {
+                        "name": tc["function"]["name"],
+                        "arguments": "".join(tc["function"]["arguments"]),
+                    },
+                })
+            assembled_message["tool_calls"] = tool_calls
+
+        return {
+            "id": response_id,
+            "object": "chat.completion",
+            "model": self.model_name,
+            "choices": [{
+                "index": 0,
+                "message": assembled_message,
+                "finish_reason": self.finish_reason or "stop"
+            }],
+            "usage": self.usage
+        }
@@ -24,8 +24,9 @@ class ConversationContextAdapter:
         logger = logging.getLogger("specter.ai_integration")
         
         context = ConversationContext(
-            max_messages=conversation.metadata.custom_fields.get('max_messages', 50),
-            max_tokens=conversation.metadata.estimated_tokens or 32768  # Increased for modern models
+            max_messages=conversation.metadata.custom_fields.get('max_messages', 200),
+            # estimated_tokens is the conversation's size, not a context budget
+            max_tokens=conversation.metadata.custom_fields.get('max_context_tokens', 32768)
         )
         
         # Convert messages with proper error handling
@@ -36,7 +37,7 @@ class ConversationContextAdapter:
                     role=msg.role.value,
                     content=msg.content,
                     timestamp=msg.timestamp,
-                    token_count=msg.token_count
+                    token_count=msg.token_count or None
                 )
                 context.messages.append(context_msg)
                 converted_count += 1
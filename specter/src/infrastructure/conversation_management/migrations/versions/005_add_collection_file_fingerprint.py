@@ -0,0 +1,32 @@
+"""Add stat fingerprint columns to collection_files
+
+Revision ID: 005
+Revises: 79afc519981f
+Create Date: 2026-10-18 00:00:00.000000
+
+Records st_mtime_ns and st_ino alongside each checksum so integrity
+verification can skip re-hashing files whose (size, mtime, inode) are
+unchanged.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '79afc519981f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add fingerprint columns to collection_files."""
+    op.add_column('collection_files', sa.Column('mtime_ns', sa.BigInteger, nullable=True))
+    op.add_column('collection_files', sa.Column('inode', sa.BigInteger, nullable=True))
+
+
+def downgrade() -> None:
+    """Remove fingerprint columns from collection_files."""
+    op.drop_column('collection_files', 'inode')
+    op.drop_column('collection_files', 'mtime_ns')
@@ -0,0 +1,35 @@
+"""Add keyset pagination indexes to conversations
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 00:00:00.000000
+
+Composite (sort column, id) indexes let the conversation browser page
+through conversations with keyset pagination without sorting the table.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a (sort column, id) index for every keyset sort order."""
+    op.create_index('idx_conversations_updated_id', 'conversations', ['updated_at', 'id'], unique=False)
+    op.create_index('idx_conversations_created_id', 'conversations', ['created_at', 'id'], unique=False)
+    op.create_index('idx_conversations_title_id', 'conversations', ['title', 'id'], unique=False)
+    op.create_index('idx_conversations_message_count_id', 'conversations', ['message_count', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove the keyset pagination indexes."""
+    op.drop_index('idx_conversations_message_count_id', table_name='conversations')
+    op.drop_index('idx_conversations_title_id', table_name='conversations')
+    op.drop_index('idx_conversations_created_id', table_name='conversations')
+    op.drop_index('idx_conversations_updated_id', table_name='conversations')
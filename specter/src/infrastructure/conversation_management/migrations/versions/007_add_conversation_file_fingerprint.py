@@ -0,0 +1,34 @@
+"""Add checksum and stat fingerprint columns to conversation_files
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 00:00:00.000000
+
+Collection files are tagged conversation_files rows, so the checksum and
+(mtime, inode) fingerprint used by integrity verification are recorded
+there when a file is uploaded.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add checksum and fingerprint columns to conversation_files."""
+    op.add_column('conversation_files', sa.Column('checksum', sa.String(64), nullable=True))
+    op.add_column('conversation_files', sa.Column('mtime_ns', sa.BigInteger, nullable=True))
+    op.add_column('conversation_files', sa.Column('inode', sa.BigInteger, nullable=True))
+
+
+def downgrade() -> None:
+    """Remove checksum and fingerprint columns from conversation_files."""
+    op.drop_column('conversation_files', 'inode')
+    op.drop_column('conversation_files', 'mtime_ns')
+    op.drop_column('conversation_files', 'checksum')
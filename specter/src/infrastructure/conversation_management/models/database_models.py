@@ -9,7 +9,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List, Set, Optional
 from sqlalchemy import (
-    Column, String, Integer, Text, DateTime, Boolean, Float, 
+    Column, String, Integer, BigInteger, Text, DateTime, Boolean, Float, 
     ForeignKey, CheckConstraint, Index, JSON, text
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -81,7 +81,11 @@ class ConversationModel(Base):
         Index('idx_conversations_category_status', 'category', 'status'),
         Index('idx_conversations_status_only', 'status'),  # Fast status lookups
         Index('idx_conversations_non_deleted', 'status', 'updated_at', sqlite_where=text("status != 'deleted'")),  # Fast non-deleted lookup
-        Index('idx_conversations_active_updated', 'updated_at', sqlite_where=text("status != 'deleted'"))  # Fast sorting for active conversations
+        Index('idx_conversations_active_updated', 'updated_at', sqlite_where=text("status != 'deleted'")),  # Fast sorting for active conversations
+        Index('idx_conversations_updated_id', 'updated_at', 'id'),  # Keyset pagination by update time
+        Index('idx_conversations_created_id', 'created_at', 'id'),  # Keyset pagination by creation time
+        Index('idx_conversations_title_id', 'title', 'id'),  # Keyset pagination by title
+        Index('idx_conversations_message_count_id', 'message_count', 'id')  # Keyset pagination by message count
     )
     
     @validates('title')
@@ -390,6 +394,9 @@ class ConversationFileModel(Base):
     is_enabled = Column(Boolean, default=True, index=True)  # Whether file is enabled for context
     metadata_json = Column(Text, default='{}')
     collection_tag = Column(String(100), nullable=True, index=True)  # Tag for grouping files into collections
+    checksum = Column(String(64), nullable=True)  # SHA256 at upload, for integrity checks
+    mtime_ns = Column(BigInteger, nullable=True)  # Stat fingerprint at checksum time
+    inode = Column(BigInteger, nullable=True)
     
     # Relationships
     conversation = relationship("ConversationModel", back_populates="conversation_files")
@@ -537,6 +544,8 @@ class CollectionFileModel(Base):
     file_type = Column(String(100), nullable=False)
     added_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     checksum = Column(String(64), nullable=False, index=True)  # SHA256 hash
+    mtime_ns = Column(BigInteger, nullable=True)  # Stat fingerprint at checksum time
+    inode = Column(BigInteger, nullable=True)
 
     # Relationships - removed entirely to prevent recursion
     # collection = relationship("CollectionModel")
@@ -580,7 +589,9 @@ class CollectionFileModel(Base):
             file_size=self.file_size,
             file_type=self.file_type,
             added_at=self.added_at,
-            checksum=self.checksum
+            checksum=self.checksum,
+            mtime_ns=self.mtime_ns,
+            inode=self.inode
         )
 
 
@@ -23,6 +23,7 @@ class ConversationStatus(Enum):
 class ExportFormat(Enum):
     """Export format options."""
     JSON = "json"
+    JSONL = "jsonl"
     TXT = "txt"
     MARKDOWN = "md"
     HTML = "html"
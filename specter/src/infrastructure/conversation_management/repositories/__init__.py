@@ -6,5 +6,6 @@ Provides data access abstractions over SQLite database.
 
 from .conversation_repository import ConversationRepository
 from .database import DatabaseManager
+from .search_engine import ConversationSearchEngine, MessageMatch
 
-__all__ = ['ConversationRepository', 'DatabaseManager']
\ No newline at end of file
+__all__ = ['ConversationRepository', 'DatabaseManager', 'ConversationSearchEngine', 'MessageMatch']
\ No newline at end of file
@@ -85,7 +85,10 @@ class CollectionRepository:
                         'chunk_count': file.chunk_count,
                         'is_enabled': file.is_enabled,
                         'collection_tag': file.collection_tag,
-                        'conversation_id': file.conversation_id
+                        'conversation_id': file.conversation_id,
+                        'checksum': file.checksum,
+                        'mtime_ns': file.mtime_ns,
+                        'inode': file.inode
                     })
 
                 logger.debug(f"✓ Found {len(result)} files with tag '{tag}'")
@@ -224,3 +227,38 @@ class CollectionRepository:
         except Exception as e:
             logger.error(f"✗ Unexpected error deleting collection tag: {e}")
             return False
+
+    async def update_file_fingerprints(self, fingerprints: Dict[str, Dict]) -> int:
+        """
+        Record checksums and stat fingerprints for files.
+
+        Args:
+            fingerprints: Row id -> dict with checksum, file_size, mtime_ns
+                and inode
+
+        Returns:
+            Number of rows updated
+        """
+        if not fingerprints:
+            return 0
+        try:
+            with self.db.get_session() as session:
+                files = session.query(ConversationFileModel)\
+                    .filter(ConversationFileModel.id.in_(list(fingerprints)))\
+                    .all()
+                for file in files:
+                    fingerprint = fingerprints[file.id]
+                    file.checksum = fingerprint['checksum']
+                    file.file_size = fingerprint['file_size']
+                    file.mtime_ns = fingerprint['mtime_ns']
+                    file.inode = fingerprint['inode']
+
+                logger.debug(f"✓ Updated fingerprints for {len(files)} files")
+                return len(files)
+
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Database error updating file fingerprints: {e}")
+            return 0
+        except Exception as e:
+            logger.error(f"✗ Unexpected error updating file fingerprints: {e}")
+            return 0
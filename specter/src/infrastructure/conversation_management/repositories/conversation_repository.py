@@ -6,7 +6,7 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Set, Tuple
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 from uuid import uuid4
 
 from sqlalchemy.orm import joinedload, selectinload
@@ -376,7 +376,185 @@ class ConversationRepository:
         except SQLAlchemyError as e:
             logger.error(f"✗ Failed to list conversations: {e}")
             return []
-    
+
+    async def list_conversations_page(
+        self,
+        sort_order: SortOrder = SortOrder.UPDATED_DESC,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: int = 200,
+        status: Optional[ConversationStatus] = None,
+        include_deleted: bool = False
+    ) -> Tuple[List[Conversation], Optional[Tuple[Any, str]]]:
+        """
+        List one page of conversations using keyset pagination.
+
+        Rows are ordered by the sort column with the conversation id as a
+        tie-breaker, and `after` is the (sort value, id) cursor returned with
+        the previous page, so every page is an index range scan no matter how
+        deep the list has been scrolled.
+
+        Returns:
+            The page of conversations (without messages) and the cursor for
+            the next page, or None when this was the last page
+        """
+        column, descending = self._keyset_column(sort_order)
+        try:
+            with self.db.get_session() as session:
+                query = session.query(ConversationModel)
+
+                if status:
+                    query = query.filter(ConversationModel.status == status.value)
+                if not include_deleted:
+                    query = query.filter(ConversationModel.status != ConversationStatus.DELETED.value)
+
+                if after is not None:
+                    value, last_id = after
+                    if descending:
+                        query = query.filter(or_(
+                            column < value, and_(column == value, ConversationModel.id < last_id)
+                        ))
+                    else:
+                        query = query.filter(or_(
+                            column > value, and_(column == value, ConversationModel.id > last_id)
+                        ))
+
+                order = desc if descending else asc
+                conv_models = query.order_by(order(column), order(ConversationModel.id)).limit(limit).all()
+
+                conversations = []
+                for conv_model in conv_models:
+                    conversation = conv_model.to_domain_model()
+                    conversation.messages = []  # Don't load full messages for listing
+                    conversations.append(conversation)
+
+                next_cursor = None
+                if len(conv_models) == limit:
+                    last = conv_models[-1]
+                    next_cursor = (getattr(last, column.key), last.id)
+
+                return conversations, next_cursor
+
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Failed to list conversation page: {e}")
+            return [], None
+
+    async def count_conversations(
+        self,
+        status: Optional[ConversationStatus] = None,
+        include_deleted: bool = False
+    ) -> int:
+        """Count conversations matching the listing filters."""
+        try:
+            with self.db.get_session() as session:
+                query = session.query(func.count(ConversationModel.id))
+                if status:
+                    query = query.filter(ConversationModel.status == status.value)
+                if not include_deleted:
+                    query = query.filter(ConversationModel.status != ConversationStatus.DELETED.value)
+                return query.scalar() or 0
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Failed to count conversations: {e}")
+            return 0
+
+    async def get_conversations_by_ids(self, conversation_ids: List[str]) -> List[Conversation]:
+        """Get several conversations (without messages) in one query, in the given order."""
+        if not conversation_ids:
+            return []
+        try:
+            with self.db.get_session() as session:
+                conv_models = session.query(ConversationModel).filter(
+                    ConversationModel.id.in_(conversation_ids)
+                ).all()
+                by_id = {}
+                for conv_model in conv_models:
+                    conversation = conv_model.to_domain_model()
+                    conversation.messages = []
+                    by_id[conversation.id] = conversation
+                return [by_id[cid] for cid in conversation_ids if cid in by_id]
+
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Failed to get conversations by id: {e}")
+            return []
+
+    async def get_existing_conversation_ids(self, conversation_ids: List[str], batch_size: int = 500) -> List[str]:
+        """Return the ids that exist, in the given order, without loading the rows."""
+        found = set()
+        try:
+            with self.db.get_session() as session:
+                for start in range(0, len(conversation_ids), batch_size):
+                    chunk = conversation_ids[start:start + batch_size]
+                    found.update(row[0] for row in session.query(ConversationModel.id).filter(
+                        ConversationModel.id.in_(chunk)
+                    ))
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Failed to check conversation ids: {e}")
+            return []
+        return [cid for cid in dict.fromkeys(conversation_ids) if cid in found]
+
+    async def get_summarized_conversation_ids(self, conversation_ids: List[str], batch_size: int = 500) -> Set[str]:
+        """Return which of the given conversations already have a summary."""
+        summarized = set()
+        try:
+            with self.db.get_session() as session:
+                for start in range(0, len(conversation_ids), batch_size):
+                    chunk = conversation_ids[start:start + batch_size]
+                    summarized.update(row[0] for row in session.query(
+                        ConversationSummaryModel.conversation_id
+                    ).filter(ConversationSummaryModel.conversation_id.in_(chunk)))
+        except SQLAlchemyError as e:
+            logger.error(f"✗ Failed to check existing summaries: {e}")
+        return summarized
+
+    def iter_conversations_with_messages(
+        self,
+        conversation_ids: List[str],
+        batch_size: int = 50,
+        message_batch_size: int = 1000
+    ) -> Iterator[Conversation]:
+        """
+        Yield conversations with their messages and summary, in the given order.
+
+        Conversations are read `batch_size` at a time, with one query for the
+        batch's rows and one streamed (``yield_per``) query for its messages,
+        so memory is bounded by the batch rather than the whole selection.
+        Each batch's session is closed before its conversations are yielded.
+        Missing ids are skipped.
+        """
+        for start in range(0, len(conversation_ids), batch_size):
+            chunk = conversation_ids[start:start + batch_size]
+            try:
+                with self.db.get_session() as session:
+                    conv_models = session.query(ConversationModel).options(
+                        joinedload(ConversationModel.summary)
+                    ).filter(ConversationModel.id.in_(chunk)).all()
+
+                    by_id = {}
+                    for conv_model in conv_models:
+                        conversation = conv_model.to_domain_model()
+                        conversation.messages = []
+                        if conv_model.summary:
+                            conversation.summary = conv_model.summary.to_domain_model()
+                        by_id[conversation.id] = conversation
+
+                    message_rows = session.query(MessageModel).filter(
+                        MessageModel.conversation_id.in_(chunk)
+                    ).order_by(
+                        MessageModel.conversation_id, MessageModel.timestamp
+                    ).yield_per(message_batch_size)
+                    for msg_model in message_rows:
+                        conversation = by_id.get(msg_model.conversation_id)
+                        if conversation is not None:
+                            conversation.messages.append(msg_model.to_domain_model())
+
+            except SQLAlchemyError as e:
+                logger.error(f"✗ Failed to load conversation batch for export: {e}")
+                raise
+
+            for cid in chunk:
+                conversation = by_id.pop(cid, None)
+                if conversation is not None:
+                    yield conversation
+
     async def get_conversations_file_counts(self, conversation_ids: List[str]) -> Dict[str, int]:
         """Get file counts for multiple conversations in single batch query - solves N+1 problem."""
         try:
@@ -889,6 +1067,20 @@ class ConversationRepository:
         else:
             return query.order_by(desc(ConversationModel.updated_at))
     
+    def _keyset_column(self, sort_order: SortOrder):
+        """Column and direction used for keyset pagination in the given sort order."""
+        keyset_columns = {
+            SortOrder.CREATED_ASC: (ConversationModel.created_at, False),
+            SortOrder.CREATED_DESC: (ConversationModel.created_at, True),
+            SortOrder.UPDATED_ASC: (ConversationModel.updated_at, False),
+            SortOrder.UPDATED_DESC: (ConversationModel.updated_at, True),
+            SortOrder.TITLE_ASC: (ConversationModel.title, False),
+            SortOrder.TITLE_DESC: (ConversationModel.title, True),
+            SortOrder.MESSAGE_COUNT_ASC: (ConversationModel.message_count, False),
+            SortOrder.MESSAGE_COUNT_DESC: (ConversationModel.message_count, True),
+        }
+        return keyset_columns.get(sort_order, (ConversationModel.updated_at, True))
+    
     async def _generate_snippet(self, session, conversation_id: str, search_term: Optional[str], max_length: int = 200) -> str:
         """Generate search result snippet from FTS content."""
         try:
@@ -16,6 +16,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from ..models.database_models import Base
+from .search_engine import register_regexp
 
 logger = logging.getLogger("specter.conversation_db")
 
@@ -101,6 +102,8 @@ class DatabaseManager:
             cursor.execute("PRAGMA cache_size=10000")
             cursor.execute("PRAGMA temp_store=MEMORY")
             cursor.close()
+            # Allow "column REGEXP pattern" in queries
+            register_regexp(dbapi_connection)
         
         return engine
     
@@ -152,6 +155,11 @@ class DatabaseManager:
                 # Create tables directly without migrations
                 Base.metadata.create_all(self._engine)
             
+            # create_all() skips existing tables, so bring databases created
+            # before newer model columns and indexes up to date
+            self._add_missing_columns()
+            self._create_missing_indexes()
+            
             # Mark as initialized before testing connection
             self._initialized = True
             
@@ -171,6 +179,39 @@ class DatabaseManager:
             logger.error(f"✗ SQLAlchemy database initialization failed: {e}")
             return False
     
+    def _add_missing_columns(self) -> None:
+        """Add nullable model columns that existing tables don't have yet."""
+        from sqlalchemy import inspect, text
+        
+        inspector = inspect(self._engine)
+        existing_tables = set(inspector.get_table_names())
+        with self._engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+                present = {column['name'] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in present or not column.nullable:
+                        continue
+                    column_type = column.type.compile(dialect=self._engine.dialect)
+                    conn.execute(text(
+                        f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                    ))
+                    logger.info(f"Added column {table.name}.{column.name}")
+    
+    def _create_missing_indexes(self) -> None:
+        """Create model indexes that existing tables don't have yet."""
+        from sqlalchemy import inspect
+        from sqlalchemy.schema import CreateIndex
+        
+        existing_tables = set(inspect(self._engine).get_table_names())
+        with self._engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+    
     def get_engine(self) -> Engine:
         """Get the SQLAlchemy engine."""
         if not self._engine:
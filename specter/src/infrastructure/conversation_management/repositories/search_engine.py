@@ -0,0 +1,229 @@
+"""
+SQL-side conversation search.
+
+Matches conversation titles and message content inside SQLite rather than by
+loading conversations into Python: plain-text queries use ``instr``/``LIKE``
+and regex queries use a ``REGEXP`` function registered on the connection.
+Matching rows are streamed from a cursor, so the first results are available
+before the scan finishes, and a search can be cancelled from another thread
+(the running statement is interrupted through SQLite's progress handler).
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Optional, Pattern, Tuple, Union
+
+from ..models.search import SearchResult
+
+logger = logging.getLogger("specter.conversation_search")
+
+# SQLite VM instructions between cancellation checks
+PROGRESS_INTERVAL = 20000
+
+# Characters of context on each side of the first match in a snippet
+SNIPPET_CONTEXT = 60
+
+
+@lru_cache(maxsize=64)
+def _compile(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+def sqlite_regexp(pattern: Optional[str], value: Optional[str]) -> bool:
+    """``value REGEXP pattern`` for SQLite (patterns are compiled once)."""
+    if pattern is None or value is None:
+        return False
+    try:
+        return _compile(pattern).search(value) is not None
+    except re.error:
+        return False
+
+
+def register_regexp(connection: sqlite3.Connection) -> None:
+    """Register the REGEXP function on a DB-API SQLite connection."""
+    try:
+        connection.create_function("REGEXP", 2, sqlite_regexp, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):  # SQLite < 3.8.3
+        connection.create_function("REGEXP", 2, sqlite_regexp)
+
+
+@dataclass
+class MessageMatch:
+    """One matching title or message with the spans of every match in it."""
+    conversation_id: str
+    message_id: Optional[str]  # None for title matches
+    field: str                 # "title" or "content"
+    spans: List[Tuple[int, int]]
+    text: str
+    conversation_title: str
+
+    @property
+    def snippet(self) -> str:
+        """Text around the first match."""
+        start, end = self.spans[0]
+        lo = max(0, start - SNIPPET_CONTEXT)
+        hi = min(len(self.text), end + SNIPPET_CONTEXT)
+        snippet = self.text[lo:hi].replace("\n", " ")
+        return ("..." if lo > 0 else "") + snippet + ("..." if hi < len(self.text) else "")
+
+
+class ConversationSearchEngine:
+    """
+    Streams conversation search matches from the conversations database.
+
+    Each search opens its own read-only connection, so searches do not
+    contend with the application's SQLAlchemy session and can be cancelled
+    without affecting other queries.
+
+    Example:
+        >>> engine = ConversationSearchEngine(db_path)
+        >>> for result in engine.iter_results(r"def \\w+\\(", regex=True, cancel=event):
+        ...     show(result)
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_spans_per_text: int = 100):
+        self.db_path = Path(db_path)
+        self.max_spans_per_text = max_spans_per_text
+
+    def compile(self, query: str, regex: bool = False, case_sensitive: bool = False) -> Pattern:
+        """
+        Compile the Python pattern used for spans.
+
+        Raises:
+            re.error: If `regex` is set and `query` is not a valid pattern
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        return re.compile(query if regex else re.escape(query), flags)
+
+    def iter_matches(
+        self,
+        query: str,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        include_deleted: bool = False,
+        cancel: Optional[threading.Event] = None
+    ) -> Iterator[MessageMatch]:
+        """
+        Yield matches as the database produces them.
+
+        Title matches of a conversation come before its message matches;
+        conversations are ordered most recently updated first. Stops quietly
+        when `cancel` is set.
+
+        Raises:
+            re.error: For an invalid regex
+        """
+        pattern = self.compile(query, regex, case_sensitive)
+        condition, param = self._sql_condition(query, pattern, regex, case_sensitive)
+        status_clause = "" if include_deleted else "AND c.status != 'deleted'"
+
+        # Conversations are walked newest first along the (updated_at, id)
+        # index and each one's matches are read through the (conversation_id,
+        # timestamp) index, so nothing is sorted or buffered as a whole
+        # before the first match is yielded.
+        conversations_sql = f"""
+            SELECT c.id, c.title, {condition.format(column="c.title")}
+              FROM conversations c
+             WHERE 1 {status_clause}
+             ORDER BY c.updated_at DESC, c.id DESC
+        """
+        messages_sql = f"""
+            SELECT m.id, m.content
+              FROM messages m
+             WHERE m.conversation_id = ? AND {condition.format(column="m.content")}
+             ORDER BY m.timestamp
+        """
+
+        connection = self._connect(cancel)
+        try:
+            conversations = connection.execute(conversations_sql, (param,))
+            for conversation_id, title, title_matches in conversations:
+                if cancel is not None and cancel.is_set():
+                    return
+                if title_matches:
+                    spans = self._spans(pattern, title)
+                    if spans:
+                        yield MessageMatch(conversation_id, None, "title", spans, title, title)
+                for message_id, text in connection.execute(messages_sql, (conversation_id, param)):
+                    if cancel is not None and cancel.is_set():
+                        return
+                    spans = self._spans(pattern, text)
+                    if spans:
+                        yield MessageMatch(conversation_id, message_id, "content", spans, text, title)
+        except sqlite3.OperationalError:
+            if cancel is not None and cancel.is_set():
+                logger.debug("Conversation search cancelled")
+                return
+            raise
+        finally:
+            connection.close()
+
+    def _spans(self, pattern: Pattern, text: Optional[str]) -> List[Tuple[int, int]]:
+        """Spans of the non-empty matches in `text`, capped at max_spans_per_text."""
+        spans = []
+        for match in pattern.finditer(text or ""):
+            if match.end() > match.start():
+                spans.append(match.span())
+                if len(spans) >= self.max_spans_per_text:
+                    break
+        return spans
+
+    def iter_results(
+        self,
+        query: str,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        include_deleted: bool = False,
+        cancel: Optional[threading.Event] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[SearchResult]:
+        """
+        Yield one SearchResult per matching conversation, as soon as all of
+        its matches have been read.
+        """
+        current: Optional[SearchResult] = None
+        count = 0
+        for match in self.iter_matches(query, regex, case_sensitive, include_deleted, cancel):
+            if current is None or match.conversation_id != current.conversation_id:
+                if current is not None:
+                    yield current
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+                current = SearchResult(conversation_id=match.conversation_id,
+                                       title=match.conversation_title)
+            if match.field == "content" and current.snippet is None:
+                current.snippet = match.snippet
+            current.match_count += len(match.spans)
+            current.relevance_score = float(current.match_count)
+            if match.field not in current.matched_fields:
+                current.matched_fields.append(match.field)
+        if current is not None and not (cancel is not None and cancel.is_set()):
+            yield current
+
+    def _sql_condition(self, query: str, pattern: Pattern, regex: bool,
+                       case_sensitive: bool) -> Tuple[str, str]:
+        """SQL predicate template (``{column}`` placeholder) and its parameter."""
+        if not regex and case_sensitive:
+            return "instr({column}, ?) > 0", query
+        if not regex and query.isascii():
+            # LIKE is case-insensitive for ASCII and runs entirely in SQLite
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return "{column} LIKE ? ESCAPE '\\'", f"%{escaped}%"
+        prefix = "" if case_sensitive else "(?i)"
+        return "{column} REGEXP ?", prefix + pattern.pattern
+
+    def _connect(self, cancel: Optional[threading.Event]) -> sqlite3.Connection:
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Conversation database not found: {self.db_path}")
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        register_regexp(connection)
+        if cancel is not None:
+            connection.set_progress_handler(lambda: 1 if cancel.is_set() else 0, PROGRESS_INTERVAL)
+        return connection
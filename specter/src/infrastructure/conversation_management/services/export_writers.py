@@ -0,0 +1,482 @@
+"""
+Streaming writers for conversation exports.
+
+Each writer emits its format one conversation at a time to a text stream,
+so an export never holds more than the conversations currently being
+written in memory.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional, TextIO, Type
+
+from ..models.conversation import Conversation
+from ..models.enums import ExportFormat, MessageRole
+
+logger = logging.getLogger("specter.export_writers")
+
+COMPRESSIONS = ("gzip", "zip")
+
+_markdown_renderer = None
+
+
+def resolve_compression(file_path: str, compression: Optional[str] = None) -> Optional[str]:
+    """Return the compression to use, inferring it from a .gz/.zip suffix when not given."""
+    if compression:
+        compression = compression.lower()
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        return compression
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix == ".gz":
+        return "gzip"
+    if suffix == ".zip":
+        return "zip"
+    return None
+
+
+@contextmanager
+def open_export_stream(file_path: str, compression: Optional[str] = None) -> Iterator[TextIO]:
+    """
+    Open a UTF-8 text stream for an export, optionally compressed.
+
+    Zip archives hold a single member named after the archive without its
+    ``.zip`` suffix.
+    """
+    compression = resolve_compression(file_path, compression)
+    if compression == "gzip":
+        with gzip.open(file_path, "wt", encoding="utf-8") as stream:
+            yield stream
+    elif compression == "zip":
+        member = os.path.basename(file_path)
+        if member.lower().endswith(".zip"):
+            member = member[:-4]
+        with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(member, "w") as raw:
+                with io.TextIOWrapper(raw, encoding="utf-8") as stream:
+                    yield stream
+    else:
+        with open(file_path, "w", encoding="utf-8") as stream:
+            yield stream
+
+
+def escape_html(text: str) -> str:
+    """Escape HTML characters."""
+    return (text
+            .replace('&', '&amp;')
+            .replace('<', '&lt;')
+            .replace('>', '&gt;')
+            .replace('"', '&quot;')
+            .replace("'", '&#39;'))
+
+
+def markdown_to_html(text: str) -> str:
+    """Convert markdown text to HTML, reusing one renderer for the whole export."""
+    global _markdown_renderer
+    if _markdown_renderer is None:
+        _markdown_renderer = _create_markdown_renderer()
+    return _markdown_renderer(text)
+
+
+def _create_markdown_renderer():
+    """Build the best available markdown renderer."""
+    try:
+        from markdown_it import MarkdownIt
+
+        md = (
+            MarkdownIt("commonmark")
+            .enable(["table", "strikethrough"])  # Enable additional features
+            .enable_many(["replacements", "smartquotes"])  # Typography improvements
+        )
+
+        # Configure for safety
+        md.options.update({
+            "html": False,  # Don't allow raw HTML for safety
+            "linkify": True,  # Auto-linkify URLs
+            "typographer": True,  # Smart quotes and dashes
+            "breaks": True,  # Convert \n to <br>
+        })
+        return md.render
+
+    except ImportError:
+        # If markdown-it-py not available, try the standard markdown library
+        try:
+            import markdown
+            md = markdown.Markdown(extensions=[
+                'fenced_code',
+                'tables',
+                'nl2br',
+                'sane_lists'
+            ])
+
+            def render(text: str) -> str:
+                md.reset()
+                return md.convert(text)
+
+            return render
+        except ImportError:
+            # Fall back to basic conversion
+            return basic_markdown_to_html
+
+
+def basic_markdown_to_html(text: str) -> str:
+    """Basic markdown to HTML conversion without library."""
+    # Escape HTML first
+    html = escape_html(text)
+
+    # Convert code blocks
+    html = re.sub(r'```(\w+)?\n(.*?)\n```', r'<pre><code class="\1">\2</code></pre>', html, flags=re.DOTALL)
+    html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
+
+    # Convert headers
+    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
+    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
+    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+
+    # Convert bold and italic
+    html = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', html)
+    html = re.sub(r'\*([^*]+)\*', r'<em>\1</em>', html)
+
+    # Convert lists
+    html = re.sub(r'^- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
+    html = re.sub(r'(<li>.*</li>\n?)+', r'<ul>\g<0></ul>', html, flags=re.DOTALL)
+
+    # Convert blockquotes
+    html = re.sub(r'^> (.+)$', r'<blockquote>\1</blockquote>', html, flags=re.MULTILINE)
+
+    # Convert links
+    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
+
+    # Convert line breaks
+    html = html.replace('\n\n', '</p><p>').replace('\n', '<br>')
+    html = f'<p>{html}</p>'
+
+    return html
+
+
+def conversation_export_dict(conversation: Conversation, include_metadata: bool) -> Dict:
+    """Serialize a conversation for JSON exports."""
+    conv_data = conversation.to_dict(include_messages=True)
+
+    # Remove sensitive metadata if requested
+    if not include_metadata:
+        conv_data.pop('metadata', None)
+        for message in conv_data.get('messages', []):
+            message.pop('metadata', None)
+    return conv_data
+
+
+class ExportWriter:
+    """
+    Base class for streaming export writers.
+
+    ``begin`` writes the document header, ``write_conversation`` is called
+    once per conversation in export order and ``end`` closes the document.
+    """
+
+    format_name = ""
+
+    def __init__(self, stream: TextIO, include_metadata: bool = True):
+        self.stream = stream
+        self.include_metadata = include_metadata
+        self.exported_at = datetime.now()
+
+    def begin(self, conversation_count: int) -> None:
+        """Write the export header."""
+
+    def write_conversation(self, conversation: Conversation, index: int) -> None:
+        """Write one conversation; ``index`` is 1-based."""
+        raise NotImplementedError
+
+    def end(self) -> None:
+        """Write the export footer."""
+
+
+class JsonExportWriter(ExportWriter):
+    """Writes a JSON document whose conversation array is streamed element by element."""
+
+    format_name = "JSON"
+
+    def begin(self, conversation_count: int) -> None:
+        export_info = {
+            'format': 'json',
+            'version': '1.0',
+            'exported_at': self.exported_at.isoformat(),
+            'conversation_count': conversation_count,
+            'include_metadata': self.include_metadata
+        }
+        info = json.dumps(export_info, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        self.stream.write(f'{{\n  "export_info": {info},\n  "conversations": [')
+        self._empty = True
+
+    def write_conversation(self, conversation: Conversation, index: int) -> None:
+        conv_data = conversation_export_dict(conversation, self.include_metadata)
+        body = json.dumps(conv_data, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        self.stream.write(("\n    " if self._empty else ",\n    ") + body)
+        self._empty = False
+
+    def end(self) -> None:
+        self.stream.write("]\n}" if self._empty else "\n  ]\n}")
+
+
+class JsonLinesExportWriter(ExportWriter):
+    """Writes one JSON object per line, one line per conversation."""
+
+    format_name = "JSON Lines"
+
+    def write_conversation(self, conversation: Conversation, index: int) -> None:
+        conv_data = conversation_export_dict(conversation, self.include_metadata)
+        self.stream.write(json.dumps(conv_data, ensure_ascii=False))
+        self.stream.write("\n")
+
+
+class TextExportWriter(ExportWriter):
+    """Writes a plain text transcript."""
+
+    format_name = "TXT"
+
+    def begin(self, conversation_count: int) -> None:
+        f = self.stream
+        f.write(f"Specter Conversation Export\n")
+        f.write(f"Exported: {self.exported_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Conversations: {conversation_count}\n")
+        f.write("=" * 80 + "\n\n")
+
+    def write_conversation(self, conversation: Conversation, index: int) -> None:
+        f = self.stream
+        # Conversation header
+        f.write(f"CONVERSATION {index}: {conversation.title}\n")
+        f.write(f"Status: {conversation.status.value.title()}\n")
+        f.write(f"Created: {conversation.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Updated: {conversation.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Messages: {len(conversation.messages)}\n")
+
+        # Metadata
+        if self.include_metadata and conversation.metadata:
+            if conversation.metadata.tags:
+                f.write(f"Tags: {', '.join(conversation.metadata.tags)}\n")
+            if conversation.metadata.category:
+                f.write(f"Category: {conversation.metadata.category}\n")
+
+        # Summary
+        if conversation.summary:
+            f.write(f"Summary: {conversation.summary.summary}\n")
+
+        f.write("-" * 40 + "\n")
+
+        # Messages
+        for message in conversation.messages:
+            timestamp = message.timestamp.strftime('%H:%M:%S')
+
+            if message.role == MessageRole.SYSTEM:
+                f.write(f"[{timestamp}] SYSTEM: {message.content}\n")
+            elif message.role == MessageRole.USER:
+                f.write(f"[{timestamp}] USER: {message.content}\n")
+            else:  # ASSISTANT
+                f.write(f"[{timestamp}] ASSISTANT: {message.content}\n")
+            f.write("\n")
+
+        f.write("=" * 80 + "\n\n")
+
+
+class MarkdownExportWriter(ExportWriter):
+    """Writes a Markdown document."""
+
+    format_name = "Markdown"
+
+    def begin(self, conversation_count: int) -> None:
+        f = self.stream
+        f.write("# Specter Conversation Export\n\n")
+        f.write(f"**Exported:** {self.exported_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"**Conversations:** {conversation_count}\n\n")
+        f.write("---\n\n")
+
+    def write_conversation(self, conversation: Conversation, index: int) -> None:
+        f = self.stream
+        # Conversation header
+        f.write(f"## {index}. {conversation.title}\n\n")
+
+        # Metadata table
+        f.write("| Property | Value |\n")
+        f.write("|----------|-------|\n")
+        f.write(f"| Status | {conversation.status.value.title()} |\n")
+        f.write(f"| Created | {conversation.created_at.strftime('%Y-%m-%d %H:%M:%S')} |\n")
+        f.write(f"| Updated | {conversation.updated_at.strftime('%Y-%m-%d %H:%M:%S')} |\n")
+        f.write(f"| Messages | {len(conversation.messages)} |\n")
+
+        if self.include_metadata and conversation.metadata:
+            if conversation.metadata.tags:
+                tags_str = ", ".join(f"`{tag}`" for tag in conversation.metadata.tags)
+                f.write(f"| Tags | {tags_str} |\n")
+            if conversation.metadata.category:
+                f.write(f"| Category | {conversation.metadata.category} |\n")
+
+        f.write("\n")
+
+        # Summary
+        if conversation.summary:
+            f.write("### Summary\n\n")
+            f.write(f"{conversation.summary.summary}\n\n")
+            if conversation.summary.key_topics:
+                f.write("**Key Topics:** ")
+                f.write(", ".join(f"`{topic}`" for topic in conversation.summary.key_topics))
+                f.write("\n\n")
+
+        # Messages
+        f.write("### Messages\n\n")
+
+        for message in conversation.messages:
+            timestamp = message.timestamp.strftime('%H:%M:%S')
+
+            if message.role == MessageRole.SYSTEM:
+                f.write(f"**🔧 SYSTEM** `{timestamp}`\n\n")
+                f.write(f"> {message.content}\n\n")
+            elif message.role == MessageRole.USER:
+                f.write(f"**👤 USER** `{timestamp}`\n\n")
+                f.write(f"{message.content}\n\n")
+            else:  # ASSISTANT
+                f.write(f"**👻 ASSISTANT** `{timestamp}`\n\n")
+                f.write(f"{message.content}\n\n")
+
+        f.write("---\n\n")
+
+
+_HTML_HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Specter Conversation Export</title>
+    <style>
+        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif; line-height: 1.6; margin: 40px; background: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        h1 {{ color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }}
+        h2 {{ color: #444; margin-top: 40px; padding: 15px; background: #f8f9fa; border-radius: 5px; border-left: 4px solid #007bff; }}
+        .metadata {{ background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; }}
+        .metadata table {{ width: 100%; border-collapse: collapse; }}
+        .metadata td {{ padding: 8px; border-bottom: 1px solid #dee2e6; }}
+        .metadata td:first-child {{ font-weight: bold; width: 150px; }}
+        .message {{ margin: 20px 0; padding: 15px; border-radius: 5px; position: relative; }}
+        .system {{ background: #e9ecef; border-left: 4px solid #6c757d; }}
+        .user {{ background: #e7f3ff; border-left: 4px solid #007bff; }}
+        .assistant {{ background: #e8f5e8; border-left: 4px solid #28a745; }}
+        .message-header {{ font-weight: bold; margin-bottom: 10px; display: flex; justify-content: space-between; align-items: center; }}
+        .timestamp {{ font-size: 0.9em; color: #666; }}
+        .content {{ white-space: pre-wrap; line-height: 1.6; }}
+        .content h1, .content h2, .content h3 {{ margin: 15px 0 10px 0; color: #333; }}
+        .content code {{ background: #f4f4f4; padding: 2px 5px; border-radius: 3px; font-family: monospace; }}
+        .content pre {{ background: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }}
+        .content pre code {{ background: none; padding: 0; }}
+        .content blockquote {{ border-left: 4px solid #ddd; margin: 10px 0; padding-left: 15px; color: #666; }}
+        .content ul, .content ol {{ margin: 10px 0; padding-left: 30px; }}
+        .content strong {{ font-weight: 600; color: #000; }}
+        .content em {{ font-style: italic; }}
+        .content a {{ color: #007bff; text-decoration: none; }}
+        .content a:hover {{ text-decoration: underline; }}
+        .summary {{ background: #fff3cd; padding: 15px; border-radius: 5px; margin: 20px 0; border-left: 4px solid #ffc107; }}
+        .tags {{ margin: 10px 0; }}
+        .tag {{ background: #007bff; color: white; padding: 3px 8px; border-radius: 12px; font-size: 0.8em; margin-right: 5px; }}
+        .conversation-separator {{ border: none; height: 2px; background: linear-gradient(to right, #007bff, transparent); margin: 40px 0; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>👻 Specter Conversation Export</h1>
+        <div class="metadata">
+            <table>
+                <tr><td>Exported</td><td>{export_time}</td></tr>
+                <tr><td>Conversations</td><td>{conversation_count}</td></tr>
+                <tr><td>Format</td><td>HTML</td></tr>
+            </table>
+        </div>
+"""
+
+
+class HtmlExportWriter(ExportWriter):
+    """Writes a styled HTML document, rendering message markdown as it goes."""
+
+    format_name = "HTML"
+
+    def begin(self, conversation_count: int) -> None:
+        self.stream.write(_HTML_HEADER.format(
+            export_time=self.exported_at.strftime('%Y-%m-%d %H:%M:%S'),
+            conversation_count=conversation_count
+        ))
+
+    def write_conversation(self, conversation: Conversation, index: int) -> None:
+        # Chunk each conversation into one write rather than dozens of small ones
+        parts = []
+        add = parts.append
+
+        if index > 1:
+            add('        <hr class="conversation-separator">\n')
+
+        # Conversation section
+        add(f'        <h2>{index}. {escape_html(conversation.title)}</h2>\n')
+
+        # Metadata
+        add('        <div class="metadata">\n')
+        add('            <table>\n')
+        add(f'                <tr><td>Status</td><td>{conversation.status.value.title()}</td></tr>\n')
+        add(f'                <tr><td>Created</td><td>{conversation.created_at.strftime("%Y-%m-%d %H:%M:%S")}</td></tr>\n')
+        add(f'                <tr><td>Updated</td><td>{conversation.updated_at.strftime("%Y-%m-%d %H:%M:%S")}</td></tr>\n')
+        add(f'                <tr><td>Messages</td><td>{len(conversation.messages)}</td></tr>\n')
+
+        if self.include_metadata and conversation.metadata:
+            if conversation.metadata.tags:
+                tags_html = ''.join(f'<span class="tag">{escape_html(tag)}</span>' for tag in conversation.metadata.tags)
+                add(f'                <tr><td>Tags</td><td>{tags_html}</td></tr>\n')
+            if conversation.metadata.category:
+                add(f'                <tr><td>Category</td><td>{escape_html(conversation.metadata.category)}</td></tr>\n')
+
+        add('            </table>\n')
+        add('        </div>\n')
+
+        # Summary
+        if conversation.summary:
+            add('        <div class="summary">\n')
+            add('            <h3>📝 Summary</h3>\n')
+            # Convert markdown in summary too
+            add(f'            <div>{markdown_to_html(conversation.summary.summary)}</div>\n')
+            if conversation.summary.key_topics:
+                topics_html = ''.join(f'<span class="tag">{escape_html(topic)}</span>' for topic in conversation.summary.key_topics)
+                add(f'            <p><strong>Key Topics:</strong> {topics_html}</p>\n')
+            add('        </div>\n')
+
+        # Messages
+        for message in conversation.messages:
+            role_class = message.role.value.lower()
+            role_icon = {'system': '🔧', 'user': '👤', 'assistant': '👻'}.get(role_class, '💬')
+            timestamp = message.timestamp.strftime('%H:%M:%S')
+
+            add(f'        <div class="message {role_class}">\n')
+            add(f'            <div class="message-header">\n')
+            add(f'                <span>{role_icon} {message.role.value.upper()}</span>\n')
+            add(f'                <span class="timestamp">{timestamp}</span>\n')
+            add(f'            </div>\n')
+            # Convert markdown to HTML for better formatting
+            add(f'            <div class="content">{markdown_to_html(message.content)}</div>\n')
+            add(f'        </div>\n')
+
+        self.stream.write(''.join(parts))
+
+    def end(self) -> None:
+        self.stream.write("""    </div>
+</body>
+</html>""")
+
+
+EXPORT_WRITERS: Dict[ExportFormat, Type[ExportWriter]] = {
+    ExportFormat.JSON: JsonExportWriter,
+    ExportFormat.JSONL: JsonLinesExportWriter,
+    ExportFormat.TXT: TextExportWriter,
+    ExportFormat.MARKDOWN: MarkdownExportWriter,
+    ExportFormat.HTML: HtmlExportWriter,
+}
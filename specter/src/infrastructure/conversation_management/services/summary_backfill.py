@@ -0,0 +1,224 @@
+"""
+Concurrent summary backfill.
+
+Generates summaries for many conversations with a bounded number of
+requests in flight, paced by a token bucket that also honors the
+provider's Retry-After, and checkpoints progress so an interrupted
+backfill resumes where it stopped.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .summary_service import SummaryService
+
+logger = logging.getLogger("specter.summary_backfill")
+
+CHECKPOINT_VERSION = 1
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter.
+
+    Tokens refill at `rate` per second up to `capacity`; each `acquire`
+    takes one. `pause` stops every caller until a Retry-After delay has
+    passed, then restarts from an empty bucket so requests ramp back up.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (e.g. from a Retry-After header)."""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = max(now, self._paused_until)
+
+
+class SummaryBackfill:
+    """
+    Generates summaries for a list of conversations concurrently.
+
+    At most `concurrency` generations run at once and requests are paced
+    to `requests_per_minute`. Rate-limited requests are retried after the
+    provider's Retry-After delay, up to `max_attempts` times. When
+    `checkpoint_path` is set, results are saved there as they finish so a
+    later run skips conversations already summarized; the checkpoint is
+    removed once a run completes.
+    """
+
+    def __init__(
+        self,
+        service: "SummaryService",
+        concurrency: int = 4,
+        requests_per_minute: float = 60,
+        checkpoint_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_attempts: int = 3,
+        checkpoint_every: int = 20
+    ):
+        self.service = service
+        self.concurrency = max(1, concurrency)
+        self.bucket = TokenBucket(requests_per_minute / 60.0, capacity=self.concurrency)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.progress_callback = progress_callback
+        self.max_attempts = max(1, max_attempts)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self._done: Dict[str, bool] = {}
+        self._unsaved = 0
+
+    async def run(self, conversation_ids: List[str], skip_existing: bool = True) -> Dict[str, bool]:
+        """Summarize the conversations and return the outcome for each."""
+        conversation_ids = list(dict.fromkeys(conversation_ids))
+        self._done = self._load_checkpoint()
+        results = {cid: True for cid in conversation_ids if self._done.get(cid)}
+
+        pending = [cid for cid in conversation_ids if cid not in results]
+        if skip_existing and pending:
+            summarized = await self.service.repository.get_summarized_conversation_ids(pending)
+            results.update((cid, True) for cid in pending if cid in summarized)
+            pending = [cid for cid in pending if cid not in summarized]
+
+        total = len(conversation_ids)
+        finished = len(results)
+        logger.info(f"Summary backfill: {len(pending)} to generate, {finished} already done")
+
+        if pending:
+            ai_service = await self.service._get_ai_service()
+            if ai_service is None:
+                logger.error("AI service not available for summary backfill")
+                results.update((cid, False) for cid in pending)
+                return {cid: results[cid] for cid in conversation_ids}
+            ai_service.ensure_async_workers(self.concurrency)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for cid in pending:
+            queue.put_nowait(cid)
+
+        def record(conv_id: str, success: bool) -> None:
+            nonlocal finished
+            results[conv_id] = success
+            self._done[conv_id] = success
+            finished += 1
+            self._unsaved += 1
+            if self._unsaved >= self.checkpoint_every:
+                self._save_checkpoint()
+            if self.progress_callback:
+                self.progress_callback(finished, total)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    conv_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                record(conv_id, await self._summarize(conv_id))
+
+        try:
+            workers = min(self.concurrency, len(pending))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            # Also reached on cancellation, so an interrupted run can resume
+            self._save_checkpoint()
+
+        self._remove_checkpoint()
+        succeeded = sum(1 for ok in results.values() if ok)
+        logger.info(f"✓ Summary backfill finished: {succeeded}/{total} summarized")
+        return {cid: results[cid] for cid in conversation_ids}
+
+    async def _summarize(self, conversation_id: str) -> bool:
+        """Generate one summary, backing off on rate limits."""
+        for attempt in range(1, self.max_attempts + 1):
+            await self.bucket.acquire()
+            try:
+                success, retry_after = await self.service._generate_summary(conversation_id)
+            except Exception as e:
+                logger.error(f"✗ Batch summary failed for {conversation_id}: {e}")
+                return False
+            if retry_after is None:
+                return success
+            logger.warning(
+                f"Rate limited summarizing {conversation_id}, waiting {retry_after:.1f}s "
+                f"(attempt {attempt}/{self.max_attempts})"
+            )
+            self.bucket.pause(retry_after)
+        return False
+
+    def _load_checkpoint(self) -> Dict[str, bool]:
+        """Read finished conversations from the checkpoint, if any."""
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return {}
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            if data.get("version") != CHECKPOINT_VERSION:
+                return {}
+            done = {str(cid): bool(ok) for cid, ok in data.get("results", {}).items()}
+            logger.info(f"Resuming summary backfill from checkpoint ({len(done)} finished)")
+            return done
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable summary checkpoint {self.checkpoint_path}: {e}")
+            return {}
+
+    def _save_checkpoint(self) -> None:
+        """Atomically write finished conversations to the checkpoint."""
+        self._unsaved = 0
+        if not self.checkpoint_path:
+            return
+        payload = json.dumps({"version": CHECKPOINT_VERSION, "results": self._done})
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.checkpoint_path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.checkpoint_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save summary checkpoint: {e}")
+
+    def _remove_checkpoint(self) -> None:
+        """Delete the checkpoint after a completed run."""
+        if self.checkpoint_path:
+            try:
+                self.checkpoint_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove summary checkpoint: {e}")
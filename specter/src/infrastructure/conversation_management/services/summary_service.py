@@ -4,14 +4,22 @@ AI-powered conversation summary service.
 
 import logging
 import json
-from typing import Optional, List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..models.conversation import ConversationSummary
 from ..repositories.conversation_repository import ConversationRepository
+from .summary_backfill import SummaryBackfill
 
 logger = logging.getLogger("specter.summary_service")
 
+# Seconds to back off after a 429 that carried no Retry-After header
+DEFAULT_RETRY_AFTER = 5.0
+
+# Response budget for the summary JSON (the stateless call otherwise uses
+# the short title-generation cap on some models)
+SUMMARY_MAX_TOKENS = 1024
+
 
 class SummaryService:
     """Service for generating AI-powered conversation summaries."""
@@ -73,12 +81,23 @@ Respond with ONLY the title, no other text.
     
     async def generate_summary(self, conversation_id: str) -> bool:
         """Generate AI summary for a conversation."""
+        success, _ = await self._generate_summary(conversation_id)
+        return success
+    
+    async def _generate_summary(self, conversation_id: str) -> Tuple[bool, Optional[float]]:
+        """
+        Generate and save a summary.
+
+        Returns:
+            Whether the summary was saved, and the seconds the provider asked
+            us to wait (Retry-After) when the request was rate limited
+        """
         try:
             # Load conversation
             conversation = await self.repository.get_conversation(conversation_id, include_messages=True)
             if not conversation or not conversation.messages:
                 logger.warning(f"No conversation found or no messages: {conversation_id}")
-                return False
+                return False, None
             
             # Skip if conversation is too short
             user_messages = [msg for msg in conversation.messages if msg.role.value == "user"]
@@ -86,13 +105,13 @@ Respond with ONLY the title, no other text.
             
             if len(user_messages) < 2 or len(assistant_messages) < 1:
                 logger.info(f"Conversation too short for summary: {conversation_id}")
-                return False
+                return False, None
             
             # Get AI service
             ai_service = await self._get_ai_service()
             if not ai_service:
                 logger.error("AI service not available for summary generation")
-                return False
+                return False, None
             
             # Prepare content for summarization
             summary_content = self._prepare_content_for_summary(conversation)
@@ -100,19 +119,25 @@ Respond with ONLY the title, no other text.
             # Generate summary prompt
             prompt = self._build_summary_prompt(conversation, summary_content)
             
-            # Call AI service asynchronously
+            # Call AI service asynchronously. The prompt is self-contained, so
+            # it is sent without chat history; that keeps concurrent summaries
+            # independent and stops earlier prompts piling up in the context.
             logger.info(f"Generating summary for conversation: {conversation_id}")
-            result = await ai_service.send_message_async(prompt)
+            result = await ai_service.send_message_without_system_prompt_async(
+                prompt, max_tokens=SUMMARY_MAX_TOKENS
+            )
             
             if not result.get('success', False):
                 logger.error(f"AI summary generation failed: {result.get('error', 'Unknown error')}")
-                return False
+                if result.get('status_code') == 429:
+                    return False, result.get('retry_after') or DEFAULT_RETRY_AFTER
+                return False, None
             
             # Parse AI response
             summary_data = self._parse_summary_response(result['response'])
             if not summary_data:
                 logger.error("Failed to parse AI summary response")
-                return False
+                return False, None
             
             # Create summary object
             summary = ConversationSummary.create(
@@ -131,11 +156,11 @@ Respond with ONLY the title, no other text.
             else:
                 logger.error(f"✗ Failed to save summary for conversation: {conversation_id}")
             
-            return success
+            return success, None
             
         except Exception as e:
             logger.error(f"✗ Summary generation failed for {conversation_id}: {e}")
-            return False
+            return False, None
     
     async def generate_title(self, conversation_id: str) -> Optional[str]:
         """Generate an AI-powered title for a conversation."""
@@ -208,33 +233,27 @@ Respond with ONLY the title, no other text.
     async def batch_generate_summaries(
         self,
         conversation_ids: List[str],
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        concurrency: int = 4,
+        requests_per_minute: float = 60,
+        checkpoint_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, bool]:
-        """Generate summaries for multiple conversations."""
-        results = {}
-        
-        for conv_id in conversation_ids:
-            try:
-                # Skip if summary already exists and skip_existing is True
-                if skip_existing:
-                    existing = await self.get_conversation_summary(conv_id)
-                    if existing:
-                        results[conv_id] = True
-                        continue
-                
-                # Generate summary
-                success = await self.generate_summary(conv_id)
-                results[conv_id] = success
-                
-                # Add small delay to avoid overwhelming AI service
-                import asyncio
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"✗ Batch summary failed for {conv_id}: {e}")
-                results[conv_id] = False
-        
-        return results
+        """
+        Generate summaries for multiple conversations.
+
+        Runs up to `concurrency` generations at once, paced by the provider
+        rate limit. Pass `checkpoint_path` to make the backfill resumable:
+        finished conversations are recorded there and skipped on the next run.
+        """
+        backfill = SummaryBackfill(
+            self,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            checkpoint_path=checkpoint_path,
+            progress_callback=progress_callback
+        )
+        return await backfill.run(conversation_ids, skip_existing=skip_existing)
     
     def _prepare_content_for_summary(self, conversation) -> str:
         """Prepare conversation content for summarization."""
@@ -0,0 +1,98 @@
+"""
+Structured debug channels for Specter hot paths.
+
+A channel is a logger under ``specter.trace`` that stays disabled unless it
+is switched on explicitly (``SPECTER_TRACE=faiss,context`` in the
+environment, the ``advanced.debug_channels`` setting, or
+``setup_logging(trace_channels=...)``). Enabling debug logging does not
+enable channels.
+
+Callers test the channel before building anything, so a disabled channel
+costs a single cached level check:
+
+    _trace = debug_channel("faiss")
+    ...
+    if _trace:
+        _trace("search", total=index.ntotal, search_k=search_k)
+"""
+
+import logging
+import os
+from typing import Any, Dict, Iterable
+
+TRACE_ROOT = "specter.trace"
+TRACE_ENV_VAR = "SPECTER_TRACE"
+
+_channels: Dict[str, "DebugChannel"] = {}
+
+
+class _Fields:
+    """Renders channel fields as ``key=value`` pairs, only when a handler formats the record."""
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value!r}" for key, value in self.fields.items())
+
+
+class DebugChannel:
+    """
+    A named structured-debug channel.
+
+    Truthy only while enabled. Calling it logs an event name plus keyword
+    fields at DEBUG level; the fields also travel on the record as
+    ``event``/``fields`` for the JSON log file.
+    """
+    __slots__ = ("name", "logger")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.logger = logging.getLogger(f"{TRACE_ROOT}.{name}")
+
+    def __bool__(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def __call__(self, event: str, **fields: Any):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "%s %s", event, _Fields(fields),
+                extra={"event": event, "fields": fields}, stacklevel=2
+            )
+
+
+def debug_channel(name: str) -> DebugChannel:
+    """Get (or create) the debug channel called `name`."""
+    channel = _channels.get(name)
+    if channel is None:
+        channel = _channels.setdefault(name, DebugChannel(name))
+    return channel
+
+
+def configure_debug_channels(names: Iterable[str] = ()) -> None:
+    """
+    Enable exactly the given channels (``"*"`` enables all).
+
+    Channels named in ``SPECTER_TRACE`` are always enabled as well.
+    """
+    wanted = {name.strip() for name in names if name and name.strip()}
+    wanted.update(
+        name.strip() for name in os.environ.get(TRACE_ENV_VAR, "").split(",") if name.strip()
+    )
+
+    root = logging.getLogger(TRACE_ROOT)
+    root.setLevel(logging.DEBUG if "*" in wanted else logging.INFO)
+    for name in set(_channels) | wanted:
+        if name == "*":
+            continue
+        level = logging.DEBUG if name in wanted else logging.NOTSET
+        logging.getLogger(f"{TRACE_ROOT}.{name}").setLevel(level)
+
+
+# Channels start disabled even if the "specter" logger is at DEBUG
+logging.getLogger(TRACE_ROOT).setLevel(logging.INFO)
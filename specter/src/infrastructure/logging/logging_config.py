@@ -2,17 +2,29 @@
 Logging Configuration for Specter.
 
 Provides structured logging with JSON output and performance monitoring.
+
+Records are handed to a queue and written by a background listener thread,
+so console and file I/O never run on the caller's thread. A rate-limit
+filter in front of the queue caps how many records each subsystem can
+produce per second.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import json
 import os
+import queue
 import sys
 import glob
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from pathlib import Path
+
+from .debug_channel import configure_debug_channels
 try:  # Optional import (PyQt may not be present in some tooling contexts)
     from PyQt6.QtCore import QStandardPaths  # type: ignore
 except Exception:  # pragma: no cover
@@ -33,19 +45,158 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno
         }
         
-        # Add exception info if present
+        # Add exception info if present (pre-rendered when queued)
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
         
         # Add extra fields
         for key, value in record.__dict__.items():
             if key not in ('name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
                           'filename', 'module', 'lineno', 'funcName', 'created', 
                           'msecs', 'relativeCreated', 'thread', 'threadName', 
-                          'processName', 'process', 'exc_info', 'exc_text', 'stack_info'):
+                          'processName', 'process', 'exc_info', 'exc_text', 'stack_info',
+                          'message', 'taskName'):
                 log_entry[key] = value
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return json.dumps(log_entry, ensure_ascii=False, default=str)
+
+
+# Records per second and burst size allowed for each logger below ERROR,
+# matched by longest logger-name prefix ("" is the default)
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "": (50.0, 200),
+    "specter.rag_pipeline": (10.0, 50),
+    "specter.safe_rag_pipeline": (10.0, 50),
+    "specter.embedding_scheduler": (10.0, 50),
+    "specter.embedding_service": (10.0, 50),
+    "specter.rag_worker": (10.0, 50),
+    "specter.faiss_client": (10.0, 50),
+    # RAGPipeline instances log under their module path
+    "specter.src.infrastructure.rag_pipeline": (10.0, 50),
+}
+
+# Records waiting for the writer thread; beyond this they are dropped
+LOG_QUEUE_SIZE = 10000
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token-bucket limit on log records per logger.
+
+    Records at ERROR and above always pass. When a logger exceeds its rate,
+    further records are dropped and counted; the next record that passes
+    reports how many were suppressed.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 exempt_level: int = logging.ERROR):
+        super().__init__()
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self.exempt_level = exempt_level
+        self._buckets: Dict[str, list] = {}  # logger name -> [tokens, last_refill, suppressed, rate, burst]
+        self._lock = threading.Lock()
+
+    def _limit_for(self, name: str) -> Optional[Tuple[float, int]]:
+        best = None
+        for prefix, limit in self.limits.items():
+            if (not prefix or name == prefix or name.startswith(prefix + ".")) and \
+                    (best is None or len(prefix) > len(best)):
+                best = prefix
+        return None if best is None else self.limits[best]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                limit = self._limit_for(record.name)
+                if limit is None:
+                    return True
+                rate, burst = limit
+                bucket = self._buckets[record.name] = [float(burst), now, 0, rate, burst]
+
+            tokens = min(bucket[4], bucket[0] + (now - bucket[1]) * bucket[3])
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            bucket[0] = tokens - 1.0
+            suppressed, bucket[2] = bucket[2], 0
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} more messages from this logger suppressed]"
+            record.args = None
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks: records are dropped when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render message and traceback now (arguments may change after this
+        # call returns) but leave formatting to the writer thread's handlers
+        message = record.getMessage()
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _FanOutHandler(logging.Handler):
+    """
+    Passes each record to several handlers, each honoring its own level.
+
+    Lets filters attached here (the rate limit) run once per record rather
+    than once per destination handler.
+    """
+
+    def __init__(self, handlers):
+        super().__init__()
+        self.handlers = list(handlers)
+
+    def emit(self, record: logging.LogRecord):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self):
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self):
+        for handler in self.handlers:
+            handler.close()
+        super().close()
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """Stop the writer thread after it has written every queued record."""
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
 
 
 def _resolve_log_dir() -> Path:
@@ -118,7 +269,10 @@ def cleanup_old_logs(log_dir: Path, retention_days: int) -> int:
         return 0
 
 
-def setup_logging(debug: bool = False, log_dir: str | None = None, retention_days: int = 10) -> None:
+def setup_logging(debug: bool = False, log_dir: str | None = None, retention_days: int = 10,
+                  async_logging: bool = True,
+                  rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                  trace_channels: Iterable[str] = ()) -> None:
     """
     Setup logging configuration for Specter with daily rotation.
     
@@ -126,6 +280,9 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
         debug: Enable debug level logging
         log_dir: Directory for log files (defaults to user data dir)
         retention_days: Number of days to retain log files (default: 10)
+        async_logging: Write records on a background thread via a queue
+        rate_limits: Per-logger-prefix (records/s, burst) limits; defaults to DEFAULT_RATE_LIMITS
+        trace_channels: Debug channels to enable (see debug_channel.py)
     """
     # Determine log directory
     if log_dir:
@@ -139,8 +296,10 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
     
-    # Clear existing handlers
+    # Clear existing handlers (and stop a previous writer thread)
+    shutdown_logging()
     root_logger.handlers.clear()
+    handlers = []
     
     # Console handler with simple format
     console_handler = logging.StreamHandler(sys.stdout)
@@ -149,7 +308,7 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Daily rotating file handler with JSON format
     log_file = str(log_dir_path / 'specter.log')
@@ -166,7 +325,7 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
     file_handler.extMatch = re.compile(r"^\-\d{4}\-\d{2}\-\d{2}\.log$", re.ASCII)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
     
     # Daily rotating error file handler
     error_file = str(log_dir_path / 'specter-errors.log')
@@ -182,7 +341,24 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
     error_handler.extMatch = re.compile(r"^\-\d{4}\-\d{2}\-\d{2}\.log$", re.ASCII)
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
+
+    rate_filter = RateLimitFilter(rate_limits)
+    if async_logging:
+        global _queue_listener
+        queue_handler = _QueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+        queue_handler.addFilter(rate_filter)
+        root_logger.addHandler(queue_handler)
+        _queue_listener = logging.handlers.QueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        # One filtering handler in front of all outputs, like the queue
+        # handler above, so every record spends a single token
+        fan_out = _FanOutHandler(handlers)
+        fan_out.addFilter(rate_filter)
+        root_logger.addHandler(fan_out)
     
     # Clean up old log files beyond retention period
     cleanup_old_logs(log_dir_path, retention_days)
@@ -191,6 +367,7 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
     logging.getLogger("specter").setLevel(logging.DEBUG if debug else logging.INFO)
     logging.getLogger("PyQt6").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
+    configure_debug_channels(trace_channels)
     
     # Suppress Qt internal warnings unless in debug mode
     if not debug:
@@ -206,7 +383,11 @@ def setup_logging(debug: bool = False, log_dir: str | None = None, retention_day
     
     # Log startup message
     logger = logging.getLogger("specter.logging")
-    logger.info(f"Logging initialized - Debug: {debug}, Log dir: {log_dir}")
+    logger.info(f"Logging initialized - Debug: {debug}, Log dir: {log_dir}, Async: {async_logging}")
+
+
+# Registered after the logging module's own handler shutdown, so it runs first
+atexit.register(shutdown_logging)
 
 
 def get_performance_logger() -> logging.Logger:
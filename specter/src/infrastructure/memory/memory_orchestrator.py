@@ -268,11 +268,18 @@ class MemoryOrchestrator:
     # Token estimation
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _content_text(content) -> str:
+        """Plain text of a message's content (a string or a list of text blocks)."""
+        if isinstance(content, list):
+            return " ".join(block.get("text", "") for block in content if isinstance(block, dict))
+        return content or ""
+
     def _estimate_message_tokens(self, messages: List[Dict]) -> int:
         """Estimate total tokens in a message list."""
         total_chars = 0
         for msg in messages:
-            content = msg.get("content", "") or ""
+            content = self._content_text(msg.get("content"))
             total_chars += len(content)
             # Tool calls add overhead
             if "tool_calls" in msg:
@@ -281,7 +288,7 @@ class MemoryOrchestrator:
         try:
             import tiktoken
             enc = tiktoken.get_encoding("cl100k_base")
-            text = " ".join(msg.get("content", "") or "" for msg in messages)
+            text = " ".join(self._content_text(msg.get("content")) for msg in messages)
             return len(enc.encode(text))
         except ImportError:
             return total_chars // 4
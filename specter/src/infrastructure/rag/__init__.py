@@ -14,7 +14,8 @@ from .conversation.conversation_rag_pipeline import (
 from .integration.file_upload_service import (
     FileUploadService,
     ProcessingStatus,
-    FileProcessingResult
+    FileProcessingResult,
+    UploadPriority
 )
 
 from .integration.repl_rag_integration import REPLRAGIntegration
@@ -26,5 +27,6 @@ __all__ = [
     'FileUploadService',
     'ProcessingStatus',
     'FileProcessingResult',
+    'UploadPriority',
     'REPLRAGIntegration'
 ]
\ No newline at end of file
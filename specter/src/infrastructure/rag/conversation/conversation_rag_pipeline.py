@@ -7,7 +7,7 @@ Provides context-aware retrieval, query rewriting, and document management.
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Union, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -16,7 +16,7 @@ import json
 from ...conversation_management.models.conversation import Conversation, Message
 from ...conversation_management.models.enums import MessageRole
 from ...conversation_management.services.conversation_service import ConversationService
-from ...rag_pipeline.pipeline.rag_pipeline import RAGPipeline, RAGQuery, RAGResponse
+from ...rag_pipeline.pipeline.rag_pipeline import RAGPipeline, RAGQuery, RAGResponse, StageCallback
 from ...rag_pipeline.config.rag_config import RAGPipelineConfig
 
 logger = logging.getLogger("specter.conversation_rag")
@@ -98,7 +98,8 @@ class ConversationRAGPipeline:
         self, 
         conversation_id: str,
         file_path: Union[str, Path],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        stage_callback: Optional[StageCallback] = None
     ) -> str:
         """
         Add a document to a conversation context.
@@ -107,14 +108,12 @@ class ConversationRAGPipeline:
             conversation_id: ID of the conversation
             file_path: Path to the document
             metadata: Optional metadata for the document
+            stage_callback: Optional observer for ingestion stage timings
             
         Returns:
             Document ID
         """
         try:
-            # Get conversation context
-            context = self.get_or_create_context(conversation_id)
-            
             # Process document through RAG pipeline
             file_path = Path(file_path)
             doc_metadata = metadata or {}
@@ -127,38 +126,65 @@ class ConversationRAGPipeline:
             # Ingest document
             doc_id = await self.rag_pipeline.ingest_document(
                 source=str(file_path),
-                metadata_override=doc_metadata
+                metadata_override=doc_metadata,
+                stage_callback=stage_callback
             )
             
-            # Add to conversation context
-            context.add_document(doc_id, doc_metadata)
-            
-            # Track document-conversation mapping
-            if doc_id not in self._document_conversations:
-                self._document_conversations[doc_id] = []
-            if conversation_id not in self._document_conversations[doc_id]:
-                self._document_conversations[doc_id].append(conversation_id)
-            
-            # Add system message to conversation
-            conversation = await self.conversation_service.get_conversation(
-                conversation_id, 
-                include_messages=False
-            )
-            if conversation:
-                await self.conversation_service.add_message(
-                    conversation_id=conversation_id,
-                    role=MessageRole.SYSTEM,
-                    content=f"📎 Document added: {file_path.name}",
-                    metadata={'document_id': doc_id, 'action': 'document_added'}
-                )
-            
-            logger.info(f"Added document {doc_id} to conversation {conversation_id}")
+            await self.attach_document(conversation_id, doc_id, file_path.name, doc_metadata)
             return doc_id
             
         except Exception as e:
             logger.error(f"Failed to add document to conversation: {e}")
             raise
     
+    async def attach_document(
+        self,
+        conversation_id: str,
+        doc_id: str,
+        filename: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Attach an already-ingested document to a conversation context.
+        
+        Used directly when identical content was ingested for another
+        conversation, so the document is shared instead of re-embedded.
+        
+        Args:
+            conversation_id: ID of the conversation
+            doc_id: ID of the ingested document
+            filename: Display name for the system message
+            metadata: Optional metadata for the document
+        """
+        # Add to conversation context
+        context = self.get_or_create_context(conversation_id)
+        context.add_document(doc_id, metadata or {})
+        
+        # Track document-conversation mapping
+        if doc_id not in self._document_conversations:
+            self._document_conversations[doc_id] = []
+        if conversation_id not in self._document_conversations[doc_id]:
+            self._document_conversations[doc_id].append(conversation_id)
+        
+        # Add system message to conversation
+        conversation = await self.conversation_service.get_conversation(
+            conversation_id, 
+            include_messages=False
+        )
+        if conversation:
+            await self.conversation_service.add_message(
+                conversation_id=conversation_id,
+                role=MessageRole.SYSTEM,
+                content=f"📎 Document added: {filename}",
+                metadata={'document_id': doc_id, 'action': 'document_added'}
+            )
+        
+        logger.info(f"Added document {doc_id} to conversation {conversation_id}")
+    
+    def has_document(self, doc_id: str) -> bool:
+        """Whether a document is still attached to any conversation."""
+        return bool(self._document_conversations.get(doc_id))
+    
     async def remove_document_from_conversation(
         self,
         conversation_id: str,
@@ -3,15 +3,21 @@ File Upload Integration Service
 
 Bridges the UI file upload functionality with the RAG pipeline.
 Handles immediate processing, status tracking, and UI updates.
+
+Uploads are scheduled onto a fixed pool of async workers that pull from a
+priority queue, so interactive uploads are processed ahead of bulk
+collection loads. Identical file content is only ingested once; later
+uploads of the same bytes are attached to their conversation directly.
 """
 
 import logging
 import asyncio
+import itertools
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 
 try:
     from PyQt6.QtCore import QObject, pyqtSignal
@@ -20,6 +26,7 @@ except ImportError:
     PYQT_AVAILABLE = False
 
 from ..conversation.conversation_rag_pipeline import ConversationRAGPipeline
+from ...storage.collection_storage import collection_storage_service
 
 logger = logging.getLogger("specter.file_upload_service")
 
@@ -32,6 +39,22 @@ class ProcessingStatus(Enum):
     FAILED = "failed"
 
 
+class UploadPriority(IntEnum):
+    """Scheduling priority for queued files (lower runs first)."""
+    INTERACTIVE = 0
+    BULK = 10
+
+
+# Progress reported to the UI once each ingestion stage finishes
+_STAGE_PROGRESS = {
+    'hash': 0.1,
+    'load': 0.3,
+    'split': 0.4,
+    'embed': 0.8,
+    'store': 0.95,
+}
+
+
 @dataclass
 class FileProcessingResult:
     """Result of file processing operation."""
@@ -50,16 +73,18 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
     Service to handle file uploads and integrate with RAG pipeline.
     
     Features:
-    - Immediate file processing upon upload
-    - Progress tracking and status updates
+    - Fixed pool of async workers fed by a priority queue
+    - Interactive uploads scheduled ahead of bulk loads
+    - Content-hash deduplication across conversations
+    - Per-stage timing (hash, load, split, embed, store) and progress signals
     - Integration with conversation context
-    - Batch processing support
     """
     
     # Qt signals for UI updates
     if PYQT_AVAILABLE:
         file_processing_started = pyqtSignal(str, str)  # file_id, filename
         file_processing_progress = pyqtSignal(str, float)  # file_id, progress
+        file_processing_stage = pyqtSignal(str, str, float)  # file_id, stage, seconds
         file_processing_completed = pyqtSignal(str, dict)  # file_id, result
         file_processing_failed = pyqtSignal(str, str)  # file_id, error
         batch_processing_completed = pyqtSignal(list)  # results
@@ -74,48 +99,70 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
             super().__init__()
         
         self.rag_pipeline = conversation_rag_pipeline
-        self.max_concurrent = max_concurrent
+        self.max_concurrent = max(1, max_concurrent)
         
-        # Processing queue
-        self._processing_queue: asyncio.Queue = asyncio.Queue()
+        # Processing queue: (priority, sequence, task_data); the sequence
+        # keeps FIFO order within a priority and avoids comparing dicts
+        self._processing_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
         self._active_tasks: Dict[str, asyncio.Task] = {}
         self._processing_results: Dict[str, FileProcessingResult] = {}
+        self._task_data: Dict[str, Dict[str, Any]] = {}
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._cancelled: set = set()
+        
+        # Content-hash deduplication: checksum -> document ID, plus the
+        # in-flight ingestions so identical concurrent uploads share one
+        self._content_index: Dict[str, str] = {}
+        self._inflight_hashes: Dict[str, asyncio.Future] = {}
         
-        # Start background processor
-        self._processor_task = None
+        # Worker pool
+        self._workers: List[asyncio.Task] = []
         
         logger.info("FileUploadService initialized")
     
     async def start(self):
-        """Start the background processor."""
-        if not self._processor_task:
-            self._processor_task = asyncio.create_task(self._process_queue())
-            logger.info("File processor started")
+        """Start the worker pool."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(index))
+                for index in range(self.max_concurrent)
+            ]
+            logger.info(f"File processor started ({self.max_concurrent} workers)")
     
     async def stop(self):
-        """Stop the background processor."""
-        if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
-            self._processor_task = None
+        """Stop the worker pool."""
+        if self._workers:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+            
+            # Release anyone still waiting on a queued file
+            for waiter in self._waiters.values():
+                if not waiter.done():
+                    waiter.cancel()
+            self._waiters.clear()
             logger.info("File processor stopped")
     
     async def upload_files(
         self,
         conversation_id: str,
         file_paths: List[str],
-        immediate_processing: bool = True
+        immediate_processing: bool = True,
+        priority: UploadPriority = UploadPriority.INTERACTIVE
     ) -> List[str]:
         """
         Upload files for a conversation.
         
+        All files are queued at once so the worker pool processes them
+        concurrently.
+        
         Args:
             conversation_id: Target conversation ID
             file_paths: List of file paths to upload
-            immediate_processing: Process immediately vs queue
+            immediate_processing: Wait for processing to finish vs just queue
+            priority: Scheduling priority for the files
             
         Returns:
             List of file IDs
@@ -126,17 +173,31 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
             file_id = await self.upload_file(
                 conversation_id,
                 file_path,
-                immediate_processing
+                immediate_processing=False,
+                priority=priority
             )
             file_ids.append(file_id)
         
+        if immediate_processing:
+            results = await asyncio.gather(
+                *(self.wait_for_file(file_id) for file_id in file_ids),
+                return_exceptions=True
+            )
+            if PYQT_AVAILABLE and hasattr(self, 'batch_processing_completed'):
+                self.batch_processing_completed.emit([
+                    self._result_to_dict(result)
+                    for result in results
+                    if isinstance(result, FileProcessingResult)
+                ])
+        
         return file_ids
     
     async def upload_file(
         self,
         conversation_id: str,
         file_path: str,
-        immediate_processing: bool = True
+        immediate_processing: bool = True,
+        priority: UploadPriority = UploadPriority.INTERACTIVE
     ) -> str:
         """
         Upload a single file.
@@ -144,11 +205,13 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
         Args:
             conversation_id: Target conversation ID
             file_path: Path to file
-            immediate_processing: Process immediately vs queue
+            immediate_processing: Wait for processing to finish vs just queue
+            priority: Scheduling priority for the file
             
         Returns:
             File ID
         """
+        file_id = None
         try:
             path = Path(file_path)
             if not path.exists():
@@ -166,30 +229,15 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
                 'file_id': file_id,
                 'conversation_id': conversation_id,
                 'file_path': str(path),
-                'filename': path.name
+                'filename': path.name,
+                'priority': int(priority)
             }
             
+            await self.start()
+            self._enqueue(task_data)
+            
             if immediate_processing:
-                # Process immediately
-                result = await self._process_file(task_data)
-                self._processing_results[file_id] = result
-                
-                # Emit completion signal
-                if PYQT_AVAILABLE and hasattr(self, 'file_processing_completed'):
-                    self.file_processing_completed.emit(
-                        file_id,
-                        self._result_to_dict(result)
-                    )
-            else:
-                # Queue for processing
-                await self._processing_queue.put(task_data)
-                
-                # Create initial result
-                self._processing_results[file_id] = FileProcessingResult(
-                    file_id=file_id,
-                    filename=path.name,
-                    status=ProcessingStatus.QUEUED
-                )
+                await self.wait_for_file(file_id)
             
             logger.info(f"File uploaded: {file_id} - {path.name}")
             return file_id
@@ -198,11 +246,90 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
             logger.error(f"Failed to upload file: {e}")
             
             # Emit failure signal
-            if PYQT_AVAILABLE and hasattr(self, 'file_processing_failed'):
+            if file_id and PYQT_AVAILABLE and hasattr(self, 'file_processing_failed'):
                 self.file_processing_failed.emit(file_id, str(e))
             
             raise
     
+    def _enqueue(self, task_data: Dict[str, Any]) -> None:
+        """Queue a file for the worker pool."""
+        file_id = task_data['file_id']
+        
+        self._task_data[file_id] = task_data
+        self._waiters[file_id] = asyncio.get_running_loop().create_future()
+        self._processing_results[file_id] = FileProcessingResult(
+            file_id=file_id,
+            filename=task_data['filename'],
+            status=ProcessingStatus.QUEUED
+        )
+        self._processing_queue.put_nowait(
+            (task_data['priority'], next(self._sequence), task_data)
+        )
+    
+    async def wait_for_file(self, file_id: str) -> FileProcessingResult:
+        """
+        Wait until a queued file has been processed.
+        
+        Args:
+            file_id: File ID returned by upload_file
+            
+        Returns:
+            Final processing result
+        """
+        waiter = self._waiters.get(file_id)
+        if waiter is None:
+            return self._processing_results[file_id]
+        # Shield so one caller cancelling doesn't cancel the shared future
+        return await asyncio.shield(waiter)
+    
+    async def _worker(self, index: int):
+        """Worker loop: process queued files in priority order."""
+        logger.debug(f"File worker {index} started")
+        
+        while True:
+            try:
+                _, _, task_data = await self._processing_queue.get()
+            except asyncio.CancelledError:
+                logger.debug(f"File worker {index} cancelled")
+                break
+            
+            file_id = task_data['file_id']
+            try:
+                if file_id in self._cancelled:
+                    self._cancelled.discard(file_id)
+                    result = self._processing_results[file_id]
+                else:
+                    task = asyncio.create_task(self._process_file(task_data))
+                    self._active_tasks[file_id] = task
+                    try:
+                        result = await task
+                    except asyncio.CancelledError:
+                        if file_id not in self._cancelled:
+                            # The worker itself is being stopped
+                            raise
+                        self._cancelled.discard(file_id)
+                        result = self._processing_results[file_id]
+                    self._processing_results[file_id] = result
+                
+                waiter = self._waiters.pop(file_id, None)
+                if waiter and not waiter.done():
+                    waiter.set_result(result)
+            except asyncio.CancelledError:
+                logger.debug(f"File worker {index} cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Queue processing error: {e}")
+            finally:
+                self._active_tasks.pop(file_id, None)
+                self._processing_queue.task_done()
+    
+    def _emit_progress(self, file_id: str, stage: str, seconds: float):
+        """Report a finished ingestion stage to the UI."""
+        if PYQT_AVAILABLE and hasattr(self, 'file_processing_stage'):
+            self.file_processing_stage.emit(file_id, stage, seconds)
+        if PYQT_AVAILABLE and hasattr(self, 'file_processing_progress'):
+            self.file_processing_progress.emit(file_id, _STAGE_PROGRESS.get(stage, 0.5))
+    
     async def _process_file(self, task_data: Dict[str, Any]) -> FileProcessingResult:
         """Process a single file."""
         file_id = task_data['file_id']
@@ -211,36 +338,42 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
         filename = task_data['filename']
         
         start_time = datetime.now()
+        stage_timings: Dict[str, float] = {}
+        chunks_created = 0
+        
+        def on_stage(stage: str, seconds: float, count: int):
+            nonlocal chunks_created
+            stage_timings[stage] = seconds
+            if stage == 'split':
+                chunks_created = count
+            self._emit_progress(file_id, stage, seconds)
         
         try:
             # Update status to processing
             if file_id in self._processing_results:
                 self._processing_results[file_id].status = ProcessingStatus.PROCESSING
             
-            # Emit progress signal
-            if PYQT_AVAILABLE and hasattr(self, 'file_processing_progress'):
-                self.file_processing_progress.emit(file_id, 0.3)
-            
-            # Add document to conversation RAG pipeline
-            doc_id = await self.rag_pipeline.add_document_to_conversation(
-                conversation_id=conversation_id,
-                file_path=file_path,
-                metadata={
-                    'upload_time': datetime.now().isoformat(),
-                    'original_filename': filename
-                }
+            # Hash content off the event loop for deduplication
+            hash_start = datetime.now()
+            checksum = await asyncio.to_thread(
+                collection_storage_service.calculate_file_checksum, file_path
             )
+            on_stage('hash', (datetime.now() - hash_start).total_seconds(), 1)
             
-            # Emit progress signal
-            if PYQT_AVAILABLE and hasattr(self, 'file_processing_progress'):
-                self.file_processing_progress.emit(file_id, 0.7)
+            metadata = {
+                'upload_time': datetime.now().isoformat(),
+                'original_filename': filename
+            }
+            if checksum:
+                metadata['checksum'] = checksum
             
-            # Get processing stats from RAG pipeline
-            stats = await self.rag_pipeline.rag_pipeline.get_stats()
+            doc_id, deduplicated = await self._ingest_or_reuse(
+                checksum, conversation_id, file_path, filename, metadata, on_stage
+            )
             
             # Calculate tokens (approximate)
             path = Path(file_path)
-            content = path.read_text(encoding='utf-8', errors='ignore')
+            content = await asyncio.to_thread(path.read_text, encoding='utf-8', errors='ignore')
             tokens_used = len(content.split()) * 1.3  # Rough token estimate
             
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -250,10 +383,15 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
                 file_id=file_id,
                 filename=filename,
                 status=ProcessingStatus.COMPLETED,
-                chunks_created=stats.get('chunks_created', 0),
+                chunks_created=chunks_created,
                 tokens_used=int(tokens_used),
                 processing_time=processing_time,
-                metadata={'document_id': doc_id}
+                metadata={
+                    'document_id': doc_id,
+                    'checksum': checksum,
+                    'deduplicated': deduplicated,
+                    'stage_timings': stage_timings,
+                }
             )
             
             # Emit completion signal
@@ -263,9 +401,14 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
                     self._result_to_dict(result)
                 )
             
-            logger.info(f"File processed successfully: {file_id}")
+            logger.info(
+                f"File processed successfully: {file_id} "
+                f"({'deduplicated' if deduplicated else 'ingested'}, {processing_time:.2f}s)"
+            )
             return result
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Failed to process file {file_id}: {e}")
             
@@ -275,7 +418,8 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
                 filename=filename,
                 status=ProcessingStatus.FAILED,
                 processing_time=(datetime.now() - start_time).total_seconds(),
-                error_message=str(e)
+                error_message=str(e),
+                metadata={'stage_timings': stage_timings}
             )
             
             # Emit failure signal
@@ -284,37 +428,72 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
             
             return result
     
-    async def _process_queue(self):
-        """Background task to process queued files."""
-        logger.info("File processing queue started")
+    async def _ingest_or_reuse(
+        self,
+        checksum: Optional[str],
+        conversation_id: str,
+        file_path: str,
+        filename: str,
+        metadata: Dict[str, Any],
+        stage_callback: Callable[[str, float, int], None]
+    ) -> tuple:
+        """
+        Ingest a file, or attach an existing document with identical content.
         
-        while True:
-            try:
-                # Get task from queue
-                task_data = await self._processing_queue.get()
-                
-                # Check concurrent limit
-                while len(self._active_tasks) >= self.max_concurrent:
-                    await asyncio.sleep(0.1)
-                    # Clean up completed tasks
-                    completed = [
-                        fid for fid, task in self._active_tasks.items()
-                        if task.done()
-                    ]
-                    for fid in completed:
-                        del self._active_tasks[fid]
-                
-                # Create processing task
-                file_id = task_data['file_id']
-                task = asyncio.create_task(self._process_file(task_data))
-                self._active_tasks[file_id] = task
-                
-            except asyncio.CancelledError:
-                logger.info("File processing queue cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Queue processing error: {e}")
-                await asyncio.sleep(1)
+        Returns:
+            Tuple of (document_id, deduplicated)
+        """
+        if checksum:
+            doc_id = self._content_index.get(checksum)
+            if doc_id is not None and not self.rag_pipeline.has_document(doc_id):
+                # Removed from every conversation and deleted from the store
+                del self._content_index[checksum]
+                doc_id = None
+            if doc_id is None and checksum in self._inflight_hashes:
+                # Same bytes are being ingested right now; share that result
+                try:
+                    doc_id = await asyncio.shield(self._inflight_hashes[checksum])
+                except Exception:
+                    doc_id = None
+            
+            if doc_id is not None:
+                await self.rag_pipeline.attach_document(
+                    conversation_id, doc_id, filename, metadata
+                )
+                logger.debug(f"Reused document {doc_id} for identical content: {filename}")
+                return doc_id, True
+        
+        inflight = None
+        if checksum:
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight_hashes[checksum] = inflight
+        
+        try:
+            doc_id = await self.rag_pipeline.add_document_to_conversation(
+                conversation_id=conversation_id,
+                file_path=file_path,
+                metadata=metadata,
+                stage_callback=stage_callback
+            )
+        except BaseException as e:
+            if inflight is not None:
+                inflight.set_exception(
+                    e if isinstance(e, Exception) else RuntimeError("Ingestion cancelled")
+                )
+                # Mark retrieved so an unobserved failure isn't logged
+                inflight.exception()
+            raise
+        finally:
+            if checksum:
+                self._inflight_hashes.pop(checksum, None)
+        
+        # Skipped ingestions (e.g. failed embeddings) must not be reused
+        if checksum and doc_id and not str(doc_id).startswith('skipped_'):
+            self._content_index[checksum] = doc_id
+        if inflight is not None:
+            inflight.set_result(doc_id)
+        
+        return doc_id, False
     
     def _result_to_dict(self, result: FileProcessingResult) -> Dict[str, Any]:
         """Convert result to dictionary for signals."""
@@ -343,24 +522,30 @@ class FileUploadService(QObject if PYQT_AVAILABLE else object):
         if not result or result.status != ProcessingStatus.FAILED:
             return False
         
-        # Find original task data
-        # This would need to be stored for retry capability
-        logger.warning(f"Retry not implemented for {file_id}")
-        return False
+        task_data = self._task_data.get(file_id)
+        if not task_data:
+            logger.warning(f"No task data stored for {file_id}, cannot retry")
+            return False
+        
+        await self.start()
+        self._enqueue(task_data)
+        logger.info(f"Re-queued {file_id} for processing")
+        return True
     
     async def cancel_processing(self, file_id: str) -> bool:
-        """Cancel file processing."""
+        """Cancel file processing (queued or in progress)."""
+        result = self._processing_results.get(file_id)
+        if not result or result.status not in (ProcessingStatus.QUEUED, ProcessingStatus.PROCESSING):
+            return False
+        
+        # Update status
+        result.status = ProcessingStatus.FAILED
+        result.error_message = "Cancelled by user"
+        
+        # A queued file is skipped by the worker; a running one is cancelled
+        self._cancelled.add(file_id)
         if file_id in self._active_tasks:
-            task = self._active_tasks[file_id]
-            task.cancel()
-            del self._active_tasks[file_id]
-            
-            # Update status
-            if file_id in self._processing_results:
-                self._processing_results[file_id].status = ProcessingStatus.FAILED
-                self._processing_results[file_id].error_message = "Cancelled by user"
-            
-            logger.info(f"Cancelled processing for {file_id}")
-            return True
+            self._active_tasks[file_id].cancel()
         
-        return False
\ No newline at end of file
+        logger.info(f"Cancelled processing for {file_id}")
+        return True
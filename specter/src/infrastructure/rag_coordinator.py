@@ -7,10 +7,13 @@ Handles initialization, configuration, and lifecycle management of FAISS RAG com
 
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from ..infrastructure.storage.settings_manager import settings
-from ..infrastructure.conversation_management.services.conversation_service import ConversationService
+from ..utils.lazy_import import is_available
+
+if TYPE_CHECKING:
+    from ..infrastructure.conversation_management.services.conversation_service import ConversationService
 # FAISS-only imports - no LangChain dependencies
 
 logger = logging.getLogger("specter.rag_coordinator")
@@ -27,7 +30,7 @@ class RAGCoordinator:
     - Support conversation-specific file isolation
     """
     
-    def __init__(self, conversation_service: ConversationService):
+    def __init__(self, conversation_service: "ConversationService"):
         """
         Initialize RAG coordinator.
         
@@ -55,12 +58,10 @@ class RAGCoordinator:
                 logger.info("RAG disabled: No OpenAI API key")
                 return
             
-            # Check for required packages (FAISS-only)
-            try:
-                import faiss
-                import numpy as np
-            except ImportError as e:
-                self._initialization_error = f"Missing required packages for FAISS: {e}"
+            # Check for required packages (FAISS-only) without importing them
+            missing = [name for name in ("faiss", "numpy") if not is_available(name)]
+            if missing:
+                self._initialization_error = f"Missing required packages for FAISS: {', '.join(missing)}"
                 logger.error(f"RAG disabled: {self._initialization_error}")
                 return
             
@@ -269,7 +270,7 @@ def get_rag_coordinator() -> Optional[RAGCoordinator]:
     return _rag_coordinator
 
 
-def initialize_rag_coordinator(conversation_service: ConversationService) -> RAGCoordinator:
+def initialize_rag_coordinator(conversation_service: "ConversationService") -> RAGCoordinator:
     """Initialize the global RAG coordinator."""
     global _rag_coordinator
     
@@ -68,6 +68,8 @@ class EmbeddingConfig:
     timeout: float = 30.0
     rate_limit_delay: float = 0.1
     batch_size: int = 100
+    max_concurrent_requests: int = 4  # Embedding batches in flight across all documents
+    tokens_per_minute: int = 0  # Embedding token rate limit (0 = unlimited)
     
     # Cache settings
     cache_enabled: bool = True
@@ -290,6 +292,14 @@ class TextProcessingConfig:
     extract_titles: bool = True
     extract_sections: bool = True
     preserve_structure: bool = True
+    
+    def chunking_key(self) -> str:
+        """Identify the settings that decide chunk boundaries.
+        
+        Stored chunks are only reusable by an ingestion that would split
+        the document the same way.
+        """
+        return f"{self.splitter_type.value}:{self.chunk_size}:{self.chunk_overlap}"
 
 
 @dataclass
@@ -309,6 +319,11 @@ class RetrievalConfig:
     rerank_top_k: int = 20
     final_top_k: int = 5
     
+    # Hybrid retrieval (vector stores with a lexical index)
+    enable_hybrid_search: bool = True  # Fuse BM25 and dense rankings
+    lexical_fast_path: bool = True  # Answer identifier-style queries without embedding
+    rrf_k: int = 60  # Reciprocal rank fusion constant
+    
     # Query processing
     query_expansion: bool = False
     expand_with_synonyms: bool = False
@@ -457,6 +472,8 @@ class RAGPipelineConfig:
                 "timeout": self.embedding.timeout,
                 "rate_limit_delay": self.embedding.rate_limit_delay,
                 "batch_size": self.embedding.batch_size,
+                "max_concurrent_requests": self.embedding.max_concurrent_requests,
+                "tokens_per_minute": self.embedding.tokens_per_minute,
                 "cache_enabled": self.embedding.cache_enabled,
                 "cache_size": self.embedding.cache_size,
                 "cache_ttl_hours": self.embedding.cache_ttl_hours,
@@ -525,6 +542,9 @@ class RAGPipelineConfig:
                 "enable_reranking": self.retrieval.enable_reranking,
                 "rerank_top_k": self.retrieval.rerank_top_k,
                 "final_top_k": self.retrieval.final_top_k,
+                "enable_hybrid_search": self.retrieval.enable_hybrid_search,
+                "lexical_fast_path": self.retrieval.lexical_fast_path,
+                "rrf_k": self.retrieval.rrf_k,
                 "query_expansion": self.retrieval.query_expansion,
                 "expand_with_synonyms": self.retrieval.expand_with_synonyms,
                 "enable_metadata_filtering": self.retrieval.enable_metadata_filtering,
@@ -14,12 +14,10 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-    pdfplumber = None
+from ....utils.lazy_import import lazy_import
+
+pdfplumber = lazy_import("pdfplumber")
+PDFPLUMBER_AVAILABLE = pdfplumber is not None
 
 try:
     import pypdf
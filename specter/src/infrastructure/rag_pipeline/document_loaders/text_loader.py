@@ -16,6 +16,8 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
+from ....utils.lazy_import import lazy_import
+
 try:
     import chardet
     CHARDET_AVAILABLE = True
@@ -23,12 +25,8 @@ except ImportError:
     CHARDET_AVAILABLE = False
     chardet = None
 
-try:
-    import docx
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    docx = None
+docx = lazy_import("docx")
+DOCX_AVAILABLE = docx is not None
 
 try:
     from bs4 import BeautifulSoup
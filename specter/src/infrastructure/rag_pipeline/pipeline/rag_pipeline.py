@@ -12,9 +12,11 @@ Complete RAG pipeline implementation that integrates:
 """
 
 import asyncio
+import hashlib
 import logging
 import time
-from typing import List, Dict, Optional, Any, Tuple, Union
+from collections import Counter
+from typing import List, Dict, Optional, Any, Tuple, Union, Callable
 from dataclasses import dataclass
 from pathlib import Path
 import os
@@ -26,12 +28,18 @@ from ..document_loaders.loader_factory import DocumentLoaderFactory, load_docume
 from ..document_loaders.base_loader import Document
 from ..text_processing.text_splitter import TextSplitterFactory, TextChunk
 from ..vector_store.chromadb_client import ChromaDBClient, SearchResult
-from ..vector_store.faiss_client import FaissClient
+from ..vector_store.faiss_client import FaissClient, VERSION_SCOPE_KEYS
+from ..vector_store.lexical_index import identifier_terms
 from ..services.embedding_service import EmbeddingService
+from ..services.embedding_scheduler import EmbeddingBatcher, EmbeddingProgressCallback
 from ...ai.session_manager import session_manager
 
 logger = logging.getLogger("specter.rag_pipeline")
 
+# Ingestion stage observer: (stage name, seconds spent, items produced).
+# Stages are reported in order: "load", "split", "embed", "store".
+StageCallback = Callable[[str, float, int], None]
+
 
 @dataclass
 class RAGQuery:
@@ -92,6 +100,10 @@ class RAGPipeline:
             cache_ttl=(self.config.embedding.cache_ttl_hours or 24) * 3600
         )
         
+        # Cross-document embedding batcher, created on first use per event loop
+        self._embedding_batcher: Optional[EmbeddingBatcher] = None
+        self._embedding_batcher_loop = None
+        
         # Propagate configured keys/models into environment for components that expect them (Chroma client, tests, etc.)
         try:
             if getattr(self.config, "embedding", None) and getattr(self.config.embedding, "api_key", None):
@@ -165,18 +177,40 @@ class RAGPipeline:
             return False
     
     async def ingest_document(self, source: Union[str, Path], 
-                            metadata_override: Optional[Dict[str, Any]] = None) -> str:
+                            metadata_override: Optional[Dict[str, Any]] = None,
+                            stage_callback: Optional[StageCallback] = None,
+                            embedding_progress: Optional[EmbeddingProgressCallback] = None) -> str:
         """
         Ingest a single document into the RAG pipeline.
         
+        If the vector store already holds a version of the same source (in
+        the same conversation/collection scope), the stored document is
+        updated in place: unchanged chunks keep their vectors, only new or
+        changed chunks are embedded, and removed chunks are tombstoned.
+        
         Args:
             source: Document source (file path or URL)
             metadata_override: Optional metadata to override/add
+            stage_callback: Optional observer called after each ingestion stage
+                with (stage, seconds, item_count)
+            embedding_progress: Optional callback(embedded, total) as chunk
+                embeddings complete
             
         Returns:
             Document ID or None if embedding generation fails
         """
         start_time = time.time()
+        stage_start = start_time
+        
+        def report_stage(stage: str, count: int):
+            nonlocal stage_start
+            now = time.time()
+            if stage_callback:
+                try:
+                    stage_callback(stage, now - stage_start, count)
+                except Exception as e:
+                    self.logger.debug(f"Stage callback failed for {stage}: {e}")
+            stage_start = now
         
         try:
             # 1. Load document
@@ -187,32 +221,72 @@ class RAGPipeline:
             if metadata_override:
                 for key, value in metadata_override.items():
                     setattr(document.metadata, key, value)
+            report_stage("load", 1)
             
             # 2. Split document into chunks
             self.logger.info(f"Splitting document into chunks")
-            chunks = self.text_splitter.split_text(document.content)
+            chunks = self.text_splitter.split_text_stable(document.content)
+            for chunk in chunks:
+                if metadata_override:
+                    # Vector stores persist chunk metadata, so carry overrides
+                    # (conversation_id, collection_id, checksum, ...) onto each chunk
+                    chunk.metadata.update(metadata_override)
+                chunk.metadata['chunk_hash'] = hashlib.sha256(chunk.content.encode('utf-8')).hexdigest()
+                chunk.metadata['chunk_config'] = self.config.text_processing.chunking_key()
+            report_stage("split", len(chunks))
+            
+            # Compare against the stored version of this source, if any, so
+            # only new or changed chunks are embedded. Unchanged content split
+            # with different chunking settings still has to be re-chunked.
+            previous = await self._get_previous_version(document, metadata_override)
+            if (previous and previous['content_hash'] == document.content_hash
+                    and previous.get('chunk_config') == self.config.text_processing.chunking_key()):
+                self.logger.info(f"Document unchanged since last ingestion: {previous['document_id']}")
+                return previous['document_id']
+            
+            reusable = Counter(previous['chunk_hashes']) if previous else Counter()
+            to_embed = []
+            for position, chunk in enumerate(chunks):
+                chunk_hash = chunk.metadata['chunk_hash']
+                if reusable[chunk_hash] > 0:
+                    reusable[chunk_hash] -= 1
+                else:
+                    to_embed.append(position)
             
-            # 3. Generate embeddings for chunks
-            self.logger.info(f"Generating embeddings for {len(chunks)} chunks")
-            embeddings = await self._generate_embeddings([chunk.content for chunk in chunks])
+            # 3. Generate embeddings for new or changed chunks
+            self.logger.info(f"Generating embeddings for {len(to_embed)}/{len(chunks)} chunks")
+            new_embeddings = await self._generate_embeddings(
+                [chunks[position].content for position in to_embed], embedding_progress
+            )
+            report_stage("embed", len(new_embeddings))
             
             # 4. Check if any embeddings failed - if so, skip storage to prevent crashes
-            failed_embeddings = sum(1 for emb in embeddings if self._is_fallback_embedding(emb))
+            failed_embeddings = sum(1 for emb in new_embeddings if self._is_fallback_embedding(emb))
             if failed_embeddings > 0:
-                self.logger.error(f"⚠️ Skipping document storage due to {failed_embeddings}/{len(embeddings)} failed embeddings")
+                self.logger.error(f"⚠️ Skipping document storage due to {failed_embeddings}/{len(new_embeddings)} failed embeddings")
                 self.logger.error(f"💡 This prevents ChromaDB segfault - fix your OpenAI API key to enable proper embedding storage")
                 # Return a fake document ID to indicate processing completed but storage was skipped
                 return f"skipped_{int(time.time())}"
             
             # 5. Store in vector database (only if all embeddings are valid)
             self.logger.info(f"Storing chunks in vector database")
-            chunk_ids = await self.vector_store.store_document(document, chunks, embeddings)
+            if previous:
+                # None marks chunks whose stored vector is kept
+                embeddings: List[Optional[np.ndarray]] = [None] * len(chunks)
+                for position, embedding in zip(to_embed, new_embeddings):
+                    embeddings[position] = embedding
+                chunk_ids = await self.vector_store.update_document(
+                    previous['document_id'], document, chunks, embeddings
+                )
+            else:
+                chunk_ids = await self.vector_store.store_document(document, chunks, new_embeddings)
+            report_stage("store", len(chunk_ids))
             
             # Update statistics
             processing_time = time.time() - start_time
             self._stats['documents_processed'] += 1
             self._stats['chunks_created'] += len(chunks)
-            self._stats['embeddings_generated'] += len(embeddings)
+            self._stats['embeddings_generated'] += len(new_embeddings)
             self._stats['total_processing_time'] += processing_time
             
             document_id = chunk_ids[0].split('_')[0] if chunk_ids else 'unknown'
@@ -226,24 +300,63 @@ class RAGPipeline:
             self.logger.error(f"Failed to ingest document {source}: {e}")
             raise
     
+    async def _get_previous_version(self, document: Document,
+                                    metadata_override: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Get the stored version of a document's source within the same scope."""
+        if not hasattr(self.vector_store, 'get_document_version') or not document.metadata.source:
+            return None
+        scope = {
+            key: value for key, value in (metadata_override or {}).items()
+            if key in VERSION_SCOPE_KEYS
+        }
+        try:
+            return await self.vector_store.get_document_version(document.metadata.source, scope)
+        except Exception as e:
+            self.logger.warning(f"Could not look up previous version of {document.metadata.source}: {e}")
+            return None
+    
     async def ingest_documents(self, sources: List[Union[str, Path]], 
-                             max_concurrent: int = 3) -> List[Optional[str]]:
+                             max_concurrent: int = 3,
+                             metadata_override: Optional[Dict[str, Any]] = None,
+                             file_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+                             progress_callback: Optional[Callable[[str, int, int], None]] = None
+                             ) -> List[Optional[str]]:
         """
         Ingest multiple documents concurrently.
         
+        Embedding requests from all documents in flight are batched together,
+        so throughput is bounded by the embedding endpoint rather than by
+        per-document round trips.
+        
         Args:
             sources: List of document sources
             max_concurrent: Maximum concurrent ingestion operations
+            metadata_override: Optional metadata applied to every document
+            file_metadata: Optional per-source metadata keyed by source path,
+                merged over metadata_override
+            progress_callback: Optional callback(source, embedded, total)
+                reporting per-document embedding progress
             
         Returns:
             List of document IDs (None for failed ingestions)
         """
         semaphore = asyncio.Semaphore(max_concurrent)
         
+        def metadata_for(source) -> Optional[Dict[str, Any]]:
+            per_file = (file_metadata or {}).get(str(source))
+            if not metadata_override and not per_file:
+                return None
+            return {**(metadata_override or {}), **(per_file or {})}
+        
         async def ingest_with_semaphore(source):
             async with semaphore:
+                progress = None
+                if progress_callback:
+                    progress = lambda done, total: progress_callback(str(source), done, total)
                 try:
-                    return await self.ingest_document(source)
+                    return await self.ingest_document(
+                        source, metadata_for(source), embedding_progress=progress
+                    )
                 except Exception as e:
                     self.logger.error(f"Failed to ingest {source}: {e}")
                     return None
@@ -264,6 +377,54 @@ class RAGPipeline:
         
         return document_ids
     
+    async def find_indexed_documents(self, checksums: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Look up documents already stored for the given content checksums.
+        
+        Args:
+            checksums: SHA-256 checksums recorded in chunk metadata at ingestion
+            
+        Returns:
+            Dict mapping checksum to a list of stored document summaries
+            (document_id, conversation_id, collection_id). Only documents
+            split with the current chunking settings are returned. Empty if
+            the vector store cannot be queried by metadata.
+        """
+        if not hasattr(self.vector_store, 'find_documents_by_metadata'):
+            return {}
+        found = await self.vector_store.find_documents_by_metadata('checksum', checksums)
+        chunk_config = self.config.text_processing.chunking_key()
+        indexed = {}
+        for checksum, docs in found.items():
+            reusable = [doc for doc in docs if doc.get('chunk_config') == chunk_config]
+            if reusable:
+                indexed[checksum] = reusable
+        return indexed
+    
+    async def reuse_documents(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[str]]:
+        """
+        Store copies of already-embedded documents under new metadata.
+        
+        Reuses the stored chunks and vectors, so no embeddings are generated.
+        
+        Args:
+            requests: List of (existing document_id, metadata updates)
+            
+        Returns:
+            New document IDs in request order (None where the copy failed or
+            the vector store does not support it)
+        """
+        if not requests:
+            return []
+        if not hasattr(self.vector_store, 'copy_documents'):
+            return [None] * len(requests)
+        
+        new_ids = await self.vector_store.copy_documents(requests)
+        reused = len([doc_id for doc_id in new_ids if doc_id])
+        self._stats['documents_processed'] += reused
+        self.logger.info(f"Reused embeddings for {reused}/{len(requests)} documents")
+        return new_ids
+    
     async def query(self, query: Union[str, RAGQuery]) -> RAGResponse:
         """
         Process a query through the complete RAG pipeline.
@@ -283,32 +444,58 @@ class RAGPipeline:
             rag_query = query
         
         try:
-            # 1. Generate query embedding
-            self.logger.debug(f"Generating embedding for query: {rag_query.text[:100]}...")
-            query_embeddings = await self._generate_embeddings([rag_query.text])
-            query_embedding = query_embeddings[0]
-            
-            # 2. Check if query embedding failed - if so, return empty response
-            if self._is_fallback_embedding(query_embedding):
-                self.logger.error("⚠️ Query embedding failed - cannot perform search")
-                self.logger.error("💡 Fix your OpenAI API key to enable RAG queries")
-                return RAGResponse(
-                    query=rag_query.text,
-                    answer="I apologize, but I cannot process your query due to an embedding service issue. Please check your API configuration.",
-                    sources=[],
-                    context_used="",
-                    processing_time=time.time() - start_time,
-                    metadata={'error': 'embedding_failed'}
-                )
-            
-            # 3. Retrieve relevant chunks
             top_k = rag_query.top_k or self.config.retrieval.top_k
-            search_results = await self.vector_store.similarity_search(
-                query_embedding=query_embedding,
-                top_k=top_k,
-                filters=rag_query.filters,
-                include_embeddings=False
-            )
+            retrieval = self.config.retrieval
+            use_hybrid = retrieval.enable_hybrid_search and hasattr(self.vector_store, 'hybrid_search')
+            search_results = None
+            
+            # Identifier-style queries (error codes, function names) are
+            # answered from the lexical index when it has exact hits
+            if use_hybrid and retrieval.lexical_fast_path:
+                terms = identifier_terms(rag_query.text)
+                if terms:
+                    lexical_results = await self.vector_store.lexical_search(
+                        rag_query.text, top_k=top_k, filters=rag_query.filters, required_terms=terms
+                    )
+                    if lexical_results:
+                        self.logger.debug(f"Lexical fast path answered query with {len(lexical_results)} results")
+                        search_results = lexical_results
+            
+            if search_results is None:
+                # 1. Generate query embedding
+                self.logger.debug(f"Generating embedding for query: {rag_query.text[:100]}...")
+                query_embeddings = await self._generate_embeddings([rag_query.text])
+                query_embedding = query_embeddings[0]
+                
+                # 2. Check if query embedding failed - if so, return empty response
+                if self._is_fallback_embedding(query_embedding):
+                    self.logger.error("⚠️ Query embedding failed - cannot perform search")
+                    self.logger.error("💡 Fix your OpenAI API key to enable RAG queries")
+                    return RAGResponse(
+                        query=rag_query.text,
+                        answer="I apologize, but I cannot process your query due to an embedding service issue. Please check your API configuration.",
+                        sources=[],
+                        context_used="",
+                        processing_time=time.time() - start_time,
+                        metadata={'error': 'embedding_failed'}
+                    )
+                
+                # 3. Retrieve relevant chunks
+                if use_hybrid:
+                    search_results = await self.vector_store.hybrid_search(
+                        query_text=rag_query.text,
+                        query_embedding=query_embedding,
+                        top_k=top_k,
+                        filters=rag_query.filters,
+                        rrf_k=retrieval.rrf_k
+                    )
+                else:
+                    search_results = await self.vector_store.similarity_search(
+                        query_embedding=query_embedding,
+                        top_k=top_k,
+                        filters=rag_query.filters,
+                        include_embeddings=False
+                    )
             
             # 4. Filter by similarity threshold
             # 4. Disabled threshold filtering; rely on top_k ordering only
@@ -353,13 +540,32 @@ class RAGPipeline:
             self.logger.error(f"Query processing failed: {e}")
             raise
     
-    async def _generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+    def _get_embedding_batcher(self) -> EmbeddingBatcher:
+        """Get the embedding batcher bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._embedding_batcher is None or self._embedding_batcher_loop is not loop:
+            if self._embedding_batcher is not None:
+                self._embedding_batcher.close()
+            embedding_config = self.config.embedding
+            self._embedding_batcher = EmbeddingBatcher(
+                self.embedding_service,
+                batch_size=embedding_config.batch_size,
+                max_concurrent_requests=embedding_config.max_concurrent_requests,
+                tokens_per_minute=embedding_config.tokens_per_minute
+            )
+            self._embedding_batcher_loop = loop
+        return self._embedding_batcher
+    
+    async def _generate_embeddings(self, texts: List[str],
+                                   progress_callback: Optional[EmbeddingProgressCallback] = None
+                                   ) -> List[np.ndarray]:
         """Generate embeddings for a list of texts."""
+        results = await self._get_embedding_batcher().embed(texts, progress_callback)
+        
         embeddings = []
         failed_count = 0
         
-        for text in texts:
-            embedding = self.embedding_service.create_embedding(text)
+        for text, embedding in zip(texts, results):
             if embedding is not None:
                 embeddings.append(embedding)
             else:
@@ -587,6 +793,8 @@ class RAGPipeline:
         
         # Add component stats
         stats['embedding_service'] = self.embedding_service.get_stats()
+        if self._embedding_batcher is not None:
+            stats['embedding_batcher'] = self._embedding_batcher.get_stats()
         stats['vector_store'] = self.vector_store.get_stats()
         stats['document_loader'] = self.document_loader_factory.get_loader_stats()
         
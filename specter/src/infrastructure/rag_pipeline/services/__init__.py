@@ -3,5 +3,6 @@ Services for RAG Pipeline.
 """
 
 from .embedding_service import EmbeddingService
+from .embedding_scheduler import EmbeddingBatcher, TokenRateLimiter
 
-__all__ = ['EmbeddingService']
\ No newline at end of file
+__all__ = ['EmbeddingService', 'EmbeddingBatcher', 'TokenRateLimiter']
\ No newline at end of file
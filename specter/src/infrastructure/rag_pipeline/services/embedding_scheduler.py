@@ -0,0 +1,217 @@
+"""
+Embedding scheduler for concurrent document ingestion.
+
+Coalesces embedding requests from all documents in flight into shared
+batches, runs the blocking EmbeddingService calls on a thread pool, and
+bounds them with a global request limit and a token-rate limiter.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from .embedding_service import EmbeddingService
+
+logger = logging.getLogger("specter.embedding_scheduler")
+
+# Progress observer: (embedded_so_far, total)
+EmbeddingProgressCallback = Callable[[int, int], None]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) used for rate limiting."""
+    return max(1, len(text) // 4)
+
+
+class TokenRateLimiter:
+    """
+    Token bucket limiting embedding throughput in tokens per minute.
+
+    A limit of 0 disables rate limiting.
+    """
+
+    def __init__(self, tokens_per_minute: int = 0):
+        self.capacity = max(0, tokens_per_minute)
+        self._rate = self.capacity / 60.0
+        self._available = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int):
+        """Wait until `tokens` can be spent (capped at the bucket capacity)."""
+        if not self.capacity:
+            return
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._available = min(
+                    self.capacity, self._available + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._available >= tokens:
+                    self._available -= tokens
+                    return
+                await asyncio.sleep((tokens - self._available) / self._rate)
+
+
+@dataclass
+class _PendingText:
+    """A text waiting to be embedded, with the request it belongs to."""
+    text: str
+    index: int
+    request: "_EmbeddingRequest"
+
+
+@dataclass
+class _EmbeddingRequest:
+    """One caller's texts; resolved once every text has an embedding (or None)."""
+    total: int
+    future: asyncio.Future
+    progress_callback: Optional[EmbeddingProgressCallback] = None
+    results: List[Optional[np.ndarray]] = field(default_factory=list)
+    done: int = 0
+
+    def __post_init__(self):
+        self.results = [None] * self.total
+
+    def resolve(self, index: int, embedding: Optional[np.ndarray]):
+        self.results[index] = embedding
+        self.done += 1
+        if self.progress_callback:
+            try:
+                self.progress_callback(self.done, self.total)
+            except Exception as e:
+                logger.debug(f"Embedding progress callback failed: {e}")
+        if self.done == self.total and not self.future.done():
+            self.future.set_result(self.results)
+
+
+class EmbeddingBatcher:
+    """
+    Shares embedding batches across concurrently ingested documents.
+
+    Callers submit their chunk texts with `embed()`. Pending texts from all
+    callers are drained into batches of up to `batch_size`, and each batch is
+    sent through `EmbeddingService.create_batch_embeddings` on a worker
+    thread, so the event loop is never blocked. At most
+    `max_concurrent_requests` batches are in flight at once.
+
+    The batcher is bound to the event loop it was first used on.
+    """
+
+    def __init__(self, embedding_service: EmbeddingService,
+                 batch_size: int = 100,
+                 max_concurrent_requests: int = 4,
+                 tokens_per_minute: int = 0,
+                 linger_seconds: float = 0.01):
+        self.embedding_service = embedding_service
+        self.batch_size = max(1, batch_size)
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.linger_seconds = linger_seconds
+        self.rate_limiter = TokenRateLimiter(tokens_per_minute)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests, thread_name_prefix="Embedding"
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._pending: List[_PendingText] = []
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._batches: set = set()
+
+        self._stats = {
+            'batches_sent': 0,
+            'texts_embedded': 0,
+        }
+
+    async def embed(self, texts: List[str],
+                    progress_callback: Optional[EmbeddingProgressCallback] = None
+                    ) -> List[Optional[np.ndarray]]:
+        """
+        Embed texts, batching them with other in-flight callers.
+
+        Args:
+            texts: Texts to embed
+            progress_callback: Optional callback(done, total) as batches finish
+
+        Returns:
+            Embeddings in input order (None where embedding failed)
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        request = _EmbeddingRequest(len(texts), loop.create_future(), progress_callback)
+        self._pending.extend(_PendingText(text, i, request) for i, text in enumerate(texts))
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+        self._wakeup.set()
+
+        return await request.future
+
+    async def _dispatch(self):
+        """Drain pending texts into batches until nothing is left."""
+        while self._pending:
+            # Give concurrently ingested documents a moment to contribute
+            # before cutting a partial batch
+            if len(self._pending) < self.batch_size and self.linger_seconds > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.linger_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+            await self._semaphore.acquire()
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            if not batch:
+                self._semaphore.release()
+                break
+
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: List[_PendingText]):
+        """Embed one batch on the executor and resolve its callers."""
+        try:
+            texts = [item.text for item in batch]
+            await self.rate_limiter.acquire(sum(estimate_tokens(text) for text in texts))
+
+            loop = asyncio.get_running_loop()
+            embeddings = await loop.run_in_executor(
+                self._executor,
+                self.embedding_service.create_batch_embeddings,
+                texts,
+                None,
+                len(texts)
+            )
+            self._stats['batches_sent'] += 1
+            self._stats['texts_embedded'] += sum(1 for e in embeddings if e is not None)
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(batch)} texts failed: {e}")
+            embeddings = [None] * len(batch)
+        finally:
+            self._semaphore.release()
+
+        for item, embedding in zip(batch, embeddings):
+            item.request.resolve(item.index, embedding)
+
+    def get_stats(self):
+        """Get batching statistics."""
+        return {
+            **self._stats,
+            'pending_texts': len(self._pending),
+            'batches_in_flight': len(self._batches),
+        }
+
+    def close(self):
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
@@ -6,8 +6,9 @@ and error handling for production use.
 """
 
 import logging
+import threading
 import time
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from functools import lru_cache
 import hashlib
 import json
@@ -17,6 +18,10 @@ import requests
 
 logger = logging.getLogger("specter.embedding_service")
 
+# Client errors that mean the endpoint is unusable as a whole, not that it
+# rejected multi-input requests
+_NON_BATCH_CLIENT_ERRORS = (401, 403, 404, 429)
+
 
 class EmbeddingService:
     """
@@ -88,6 +93,13 @@ class EmbeddingService:
         # Rate limiting
         self._last_request_time = 0
         
+        # Guards cache and rate-limit state; the pipeline calls this service
+        # from executor threads
+        self._lock = threading.Lock()
+        
+        # Cleared once the endpoint rejects multi-input requests
+        self._batch_input_supported = True
+        
         # Statistics
         self.stats = {
             'requests_made': 0,
@@ -132,23 +144,28 @@ class EmbeddingService:
     
     def _store_in_cache(self, cache_key: str, embedding: np.ndarray):
         """Store embedding in cache."""
-        # Clean old entries if cache is full
-        if len(self._cache) >= self._max_cache_size:
-            oldest_key = min(self._cache_timestamps.keys(), 
-                           key=lambda k: self._cache_timestamps[k])
-            del self._cache[oldest_key]
-            del self._cache_timestamps[oldest_key]
-        
-        self._cache[cache_key] = embedding
-        self._cache_timestamps[cache_key] = time.time()
+        with self._lock:
+            # Clean old entries if cache is full
+            if len(self._cache) >= self._max_cache_size:
+                oldest_key = min(self._cache_timestamps.keys(), 
+                               key=lambda k: self._cache_timestamps[k])
+                del self._cache[oldest_key]
+                del self._cache_timestamps[oldest_key]
+            
+            self._cache[cache_key] = embedding
+            self._cache_timestamps[cache_key] = time.time()
     
     def _rate_limit(self):
         """Apply rate limiting between requests."""
-        if self.rate_limit_delay > 0:
-            time_since_last = time.time() - self._last_request_time
-            if time_since_last < self.rate_limit_delay:
-                time.sleep(self.rate_limit_delay - time_since_last)
-        self._last_request_time = time.time()
+        if self.rate_limit_delay <= 0:
+            return
+        # Reserve the next request slot under the lock, sleep outside it
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._last_request_time + self.rate_limit_delay)
+            self._last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def _should_retry(self, status_code: int, attempt: int, max_retries: int = 3) -> float:
         """
@@ -233,6 +250,99 @@ class EmbeddingService:
             logger.error(f"Error parsing embedding response: {e}")
             return None
     
+    def _record_usage(self, response_data: Dict[str, Any]):
+        """Accumulate token usage reported by the API."""
+        if 'usage' in response_data:
+            self.stats['total_tokens_processed'] += response_data['usage'].get('total_tokens', 0)
+
+    def _post_embeddings(self, request_data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        POST to the embeddings endpoint with retry and backoff.
+
+        Args:
+            request_data: JSON request body
+
+        Returns:
+            Tuple of (parsed JSON response or None if the request ultimately
+            failed, last HTTP status code or None if no response was received)
+        """
+        max_retries = 3
+        last_error = None
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.session_manager.make_request(
+                    method="POST",
+                    url=f"{self.api_endpoint}/embeddings",
+                    json=request_data,
+                    headers=self.headers,
+                    timeout=self.timeout
+                )
+                self.stats['requests_made'] += 1
+
+                if response.status_code == 200:
+                    return response.json(), response.status_code
+
+                # Check if we should retry
+                retry_delay = self._should_retry(response.status_code, attempt, max_retries)
+                if retry_delay > 0:
+                    logger.warning(
+                        f"Embedding request failed (HTTP {response.status_code}), "
+                        f"retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})"
+                    )
+                    time.sleep(retry_delay)
+                    continue
+
+                # Non-retryable error
+                error_msg = self._get_error_message(response.status_code, response.text)
+                logger.error(error_msg)
+                self.stats['errors'] += 1
+                return None, response.status_code
+
+            except requests.exceptions.Timeout:
+                last_error = "timeout"
+                if attempt < max_retries:
+                    logger.warning(f"Embedding request timed out, retrying (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(1)
+                    continue
+                logger.error(f"Embedding request timed out after {max_retries} retries")
+                self.stats['errors'] += 1
+                return None, None
+
+            except requests.exceptions.ConnectionError as e:
+                last_error = str(e)
+                if attempt < max_retries:
+                    logger.warning(f"Connection error, retrying (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(1)
+                    continue
+                logger.error(
+                    f"Cannot connect to embedding endpoint: {self.api_endpoint}. "
+                    f"Verify the URL in Settings → Advanced. Error: {e}"
+                )
+                self.stats['errors'] += 1
+                return None, None
+
+        # All retries exhausted
+        logger.error(f"Embedding failed after all retries. Last error: {last_error}")
+        self.stats['errors'] += 1
+        return None, None
+
+    def _parse_batch_response(self, response_data: Dict[str, Any], count: int) -> Optional[List[np.ndarray]]:
+        """Parse a multi-input embedding response, ordered like the request."""
+        try:
+            if 'data' in response_data:
+                # OpenAI format; items carry their input index
+                items = response_data['data']
+                if isinstance(items, list) and len(items) == count:
+                    ordered = sorted(items, key=lambda item: item.get('index', 0))
+                    return [np.array(item['embedding'], dtype=np.float32) for item in ordered]
+            elif 'embeddings' in response_data:
+                items = response_data['embeddings']
+                if isinstance(items, list) and len(items) == count:
+                    return [np.array(item, dtype=np.float32) for item in items]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Error parsing batch embedding response: {e}")
+        return None
+
     def create_embedding(self, text: str, model: str = None) -> Optional[np.ndarray]:
         """
         Create embedding for text with caching, retry, and error handling.
@@ -267,77 +377,20 @@ class EmbeddingService:
 
             logger.debug(f"Creating embedding for {len(text)} characters")
 
-            # Retry loop
-            max_retries = 3
-            last_error = None
-            for attempt in range(max_retries + 1):
-                try:
-                    response = self.session_manager.make_request(
-                        method="POST",
-                        url=f"{self.api_endpoint}/embeddings",
-                        json=request_data,
-                        headers=self.headers,
-                        timeout=self.timeout
-                    )
-                    self.stats['requests_made'] += 1
-
-                    if response.status_code == 200:
-                        response_data = response.json()
-                        embedding = self._parse_response(response_data)
-                        if embedding is not None:
-                            self._store_in_cache(cache_key, embedding)
-                            if 'usage' in response_data:
-                                self.stats['total_tokens_processed'] += response_data['usage'].get('total_tokens', 0)
-                            logger.debug(f"Successfully created embedding: {embedding.shape}")
-                            return embedding
-                        else:
-                            logger.error("Failed to parse embedding from response")
-                            self.stats['errors'] += 1
-                            return None
-
-                    # Check if we should retry
-                    retry_delay = self._should_retry(response.status_code, attempt, max_retries)
-                    if retry_delay > 0:
-                        logger.warning(
-                            f"Embedding request failed (HTTP {response.status_code}), "
-                            f"retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})"
-                        )
-                        time.sleep(retry_delay)
-                        continue
-
-                    # Non-retryable error
-                    error_msg = self._get_error_message(response.status_code, response.text)
-                    logger.error(error_msg)
-                    self.stats['errors'] += 1
-                    return None
-
-                except requests.exceptions.Timeout:
-                    last_error = "timeout"
-                    if attempt < max_retries:
-                        logger.warning(f"Embedding request timed out, retrying (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(1)
-                        continue
-                    logger.error(f"Embedding request timed out after {max_retries} retries")
-                    self.stats['errors'] += 1
-                    return None
-
-                except requests.exceptions.ConnectionError as e:
-                    last_error = str(e)
-                    if attempt < max_retries:
-                        logger.warning(f"Connection error, retrying (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(1)
-                        continue
-                    logger.error(
-                        f"Cannot connect to embedding endpoint: {self.api_endpoint}. "
-                        f"Verify the URL in Settings → Advanced. Error: {e}"
-                    )
-                    self.stats['errors'] += 1
-                    return None
+            response_data, _ = self._post_embeddings(request_data)
+            if response_data is None:
+                return None
 
-            # All retries exhausted
-            logger.error(f"Embedding failed after all retries. Last error: {last_error}")
-            self.stats['errors'] += 1
-            return None
+            embedding = self._parse_response(response_data)
+            if embedding is None:
+                logger.error("Failed to parse embedding from response")
+                self.stats['errors'] += 1
+                return None
+
+            self._store_in_cache(cache_key, embedding)
+            self._record_usage(response_data)
+            logger.debug(f"Successfully created embedding: {embedding.shape}")
+            return embedding
 
         except ValueError as e:
             logger.error(f"Invalid embedding input: {e}")
@@ -357,6 +410,13 @@ class EmbeddingService:
         """
         Create embeddings for multiple texts with batching.
         
+        Each batch is sent as a single multi-input request. If the endpoint
+        rejects list input (a client error other than auth, not-found or rate
+        limiting) or answers it without one embedding per text, the batch and
+        every later one are embedded one text at a time. Network failures,
+        timeouts and server errors are not retried per text; those texts
+        come back as None.
+        
         Args:
             texts: List of texts to embed
             model: Override default model
@@ -368,31 +428,77 @@ class EmbeddingService:
         if not texts:
             return []
         
-        embeddings = []
+        model = model or self.model
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
         
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i+batch_size]
-            batch_embeddings = []
+        # Resolve cache hits and invalid inputs up front
+        pending = []  # (index, cleaned text, cache key)
+        for i, text in enumerate(texts):
+            try:
+                cleaned = self._validate_input(text)
+            except ValueError as e:
+                logger.error(f"Invalid embedding input: {e}")
+                self.stats['errors'] += 1
+                continue
+            cache_key = self._generate_cache_key(cleaned, model)
+            cached_embedding = self._get_embedding_from_cache(cache_key)
+            if cached_embedding is not None:
+                embeddings[i] = cached_embedding
+            else:
+                pending.append((i, cleaned, cache_key))
+        
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
             
-            # For now, process individually (can be optimized for APIs supporting batch)
-            for text in batch:
-                embedding = self.create_embedding(text, model)
-                batch_embeddings.append(embedding)
-                
-                # Brief pause between requests in batch
-                if len(batch) > 1:
-                    time.sleep(0.05)
+            if not self._batch_input_supported:
+                for i, cleaned, _ in batch:
+                    embeddings[i] = self.create_embedding(cleaned, model)
+                continue
             
-            embeddings.extend(batch_embeddings)
+            self._rate_limit()
+            request_data = {
+                'input': [cleaned for _, cleaned, _ in batch],
+                'model': model
+            }
+            request_data.update(self._get_provider_params())
+            
+            response_data, status_code = self._post_embeddings(request_data)
+            if response_data is None:
+                if self._rejects_batch_input(status_code):
+                    logger.warning(
+                        f"Embedding endpoint rejected batch input (HTTP {status_code}), "
+                        f"embedding texts individually"
+                    )
+                    self._batch_input_supported = False
+                    for i, cleaned, _ in batch:
+                        embeddings[i] = self.create_embedding(cleaned, model)
+                continue
             
-            # Pause between batches
-            if i + batch_size < len(texts):
-                time.sleep(0.2)
+            batch_embeddings = self._parse_batch_response(response_data, len(batch))
+            if batch_embeddings is None:
+                logger.warning("Embedding endpoint did not answer batch input per text, embedding texts individually")
+                self._batch_input_supported = False
+                for i, cleaned, _ in batch:
+                    embeddings[i] = self.create_embedding(cleaned, model)
+                continue
+            
+            self._record_usage(response_data)
+            for (i, _, cache_key), embedding in zip(batch, batch_embeddings):
+                self._store_in_cache(cache_key, embedding)
+                embeddings[i] = embedding
         
         logger.info(f"Created {len([e for e in embeddings if e is not None])}/{len(texts)} embeddings")
         return embeddings
     
+    @staticmethod
+    def _rejects_batch_input(status_code: Optional[int]) -> bool:
+        """Whether a failed multi-input request was refused for its list input."""
+        return (
+            status_code is not None
+            and 400 <= status_code < 500
+            and status_code not in _NON_BATCH_CLIENT_ERRORS
+        )
+    
     def _get_provider_params(self) -> Dict[str, Any]:
         """Get provider-specific parameters."""
         # Can be extended for different providers
@@ -12,6 +12,11 @@ from typing import Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
 
+from ..logging.debug_channel import debug_channel
+
+# Structured tracing of selection decisions (disabled unless the "context" channel is enabled)
+_trace = debug_channel("context")
+
 
 class ContextSource(Enum):
     """Source type for context results."""
@@ -106,22 +111,21 @@ class SmartContextSelector:
         }
         
         # Generate query embedding once
-        self.logger.warning(f"🔍 EMBEDDING: Generating embedding for query: '{query_text[:50]}...'")
         query_embedding = embedding_service.create_embedding(query_text)
         if query_embedding is None:
             self.logger.error("Failed to generate query embedding")
             return [], selection_info
-        self.logger.warning(f"🔍 EMBEDDING: Successfully generated embedding with {len(query_embedding)} dimensions")
+        if _trace:
+            _trace("embedding", query=query_text[:50], dimensions=len(query_embedding))
         
         all_results = []
         
         if strict_conversation_isolation:
-            self.logger.warning("🚨 NUCLEAR OPTION: MAXIMUM STRICT CONVERSATION ISOLATION ENABLED")
-            self.logger.warning("🚫 NO FALLBACKS - NO GLOBAL FILES - NO CROSS-CONTAMINATION")
-            
             # In strict mode, ONLY search conversation-specific files
             if conversation_id:
-                self.logger.warning(f"🔒 NUCLEAR: Searching ONLY for files in conversation {conversation_id[:8]}...")
+                if _trace:
+                    _trace("strict_isolation", conversation=conversation_id[:8],
+                           additional_filters=additional_filters)
                 
                 # Tier 1: Conversation-specific files (includes collection tags if provided)
                 conversation_results = await self._search_conversation_files(
@@ -138,39 +142,25 @@ class SmartContextSelector:
                 selection_info['strategies_attempted'].append('pending')
 
                 # Tier 3: Collection-tagged files (if additional_filters provided)
-                self.logger.warning(f"🔍 TIER 3 CHECK: additional_filters = {additional_filters}")
-                self.logger.warning(f"🔍 TIER 3 CHECK: additional_filters is None? {additional_filters is None}")
-                if additional_filters:
-                    self.logger.warning(f"🔍 TIER 3 CHECK: 'collection_tag' in additional_filters? {'collection_tag' in additional_filters}")
-
                 if additional_filters and 'collection_tag' in additional_filters:
                     collection_tags = additional_filters['collection_tag']
-                    self.logger.warning(f"🔍 TIER 3 CHECK: collection_tags = {collection_tags}, type = {type(collection_tags)}")
                     if isinstance(collection_tags, list) and len(collection_tags) > 0:
-                        self.logger.warning(f"🏷️  COLLECTION TAGS: Searching for tags {collection_tags}...")
                         collection_results = await self._search_collection_files(
                             faiss_client, query_embedding, collection_tags, top_k, selection_info
                         )
                         all_results.extend(collection_results)
                         selection_info['strategies_attempted'].append('collection_tags')
                         self.logger.info(f"✅ Found {len(collection_results)} results from collection tags")
-                    else:
-                        self.logger.warning(f"🔍 TIER 3 CHECK: collection_tags is not a non-empty list")
-                else:
-                    self.logger.warning(f"🔍 TIER 3 CHECK: SKIPPING - additional_filters is None or no 'collection_tag' key")
-
-                # NUCLEAR OPTION: Log exactly what we found
-                total_found = len(all_results)
-                self.logger.warning(f"🔍 NUCLEAR RESULT: Found {total_found} files STRICTLY from conversation {conversation_id[:8]}... + collections")
+                    elif _trace:
+                        _trace("collection_tags.invalid", collection_tags=collection_tags)
 
                 if not all_results:
-                    self.logger.warning(f"🚨 NUCLEAR: ZERO files found for conversation {conversation_id[:8]}... - NO FALLBACK - returning EMPTY")
+                    self.logger.info(f"No files found for conversation {conversation_id[:8]}... (strict isolation, no fallback)")
                     selection_info['strict_isolation_enforced'] = True
-                else:
-                    self.logger.warning(f"✅ NUCLEAR: SUCCESS - {total_found} conversation-specific + collection files found")
+                elif _trace:
+                    _trace("strict_isolation.done", conversation=conversation_id[:8], found=len(all_results))
         else:
             # TEMPORARY FIX: Relaxed mode with time-based filtering for recent files
-            self.logger.warning("🕒 TEMPORARY MODE: Using time-based filtering for recently uploaded files")
             
             # Try conversation files first
             if conversation_id:
@@ -222,7 +212,6 @@ class SmartContextSelector:
             # Collection tags are global and not tied to specific conversations
             if additional_filters and 'collection_tag' in additional_filters:
                 filters = additional_filters.copy()  # Use ONLY collection_tag filter
-                self.logger.warning(f"🏷️  COLLECTION TAG MODE: Searching by collection_tag ONLY (ignoring conversation): {filters}")
             else:
                 # FIXED: Enhanced conversation filters to handle both stored and pending associations
                 filters = {
@@ -233,7 +222,6 @@ class SmartContextSelector:
                 # Merge other additional_filters (not collection_tag) with conversation filters
                 if additional_filters:
                     filters.update(additional_filters)
-                    self.logger.warning(f"🏷️  MERGED FILTERS: Conversation + additional filters = {filters}")
 
             # FIXED: Get more results for better filtering coverage
             raw_results = await faiss_client.similarity_search(
@@ -242,11 +230,9 @@ class SmartContextSelector:
                 filters=filters
             )
             
-            # FIXED: Debug conversation search
-            self.logger.info(f"🔍 DEBUG Conversation: Got {len(raw_results)} raw results for conversation {conversation_id[:8]}...")
-            for i, result in enumerate(raw_results[:3]):  # Log first 3
-                metadata_keys = list(result.metadata.keys()) if hasattr(result, 'metadata') else []
-                self.logger.info(f"  Conv Result {i+1}: Score={result.score:.4f}, Metadata keys={metadata_keys}")
+            if _trace:
+                _trace("conversation.raw", conversation=conversation_id[:8], filters=filters,
+                       count=len(raw_results), top_scores=[round(r.score, 4) for r in raw_results[:3]])
             
             results = []
             passed_count = 0
@@ -266,8 +252,9 @@ class SmartContextSelector:
                 else:
                     failed_count += 1
             
-            # FIXED: Enhanced conversation search logging
-            self.logger.info(f"🔍 Conversation threshold {self.thresholds[ContextSource.CONVERSATION]}: {passed_count} passed, {failed_count} filtered out")
+            if _trace:
+                _trace("conversation.threshold", threshold=self.thresholds[ContextSource.CONVERSATION],
+                       passed=passed_count, filtered=failed_count)
             
             selection_info['results_by_tier']['conversation'] = len(results)
             self.logger.info(f"🔍 Tier 1 (Conversation): Found {len(results)} results")
@@ -290,7 +277,7 @@ class SmartContextSelector:
             # CRITICAL: If collection_tag filter is present, DON'T search pending files
             # Collection tags are global - they're already searched in conversation files tier
             if additional_filters and 'collection_tag' in additional_filters:
-                self.logger.warning(f"🏷️  SKIPPING PENDING SEARCH: Collection tag mode bypasses pending tier")
+                self.logger.debug("Skipping pending search: collection tag mode bypasses pending tier")
                 selection_info['results_by_tier']['pending'] = 0
                 return []
 
@@ -300,10 +287,7 @@ class SmartContextSelector:
             # Merge other additional_filters (not collection_tag) with pending filters
             if additional_filters:
                 filters.update(additional_filters)
-                self.logger.warning(f"🏷️  MERGED FILTERS: Pending + additional filters = {filters}")
 
-            self.logger.warning(f"🔍 PENDING SEARCH: About to call FAISS with filters: {filters}")
-            self.logger.warning(f"🔍 PENDING SEARCH: Query embedding shape: {len(query_embedding) if query_embedding is not None else 'None'}")
             
             raw_results = await faiss_client.similarity_search(
                 query_embedding=query_embedding,
@@ -311,14 +295,9 @@ class SmartContextSelector:
                 filters=filters
             )
             
-            self.logger.warning(f"🔍 PENDING SEARCH: FAISS returned {len(raw_results)} raw results")
-            
-            # FIXED: Debug pending search
-            self.logger.info(f"🔍 DEBUG Pending: Got {len(raw_results)} raw results for pending conversation {conversation_id[:8]}...")
-            for i, result in enumerate(raw_results[:3]):  # Log first 3
-                metadata_keys = list(result.metadata.keys()) if hasattr(result, 'metadata') else []
-                pending_id = result.metadata.get('pending_conversation_id', 'None') if hasattr(result, 'metadata') else 'None'
-                self.logger.info(f"  Pending Result {i+1}: Score={result.score:.4f}, PendingID={pending_id[:8] if pending_id != 'None' else 'None'}")
+            if _trace:
+                _trace("pending.raw", conversation=conversation_id[:8], filters=filters,
+                       count=len(raw_results), top_scores=[round(r.score, 4) for r in raw_results[:3]])
             
             results = []
             passed_count = 0
@@ -338,8 +317,9 @@ class SmartContextSelector:
                 else:
                     failed_count += 1
             
-            # FIXED: Enhanced pending search logging
-            self.logger.info(f"🔍 Pending threshold {self.thresholds[ContextSource.PENDING]}: {passed_count} passed, {failed_count} filtered out")
+            if _trace:
+                _trace("pending.threshold", threshold=self.thresholds[ContextSource.PENDING],
+                       passed=passed_count, filtered=failed_count)
             
             selection_info['results_by_tier']['pending'] = len(results)
             self.logger.info(f"🔍 Tier 2 (Pending): Found {len(results)} results")
@@ -361,9 +341,6 @@ class SmartContextSelector:
             # Build filter for collection tags (supports multiple tags via list)
             filters = {'collection_tag': collection_tags}
 
-            self.logger.warning(f"🏷️  COLLECTION TAG SEARCH: About to call FAISS with filters: {filters}")
-            self.logger.warning(f"🏷️  COLLECTION TAG SEARCH: Query embedding shape: {len(query_embedding) if query_embedding is not None else 'None'}")
-
             # Search FAISS with collection_tag filter
             raw_results = await faiss_client.similarity_search(
                 query_embedding=query_embedding,
@@ -371,14 +348,9 @@ class SmartContextSelector:
                 filters=filters
             )
 
-            self.logger.warning(f"🏷️  COLLECTION TAG SEARCH: FAISS returned {len(raw_results)} raw results")
-
-            # Debug collection tag search
-            self.logger.info(f"🏷️  DEBUG Collection Tags: Got {len(raw_results)} raw results for tags {collection_tags}")
-            for i, result in enumerate(raw_results[:3]):  # Log first 3
-                metadata_keys = list(result.metadata.keys()) if hasattr(result, 'metadata') else []
-                coll_tag = result.metadata.get('collection_tag', 'None') if hasattr(result, 'metadata') else 'None'
-                self.logger.info(f"  Collection Result {i+1}: Score={result.score:.4f}, Tag={coll_tag}")
+            if _trace:
+                _trace("collection.raw", collection_tags=collection_tags, count=len(raw_results),
+                       top_scores=[round(r.score, 4) for r in raw_results[:3]])
 
             # Apply threshold filtering
             results = []
@@ -403,8 +375,8 @@ class SmartContextSelector:
                 else:
                     failed_count += 1
 
-            # Enhanced collection tag search logging
-            self.logger.info(f"🏷️  Collection tag threshold {threshold}: {passed_count} passed, {failed_count} filtered out")
+            if _trace:
+                _trace("collection.threshold", threshold=threshold, passed=passed_count, filtered=failed_count)
 
             selection_info['results_by_tier']['collection_tags'] = len(results)
             self.logger.info(f"🏷️  Tier 3 (Collection Tags): Found {len(results)} results from tags {collection_tags}")
@@ -435,10 +407,9 @@ class SmartContextSelector:
                     filters=None  # No conversation filter
                 )
                 
-                # Debug: Log all raw results and their scores
-                self.logger.info(f"🔍 DEBUG: Got {len(raw_results)} raw results from FAISS")
-                for i, result in enumerate(raw_results[:5]):  # Log first 5
-                    self.logger.info(f"  Result {i+1}: Score={result.score:.4f}, Content='{result.content[:100]}...'")
+                if _trace:
+                    _trace("recent.raw", count=len(raw_results),
+                           top_scores=[round(r.score, 4) for r in raw_results[:5]])
                 
                 results = []
                 filtered_count = 0
@@ -456,7 +427,8 @@ class SmartContextSelector:
                     else:
                         filtered_count += 1
                 
-                self.logger.info(f"🔍 DEBUG: Threshold {threshold}: {len(results)} passed, {filtered_count} filtered out")
+                if _trace:
+                    _trace("recent.threshold", threshold=threshold, passed=len(results), filtered=filtered_count)
                 
                 if results:
                     selection_info['results_by_tier']['recent'] = len(results)
@@ -484,10 +456,9 @@ class SmartContextSelector:
                 filters=None
             )
             
-            # Debug: Log all raw results and their scores for global search
-            self.logger.info(f"🔍 DEBUG Global: Got {len(raw_results)} raw results from FAISS")
-            for i, result in enumerate(raw_results[:3]):  # Log first 3
-                self.logger.info(f"  Global Result {i+1}: Score={result.score:.4f}, Content='{result.content[:100]}...'")
+            if _trace:
+                _trace("global.raw", count=len(raw_results),
+                       top_scores=[round(r.score, 4) for r in raw_results[:3]])
             
             results = []
             filtered_count = 0
@@ -505,7 +476,9 @@ class SmartContextSelector:
                 else:
                     filtered_count += 1
                     
-            self.logger.info(f"🔍 DEBUG Global: Threshold {self.thresholds[ContextSource.GLOBAL]}: {len(results)} passed, {filtered_count} filtered out")
+            if _trace:
+                _trace("global.threshold", threshold=self.thresholds[ContextSource.GLOBAL],
+                       passed=len(results), filtered=filtered_count)
             
             selection_info['results_by_tier']['global'] = len(results)
             self.logger.info(f"🔍 Tier 4 (Global): Found {len(results)} results")
@@ -563,8 +536,6 @@ class SmartContextSelector:
             current_time = time.time()
             recent_threshold = current_time - 600  # 10 minutes ago
             
-            self.logger.warning(f"🕒 TEMPORAL: Searching for files uploaded after {time.ctime(recent_threshold)}")
-            
             # Get all results without conversation filters
             raw_results = await faiss_client.similarity_search(
                 query_embedding=query_embedding,
@@ -593,7 +564,9 @@ class SmartContextSelector:
                 else:
                     time_filtered_count += 1
             
-            self.logger.warning(f"🕒 TEMPORAL: Found {len(results)} recent files, filtered {time_filtered_count} older/low-score files")
+            if _trace:
+                _trace("temporal", after=time.ctime(recent_threshold), found=len(results),
+                       filtered=time_filtered_count)
             
             selection_info['results_by_tier']['recent_time_filtered'] = len(results)
             return results[:top_k]
@@ -663,8 +636,10 @@ class SmartContextSelector:
         
         if results:
             self.logger.info(f"✅ Final selection: {len(results)} results")
-            for i, result in enumerate(results[:3]):  # Log top 3
-                self.logger.info(f"  {i+1}. [{result.source_type.value}] Score: {result.score:.3f}, "
-                               f"Tier: {result.selection_tier}, Content: {result.content[:50]}...")
+            if _trace:
+                for i, result in enumerate(results[:3]):  # Top 3
+                    _trace("selected", rank=i + 1, source=result.source_type.value,
+                           score=round(result.score, 3), tier=result.selection_tier,
+                           content=result.content[:50])
         else:
             self.logger.warning("❌ No results selected")
\ No newline at end of file
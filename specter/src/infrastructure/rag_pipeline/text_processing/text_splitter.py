@@ -12,6 +12,7 @@ Comprehensive text splitting with multiple strategies:
 
 import logging
 import re
+import zlib
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Callable
 from abc import ABC, abstractmethod
@@ -28,16 +29,20 @@ try:
 except ImportError:
     LANGCHAIN_AVAILABLE = False
 
-try:
-    import tiktoken
-    TIKTOKEN_AVAILABLE = True
-except ImportError:
-    TIKTOKEN_AVAILABLE = False
-
 from ..config.rag_config import TextProcessingConfig, TextSplitterType
+from ....utils.lazy_import import lazy_import
+
+tiktoken = lazy_import("tiktoken")
+TIKTOKEN_AVAILABLE = tiktoken is not None
 
 logger = logging.getLogger("specter.text_splitter")
 
+# Paragraph boundary candidates for content-defined blocks
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+
+# Upper bound on a content-defined block, in multiples of chunk_size
+_MAX_BLOCK_CHUNKS = 4
+
 
 @dataclass
 class TextChunk:
@@ -80,6 +85,45 @@ class BaseTextSplitter(ABC):
         """Split text into chunks."""
         pass
     
+    def split_text_stable(self, text: str) -> List[TextChunk]:
+        """
+        Split text so that chunk boundaries survive local edits.
+        
+        The text is first cut into content-defined blocks at paragraph breaks:
+        a block ends after a paragraph once it holds at least chunk_size
+        characters and the paragraph's checksum selects it as a cut point (or
+        it reaches _MAX_BLOCK_CHUNKS * chunk_size). Because cut points depend
+        only on nearby content, an edit changes the chunks of the affected
+        block and leaves the rest byte-identical. Each block is then split with
+        split_text() and the chunks are renumbered across the document.
+        """
+        min_size = max(1, self.config.chunk_size)
+        max_size = min_size * _MAX_BLOCK_CHUNKS
+        
+        blocks = []
+        block_start = 0
+        paragraph_start = 0
+        for match in _PARAGRAPH_BREAK.finditer(text):
+            paragraph = text[paragraph_start:match.start()]
+            paragraph_start = match.end()
+            block_length = match.end() - block_start
+            if block_length < min_size:
+                continue
+            if block_length >= max_size or zlib.crc32(paragraph.encode('utf-8')) & 1 == 0:
+                blocks.append((block_start, match.end()))
+                block_start = match.end()
+        if block_start < len(text):
+            blocks.append((block_start, len(text)))
+        
+        chunks = []
+        for start, end in blocks:
+            for chunk in self.split_text(text[start:end]):
+                chunk.chunk_index = len(chunks)
+                chunk.start_char += start
+                chunk.end_char += start
+                chunks.append(chunk)
+        return chunks
+    
     def _create_chunk(self, content: str, index: int, start: int, end: int, 
                      metadata: Optional[Dict[str, Any]] = None) -> TextChunk:
         """Create a text chunk with metadata."""
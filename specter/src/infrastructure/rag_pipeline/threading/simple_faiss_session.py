@@ -16,9 +16,14 @@ from ..services.embedding_service import EmbeddingService
 from ..document_loaders.loader_factory import load_document
 from ..text_processing.text_splitter import TextSplitterFactory
 from ..smart_context_selector import SmartContextSelector, ContextResult
+from ...storage.collection_storage import collection_storage_service
 
 logger = logging.getLogger("specter.simple_faiss_session")
 
+# Metadata that places a document in a conversation/collection; identical
+# content stored under the same values is already loaded there
+REUSE_SCOPE_KEYS = ("conversation_id", "collection_id", "collection_tag")
+
 
 class SimpleFAISSSession:
     """
@@ -92,6 +97,11 @@ class SimpleFAISSSession:
         """
         Ingest a document into FAISS.
         
+        Content already indexed with the same chunking settings is not
+        embedded again: if it is loaded in the same conversation/collection
+        that document is returned, otherwise its stored vectors are copied
+        under the new metadata.
+        
         Args:
             file_path: Path to document file
             metadata_override: Optional metadata overrides
@@ -108,6 +118,18 @@ class SimpleFAISSSession:
             self.logger.info(f"🔄 Ingesting document: {file_path}")
             start_time = time.time()
             
+            metadata_override = {
+                **(metadata_override or {}),
+                'chunk_config': self.config.text_processing.chunking_key()
+            }
+            checksum = (metadata_override.get('checksum')
+                        or collection_storage_service.calculate_file_checksum(str(file_path)))
+            if checksum:
+                metadata_override['checksum'] = checksum
+                reused_id = self._reuse_indexed_document(file_path, checksum, metadata_override, timeout)
+                if reused_id:
+                    return reused_id
+            
             # Load document using thread-safe pattern
             import asyncio
             import threading
@@ -206,6 +228,9 @@ class SimpleFAISSSession:
                 self.logger.error("Failed to store document in FAISS")
                 return None
             
+            # The vector store assigns its own document ID to the stored chunks
+            document_id = chunk_ids[0].split('_')[0]
+            
             processing_time = time.time() - start_time
             self.logger.info(f"✅ Document ingested successfully: {document_id} ({processing_time:.2f}s)")
             
@@ -215,6 +240,62 @@ class SimpleFAISSSession:
             self.logger.error(f"❌ Document ingestion error: {e}")
             return None
     
+    def _reuse_indexed_document(self, file_path: Union[str, Path], checksum: str,
+                                metadata: Dict[str, Any], timeout: float) -> Optional[str]:
+        """
+        Find or copy a stored document with identical content.
+        
+        Returns:
+            Document ID, or None if the content has to be ingested
+        """
+        found = self._run_faiss(
+            lambda: self.faiss_client.find_documents_by_metadata('checksum', [checksum]),
+            timeout
+        ) or {}
+        stored = [
+            doc for doc in found.get(checksum, [])
+            if doc.get('chunk_config') == metadata['chunk_config']
+        ]
+        if not stored:
+            return None
+        
+        for doc in stored:
+            if all(doc.get(key) == metadata.get(key) for key in REUSE_SCOPE_KEYS):
+                self.logger.info(f"♻️ Already indexed: {file_path} ({doc['document_id']})")
+                return doc['document_id']
+        
+        updates = {**metadata, 'source': str(file_path), 'filename': Path(file_path).name}
+        new_ids = self._run_faiss(
+            lambda: self.faiss_client.copy_documents([(stored[0]['document_id'], updates)]),
+            timeout
+        ) or [None]
+        if new_ids[0]:
+            self.logger.info(f"♻️ Reused embeddings of {stored[0]['document_id']} for {file_path}")
+        return new_ids[0]
+    
+    def _run_faiss(self, make_call, timeout: float):
+        """Run a FAISS client coroutine on its own event loop thread (None on failure)."""
+        import asyncio
+        import threading
+        import queue
+        
+        result_q: queue.Queue = queue.Queue()
+        
+        def _run():
+            loop = asyncio.new_event_loop()
+            try:
+                result_q.put(loop.run_until_complete(make_call()))
+            except Exception as e:
+                self.logger.error(f"FAISS call error: {e}")
+                result_q.put(None)
+            finally:
+                loop.close()
+        
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        thread.join(timeout=timeout)
+        return None if result_q.empty() else result_q.get()
+    
     def query(self, query_text: str, top_k: int = 5, 
               filters: Optional[Dict[str, Any]] = None,
               timeout: float = 30.0,
@@ -263,13 +344,6 @@ class SimpleFAISSSession:
                         else:
                             self.logger.warning(f"⚠️ No conversation ID - no files will be found")
 
-                        # CRITICAL DEBUG: Log additional_filters before passing
-                        self.logger.warning(f"🔍 CRITICAL DEBUG: additional_filters = {filters}")
-                        self.logger.warning(f"🔍 CRITICAL DEBUG: filters type = {type(filters)}")
-                        self.logger.warning(f"🔍 CRITICAL DEBUG: filters is None? {filters is None}")
-                        if filters:
-                            self.logger.warning(f"🔍 CRITICAL DEBUG: 'collection_tag' in filters? {'collection_tag' in filters}")
-
                         context_results, selection_info = new_loop.run_until_complete(
                             self.context_selector.select_context(
                                 faiss_client=self.faiss_client,
@@ -6,7 +6,8 @@ ChromaDB uses thread-safe worker to prevent segmentation faults.
 """
 
 from .faiss_client import FaissClient
+from .lexical_index import BM25Index
 from .chromadb_client import ChromaDBClient
 from .safe_chromadb_client import SafeChromaDBClient
 
-__all__ = ['FaissClient', 'ChromaDBClient', 'SafeChromaDBClient']
\ No newline at end of file
+__all__ = ['FaissClient', 'BM25Index', 'ChromaDBClient', 'SafeChromaDBClient']
\ No newline at end of file
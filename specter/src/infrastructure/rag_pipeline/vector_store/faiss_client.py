@@ -31,6 +31,9 @@ import numpy as np
 from ..config.rag_config import VectorStoreConfig
 from ..document_loaders.base_loader import Document, DocumentMetadata
 from ..text_processing.text_splitter import TextChunk
+from .lexical_index import BM25Index, reciprocal_rank_fusion
+from ...logging.debug_channel import debug_channel
+from ....utils.lazy_import import lazy_import
 # Define SearchResult locally (previously from chromadb_client)
 from dataclasses import dataclass
 
@@ -43,12 +46,17 @@ class SearchResult:
     chunk_id: str
     document_id: Optional[str] = None
     embedding: Optional[np.ndarray] = None
+    # Score the result was ranked by when that isn't a similarity
+    # (fused RRF or raw BM25); `score` always stays in the 0-1 range
+    rank_score: Optional[float] = None
 
 logger = logging.getLogger("specter.faiss_client")
 
 # Debug logger specifically for array comparison issues
 debug_logger = logging.getLogger("specter.faiss_client.array_debug")
-debug_logger.setLevel(logging.DEBUG)
+
+# Structured tracing of searches (disabled unless the "faiss" channel is enabled)
+_trace = debug_channel("faiss")
 
 
 def safe_array_comparison(metadata_value: Any, filter_value: Any, filter_key: str) -> bool:
@@ -68,8 +76,10 @@ def safe_array_comparison(metadata_value: Any, filter_value: Any, filter_key: st
     """
     try:
         # ENHANCED DEBUG LOGGING
-        debug_logger.debug(f"safe_array_comparison called: key='{filter_key}', meta_type={type(metadata_value)}, filter_type={type(filter_value)}")
-        debug_logger.debug(f"metadata_value={metadata_value}, filter_value={filter_value}")
+        # Called per candidate per filter key: arguments are only formatted when enabled
+        debug_logger.debug("safe_array_comparison called: key='%s', meta_type=%s, filter_type=%s, "
+                           "metadata_value=%s, filter_value=%s", filter_key, type(metadata_value),
+                           type(filter_value), metadata_value, filter_value)
         # Handle numpy scalars and arrays
         if hasattr(metadata_value, 'item'):  # numpy scalar
             metadata_value = metadata_value.item()
@@ -113,13 +123,9 @@ def safe_array_comparison(metadata_value: Any, filter_value: Any, filter_key: st
         return False
 
 
-# Try to import FAISS
-try:
-    import faiss
-    FAISS_AVAILABLE = True
-except ImportError:
-    FAISS_AVAILABLE = False
-    faiss = None
+# FAISS is imported lazily; the module body runs on first index operation
+faiss = lazy_import("faiss")
+FAISS_AVAILABLE = faiss is not None
 
 
 class FaissError(Exception):
@@ -127,6 +133,17 @@ class FaissError(Exception):
     pass
 
 
+# Metadata flag marking a chunk as removed; its vector stays in the flat index
+# until the next compaction
+TOMBSTONE_KEY = "tombstoned"
+
+# Compact once this fraction of stored vectors are tombstones
+COMPACTION_THRESHOLD = 0.25
+
+# Metadata keys that scope a document version (same source, same scope)
+VERSION_SCOPE_KEYS = ("conversation_id", "pending_conversation_id", "collection_id")
+
+
 class FaissClient:
     """
     FAISS-based vector store client as an alternative to ChromaDB.
@@ -159,6 +176,8 @@ class FaissClient:
         # Document storage (FAISS only stores vectors, not metadata)
         self._documents = []  # List of (chunk_id, content, metadata) tuples
         self._id_to_index = {}  # Map chunk_id to FAISS index position
+        self._tombstone_count = 0  # Rows removed but not yet compacted
+        self._lexical = BM25Index()  # BM25 over live chunk text, keyed by row
         
         # Persistence paths
         self._index_path = Path(config.persist_directory) / "faiss_index.bin"
@@ -228,6 +247,8 @@ class FaissClient:
         self._index = faiss.IndexFlatIP(self._dimension)
         self._documents = []
         self._id_to_index = {}
+        self._tombstone_count = 0
+        self._lexical.clear()
         self._stats['index_size'] = 0
         self._stats['documents_stored'] = 0
         self._stats['chunks_stored'] = 0
@@ -262,6 +283,11 @@ class FaissClient:
                             self._documents = self._documents[:self._index.ntotal]
                             self.logger.info("Truncated document list to match index size")
                     
+                    self._tombstone_count = sum(
+                        1 for _, _, metadata in self._documents if metadata.get(TOMBSTONE_KEY)
+                    )
+                    self._rebuild_lexical_index()
+                    
                     self._stats['index_size'] = self._index.ntotal
                     self._stats['documents_stored'] = len(self._documents)
                     self._stats['chunks_stored'] = self._index.ntotal
@@ -367,6 +393,168 @@ class FaissClient:
         except Exception as e:
             self.logger.error(f"Failed to save FAISS index to disk: {e}")
     
+    def _build_chunk_metadata(self, document: Document, chunk: TextChunk,
+                              document_id: str) -> Dict[str, Any]:
+        """Build the stored metadata for one chunk of a document."""
+        # Combine metadata - start with chunk metadata (includes conversation_id)
+        metadata = {}
+        
+        # Add chunk metadata first (this includes conversation_id and other overrides)
+        if hasattr(chunk, 'metadata') and chunk.metadata:
+            for key, value in chunk.metadata.items():
+                if isinstance(value, (str, int, float, bool)):
+                    metadata[key] = value
+        
+        # Then add document-level metadata (may override some chunk metadata)
+        metadata.update({
+            "document_id": document_id,
+            "chunk_index": chunk.chunk_index if chunk.chunk_index is not None else 0,
+            "start_char": chunk.start_char if chunk.start_char is not None else 0,
+            "end_char": chunk.end_char if chunk.end_char is not None else 0,
+            "token_count": chunk.token_count if chunk.token_count is not None else 0,
+            "source": document.metadata.source or "unknown",
+            "source_type": document.metadata.source_type or "text",
+            "filename": document.metadata.filename or "untitled",
+            "file_extension": document.metadata.file_extension or ".txt",
+            "content_hash": document.content_hash or "",
+            "created_at": time.time(),
+        })
+        
+        # Add document metadata (won't override chunk metadata due to update order)
+        if document.metadata.title:
+            metadata["title"] = document.metadata.title
+        if document.metadata.author:
+            metadata["author"] = document.metadata.author
+        if document.metadata.language:
+            metadata["language"] = document.metadata.language
+        
+        # Add custom metadata from document
+        if document.metadata.custom:
+            for key, value in document.metadata.custom.items():
+                if isinstance(value, (str, int, float, bool)):
+                    metadata[f"custom_{key}"] = value
+        
+        return metadata
+    
+    @staticmethod
+    def _normalize_vector(embedding) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        if isinstance(embedding, np.ndarray):
+            vector = embedding.astype(np.float32)
+        else:
+            vector = np.array(embedding, dtype=np.float32)
+        
+        # Normalize for cosine similarity (FAISS IndexFlatIP uses inner product)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector
+    
+    def _tombstone_rows(self, rows: List[int]) -> int:
+        """Mark rows as removed. Caller must hold the lock."""
+        removed = 0
+        for row in rows:
+            chunk_id, content, metadata = self._documents[row]
+            if metadata.get(TOMBSTONE_KEY):
+                continue
+            metadata = dict(metadata)
+            metadata[TOMBSTONE_KEY] = True
+            self._documents[row] = (chunk_id, content, metadata)
+            if self._id_to_index.get(chunk_id) == row:
+                del self._id_to_index[chunk_id]
+            self._lexical.remove(row)
+            removed += 1
+        self._tombstone_count += removed
+        return removed
+    
+    def _compact_if_needed(self) -> bool:
+        """
+        Rebuild the index without tombstoned rows once they pass the threshold.
+        
+        Caller must hold the lock. Returns True if the index was rebuilt.
+        """
+        total = self._index.ntotal
+        if not self._tombstone_count or self._tombstone_count < total * COMPACTION_THRESHOLD:
+            return False
+        if total != len(self._documents):
+            self.logger.warning("Skipping FAISS compaction: index and documents are out of sync")
+            return False
+        
+        live_rows = [
+            row for row, (_, _, metadata) in enumerate(self._documents)
+            if not metadata.get(TOMBSTONE_KEY)
+        ]
+        vectors = self._index.reconstruct_n(0, total)[live_rows] if live_rows else None
+        documents = [self._documents[row] for row in live_rows]
+        
+        stats = dict(self._stats)
+        self._create_empty_index()
+        self._stats.update(stats)
+        if vectors is not None:
+            self._index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        self._documents = documents
+        self._id_to_index = {chunk_id: row for row, (chunk_id, _, _) in enumerate(documents)}
+        self._rebuild_lexical_index()
+        self._stats['index_size'] = self._index.ntotal
+        
+        self.logger.info(f"Compacted FAISS index: {total} -> {self._index.ntotal} vectors")
+        return True
+    
+    def _rebuild_lexical_index(self):
+        """Rebuild the BM25 index from live rows. Caller must hold the lock."""
+        self._lexical.rebuild(
+            (row, content) for row, (_, content, metadata) in enumerate(self._documents)
+            if not metadata.get(TOMBSTONE_KEY)
+        )
+    
+    @staticmethod
+    def _matches_filters(metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        """
+        Check chunk metadata against search filters.
+        
+        Supports a standalone pending_conversation_id filter, conversation_id
+        OR _or_pending_conversation_id for conversation isolation, list-valued
+        collection_tag filters, and exact matches for any other key.
+        """
+        def equals(key: str, value: Any) -> bool:
+            return key in metadata and safe_array_comparison(metadata[key], value, key)
+        
+        try:
+            if ('pending_conversation_id' in filters and 'conversation_id' not in filters
+                    and '_or_pending_conversation_id' not in filters):
+                # Direct pending conversation search (Tier 2 in SmartContextSelector)
+                return all(equals(key, value) for key, value in filters.items())
+            
+            if 'conversation_id' in filters and '_or_pending_conversation_id' in filters:
+                # Document belongs to the conversation via either field
+                if not (equals('conversation_id', filters['conversation_id']) or
+                        equals('pending_conversation_id', filters['_or_pending_conversation_id'])):
+                    return False
+                return all(
+                    equals(key, value) for key, value in filters.items()
+                    if key not in ('conversation_id', '_or_pending_conversation_id')
+                )
+            
+            for key, value in filters.items():
+                if key.startswith('_or_'):
+                    # Special OR keys only apply together with conversation_id
+                    continue
+                if key == 'collection_tag' and isinstance(value, list):
+                    tag = metadata.get('collection_tag')
+                    if hasattr(tag, 'item'):
+                        tag = tag.item()
+                    if tag is None or str(tag) not in value:
+                        return False
+                    continue
+                if not equals(key, value):
+                    return False
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Error during metadata filtering: {e}")
+            # Skip this result to be safe
+            return False
+    
     async def store_document(self, document: Document, chunks: List[TextChunk], 
                            embeddings: List[np.ndarray]) -> List[str]:
         """
@@ -393,19 +581,7 @@ class FaissClient:
                     chunk_ids = []
                     
                     # Prepare embeddings for FAISS (normalize for cosine similarity)
-                    vectors = []
-                    for embedding in embeddings:
-                        if isinstance(embedding, np.ndarray):
-                            vector = embedding.astype(np.float32)
-                        else:
-                            vector = np.array(embedding, dtype=np.float32)
-                        
-                        # Normalize for cosine similarity (FAISS IndexFlatIP uses inner product)
-                        norm = np.linalg.norm(vector)
-                        if norm > 0:
-                            vector = vector / norm
-                        
-                        vectors.append(vector)
+                    vectors = [self._normalize_vector(embedding) for embedding in embeddings]
                     
                     vectors_array = np.array(vectors)
                     
@@ -418,46 +594,12 @@ class FaissClient:
                         chunk_id = f"{document_id}_{chunk.chunk_index}"
                         chunk_ids.append(chunk_id)
                         
-                        # Combine metadata - start with chunk metadata (includes conversation_id)
-                        metadata = {}
-                        
-                        # Add chunk metadata first (this includes conversation_id and other overrides)
-                        if hasattr(chunk, 'metadata') and chunk.metadata:
-                            for key, value in chunk.metadata.items():
-                                if isinstance(value, (str, int, float, bool)):
-                                    metadata[key] = value
-                        
-                        # Then add document-level metadata (may override some chunk metadata)
-                        metadata.update({
-                            "document_id": document_id,
-                            "chunk_index": chunk.chunk_index if chunk.chunk_index is not None else 0,
-                            "start_char": chunk.start_char if chunk.start_char is not None else 0,
-                            "end_char": chunk.end_char if chunk.end_char is not None else 0,
-                            "token_count": chunk.token_count if chunk.token_count is not None else 0,
-                            "source": document.metadata.source or "unknown",
-                            "source_type": document.metadata.source_type or "text",
-                            "filename": document.metadata.filename or "untitled",
-                            "file_extension": document.metadata.file_extension or ".txt",
-                            "created_at": time.time(),
-                        })
-                        
-                        # Add document metadata (won't override chunk metadata due to update order)
-                        if document.metadata.title:
-                            metadata["title"] = document.metadata.title
-                        if document.metadata.author:
-                            metadata["author"] = document.metadata.author
-                        if document.metadata.language:
-                            metadata["language"] = document.metadata.language
-                        
-                        # Add custom metadata from document
-                        if document.metadata.custom:
-                            for key, value in document.metadata.custom.items():
-                                if isinstance(value, (str, int, float, bool)):
-                                    metadata[f"custom_{key}"] = value
+                        metadata = self._build_chunk_metadata(document, chunk, document_id)
                         
                         # Store document info
                         self._documents.append((chunk_id, chunk.content, metadata))
                         self._id_to_index[chunk_id] = start_idx + i
+                        self._lexical.add(start_idx + i, chunk.content)
                     
                     # Save to disk
                     self._save_to_disk()
@@ -481,6 +623,273 @@ class FaissClient:
         except Exception as e:
             raise FaissError(f"Failed to store document in FAISS: {e}")
     
+    async def get_document_version(self, source: str,
+                                   scope: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the current stored version of a document by source.
+        
+        Args:
+            source: Document source (file path or URL)
+            scope: Values for VERSION_SCOPE_KEYS; a stored document matches only
+                if each scope key is equal (absent keys must be absent)
+            
+        Returns:
+            Dict with document_id, content_hash, chunk_config (the chunking
+            key the chunks were split with), version and chunk_hashes (a
+            list with one hash per live chunk), or None if not stored
+        """
+        scope = scope or {}
+        
+        def _find():
+            with self._lock:
+                versions: Dict[str, Dict[str, Any]] = {}
+                for _, _, metadata in self._documents:
+                    if metadata.get(TOMBSTONE_KEY) or metadata.get("source") != source:
+                        continue
+                    if any(metadata.get(key) != scope.get(key) for key in VERSION_SCOPE_KEYS):
+                        continue
+                    document_id = metadata.get("document_id")
+                    version = versions.setdefault(document_id, {
+                        "document_id": document_id,
+                        "content_hash": metadata.get("content_hash"),
+                        "chunk_config": metadata.get("chunk_config"),
+                        "version": metadata.get("version", 0),
+                        "chunk_hashes": [],
+                        "created_at": metadata.get("created_at", 0),
+                    })
+                    version["chunk_hashes"].append(metadata.get("chunk_hash"))
+                    version["created_at"] = max(version["created_at"], metadata.get("created_at", 0))
+                if not versions:
+                    return None
+                return max(versions.values(), key=lambda v: (v["version"], v["created_at"]))
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, _find)
+    
+    async def update_document(self, document_id: str, document: Document,
+                              chunks: List[TextChunk],
+                              embeddings: List[Optional[np.ndarray]]) -> List[str]:
+        """
+        Replace a stored document with a new version, reusing unchanged chunks.
+        
+        Chunks whose embedding is None must match (by metadata chunk_hash) a
+        live chunk of the stored document; that row's vector is kept and only
+        its position metadata is updated. Chunks with an embedding are added,
+        and stored chunks not matched by the new version are tombstoned.
+        
+        Args:
+            document_id: ID of the stored document to update (kept)
+            document: New document version
+            chunks: All chunks of the new version
+            embeddings: Embedding per chunk, or None to reuse a stored vector
+            
+        Returns:
+            Chunk IDs of the new version, in chunk order
+        """
+        start_time = time.time()
+        
+        if len(chunks) != len(embeddings):
+            raise FaissError("Number of chunks must match number of embeddings")
+        
+        try:
+            def _update():
+                with self._lock:
+                    # Live rows of the stored version, grouped by chunk hash
+                    reusable: Dict[str, List[int]] = {}
+                    live_rows = []
+                    version = 0
+                    for row, (_, _, metadata) in enumerate(self._documents):
+                        if metadata.get("document_id") != document_id or metadata.get(TOMBSTONE_KEY):
+                            continue
+                        live_rows.append(row)
+                        version = max(version, metadata.get("version", 0))
+                        reusable.setdefault(metadata.get("chunk_hash"), []).append(row)
+                    version += 1
+                    
+                    # Resolve every reused chunk before touching the store, so a
+                    # missing vector leaves the stored version unchanged
+                    chunk_ids: List[Optional[str]] = [None] * len(chunks)
+                    reused = []  # (position, row, chunk)
+                    new_items = []
+                    for position, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+                        if embedding is not None:
+                            new_items.append((position, chunk, embedding))
+                            continue
+                        
+                        rows = reusable.get(chunk.metadata.get("chunk_hash"))
+                        if not rows:
+                            raise FaissError(
+                                f"No stored vector to reuse for chunk {chunk.chunk_index} of {document_id}"
+                            )
+                        reused.append((position, rows.pop(0), chunk))
+                    
+                    kept_rows = set()
+                    for position, row, chunk in reused:
+                        kept_rows.add(row)
+                        chunk_id, _, metadata = self._documents[row]
+                        metadata = dict(metadata)
+                        metadata.update(self._build_chunk_metadata(document, chunk, document_id))
+                        metadata["version"] = version
+                        self._documents[row] = (chunk_id, chunk.content, metadata)
+                        chunk_ids[position] = chunk_id
+                    
+                    removed = self._tombstone_rows([row for row in live_rows if row not in kept_rows])
+                    
+                    if new_items:
+                        start_idx = self._index.ntotal
+                        self._index.add(np.array([
+                            self._normalize_vector(embedding) for _, _, embedding in new_items
+                        ]))
+                        for offset, (position, chunk, _) in enumerate(new_items):
+                            chunk_id = f"{document_id}_{chunk.chunk_index}_v{version}"
+                            metadata = self._build_chunk_metadata(document, chunk, document_id)
+                            metadata["version"] = version
+                            self._documents.append((chunk_id, chunk.content, metadata))
+                            self._id_to_index[chunk_id] = start_idx + offset
+                            self._lexical.add(start_idx + offset, chunk.content)
+                            chunk_ids[position] = chunk_id
+                    
+                    self._compact_if_needed()
+                    self._save_to_disk()
+                    return chunk_ids, len(kept_rows), len(new_items), removed
+            
+            loop = asyncio.get_event_loop()
+            chunk_ids, kept, added, removed = await loop.run_in_executor(self._executor, _update)
+            
+            storage_time = time.time() - start_time
+            self._stats['chunks_stored'] += added
+            self._stats['total_storage_time'] += storage_time
+            self._stats['index_size'] = self._index.ntotal
+            
+            self.logger.info(f"Updated document {document_id}: {kept} chunks kept, "
+                           f"{added} added, {removed} removed in {storage_time:.2f}s")
+            return chunk_ids
+            
+        except FaissError:
+            raise
+        except Exception as e:
+            raise FaissError(f"Failed to update document in FAISS: {e}")
+    
+    async def find_documents_by_metadata(self, key: str,
+                                         values: List[Any]) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Find stored documents whose chunk metadata has one of the given values.
+        
+        Args:
+            key: Metadata key to match (e.g. "checksum")
+            values: Values to look up
+            
+        Returns:
+            Dict mapping each matched value to one summary per stored document
+            (document_id, conversation_id, collection_id, collection_tag,
+            chunk_config, chunk_count)
+        """
+        wanted = set(values)
+        if not wanted:
+            return {}
+        
+        def _find():
+            with self._lock:
+                found: Dict[Any, Dict[str, Dict[str, Any]]] = {}
+                for _, _, metadata in self._documents:
+                    value = metadata.get(key)
+                    if value not in wanted or metadata.get(TOMBSTONE_KEY):
+                        continue
+                    docs = found.setdefault(value, {})
+                    document_id = metadata.get("document_id")
+                    summary = docs.get(document_id)
+                    if summary is None:
+                        docs[document_id] = {
+                            "document_id": document_id,
+                            "conversation_id": metadata.get("conversation_id"),
+                            "collection_id": metadata.get("collection_id"),
+                            "collection_tag": metadata.get("collection_tag"),
+                            "chunk_config": metadata.get("chunk_config"),
+                            "chunk_count": 1,
+                        }
+                    else:
+                        summary["chunk_count"] += 1
+                return {value: list(docs.values()) for value, docs in found.items()}
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, _find)
+    
+    async def copy_documents(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[str]]:
+        """
+        Store copies of existing documents with updated metadata.
+        
+        The stored vectors are reused as-is, so identical content can be
+        attached to another conversation or collection without re-embedding.
+        
+        Args:
+            requests: List of (source document_id, metadata updates)
+            
+        Returns:
+            New document IDs in request order (None if the source document
+            was not found or its vectors are unavailable)
+        """
+        start_time = time.time()
+        
+        try:
+            def _copy_batch():
+                """Thread-safe batch copy function."""
+                with self._lock:
+                    rows_by_document: Dict[str, List[int]] = {}
+                    for row, (_, _, metadata) in enumerate(self._documents):
+                        if not metadata.get(TOMBSTONE_KEY):
+                            rows_by_document.setdefault(metadata.get("document_id"), []).append(row)
+                    
+                    new_ids: List[Optional[str]] = []
+                    copied_chunks = 0
+                    for source_id, updates in requests:
+                        rows = rows_by_document.get(source_id, [])
+                        positions = [self._id_to_index.get(self._documents[row][0]) for row in rows]
+                        if not rows or any(pos is None or pos >= self._index.ntotal for pos in positions):
+                            new_ids.append(None)
+                            continue
+                        
+                        vectors = np.vstack([self._index.reconstruct(pos) for pos in positions])
+                        new_document_id = str(uuid.uuid4())
+                        start_idx = self._index.ntotal
+                        self._index.add(vectors.astype(np.float32))
+                        
+                        for i, row in enumerate(rows):
+                            _, content, metadata = self._documents[row]
+                            new_metadata = dict(metadata)
+                            new_metadata.update({
+                                key: value for key, value in updates.items()
+                                if isinstance(value, (str, int, float, bool))
+                            })
+                            new_metadata["document_id"] = new_document_id
+                            new_metadata["created_at"] = time.time()
+                            chunk_id = f"{new_document_id}_{new_metadata.get('chunk_index', i)}"
+                            self._documents.append((chunk_id, content, new_metadata))
+                            self._id_to_index[chunk_id] = start_idx + i
+                            self._lexical.add(start_idx + i, content)
+                        
+                        new_ids.append(new_document_id)
+                        copied_chunks += len(rows)
+                    
+                    if copied_chunks:
+                        self._save_to_disk()
+                    
+                    return new_ids, copied_chunks
+            
+            loop = asyncio.get_event_loop()
+            new_ids, copied_chunks = await loop.run_in_executor(self._executor, _copy_batch)
+            
+            storage_time = time.time() - start_time
+            self._stats['documents_stored'] += len([doc_id for doc_id in new_ids if doc_id])
+            self._stats['chunks_stored'] += copied_chunks
+            self._stats['total_storage_time'] += storage_time
+            self._stats['index_size'] = self._index.ntotal
+            
+            self.logger.info(f"Copied {copied_chunks} chunks for {len(requests)} documents in {storage_time:.2f}s")
+            return new_ids
+            
+        except Exception as e:
+            raise FaissError(f"Failed to copy documents in FAISS: {e}")
+    
     async def similarity_search(self, query_embedding: np.ndarray, 
                               top_k: int = 5,
                               filters: Optional[Dict[str, Any]] = None,
@@ -537,17 +946,20 @@ class FaissClient:
                         # For conversation isolation, search ALL documents to ensure we find 
                         # conversation-specific files regardless of similarity ranking
                         search_k = self._index.ntotal
-                        self.logger.warning(f"🔒 CONVERSATION ISOLATION: Searching ALL {search_k} documents")
                     else:
                         # For regular similarity search, use limited search
-                        search_k = min(top_k * 2, self._index.ntotal)  # Get more results for filtering
+                        # (tombstoned rows still occupy the index until compaction)
+                        search_k = min(top_k * 2 + self._tombstone_count, self._index.ntotal)  # Get more results for filtering
+                    # Checked once: per-result tracing costs nothing when disabled
+                    trace = _trace.enabled
                     try:
-                        self.logger.warning(f"🔍 FAISS SEARCH: total vectors={self._index.ntotal}, search_k={search_k}, top_k={top_k}")
-                        if filters:
-                            self.logger.warning(f"🔍 FAISS SEARCH: Will apply filters after search: {filters}")
+                        if trace:
+                            _trace("search", total=self._index.ntotal, search_k=search_k, top_k=top_k,
+                                   filters=filters, isolation=bool(is_conversation_filter))
                         similarities, indices = self._index.search(query_vector, search_k)
-                        self.logger.warning(f"🔍 FAISS SEARCH: Raw results count: {len([i for i in indices[0] if i != -1])}")
-                        self.logger.warning(f"🔍 FAISS SEARCH: similarities={similarities[0][:5]}, indices={indices[0][:5]}")
+                        if trace:
+                            _trace("search.raw", count=int((indices[0] != -1).sum()),
+                                   similarities=similarities[0][:5].tolist(), indices=indices[0][:5].tolist())
                     except Exception as search_error:
                         self.logger.error(f"FAISS search failed: {search_error}")
                         self.logger.error(f"Query vector shape: {query_vector.shape}, dtype: {query_vector.dtype}")
@@ -556,16 +968,13 @@ class FaissClient:
                     
                     # Convert to SearchResult objects
                     results = []
-                    self.logger.debug(f"Processing {len(indices[0])} potential results, docs available: {len(self._documents)}")
                     for i in range(len(indices[0])):
                         index_value = int(indices[0][i])
                         if index_value == -1:  # FAISS returns -1 for invalid results
-                            self.logger.debug(f"Skipping invalid result at position {i}")
                             continue
                         
                         doc_idx = index_value
                         similarity_score = float(similarities[0][i])
-                        self.logger.debug(f"Result {i}: doc_idx={doc_idx}, score={similarity_score}")
                         
                         # Get document info
                         if doc_idx < len(self._documents):
@@ -578,147 +987,14 @@ class FaissClient:
                             content = f"[Orphaned vector at index {doc_idx}]"
                             metadata = {"orphaned": True, "index": doc_idx}
                         
-                        # ENHANCED FILTERING: Support OR logic for conversation isolation
-                        if filters:
-                            skip = False                                
-                            try:
-                                self.logger.warning(f"🔍 FILTER DEBUG: Applying filters {filters} to document {chunk_id}")
-                                self.logger.warning(f"🔍 FILTER DEBUG: Document metadata keys: {list(metadata.keys())}")
-                                
-                                # FIXED: Handle single pending_conversation_id filter (Tier 2 search)
-                                if 'pending_conversation_id' in filters and 'conversation_id' not in filters and '_or_pending_conversation_id' not in filters:
-                                    # This is a direct pending conversation search (Tier 2 in SmartContextSelector)
-                                    pending_value = filters['pending_conversation_id']
-                                    
-                                    # ENHANCED DEBUG LOGGING
-                                    self.logger.warning(f"🔍 PENDING FILTER: Looking for pending_conversation_id = {pending_value[:8]}...")
-                                    self.logger.warning(f"🔍 PENDING FILTER: Document {chunk_id} metadata keys: {list(metadata.keys())}")
-                                    
-                                    if 'pending_conversation_id' in metadata:
-                                        doc_pending_id = metadata['pending_conversation_id']
-                                        # Handle numpy arrays/scalars safely
-                                        if hasattr(doc_pending_id, 'item'):
-                                            doc_pending_id = doc_pending_id.item()
-                                        doc_id_str = str(doc_pending_id)[:8] if doc_pending_id is not None else 'None'
-                                        self.logger.warning(f"🔍 PENDING FILTER: Document has pending_conversation_id = {doc_id_str}...")
-                                        
-                                        try:
-                                            comparison_result = safe_array_comparison(metadata['pending_conversation_id'], pending_value, 'pending_conversation_id')
-                                            if comparison_result:
-                                                self.logger.warning(f"✅ PENDING FILTER: Document {chunk_id} MATCHES pending filter!")
-                                                # Continue processing other filters if any
-                                                remaining_filters = {k: v for k, v in filters.items() if k != 'pending_conversation_id'}
-                                                if remaining_filters:
-                                                    for filter_key, filter_value in remaining_filters.items():
-                                                        if filter_key not in metadata:
-                                                            skip = True
-                                                            break
-                                                        if not safe_array_comparison(metadata[filter_key], filter_value, filter_key):
-                                                            skip = True
-                                                            break
-                                                    if skip:
-                                                        continue
-                                                # If we get here, all filters passed - don't skip this document
-                                            else:
-                                                self.logger.warning(f"❌ PENDING FILTER: Document {chunk_id} filtered out - pending mismatch ({doc_id_str}... != {pending_value[:8]}...)")
-                                                skip = True
-                                        except Exception as pending_error:
-                                            self.logger.error(f"🔥 PENDING FILTER ERROR: {pending_error}")
-                                            skip = True
-                                        
-                                        if skip:
-                                            continue
-                                    else:
-                                        self.logger.warning(f"❌ PENDING FILTER: Document {chunk_id} filtered out - no pending_conversation_id in metadata")
-                                        continue
-                                # Handle special OR filtering for conversation isolation
-                                elif 'conversation_id' in filters and '_or_pending_conversation_id' in filters:
-                                    # Check if document belongs to this conversation via either field
-                                    conv_id_value = filters['conversation_id']
-                                    pending_conv_id_value = filters['_or_pending_conversation_id']
-                                    
-                                    # Document matches if it has matching conversation_id OR pending_conversation_id
-                                    matches_conversation = (
-                                        ('conversation_id' in metadata and safe_array_comparison(metadata['conversation_id'], conv_id_value, 'conversation_id')) or
-                                        ('pending_conversation_id' in metadata and safe_array_comparison(metadata['pending_conversation_id'], pending_conv_id_value, 'pending_conversation_id'))
-                                    )
-                                    
-                                    if matches_conversation:
-                                        self.logger.debug(f"Document {chunk_id} matches conversation filter (OR logic)")
-                                    else:
-                                        self.logger.debug(f"Document {chunk_id} filtered out - no conversation match")
-                                        continue
-                                        
-                                    # Skip regular filter processing for these special keys
-                                    remaining_filters = {k: v for k, v in filters.items() 
-                                                       if k not in ['conversation_id', '_or_pending_conversation_id']}
-                                    if not remaining_filters:
-                                        # Only conversation filters - we already processed them
-                                        pass
-                                    else:
-                                        # Apply remaining filters normally
-                                        for filter_key, filter_value in remaining_filters.items():
-                                            if filter_key not in metadata:
-                                                self.logger.debug(f"Filter key '{filter_key}' not found in metadata, skipping document")
-                                                skip = True
-                                                break
-                                            
-                                            metadata_value = metadata[filter_key]
-                                            if not safe_array_comparison(metadata_value, filter_value, filter_key):
-                                                self.logger.debug(f"Filter mismatch: '{filter_key}' value '{metadata_value}' != '{filter_value}', skipping document")
-                                                skip = True
-                                                break
-                                else:
-                                    # Regular filtering logic for other cases
-                                    for filter_key, filter_value in filters.items():
-                                        if filter_key.startswith('_or_'):
-                                            # Skip special OR keys when not used with conversation_id
-                                            continue
-
-                                        # Special handling for collection_tag filter (supports list of tags)
-                                        if filter_key == 'collection_tag' and isinstance(filter_value, list):
-                                            # Check if document's collection_tag is IN the list
-                                            if 'collection_tag' not in metadata:
-                                                self.logger.debug(f"Document has no collection_tag, skipping")
-                                                skip = True
-                                                break
-
-                                            doc_tag = metadata['collection_tag']
-                                            # Handle numpy types
-                                            if hasattr(doc_tag, 'item'):
-                                                doc_tag = doc_tag.item()
-                                            doc_tag = str(doc_tag) if doc_tag is not None else None
-
-                                            # Check if document tag is in the filter list
-                                            if doc_tag not in filter_value:
-                                                self.logger.debug(f"Document collection_tag '{doc_tag}' not in {filter_value}, skipping")
-                                                skip = True
-                                                break
-                                            else:
-                                                self.logger.info(f"✅ Document collection_tag '{doc_tag}' matches filter {filter_value}")
-                                            continue  # Skip to next filter
-
-                                        if filter_key not in metadata:
-                                            self.logger.debug(f"Filter key '{filter_key}' not found in metadata, skipping document")
-                                            skip = True
-                                            break
-
-                                        metadata_value = metadata[filter_key]
-                                        if not safe_array_comparison(metadata_value, filter_value, filter_key):
-                                            self.logger.debug(f"Filter mismatch: '{filter_key}' value '{metadata_value}' != '{filter_value}', skipping document")
-                                            skip = True
-                                            break
-                                        else:
-                                            self.logger.debug(f"Filter match: '{filter_key}' value '{metadata_value}' == '{filter_value}'")
-                                
-                                if skip:
-                                    self.logger.debug(f"Document {chunk_id} filtered out")
-                                    continue
-                                    
-                            except Exception as filter_error:
-                                self.logger.warning(f"Error during metadata filtering: {filter_error}")
-                                # Skip this result to be safe
-                                continue
+                        if metadata.get(TOMBSTONE_KEY):
+                            continue
+                        
+                        # Support OR logic for conversation isolation
+                        if filters and not self._matches_filters(metadata, filters):
+                            if trace:
+                                _trace("search.filtered", chunk_id=chunk_id, score=similarity_score)
+                            continue
                         
                         # Create search result
                         result = SearchResult(
@@ -730,15 +1006,14 @@ class FaissClient:
                             embedding=None  # FAISS doesn't return embeddings by default
                         )
                         results.append(result)
-                        self.logger.debug(f"Added result: {chunk_id} (score: {similarity_score})")
                         
                         if len(results) >= top_k:
                             break
                     
-                    # FINAL RESULT DEBUG
-                    self.logger.warning(f"🔍 FAISS SEARCH COMPLETE: Returning {len(results)} results after filtering")
-                    if filters and len(results) == 0:
-                        self.logger.warning(f"❌ FAISS SEARCH: No results survived filtering with {filters}")
+                    if trace:
+                        _trace("search.done", returned=len(results), filters=filters)
+                    if filters and not results:
+                        self.logger.debug("FAISS search: no results survived filtering with %s", filters)
                     
                     return results
             
@@ -772,12 +1047,111 @@ class FaissClient:
                 debug_logger.error(f"General FAISS search error: {error_msg}")
                 raise FaissError(f"FAISS search failed: {e}")
     
+    async def lexical_search(self, query_text: str, top_k: int = 5,
+                             filters: Optional[Dict[str, Any]] = None,
+                             required_terms: Optional[List[str]] = None) -> List[SearchResult]:
+        """
+        Search chunk text with BM25, without an embedding.
+        
+        Args:
+            query_text: Query text
+            top_k: Number of results to return
+            filters: Metadata filters (same semantics as similarity_search)
+            required_terms: Optional lowercase terms every result must contain
+            
+        Returns:
+            List of search results, best first. `score` is the BM25 score
+            relative to the best match (1.0 for the top result) and
+            `rank_score` the raw BM25 score
+        """
+        start_time = time.time()
+        
+        def _search():
+            with self._lock:
+                def accept(row: int) -> bool:
+                    if row >= len(self._documents):
+                        return False
+                    metadata = self._documents[row][2]
+                    if metadata.get(TOMBSTONE_KEY):
+                        return False
+                    if required_terms and not self._lexical.has_terms(row, required_terms):
+                        return False
+                    return not filters or self._matches_filters(metadata, filters)
+                
+                ranked = self._lexical.search(query_text, top_k, accept)
+                best = ranked[0][1] if ranked else 0.0
+                results = []
+                for row, score in ranked:
+                    chunk_id, content, metadata = self._documents[row]
+                    results.append(SearchResult(
+                        content=content,
+                        metadata=metadata,
+                        score=score / best if best > 0 else 0.0,
+                        chunk_id=chunk_id,
+                        document_id=metadata.get("document_id", ""),
+                        rank_score=score,
+                    ))
+                return results
+        
+        loop = asyncio.get_event_loop()
+        results = await loop.run_in_executor(self._executor, _search)
+        
+        self._stats['searches_performed'] += 1
+        self._stats['total_search_time'] += time.time() - start_time
+        return results
+    
+    async def hybrid_search(self, query_text: str, query_embedding: np.ndarray,
+                            top_k: int = 5,
+                            filters: Optional[Dict[str, Any]] = None,
+                            rrf_k: int = 60) -> List[SearchResult]:
+        """
+        Search with both BM25 and dense similarity, fused by reciprocal rank.
+        
+        Args:
+            query_text: Query text for the lexical ranking
+            query_embedding: Query embedding for the dense ranking
+            top_k: Number of results to return
+            filters: Metadata filters applied to both rankings
+            rrf_k: Reciprocal rank fusion constant
+            
+        Returns:
+            List of search results in fused order. `score` is the dense
+            similarity (or the relative BM25 score for lexical-only hits)
+            and `rank_score` the fused RRF score
+        """
+        candidates = top_k * 2
+        dense, lexical = await asyncio.gather(
+            self.similarity_search(query_embedding, top_k=candidates, filters=filters),
+            self.lexical_search(query_text, top_k=candidates, filters=filters)
+        )
+        
+        by_id = {result.chunk_id: result for result in lexical}
+        by_id.update({result.chunk_id: result for result in dense})
+        fused = reciprocal_rank_fusion(
+            [[r.chunk_id for r in dense], [r.chunk_id for r in lexical]], k=rrf_k
+        )
+        
+        results = []
+        for chunk_id, score in fused[:top_k]:
+            result = by_id[chunk_id]
+            results.append(SearchResult(
+                content=result.content,
+                metadata=result.metadata,
+                score=result.score,
+                chunk_id=chunk_id,
+                document_id=result.document_id,
+                rank_score=score,
+            ))
+        
+        self.logger.debug(f"Hybrid search: {len(dense)} dense + {len(lexical)} lexical -> {len(results)} results")
+        return results
+    
     async def delete_document(self, document_id: str) -> int:
         """
         Delete all chunks for a document.
         
-        Note: FAISS doesn't support individual deletion efficiently,
-        so we rebuild the index without the deleted documents.
+        Chunks are tombstoned and skipped by searches; the index is rebuilt
+        from the surviving vectors once enough tombstones accumulate.
         
         Args:
             document_id: Document ID to delete
@@ -789,41 +1163,21 @@ class FaissClient:
             def _delete_document():
                 """Thread-safe deletion function."""
                 with self._lock:
-                    # Find indices to remove
-                    indices_to_remove = []
-                    new_documents = []
-                    new_id_to_index = {}
-                    
-                    deleted_count = 0
-                    new_index = 0
-                    
-                    for i, (chunk_id, content, metadata) in enumerate(self._documents):
-                        if metadata.get("document_id") == document_id:
-                            indices_to_remove.append(i)
-                            deleted_count += 1
-                        else:
-                            new_documents.append((chunk_id, content, metadata))
-                            new_id_to_index[chunk_id] = new_index
-                            new_index += 1
+                    rows = [
+                        row for row, (_, _, metadata) in enumerate(self._documents)
+                        if metadata.get("document_id") == document_id
+                    ]
+                    deleted_count = self._tombstone_rows(rows)
                     
                     if deleted_count > 0:
-                        # Rebuild FAISS index without deleted vectors
-                        self._create_empty_index()
-                        
-                        if new_documents:
-                            # Collect remaining vectors (need to regenerate or store them)
-                            self.logger.warning("Document deletion in FAISS requires index rebuild - this may be slow")
-                            # For now, just update document list
-                            # In production, you'd want to store embeddings alongside metadata
-                        
-                        self._documents = new_documents
-                        self._id_to_index = new_id_to_index
+                        self._compact_if_needed()
                         self._save_to_disk()
                     
                     return deleted_count
             
             loop = asyncio.get_event_loop()
             deleted_count = await loop.run_in_executor(self._executor, _delete_document)
+            self._stats['index_size'] = self._index.ntotal
             
             self.logger.info(f"Deleted {deleted_count} chunks for document {document_id}")
             return deleted_count
@@ -844,8 +1198,9 @@ class FaissClient:
             with self._lock:
                 return {
                     "name": self.config.collection_name,
-                    "count": len(self._documents),
+                    "count": len(self._documents) - self._tombstone_count,
                     "vector_count": self._index.ntotal if self._index else 0,
+                    "tombstones": self._tombstone_count,
                     "dimension": self._dimension,
                     "index_type": "FAISS IndexFlatIP",
                     "persist_directory": self.config.persist_directory
@@ -0,0 +1,192 @@
+"""
+Lexical (BM25) index for hybrid retrieval.
+
+Keeps an in-memory inverted index over chunk text so exact terms such as
+error codes and function names can be matched locally, without an embedding
+round-trip, and fused with dense similarity results.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Word-like tokens, keeping compound identifiers (foo.bar, ERR-42, a::b) whole
+_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_]+(?:(?:::|[.:/\-])[A-Za-z0-9_]+)*")
+
+# Separators and case changes inside an identifier
+_PART_SEPARATOR = re.compile(r"(?:::|[._:/\-])+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+# Tokens worth also indexing as their parts (any separator or case change)
+_COMPOUND_HINT = re.compile(r"\d|_|::|[.:/\-]|[a-z][A-Z]")
+
+# Identifier shapes that mark a query token as an exact lookup rather than
+# prose: snake_case, a::b, camelCase, dotted names (os.path, config.yaml),
+# upper-case error codes (ERR-4012, E1234) and hex literals. Plain numbers,
+# years and hyphenated words do not count.
+_IDENTIFIER_HINT = re.compile(
+    r"_|::|[a-z][A-Z]|[A-Za-z_]\w*\.[A-Za-z_]\w|^[A-Z]+-?\d{2,}$|^0[xX][0-9A-Fa-f]+$"
+)
+
+_QUOTED = re.compile(r'"([^"]+)"|`([^`]+)`')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize text for indexing and querying.
+
+    Compound identifiers are emitted whole and as their parts, so
+    "parseHttpError" matches queries for "parsehttperror", "http" or "error".
+    """
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        raw = match.group()
+        tokens.append(raw.lower())
+        if not _COMPOUND_HINT.search(raw):
+            continue
+        parts = []
+        for piece in _PART_SEPARATOR.split(raw):
+            parts.extend(_CAMEL_PART.findall(piece) or [piece])
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts if part)
+    return tokens
+
+
+def identifier_terms(query: str) -> List[str]:
+    """
+    Extract the exact terms a keyword-style query is looking for.
+
+    Returns identifier-shaped tokens (snake_case, camelCase, dotted or
+    ``::`` names, error codes such as ERR-4012, hex literals) and tokens
+    inside quotes or backticks. An empty list means the query reads as
+    natural language, even if it mentions numbers, years or hyphenated words.
+    """
+    terms = []
+    for match in _QUOTED.finditer(query):
+        terms.extend(token.lower() for token in _TOKEN_PATTERN.findall(match.group(1) or match.group(2)))
+    for match in _TOKEN_PATTERN.finditer(query):
+        raw = match.group()
+        if _IDENTIFIER_HINT.search(raw) and len(raw) > 2:
+            terms.append(raw.lower())
+    return list(dict.fromkeys(terms))
+
+
+class BM25Index:
+    """
+    Incrementally maintained BM25 inverted index keyed by integer row.
+
+    Rows are the caller's document positions (FAISS row numbers); the index
+    does not own the text. Not thread-safe: callers serialize access.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._row_terms: Dict[int, Counter] = {}
+        self._row_lengths: Dict[int, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._row_terms)
+
+    def __contains__(self, row: int) -> bool:
+        return row in self._row_terms
+
+    def add(self, row: int, text: str):
+        """Index (or re-index) the text stored at a row."""
+        if row in self._row_terms:
+            self.remove(row)
+        terms = Counter(tokenize(text))
+        self._row_terms[row] = terms
+        self._row_lengths[row] = sum(terms.values())
+        self._total_length += self._row_lengths[row]
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[row] = count
+
+    def remove(self, row: int):
+        """Drop a row from the index."""
+        terms = self._row_terms.pop(row, None)
+        if terms is None:
+            return
+        self._total_length -= self._row_lengths.pop(row)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(row, None)
+                if not postings:
+                    del self._postings[term]
+
+    def clear(self):
+        """Remove all rows."""
+        self._postings.clear()
+        self._row_terms.clear()
+        self._row_lengths.clear()
+        self._total_length = 0
+
+    def rebuild(self, rows: Iterable[Tuple[int, str]]):
+        """Replace the index contents with the given (row, text) pairs."""
+        self.clear()
+        for row, text in rows:
+            self.add(row, text)
+
+    def has_terms(self, row: int, terms: Sequence[str]) -> bool:
+        """True if the row contains every given term."""
+        row_terms = self._row_terms.get(row)
+        return row_terms is not None and all(term in row_terms for term in terms)
+
+    def search(self, query: str, top_k: int,
+               accept: Optional[Callable[[int], bool]] = None) -> List[Tuple[int, float]]:
+        """
+        Rank rows against a query with BM25.
+
+        Args:
+            query: Query text
+            top_k: Maximum results
+            accept: Optional row predicate (e.g. metadata filters)
+
+        Returns:
+            List of (row, score), best first
+        """
+        row_count = len(self._row_terms)
+        if not row_count or top_k <= 0:
+            return []
+
+        average_length = self._total_length / row_count or 1.0
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (row_count - df + 0.5) / (df + 0.5))
+            for row, tf in postings.items():
+                length = self._row_lengths[row]
+                norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / average_length))
+                scores[row] = scores.get(row, 0.0) + idf * norm
+
+        results = []
+        for row, score in sorted(scores.items(), key=lambda item: item[1], reverse=True):
+            if accept is not None and not accept(row):
+                continue
+            results.append((row, score))
+            if len(results) >= top_k:
+                break
+        return results
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked lists of IDs with reciprocal rank fusion.
+
+    Each ID scores sum(1 / (k + rank)) over the lists it appears in.
+
+    Returns:
+        List of (id, fused_score), best first
+    """
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            fused[item_id] = fused.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
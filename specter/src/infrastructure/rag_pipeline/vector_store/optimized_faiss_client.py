@@ -27,14 +27,11 @@ from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QMutexLocker
 from ..config.rag_config import VectorStoreConfig
 from ..document_loaders.base_loader import Document, DocumentMetadata
 from ..text_processing.text_splitter import TextChunk
+from ....utils.lazy_import import lazy_import
 
-# Import FAISS with error handling
-try:
-    import faiss
-    FAISS_AVAILABLE = True
-except ImportError:
-    FAISS_AVAILABLE = False
-    faiss = None
+# FAISS is imported lazily; the module body runs on first index operation
+faiss = lazy_import("faiss")
+FAISS_AVAILABLE = faiss is not None
 
 logger = logging.getLogger("specter.optimized_faiss_client")
 
@@ -10,6 +10,7 @@ from .intent_classifier import IntentClassifier
 from .skill_executor import SkillExecutor
 from .skill_manager import SkillManager
 from .tool_bridge import ToolCallingBridge, tool_bridge
+from .tool_execution import ToolExecutionEngine
 
 __all__ = [
     "SkillRegistry",
@@ -18,4 +19,5 @@ __all__ = [
     "SkillManager",
     "ToolCallingBridge",
     "tool_bridge",
+    "ToolExecutionEngine",
 ]
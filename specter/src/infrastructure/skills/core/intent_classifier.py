@@ -8,15 +8,26 @@ to execute skills from natural language input.
 import logging
 import re
 import json
+import time
 import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
 from functools import lru_cache
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass, field
+from threading import RLock
+from typing import Dict, FrozenSet, Iterable, List, Optional, Callable, Any, Pattern, Set, Tuple
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse
 
 from ..interfaces.skill_manager import SkillIntent, IIntentClassifier
 
 logger = logging.getLogger("specter.skills.intent")
 
+# Sentinel distinguishing "cached no-match" from "not cached"
+_CACHE_MISS = object()
+
 
 @dataclass
 class IntentPattern:
@@ -36,6 +47,203 @@ class IntentPattern:
     parameter_extractors: Dict[str, Callable[[str], Any]] = field(default_factory=dict)
     confidence_boost: float = 0.0
     examples: List[str] = field(default_factory=list)
+    compiled: List[Pattern] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        """Compile patterns once at registration instead of on every message."""
+        self.compiled = [re.compile(pattern) for pattern in self.patterns]
+
+
+def _required_literals(parsed) -> Optional[Set[str]]:
+    """
+    Derive a set of literals, one of which must occur in any text the
+    parsed regex can match.
+
+    Walks the ``re`` parse tree: runs of consecutive literal characters in a
+    mandatory sequence are required substrings, and a mandatory alternation
+    is satisfied by any of its branches' literals. The most selective
+    candidate (longest shortest-literal) wins.
+
+    Args:
+        parsed: Sequence of (opcode, argument) pairs from the regex parser
+
+    Returns:
+        Set of required literals, or None if none can be proven
+    """
+    best: Optional[Set[str]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[Set[str]]) -> None:
+        nonlocal best
+        if not candidate:
+            return
+        if best is None or min(map(len, candidate)) > min(map(len, best)):
+            best = candidate
+
+    for op, av in parsed:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if op is _sre_parse.AT:
+            # Zero-width anchors keep the surrounding literals contiguous
+            continue
+
+        if run:
+            consider({"".join(run)})
+            run = []
+
+        if op is _sre_parse.SUBPATTERN:
+            add_flags = av[1]
+            if not add_flags & re.IGNORECASE:
+                consider(_required_literals(av[-1]))
+        elif op is _sre_parse.BRANCH:
+            alternatives = [_required_literals(branch) for branch in av[1]]
+            if all(alternatives):
+                consider(set().union(*alternatives))
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+            consider(_required_literals(av[2]))
+
+    if run:
+        consider({"".join(run)})
+
+    return best
+
+
+def _pattern_literals(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Get the prefilter literals for a regex pattern.
+
+    Args:
+        pattern: Regex source string
+
+    Returns:
+        Frozen set of literals (at least one must appear in matching text),
+        or None if the pattern must always be evaluated
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+
+    literals = _required_literals(parsed)
+    return frozenset(literals) if literals else None
+
+
+class _LiteralAutomaton:
+    """
+    Aho-Corasick automaton reporting every registered literal in a text.
+
+    Scans the input once regardless of how many literals are registered,
+    including overlapping matches (e.g. "task" and "tasks").
+    """
+
+    def __init__(self, literals: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+
+        for literal in literals:
+            self._insert(literal)
+        self._build_failure_links()
+
+    def _insert(self, literal: str) -> None:
+        state = 0
+        for ch in literal:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][ch] = next_state
+            state = next_state
+        if literal not in self._out[state]:
+            self._out[state] = self._out[state] + (literal,)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Find all registered literals occurring in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of literals found
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class _IntentIndex:
+    """
+    Compiled lookup structure over all registered IntentPatterns.
+
+    Maps prefilter literals to the (intent pattern, regex) pairs that could
+    match, so only candidate regexes are evaluated per message.
+    """
+
+    def __init__(self, patterns: Dict[str, List[IntentPattern]]):
+        # Flattened registration order: (skill_id, IntentPattern)
+        self.entries: List[Tuple[str, IntentPattern]] = []
+        self._by_literal: Dict[str, List[Tuple[int, int]]] = {}
+        self._always: List[Tuple[int, int]] = []
+
+        for skill_id, intent_patterns in patterns.items():
+            for intent_pattern in intent_patterns:
+                entry_id = len(self.entries)
+                self.entries.append((skill_id, intent_pattern))
+                for pattern_idx, pattern in enumerate(intent_pattern.patterns):
+                    literals = _pattern_literals(pattern)
+                    if literals is None:
+                        self._always.append((entry_id, pattern_idx))
+                        continue
+                    for literal in literals:
+                        self._by_literal.setdefault(literal, []).append((entry_id, pattern_idx))
+
+        self._automaton = _LiteralAutomaton(self._by_literal.keys())
+
+    def candidates(self, text_lower: str) -> Dict[int, List[int]]:
+        """
+        Get candidate regexes for the given lowercased text.
+
+        Args:
+            text_lower: Lowercased user input
+
+        Returns:
+            Dict mapping entry index to sorted pattern indices worth evaluating
+        """
+        hits: Set[Tuple[int, int]] = set(self._always)
+        for literal in self._automaton.find_all(text_lower):
+            hits.update(self._by_literal[literal])
+
+        grouped: Dict[int, List[int]] = {}
+        for entry_id, pattern_idx in sorted(hits):
+            grouped.setdefault(entry_id, []).append(pattern_idx)
+        return grouped
 
 
 class IntentClassifier(IIntentClassifier):
@@ -175,6 +383,12 @@ User: "what's the weather today"
 
 Now classify the user's request."""
 
+    # Maximum number of normalized inputs kept in the pattern-match cache
+    MATCH_CACHE_SIZE = 256
+
+    # Maximum number of AI classifications kept (entries also expire by TTL)
+    AI_CACHE_SIZE = 128
+
     def __init__(
         self,
         confidence_threshold: float = 0.75,
@@ -191,6 +405,18 @@ Now classify the user's request."""
         self._confidence_threshold = confidence_threshold
         self._use_ai_fallback = use_ai_fallback
 
+        # Compiled pattern index (rebuilt lazily after registration changes)
+        # and LRU cache of pattern-match results keyed by normalized input
+        self._index: Optional[_IntentIndex] = None
+        self._match_cache: "OrderedDict[str, Optional[SkillIntent]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._lock = RLock()
+
+        # Parsed AI classification responses keyed by input signature and
+        # the skill list they were produced against: key -> (timestamp, result)
+        self._ai_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
         # Register default patterns
         self._register_default_patterns()
 
@@ -227,8 +453,57 @@ Now classify the user's request."""
 
             self._patterns[skill_id].append(intent_pattern)
 
+        self._invalidate_index()
         logger.debug(f"Registered default patterns for {len(self.DEFAULT_PATTERNS)} skills")
 
+    def _invalidate_index(self) -> None:
+        """Drop the compiled index and cached matches after pattern changes."""
+        with self._lock:
+            self._index = None
+            self._match_cache.clear()
+            self._ai_cache.clear()
+
+    @staticmethod
+    def _similarity_key(user_input: str) -> str:
+        """
+        Reduce input to a signature shared by trivially different phrasings.
+
+        Case, punctuation, and whitespace differences map to the same key, so
+        "Take a screenshot!" and "take a  screenshot" reuse one AI answer.
+        """
+        return " ".join(re.findall(r"[\w./\\:@-]+", user_input.lower()))
+
+    def _get_cached_ai_result(self, key: Tuple[str, str], ttl: float) -> Optional[Dict[str, Any]]:
+        """Get a cached AI classification if it has not expired."""
+        with self._lock:
+            entry = self._ai_cache.get(key)
+            if entry is None:
+                return None
+            timestamp, ai_result = entry
+            if time.monotonic() - timestamp > ttl:
+                del self._ai_cache[key]
+                return None
+            self._ai_cache.move_to_end(key)
+            return ai_result
+
+    def _store_ai_result(self, key: Tuple[str, str], ai_result: Dict[str, Any]) -> None:
+        """Remember a parsed AI classification response."""
+        with self._lock:
+            self._ai_cache[key] = (time.monotonic(), ai_result)
+            self._ai_cache.move_to_end(key)
+            while len(self._ai_cache) > self.AI_CACHE_SIZE:
+                self._ai_cache.popitem(last=False)
+
+    def _get_index(self) -> _IntentIndex:
+        """Get the compiled pattern index, building it if needed."""
+        with self._lock:
+            if self._index is None:
+                self._index = _IntentIndex(self._patterns)
+                logger.debug(
+                    f"Built intent index ({len(self._index.entries)} pattern groups)"
+                )
+            return self._index
+
     def _extract_task_action(self, user_input: str) -> str:
         """
         Extract the appropriate action for task_tracker skill based on user input.
@@ -380,6 +655,9 @@ Now classify the user's request."""
         """
         Perform pattern matching on user input.
 
+        Results are cached per normalized input; the cache is cleared whenever
+        patterns are registered or unregistered.
+
         Args:
             user_input: User input text
             context: Optional context
@@ -387,56 +665,101 @@ Now classify the user's request."""
         Returns:
             SkillIntent if matched, None otherwise
         """
-        text_lower = user_input.lower()
+        normalized = user_input.strip()
+
+        with self._lock:
+            cached = self._match_cache.get(normalized, _CACHE_MISS)
+            if cached is not _CACHE_MISS:
+                self._match_cache.move_to_end(normalized)
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+
+        if cached is _CACHE_MISS:
+            cached = self._compute_pattern_match(normalized)
+            with self._lock:
+                self._match_cache[normalized] = cached
+                if len(self._match_cache) > self.MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+
+        if cached is None:
+            return None
+
+        # Hand out a copy so callers can't mutate the cached entry
+        return replace(
+            cached,
+            parameters=dict(cached.parameters),
+            raw_input=user_input,
+            matched_patterns=list(cached.matched_patterns),
+        )
+
+    def _compute_pattern_match(self, text: str) -> Optional[SkillIntent]:
+        """
+        Match text against the compiled index.
+
+        Only patterns whose required literals occur in the text are evaluated,
+        and parameter extractors run only for pattern groups that matched.
+
+        Args:
+            text: Normalized user input
+
+        Returns:
+            Best-scoring SkillIntent, or None if nothing matched
+        """
+        text_lower = text.lower()
+        index = self._get_index()
         best_match = None
         best_score = 0.0
 
-        for skill_id, intent_patterns in self._patterns.items():
-            for intent_pattern in intent_patterns:
-                score = 0.0
-                matched_patterns = []
-                extracted_params = {}
-
-                # Check each pattern
-                for pattern in intent_pattern.patterns:
-                    match = re.search(pattern, text_lower)
-                    if match:
-                        # Base score for match
-                        score += 0.5
-
-                        # Extract named groups as parameters
-                        for param_name, param_value in match.groupdict().items():
-                            if param_value:
-                                extracted_params[param_name] = param_value
-
-                        matched_patterns.append(pattern)
-
-                # Apply parameter extractors
-                for param_name, extractor in intent_pattern.parameter_extractors.items():
-                    try:
-                        value = extractor(user_input)
-                        if value is not None:
-                            extracted_params[param_name] = value
-                            score += 0.1  # Bonus for extracted param
-                    except Exception as e:
-                        logger.warning(f"Parameter extractor failed for {param_name}: {e}")
-
-                # Apply confidence boost
-                score += intent_pattern.confidence_boost
-
-                # Normalize score to 0.0-1.0
-                confidence = min(score, 1.0)
-
-                # Track best match
-                if confidence > best_score:
-                    best_score = confidence
-                    best_match = SkillIntent(
-                        skill_id=skill_id,
-                        confidence=confidence,
-                        parameters=extracted_params,
-                        raw_input=user_input,
-                        matched_patterns=matched_patterns
-                    )
+        for entry_id, pattern_indices in index.candidates(text_lower).items():
+            skill_id, intent_pattern = index.entries[entry_id]
+            score = 0.0
+            matched_patterns = []
+            extracted_params = {}
+
+            # Check each candidate pattern
+            for pattern_idx in pattern_indices:
+                match = intent_pattern.compiled[pattern_idx].search(text_lower)
+                if match:
+                    # Base score for match
+                    score += 0.5
+
+                    # Extract named groups as parameters
+                    for param_name, param_value in match.groupdict().items():
+                        if param_value:
+                            extracted_params[param_name] = param_value
+
+                    matched_patterns.append(intent_pattern.patterns[pattern_idx])
+
+            if not matched_patterns:
+                continue
+
+            # Apply parameter extractors
+            for param_name, extractor in intent_pattern.parameter_extractors.items():
+                try:
+                    value = extractor(text)
+                    if value is not None:
+                        extracted_params[param_name] = value
+                        score += 0.1  # Bonus for extracted param
+                except Exception as e:
+                    logger.warning(f"Parameter extractor failed for {param_name}: {e}")
+
+            # Apply confidence boost
+            score += intent_pattern.confidence_boost
+
+            # Normalize score to 0.0-1.0
+            confidence = min(score, 1.0)
+
+            # Track best match
+            if confidence > best_score:
+                best_score = confidence
+                best_match = SkillIntent(
+                    skill_id=skill_id,
+                    confidence=confidence,
+                    parameters=extracted_params,
+                    raw_input=text,
+                    matched_patterns=matched_patterns
+                )
 
         return best_match
 
@@ -459,7 +782,7 @@ Now classify the user's request."""
         """
         try:
             # Check if AI classification is enabled (lazy import settings)
-            from ....storage.settings_manager import settings
+            from ...storage.settings_manager import settings
 
             if not settings.get('advanced.enable_ai_intent_classification', False):
                 logger.debug("AI intent classification disabled in settings")
@@ -468,13 +791,7 @@ Now classify the user's request."""
             # Get configuration
             timeout_seconds = settings.get('advanced.ai_intent_timeout_seconds', 5)
             ai_threshold = settings.get('advanced.ai_intent_confidence_threshold', 0.65)
-
-            # Import AIService lazily (avoid circular dependency)
-            from ....ai.ai_service import ai_service
-
-            if not ai_service or not ai_service.is_initialized:
-                logger.warning("AIService not initialized, cannot perform AI classification")
-                return None
+            cache_ttl = settings.get('advanced.ai_intent_cache_ttl_seconds', 300)
 
             # Format prompt with enabled skills only
             skill_list = self._format_enabled_skill_list()
@@ -482,35 +799,51 @@ Now classify the user's request."""
                 logger.debug("No enabled skills to classify")
                 return None
 
-            prompt = self.AI_CLASSIFICATION_PROMPT_TEMPLATE.format(
-                skill_list=skill_list,
-                user_input=user_input[:200]  # Limit input length
-            )
+            # Reuse a recent classification of an equivalent request
+            cache_key = (self._similarity_key(user_input[:200]), skill_list)
+            ai_result = self._get_cached_ai_result(cache_key, cache_ttl)
+            if ai_result is not None:
+                logger.debug("Using cached AI classification")
+            else:
+                # Import AIService lazily (avoid circular dependency)
+                from ...ai.ai_service import ai_service
+
+                if not ai_service or not ai_service.is_initialized:
+                    logger.warning("AIService not initialized, cannot perform AI classification")
+                    return None
+
+                prompt = self.AI_CLASSIFICATION_PROMPT_TEMPLATE.format(
+                    skill_list=skill_list,
+                    user_input=user_input[:200]  # Limit input length
+                )
 
-            logger.debug(f"Sending AI classification request (timeout={timeout_seconds}s)")
+                logger.debug(f"Sending AI classification request (timeout={timeout_seconds}s)")
 
-            # Send request with timeout protection
-            try:
-                # Use asyncio.wait_for to enforce timeout
-                response_text = await asyncio.wait_for(
-                    self._call_ai_service(ai_service, prompt),
-                    timeout=timeout_seconds
-                )
-            except asyncio.TimeoutError:
-                logger.warning(f"AI classification timed out after {timeout_seconds}s")
-                return None
-            except Exception as e:
-                logger.error(f"AI service call failed: {e}")
-                return None
+                # Send request with timeout protection
+                try:
+                    # Use asyncio.wait_for to enforce timeout
+                    response_text = await asyncio.wait_for(
+                        self._call_ai_service(ai_service, prompt),
+                        timeout=timeout_seconds
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"AI classification timed out after {timeout_seconds}s")
+                    return None
+                except Exception as e:
+                    logger.error(f"AI service call failed: {e}")
+                    return None
 
-            if not response_text:
-                logger.warning("AI returned empty response")
-                return None
+                if not response_text:
+                    logger.warning("AI returned empty response")
+                    return None
 
-            # Parse and validate JSON response
-            ai_result = self._parse_ai_response(response_text)
-            if not ai_result:
-                return None
+                # Parse and validate JSON response
+                ai_result = self._parse_ai_response(response_text)
+                if not ai_result:
+                    return None
+
+                # Only well-formed answers are cached; failures are retried
+                self._store_ai_result(cache_key, ai_result)
 
             # Extract results
             skill_id = ai_result.get('skill_id')
@@ -747,6 +1080,7 @@ Now classify the user's request."""
         )
 
         self._patterns[skill_id].append(intent_pattern)
+        self._invalidate_index()
 
         logger.debug(f"Registered {len(patterns)} patterns for skill: {skill_id}")
 
@@ -762,6 +1096,7 @@ Now classify the user's request."""
         """
         if skill_id in self._patterns:
             del self._patterns[skill_id]
+            self._invalidate_index()
             logger.debug(f"Unregistered patterns for skill: {skill_id}")
             return True
         return False
@@ -789,25 +1124,24 @@ Now classify the user's request."""
         Returns:
             Dict mapping skill_id to confidence score
         """
-        text_lower = user_input.lower()
+        text_lower = user_input.strip().lower()
+        index = self._get_index()
         scores = {}
 
-        for skill_id, intent_patterns in self._patterns.items():
-            max_score = 0.0
+        for entry_id, pattern_indices in index.candidates(text_lower).items():
+            skill_id, intent_pattern = index.entries[entry_id]
+            score = 0.0
 
-            for intent_pattern in intent_patterns:
-                score = 0.0
+            # Check each candidate pattern
+            for pattern_idx in pattern_indices:
+                if intent_pattern.compiled[pattern_idx].search(text_lower):
+                    score += 0.5
 
-                # Check each pattern
-                for pattern in intent_pattern.patterns:
-                    if re.search(pattern, text_lower):
-                        score += 0.5
+            if score == 0.0:
+                continue
 
-                score += intent_pattern.confidence_boost
-                max_score = max(max_score, min(score, 1.0))
-
-            if max_score > 0.0:
-                scores[skill_id] = max_score
+            score += intent_pattern.confidence_boost
+            scores[skill_id] = max(scores.get(skill_id, 0.0), min(score, 1.0))
 
         return scores
 
@@ -829,5 +1163,11 @@ Now classify the user's request."""
                 skill_id: len(intent_patterns)
                 for skill_id, intent_patterns in self._patterns.items()
             },
+            "match_cache": {
+                "size": len(self._match_cache),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            },
+            "ai_cache_size": len(self._ai_cache),
         }
         return stats
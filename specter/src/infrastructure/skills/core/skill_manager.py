@@ -6,6 +6,7 @@ combining the skill registry, intent classifier, and executor.
 """
 
 import logging
+import threading
 from typing import List, Optional, Dict, Any, Callable, Type
 
 from ..interfaces.base_skill import BaseSkill, SkillMetadata, PermissionType
@@ -34,7 +35,8 @@ class SkillManager(ISkillManager):
     This is the main entry point for skill interactions in Specter.
 
     Attributes:
-        _registry: Skill registry for skill storage and lookup
+        _registry: Skill registry for skill storage and lookup (runs any
+                   deferred skill loader on first access)
         _classifier: Intent classifier for detecting user intent
         _executor: Skill executor for running skills
         _permissions_granted: Set of granted permissions
@@ -81,7 +83,10 @@ class SkillManager(ISkillManager):
                 logger.warning(f"Could not read AI fallback setting: {e}")
                 use_ai_fallback = False
 
-        self._registry = SkillRegistry()
+        self._skill_registry = SkillRegistry()
+        self._skill_loader: Optional[Callable[[], None]] = None
+        self._skills_loaded = True
+        self._loader_lock = threading.RLock()
         self._classifier = IntentClassifier(
             confidence_threshold=confidence_threshold,
             use_ai_fallback=use_ai_fallback
@@ -110,6 +115,40 @@ class SkillManager(ISkillManager):
         """Public accessor for the skill registry."""
         return self._registry
 
+    @property
+    def _registry(self) -> SkillRegistry:
+        if not self._skills_loaded:
+            self.ensure_skills_loaded()
+        return self._skill_registry
+
+    def set_skill_loader(self, loader: Callable[[], None]) -> None:
+        """
+        Defer skill registration until the registry is first used.
+
+        The loader typically imports and registers the built-in skills; it
+        runs once, on the first registry access or an explicit
+        ``ensure_skills_loaded`` call, whichever comes first.
+
+        Args:
+            loader: Callable that registers skills with this manager
+        """
+        with self._loader_lock:
+            self._skill_loader = loader
+            self._skills_loaded = False
+
+    def ensure_skills_loaded(self) -> None:
+        """Run the deferred skill loader if it has not run yet."""
+        with self._loader_lock:
+            # The loader registers skills through this manager, which re-enters
+            # here on the same thread once it has been taken
+            loader, self._skill_loader = self._skill_loader, None
+            if loader is None:
+                return
+            try:
+                loader()
+            finally:
+                self._skills_loaded = True
+
     def register_skill(self, skill_class: Type[BaseSkill]) -> None:
         """
         Register a skill class with the manager.
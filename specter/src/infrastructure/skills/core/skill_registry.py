@@ -26,6 +26,7 @@ class SkillRegistry:
         _skills: Dictionary mapping skill_id to skill instance
         _metadata: Dictionary mapping skill_id to SkillMetadata
         _status: Dictionary mapping skill_id to SkillStatus
+        _version: Counter bumped on every registration or status change
         _lock: Thread lock for safe concurrent access
 
     Example:
@@ -40,10 +41,21 @@ class SkillRegistry:
         self._skills: Dict[str, BaseSkill] = {}
         self._metadata: Dict[str, SkillMetadata] = {}
         self._status: Dict[str, SkillStatus] = {}
+        self._version = 0
         self._lock = Lock()
 
         logger.info("Skill registry initialized")
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic version of the registry contents.
+
+        Incremented whenever a skill is registered, unregistered, or changes
+        status, so callers can cache data derived from the registry.
+        """
+        return self._version
+
     def register(self, skill_class: Type[BaseSkill]) -> None:
         """
         Register a skill class with the registry.
@@ -78,6 +90,7 @@ class SkillRegistry:
             self._skills[skill_id] = skill_instance
             self._metadata[skill_id] = metadata
             self._status[skill_id] = SkillStatus.LOADED
+            self._version += 1
 
             logger.info(
                 f"✓ Registered skill: {metadata.name} (ID: {skill_id}, "
@@ -104,6 +117,7 @@ class SkillRegistry:
             del self._skills[skill_id]
             del self._metadata[skill_id]
             del self._status[skill_id]
+            self._version += 1
 
             logger.info(f"✓ Unregistered skill: {skill_name} (ID: {skill_id})")
             return True
@@ -164,6 +178,8 @@ class SkillRegistry:
 
             old_status = self._status[skill_id]
             self._status[skill_id] = status
+            if status != old_status:
+                self._version += 1
 
             logger.debug(
                 f"Skill {skill_id} status: {old_status.value} -> {status.value}"
@@ -242,6 +258,7 @@ class SkillRegistry:
             self._skills.clear()
             self._metadata.clear()
             self._status.clear()
+            self._version += 1
 
             logger.info(f"Registry cleared ({count} skills removed)")
 
@@ -23,7 +23,8 @@ Usage:
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..interfaces.base_skill import SkillResult
 
@@ -32,14 +33,53 @@ logger = logging.getLogger("specter.skills.tool_bridge")
 
 class ToolCallingBridge:
     """
-    Stateless bridge that translates between the Specter skills framework
-    and AI provider tool-calling protocols.
-
-    All methods are regular instance methods on a module-level singleton.
-    No instance state is required; the singleton pattern is used purely for
-    a clean calling convention (``tool_bridge.method(...)``).
+    Bridge that translates between the Specter skills framework and AI
+    provider tool-calling protocols.
+
+    All methods are regular instance methods on a module-level singleton
+    (``tool_bridge.method(...)``). The only instance state is a cache of
+    generated tool definitions and the tool awareness prompt, keyed by the
+    registry version and a settings version that is bumped whenever a
+    ``tools.*`` setting changes.
     """
 
+    def __init__(self):
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+        self._settings_version = 0
+        self._listening = False
+        self._lock = Lock()
+
+    # ------------------------------------------------------------------
+    # 0. Cache management
+    # ------------------------------------------------------------------
+
+    def _ensure_settings_listener(self, settings) -> None:
+        """Subscribe to settings changes the first time the cache is used."""
+        if self._listening:
+            return
+        settings.on_change(self._on_settings_changed)
+        self._listening = True
+
+    def _on_settings_changed(self, key_path: str) -> None:
+        """Invalidate cached tool data when a tools setting changes."""
+        if key_path == "tools" or key_path.startswith("tools."):
+            self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached tool definitions and awareness prompts."""
+        with self._lock:
+            self._settings_version += 1
+            self._cache.clear()
+        logger.debug("Tool definition cache invalidated")
+
+    def _cache_key(self, registry: "SkillRegistry", kind: str) -> Tuple[Any, ...]:
+        return (
+            kind,
+            id(registry),
+            getattr(registry, "version", None),
+            self._settings_version,
+        )
+
     # ------------------------------------------------------------------
     # 1. Build tool definitions for a given provider
     # ------------------------------------------------------------------
@@ -55,6 +95,8 @@ class ToolCallingBridge:
         Iterates all registered skills, keeps only those that are both
         ``ai_callable`` and enabled in the user's settings, then formats
         each skill's parameter schema according to *provider_format*.
+        The result is cached until the registry or a ``tools.*`` setting
+        changes.
 
         Args:
             registry: The SkillRegistry containing all registered skills.
@@ -66,6 +108,25 @@ class ToolCallingBridge:
         # Lazy import to avoid circular dependency at module load time
         from ...storage.settings_manager import settings
 
+        self._ensure_settings_listener(settings)
+        key = self._cache_key(registry, f"definitions:{provider_format}")
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        definitions = self._build_tool_definitions(registry, provider_format, settings)
+        with self._lock:
+            self._cache[key] = definitions
+        return list(definitions)
+
+    def _build_tool_definitions(
+        self,
+        registry: "SkillRegistry",
+        provider_format: str,
+        settings,
+    ) -> List[Dict[str, Any]]:
+        """Generate tool definitions without consulting the cache."""
         # Global kill-switch for tool calling
         if not settings.get("tools.enabled", True):
             logger.debug("Tool calling globally disabled via settings")
@@ -140,9 +201,24 @@ class ToolCallingBridge:
         This is injected into the system prompt so the AI model knows what
         tools it has and when to use them.  Without this, models often refuse
         file paths or suggest cloud uploads instead of using their tools.
+        Cached the same way as :meth:`get_tool_definitions`.
         """
         from ...storage.settings_manager import settings
 
+        self._ensure_settings_listener(settings)
+        key = self._cache_key(registry, "awareness")
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_tool_awareness_prompt(registry, settings)
+        with self._lock:
+            self._cache[key] = prompt
+        return prompt
+
+    def _build_tool_awareness_prompt(self, registry: "SkillRegistry", settings) -> str:
+        """Generate the tool awareness prompt without consulting the cache."""
         if not settings.get("tools.enabled", True):
             return ""
 
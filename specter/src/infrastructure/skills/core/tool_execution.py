@@ -0,0 +1,301 @@
+"""
+Tool Execution Engine - Concurrent execution of AI tool calls.
+
+Runs the tool calls returned by a model in a single turn. Calls to skills
+whose metadata declares them ``parallel_safe`` run concurrently, bounded by
+each skill's ``max_concurrency``; any other call acts as a barrier and runs
+alone, after the calls before it and before the calls after it. Results are
+always returned in the original call order so the provider message format
+is preserved.
+
+Scheduling happens on one long-lived event loop thread. Skill bodies run on
+a worker pool because most skills perform blocking I/O inside ``execute``;
+each worker keeps its own persistent event loop for them.
+
+Calls time out after the skill's ``timeout_seconds`` (or the engine default),
+except for ``interactive`` skills, which wait on the user. A timed-out skill
+is cancelled at its next ``await``; a skill blocked in synchronous code
+cannot be interrupted and keeps its worker until it returns. Either way the
+call holds its concurrency slot, and its group the barrier, until the worker
+has finished, so a timeout never lets calls overlap that otherwise would not.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..interfaces.base_skill import SkillResult
+
+logger = logging.getLogger("specter.skills.tool_execution")
+
+# Tool status observer: (status, skill_id, details), status is "executing" or "completed"
+ToolStatusCallback = Callable[[str, str, Dict[str, Any]], None]
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+
+class _SkillCall:
+    """Cancellation handle shared between the scheduler and a worker."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def attach(self, loop: asyncio.AbstractEventLoop, task: asyncio.Task) -> bool:
+        """Register the worker's task; False if the call was already cancelled."""
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._loop, self._task = loop, task
+            return True
+
+    def cancel(self):
+        """Cancel the skill's task on its worker loop (or before it starts)."""
+        with self._lock:
+            self._cancelled = True
+            if self._task is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._task.cancel)
+
+
+class ToolExecutionEngine:
+    """
+    Executes a turn's tool calls with per-skill concurrency and timeouts.
+
+    Attributes:
+        _skill_manager: Skill manager used to run skills (resolved lazily)
+        _max_workers: Size of the worker pool running skill bodies
+        _loop: Long-lived scheduling loop (started on first use)
+        _semaphores: Per-skill concurrency limits, created on the loop
+
+    Example:
+        >>> engine = ToolExecutionEngine(skill_manager)
+        >>> results = engine.execute(tool_calls)
+        >>> for call, result in results:
+        ...     print(call["skill_id"], result.success)
+    """
+
+    def __init__(self, skill_manager=None, max_workers: int = 4,
+                 default_timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        """
+        Initialize the engine.
+
+        Args:
+            skill_manager: Skill manager (defaults to the module singleton)
+            max_workers: Maximum skill bodies running at once
+            default_timeout: Timeout for skills that do not declare one
+        """
+        self._skill_manager = skill_manager
+        self._max_workers = max(1, max_workers)
+        self.default_timeout = default_timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._workers: Optional[ThreadPoolExecutor] = None
+        self._worker_state = threading.local()
+        self._worker_loops: List[asyncio.AbstractEventLoop] = []
+        self._semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+        self._start_lock = threading.Lock()
+
+    @property
+    def skill_manager(self):
+        if self._skill_manager is None:
+            from .skill_manager import skill_manager
+            self._skill_manager = skill_manager
+        return self._skill_manager
+
+    def execute(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        status_callback: Optional[ToolStatusCallback] = None
+    ) -> List[Tuple[Dict[str, Any], SkillResult]]:
+        """
+        Execute tool calls, blocking the calling thread until all finish.
+
+        Args:
+            tool_calls: Parsed tool calls (``id``, ``skill_id``, ``arguments``)
+            status_callback: Optional observer, called from the scheduling thread
+
+        Returns:
+            List of (tool_call, SkillResult) in the original order
+        """
+        if not tool_calls:
+            return []
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            self.execute_async(tool_calls, status_callback), loop
+        )
+        return future.result()
+
+    async def execute_async(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        status_callback: Optional[ToolStatusCallback] = None
+    ) -> List[Tuple[Dict[str, Any], SkillResult]]:
+        """
+        Execute tool calls on the engine's loop.
+
+        Consecutive parallel-safe calls run together; every other call runs
+        on its own between them.
+        """
+        results: List[Optional[SkillResult]] = [None] * len(tool_calls)
+
+        for group in self._plan(tool_calls):
+            if len(group) > 1:
+                logger.info(f"Running {len(group)} tool calls concurrently")
+            group_results = await asyncio.gather(
+                *(self._run_call(tool_calls[i], status_callback) for i in group)
+            )
+            for i, result in zip(group, group_results):
+                results[i] = result
+
+        return list(zip(tool_calls, results))
+
+    def _plan(self, tool_calls: List[Dict[str, Any]]) -> List[List[int]]:
+        """Split call indices into groups that may run concurrently."""
+        groups: List[List[int]] = []
+        parallel: List[int] = []
+        for i, call in enumerate(tool_calls):
+            metadata = self.skill_manager.get_skill_metadata(call.get("skill_id", ""))
+            if metadata is not None and metadata.parallel_safe:
+                parallel.append(i)
+                continue
+            if parallel:
+                groups.append(parallel)
+                parallel = []
+            groups.append([i])
+        if parallel:
+            groups.append(parallel)
+        return groups
+
+    async def _run_call(
+        self,
+        call: Dict[str, Any],
+        status_callback: Optional[ToolStatusCallback]
+    ) -> SkillResult:
+        """Run one tool call under its skill's concurrency limit and timeout."""
+        skill_id = call["skill_id"]
+        arguments = call.get("arguments", {})
+        metadata = self.skill_manager.get_skill_metadata(skill_id)
+        if metadata is not None and metadata.interactive:
+            timeout = None
+        elif metadata is not None and metadata.timeout_seconds:
+            timeout = metadata.timeout_seconds
+        else:
+            timeout = self.default_timeout
+        limit = metadata.max_concurrency if metadata and metadata.parallel_safe else 1
+
+        async with self._semaphore(skill_id, limit):
+            logger.info(f"Executing tool: {skill_id} (call_id: {call.get('id')})")
+            self._notify(status_callback, "executing", skill_id, arguments)
+            handle = _SkillCall()
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._workers, self._run_skill, skill_id, arguments, handle)
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout)
+                logger.info(
+                    f"Tool result: success={result.success}, message={result.message}"
+                )
+            except asyncio.TimeoutError:
+                handle.cancel()
+                logger.error(f"Tool {skill_id} timed out after {timeout:.0f}s, cancelling it")
+                # Keep the slot until the worker is actually done with the skill
+                try:
+                    await future
+                except Exception:
+                    pass
+                result = SkillResult(
+                    success=False,
+                    message=f"Tool execution timed out after {timeout:.0f} seconds",
+                    error="timeout"
+                )
+            except Exception as e:
+                logger.error(f"Tool execution failed: {e}")
+                result = SkillResult(
+                    success=False,
+                    message=f"Tool execution failed: {str(e)}",
+                    error=str(e)
+                )
+            self._notify(status_callback, "completed", skill_id,
+                         {"success": result.success, "message": result.message})
+            return result
+
+    def _run_skill(self, skill_id: str, arguments: Dict[str, Any],
+                   handle: _SkillCall) -> Optional[SkillResult]:
+        """
+        Run a skill to completion on the current worker's event loop.
+
+        Returns None if the call was cancelled (its result is no longer
+        awaited by then).
+        """
+        loop = getattr(self._worker_state, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._worker_state.loop = loop
+            with self._start_lock:
+                self._worker_loops.append(loop)
+        task = loop.create_task(
+            self.skill_manager.execute_skill(skill_id, skip_confirmation=True, **arguments)
+        )
+        if not handle.attach(loop, task):
+            task.cancel()
+        try:
+            return loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            logger.info(f"Tool {skill_id} cancelled after timing out")
+            return None
+
+    def _semaphore(self, skill_id: str, limit: int) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent executions of a skill."""
+        key = (skill_id, max(1, limit))
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(key[1])
+            self._semaphores[key] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _notify(callback: Optional[ToolStatusCallback], status: str,
+                skill_id: str, details: Dict[str, Any]):
+        if callback:
+            try:
+                callback(status, skill_id, details)
+            except Exception:
+                pass
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the scheduling loop and worker pool if needed."""
+        with self._start_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._workers = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="ToolWorker"
+                )
+                self._semaphores.clear()
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="ToolExecutionLoop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def shutdown(self):
+        """Stop the scheduling loop and worker pool."""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+            self._workers.shutdown(wait=False)
+            self._workers = None
+            # Loops of workers still stuck in a timed-out skill are left to it
+            for worker_loop in self._worker_loops:
+                if not worker_loop.is_running():
+                    worker_loop.close()
+            self._worker_loops.clear()
+            logger.info("Tool execution engine shut down")
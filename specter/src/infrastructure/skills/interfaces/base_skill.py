@@ -52,6 +52,13 @@ class SkillMetadata:
         enabled_by_default: Whether skill is active on first install
         requires_confirmation: Whether to prompt user before execution
         permissions_required: List of permissions needed
+        ai_callable: Whether AI models can invoke this skill via tool calling
+        parallel_safe: Whether the skill is side-effect-free and may run
+            concurrently with other tool calls in the same turn
+        max_concurrency: Maximum simultaneous executions when parallel_safe
+        timeout_seconds: Tool-call timeout (None uses the engine default)
+        interactive: Whether the skill waits on the user (overlays, dialogs,
+            security prompts); interactive skills are exempt from the timeout
         version: Semantic version string
         author: Skill author/maintainer
 
@@ -77,6 +84,10 @@ class SkillMetadata:
     requires_confirmation: bool = False
     permissions_required: List[PermissionType] = field(default_factory=list)
     ai_callable: bool = False  # Whether AI models can invoke this skill via tool calling
+    parallel_safe: bool = False  # Side-effect-free; safe to run alongside other tool calls
+    max_concurrency: int = 4
+    timeout_seconds: Optional[float] = None
+    interactive: bool = False  # Waits on the user; never timed out
     version: str = "1.0.0"
     author: str = "Specter"
 
@@ -88,6 +99,8 @@ class SkillMetadata:
             raise ValueError("name cannot be empty")
         if not self.description.strip():
             raise ValueError("description cannot be empty")
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got: {self.max_concurrency}")
 
 
 @dataclass(frozen=True)
@@ -19,7 +19,7 @@ import shutil
 import tempfile
 import threading
 from dataclasses import dataclass
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Callable, Dict, Optional, Tuple
 from pathlib import Path
 
 from ..interfaces.base_skill import (
@@ -87,6 +87,118 @@ class CodeExecutionResult:
     runs_after: int = 0
 
 
+class ParagraphContext:
+    """
+    One paragraph as seen by a formatting pass.
+
+    python-docx builds new proxies on every ``paragraph.style``,
+    ``paragraph.runs`` and ``paragraph.text`` access, so the context resolves
+    each once and shares it between operations. Operations that rewrite run
+    text call ``invalidate_text``.
+    """
+
+    __slots__ = ("paragraph", "_style_name", "_runs", "_text", "_format")
+
+    def __init__(self, paragraph: Any):
+        self.paragraph = paragraph
+        self._style_name: Optional[str] = None
+        self._runs: Optional[List[Any]] = None
+        self._text: Optional[str] = None
+        self._format: Any = None
+
+    @property
+    def style_name(self) -> str:
+        if self._style_name is None:
+            style = self.paragraph.style
+            self._style_name = style.name if style else ""
+        return self._style_name
+
+    @property
+    def is_heading(self) -> bool:
+        return self.style_name.lower().startswith("heading")
+
+    @property
+    def is_list(self) -> bool:
+        return "List" in self.style_name
+
+    @property
+    def runs(self) -> List[Any]:
+        if self._runs is None:
+            self._runs = self.paragraph.runs
+        return self._runs
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.paragraph.text
+        return self._text
+
+    @property
+    def paragraph_format(self) -> Any:
+        if self._format is None:
+            self._format = self.paragraph.paragraph_format
+        return self._format
+
+    def invalidate_text(self) -> None:
+        self._text = None
+
+
+# Formats one paragraph and returns its change count
+ParagraphVisitor = Callable[[ParagraphContext], int]
+
+
+class FormattingPipeline:
+    """
+    Runs paragraph operations as one fused pass over the document.
+
+    The paragraph list is snapshotted once and every operation visits each
+    paragraph in ALL_OPERATIONS order before the pass moves on, so N
+    operations cost one walk instead of N. An operation that raises is
+    recorded as an error and dropped for the rest of the pass.
+    """
+
+    def __init__(self):
+        self._visitors: List[Tuple[str, ParagraphVisitor]] = []
+
+    def add(self, operation: str, visitor: ParagraphVisitor) -> None:
+        self._visitors.append((operation, visitor))
+
+    def __len__(self) -> int:
+        return len(self._visitors)
+
+    def run(self, doc: Any) -> Dict[str, Any]:
+        """
+        Apply every operation to every paragraph of ``doc``.
+
+        Returns:
+            Change count per operation, or "error: ..." for failed operations
+        """
+        results: Dict[str, Any] = {operation: 0 for operation, _ in self._visitors}
+        if not self._visitors:
+            return results
+
+        active = list(self._visitors)
+        paragraphs = doc.paragraphs
+
+        for paragraph in paragraphs:
+            ctx = ParagraphContext(paragraph)
+            failed = []
+            for operation, visitor in active:
+                try:
+                    results[operation] += visitor(ctx)
+                except Exception as e:
+                    logger.error(f"Operation '{operation}' failed: {e}", exc_info=True)
+                    results[operation] = f"error: {e}"
+                    failed.append(operation)
+            if failed:
+                active = [(op, visitor) for op, visitor in active if op not in failed]
+                if not active:
+                    break
+
+        logger.debug(f"Formatting pass: {len(self._visitors)} operation(s) over {len(paragraphs)} paragraph(s)")
+        return results
+
+
 class DocxFormatterSkill(BaseSkill):
     """
     Skill for reformatting and standardizing DOCX documents.
@@ -351,69 +463,36 @@ class DocxFormatterSkill(BaseSkill):
             )
             bullet_indent = params.get("bullet_indent", 0.5)
 
-            # --- Execute operations in order ---
+            # --- Execute operations in a single pass ---
+            options = dict(
+                params,
+                font_name=font_name,
+                font_size=font_size,
+                line_spacing=line_spacing,
+                margins=margins,
+                bullet_indent=bullet_indent,
+            )
             changes: Dict[str, Any] = {}
+            pipeline = self._build_pipeline(doc, operations, options, changes)
+            changes.update(pipeline.run(doc))
 
-            for operation in ALL_OPERATIONS:
-                if operation not in operations:
-                    continue
-
-                try:
-                    if operation == "standardize_fonts":
-                        changes[operation] = self._standardize_fonts(doc, font_name, font_size)
-                    elif operation == "fix_margins":
-                        changes[operation] = self._fix_margins(doc, margins)
-                    elif operation == "normalize_spacing":
-                        changes[operation] = self._normalize_spacing(doc, line_spacing)
-                    elif operation == "fix_bullets":
-                        changes[operation] = self._fix_bullets(doc, bullet_indent)
-                    elif operation == "fix_spelling":
-                        changes[operation] = self._fix_spelling(doc)
-                    elif operation == "fix_case":
-                        changes[operation] = self._fix_case(doc)
-                    elif operation == "normalize_headings":
-                        changes[operation] = self._normalize_headings(doc)
-                    elif operation == "find_replace":
-                        find_text = params.get("find_text", "")
-                        replace_text = params.get("replace_text", "")
-                        if find_text:
-                            changes[operation] = self._find_replace(doc, find_text, replace_text)
-                        else:
-                            changes[operation] = "skipped: no find_text provided"
-                    elif operation == "set_font_color":
-                        font_color = params.get("font_color", "")
-                        target_scope = params.get("target_scope", "all")
-                        if font_color:
-                            changes[operation] = self._set_font_color(doc, font_color, target_scope)
-                        else:
-                            changes[operation] = "skipped: no font_color provided"
-                    elif operation == "set_alignment":
-                        alignment = params.get("alignment", "")
-                        target_scope = params.get("target_scope", "all")
-                        if alignment:
-                            changes[operation] = self._set_alignment(doc, alignment, target_scope)
-                        else:
-                            changes[operation] = "skipped: no alignment provided"
-                    elif operation == "set_indent":
-                        indent_inches = params.get("indent_inches")
-                        if indent_inches is not None:
-                            changes[operation] = self._set_indent(doc, indent_inches)
-                        else:
-                            changes[operation] = "skipped: no indent_inches provided"
-
-                    logger.info(f"Operation '{operation}' completed: {changes[operation]}")
-
-                except Exception as e:
-                    logger.error(f"Operation '{operation}' failed: {e}", exc_info=True)
-                    changes[operation] = f"error: {e}"
+            for operation, value in changes.items():
+                logger.info(f"Operation '{operation}' completed: {value}")
 
             # --- Save formatted document ---
             session_mode = params.get("_session_mode", False)
+            output_path = params.get("_output_path")
             if session_mode:
                 # Session mode: save in-place (working on temp copy)
                 doc.save(str(file_path))
                 formatted_path = file_path
                 logger.info(f"Session mode: saved in-place to {file_path}")
+            elif output_path:
+                # Batch mode: the caller planned the output path and presents results itself
+                formatted_path = Path(output_path)
+                formatted_path.parent.mkdir(parents=True, exist_ok=True)
+                doc.save(str(formatted_path))
+                logger.info(f"Formatted document saved: {formatted_path}")
             else:
                 # Normal mode: save to AppData temp dir
                 formatted_path = self._get_output_path(file_path)
@@ -462,37 +541,119 @@ class DocxFormatterSkill(BaseSkill):
                 error=str(e),
             )
 
+    # ------------------------------------------------------------------
+    # Operation pipeline
+    # ------------------------------------------------------------------
+
+    def _build_pipeline(self, doc: Any, operations: List[str], options: Dict[str, Any],
+                        changes: Dict[str, Any]) -> "FormattingPipeline":
+        """
+        Compile the selected paragraph operations into one fused pass.
+
+        Document-level operations (margins) run immediately; operations that
+        are skipped or cannot be compiled are recorded in ``changes``.
+
+        Args:
+            doc: python-docx Document object
+            operations: Operation names requested
+            options: Skill parameters merged with formatting defaults
+            changes: Per-operation results, filled in ALL_OPERATIONS order
+
+        Returns:
+            Pipeline of paragraph visitors ready to run
+        """
+        pipeline = FormattingPipeline()
+        target_scope = options.get("target_scope", "all")
+
+        for operation in ALL_OPERATIONS:
+            if operation not in operations:
+                continue
+
+            try:
+                visitor = None
+                if operation == "fix_margins":
+                    changes[operation] = self._fix_margins(doc, options["margins"])
+                elif operation == "standardize_fonts":
+                    visitor = self._standardize_fonts(options["font_name"], options["font_size"])
+                elif operation == "normalize_spacing":
+                    visitor = self._normalize_spacing(options["line_spacing"])
+                elif operation == "fix_bullets":
+                    visitor = self._fix_bullets(options["bullet_indent"])
+                elif operation == "fix_spelling":
+                    visitor = self._fix_spelling()
+                elif operation == "fix_case":
+                    visitor = self._fix_case()
+                elif operation == "normalize_headings":
+                    visitor = self._normalize_headings()
+                elif operation == "find_replace":
+                    find_text = options.get("find_text", "")
+                    if find_text:
+                        visitor = self._find_replace(find_text, options.get("replace_text", ""))
+                    else:
+                        changes[operation] = "skipped: no find_text provided"
+                elif operation == "set_font_color":
+                    font_color = options.get("font_color", "")
+                    if font_color:
+                        visitor = self._set_font_color(font_color, target_scope)
+                    else:
+                        changes[operation] = "skipped: no font_color provided"
+                elif operation == "set_alignment":
+                    alignment = options.get("alignment", "")
+                    if alignment:
+                        visitor = self._set_alignment(alignment, target_scope)
+                    else:
+                        changes[operation] = "skipped: no alignment provided"
+                elif operation == "set_indent":
+                    indent_inches = options.get("indent_inches")
+                    if indent_inches is not None:
+                        visitor = self._set_indent(indent_inches)
+                    else:
+                        changes[operation] = "skipped: no indent_inches provided"
+
+                if visitor is not None:
+                    pipeline.add(operation, visitor)
+                    changes[operation] = 0  # Keeps ALL_OPERATIONS order in the result
+                elif operation not in changes:
+                    # Operation could not run (missing dependency, bad value)
+                    changes[operation] = 0
+
+            except Exception as e:
+                logger.error(f"Operation '{operation}' failed: {e}", exc_info=True)
+                changes[operation] = f"error: {e}"
+
+        return pipeline
+
     # ------------------------------------------------------------------
     # Private operation methods
+    #
+    # Paragraph operations return a visitor that formats one paragraph and
+    # returns its change count, or None when the operation cannot run.
     # ------------------------------------------------------------------
 
-    def _standardize_fonts(self, doc: Any, font_name: str, font_size: int) -> int:
+    def _standardize_fonts(self, font_name: str, font_size: int) -> "ParagraphVisitor":
         """
         Standardize all fonts in the document to the specified font and size.
 
-        Iterates every run in every paragraph and sets a uniform font name
-        and point size.
+        Sets a uniform font name and point size on every run.
 
         Args:
-            doc: python-docx Document object
             font_name: Target font family name (e.g. "Calibri")
             font_size: Target font size in points (e.g. 11)
 
         Returns:
-            Number of runs changed
+            Visitor counting runs changed
         """
         from docx.shared import Pt
 
-        changes_count = 0
+        size = Pt(font_size)
 
-        for paragraph in doc.paragraphs:
-            for run in paragraph.runs:
+        def visit(ctx: ParagraphContext) -> int:
+            for run in ctx.runs:
                 run.font.name = font_name
-                run.font.size = Pt(font_size)
-                changes_count += 1
+                run.font.size = size
+            return len(ctx.runs)
 
-        logger.debug(f"Standardized fonts: {changes_count} runs updated to {font_name} {font_size}pt")
-        return changes_count
+        return visit
 
     def _fix_margins(self, doc: Any, margins: Dict[str, float]) -> bool:
         """
@@ -508,18 +669,19 @@ class DocxFormatterSkill(BaseSkill):
         from docx.shared import Inches
 
         applied = False
+        sections = doc.sections
 
-        for section in doc.sections:
+        for section in sections:
             section.top_margin = Inches(margins.get("top", 1.0))
             section.bottom_margin = Inches(margins.get("bottom", 1.0))
             section.left_margin = Inches(margins.get("left", 1.0))
             section.right_margin = Inches(margins.get("right", 1.0))
             applied = True
 
-        logger.debug(f"Fixed margins for {len(doc.sections)} section(s)")
+        logger.debug(f"Fixed margins for {len(sections)} section(s)")
         return applied
 
-    def _normalize_spacing(self, doc: Any, line_spacing: float) -> int:
+    def _normalize_spacing(self, line_spacing: float) -> "ParagraphVisitor":
         """
         Normalize line spacing and paragraph spacing throughout the document.
 
@@ -527,33 +689,28 @@ class DocxFormatterSkill(BaseSkill):
         paragraphs), space_before and space_after are set to zero.
 
         Args:
-            doc: python-docx Document object
             line_spacing: Line spacing multiplier (e.g. 1.15)
 
         Returns:
-            Number of paragraphs changed
+            Visitor counting paragraphs changed
         """
         from docx.shared import Pt
 
-        changes_count = 0
+        zero = Pt(0)
 
-        for paragraph in doc.paragraphs:
-            paragraph.paragraph_format.line_spacing = line_spacing
+        def visit(ctx: ParagraphContext) -> int:
+            paragraph_format = ctx.paragraph_format
+            paragraph_format.line_spacing = line_spacing
 
             # Only zero out spacing for body text, not headings
-            style_name = paragraph.style.name if paragraph.style else ""
-            is_heading = style_name.lower().startswith("heading")
-
-            if not is_heading:
-                paragraph.paragraph_format.space_before = Pt(0)
-                paragraph.paragraph_format.space_after = Pt(0)
+            if not ctx.is_heading:
+                paragraph_format.space_before = zero
+                paragraph_format.space_after = zero
+            return 1
 
-            changes_count += 1
+        return visit
 
-        logger.debug(f"Normalized spacing: {changes_count} paragraphs updated")
-        return changes_count
-
-    def _fix_bullets(self, doc: Any, base_indent: float = 0.5) -> int:
+    def _fix_bullets(self, base_indent: float = 0.5) -> "ParagraphVisitor":
         """
         Detect and normalize bullet/list paragraph indentation with multi-level support.
 
@@ -562,39 +719,34 @@ class DocxFormatterSkill(BaseSkill):
         indentation: level * base_indent inches.
 
         Args:
-            doc: python-docx Document object
             base_indent: Indent per bullet level in inches (default 0.5)
 
         Returns:
-            Number of bullet paragraphs fixed
+            Visitor counting bullet paragraphs fixed
         """
         from docx.shared import Inches
 
-        changes_count = 0
-
-        for paragraph in doc.paragraphs:
-            level = self._detect_bullet_level(paragraph)
+        def visit(ctx: ParagraphContext) -> int:
+            level = self._detect_bullet_level(ctx)
             if level == 0:
-                continue
+                return 0
+            ctx.paragraph_format.left_indent = Inches(level * base_indent)
+            return 1
 
-            paragraph.paragraph_format.left_indent = Inches(level * base_indent)
-            changes_count += 1
+        return visit
 
-        logger.debug(f"Fixed bullets: {changes_count} paragraphs normalized (base_indent={base_indent}\")")
-        return changes_count
-
-    def _detect_bullet_level(self, paragraph: Any) -> int:
+    def _detect_bullet_level(self, ctx: "ParagraphContext") -> int:
         """
         Detect the bullet/list nesting level of a paragraph.
 
         Returns:
             0 if not a bullet paragraph, 1+ for nesting level.
         """
-        style_name = paragraph.style.name if paragraph.style else ""
-        text = paragraph.text.strip()
+        style_name = ctx.style_name
+        text = ctx.text.strip()
         bullet_chars = {"\u2022", "-", "*", "\u25e6", "\u25aa", "\u25ab"}
 
-        is_list_style = "List" in style_name
+        is_list_style = ctx.is_list
         starts_with_bullet = any(text.startswith(ch) for ch in bullet_chars) if text else False
 
         if not is_list_style and not starts_with_bullet:
@@ -606,7 +758,7 @@ class DocxFormatterSkill(BaseSkill):
             return int(level_match.group(1))
 
         # Priority 2: Existing indent depth → estimate level
-        current_indent = paragraph.paragraph_format.left_indent
+        current_indent = ctx.paragraph_format.left_indent
         if current_indent is not None and current_indent > 0:
             # EMU per inch = 914400
             estimated_level = max(1, round(current_indent / (914400 * 0.5)))
@@ -615,7 +767,7 @@ class DocxFormatterSkill(BaseSkill):
         # Default: level 1
         return 1
 
-    def _fix_spelling(self, doc: Any) -> int:
+    def _fix_spelling(self) -> Optional["ParagraphVisitor"]:
         """
         Run spell checking on all document text and apply confident corrections.
 
@@ -623,11 +775,8 @@ class DocxFormatterSkill(BaseSkill):
         them with the top correction, operating at the run level to preserve
         formatting.
 
-        Args:
-            doc: python-docx Document object
-
         Returns:
-            Number of words corrected
+            Visitor counting words corrected, or None if pyspellchecker is missing
         """
         try:
             from spellchecker import SpellChecker
@@ -636,17 +785,18 @@ class DocxFormatterSkill(BaseSkill):
                 "pyspellchecker not installed. Skipping spell check. "
                 "Install with: pip install pyspellchecker"
             )
-            return 0
+            return None
 
         spell = SpellChecker()
-        changes_count = 0
 
-        for paragraph in doc.paragraphs:
-            for run in paragraph.runs:
-                if not run.text or not run.text.strip():
-                    continue
+        def visit(ctx: ParagraphContext) -> int:
+            changes_count = 0
 
+            for run in ctx.runs:
                 original_text = run.text
+                if not original_text or not original_text.strip():
+                    continue
+
                 words = re.findall(r"\b[a-zA-Z]+\b", original_text)
 
                 if not words:
@@ -679,7 +829,6 @@ class DocxFormatterSkill(BaseSkill):
                         correction = correction.upper()
 
                     # Replace the word in the run text using word boundaries
-                    # Use re.IGNORECASE to match regardless of case variations
                     new_text = re.sub(
                         r"\b" + re.escape(orig_word) + r"\b",
                         correction,
@@ -689,11 +838,13 @@ class DocxFormatterSkill(BaseSkill):
 
                 if new_text != original_text:
                     run.text = new_text
+                    ctx.invalidate_text()
+
+            return changes_count
 
-        logger.debug(f"Fixed spelling: {changes_count} words corrected")
-        return changes_count
+        return visit
 
-    def _fix_case(self, doc: Any) -> int:
+    def _fix_case(self) -> "ParagraphVisitor":
         """
         Detect and correct words with bad casing.
 
@@ -706,20 +857,18 @@ class DocxFormatterSkill(BaseSkill):
 
         Operates at the run level to preserve formatting.
 
-        Args:
-            doc: python-docx Document object
-
         Returns:
-            Number of words fixed
+            Visitor counting words fixed
         """
-        changes_count = 0
 
-        for paragraph in doc.paragraphs:
-            for run in paragraph.runs:
-                if not run.text or not run.text.strip():
-                    continue
+        def visit(ctx: ParagraphContext) -> int:
+            changes_count = 0
 
+            for run in ctx.runs:
                 original_text = run.text
+                if not original_text or not original_text.strip():
+                    continue
+
                 words = re.findall(r"\b[a-zA-Z]+\b", original_text)
 
                 if not words:
@@ -757,11 +906,13 @@ class DocxFormatterSkill(BaseSkill):
 
                 if new_text != original_text:
                     run.text = new_text
+                    ctx.invalidate_text()
 
-        logger.debug(f"Fixed case: {changes_count} words corrected")
-        return changes_count
+            return changes_count
 
-    def _normalize_headings(self, doc: Any) -> int:
+        return visit
+
+    def _normalize_headings(self) -> "ParagraphVisitor":
         """
         Normalize heading paragraphs to consistent font sizes and bold style.
 
@@ -770,44 +921,34 @@ class DocxFormatterSkill(BaseSkill):
             - Heading 2: 14pt, bold
             - Heading 3: 12pt, bold
 
-        Args:
-            doc: python-docx Document object
-
         Returns:
-            Number of headings normalized
+            Visitor counting headings normalized
         """
         from docx.shared import Pt
 
         heading_sizes = {
-            "Heading 1": 16,
-            "Heading 2": 14,
-            "Heading 3": 12,
+            "Heading 1": Pt(16),
+            "Heading 2": Pt(14),
+            "Heading 3": Pt(12),
         }
 
-        changes_count = 0
+        def visit(ctx: ParagraphContext) -> int:
+            target_size = heading_sizes.get(ctx.style_name)
+            if target_size is None:
+                return 0
 
-        for paragraph in doc.paragraphs:
-            style_name = paragraph.style.name if paragraph.style else ""
-
-            if style_name not in heading_sizes:
-                continue
-
-            target_size = heading_sizes[style_name]
-
-            for run in paragraph.runs:
-                run.font.size = Pt(target_size)
+            for run in ctx.runs:
+                run.font.size = target_size
                 run.font.bold = True
+            return 1
 
-            changes_count += 1
-
-        logger.debug(f"Normalized headings: {changes_count} headings updated")
-        return changes_count
+        return visit
 
     # ------------------------------------------------------------------
     # New operations: find_replace, set_font_color, set_alignment, set_indent
     # ------------------------------------------------------------------
 
-    def _find_replace(self, doc: Any, find_text: str, replace_text: str) -> int:
+    def _find_replace(self, find_text: str, replace_text: str) -> "ParagraphVisitor":
         """
         Find and replace text throughout the document, preserving run-level formatting.
 
@@ -815,38 +956,45 @@ class DocxFormatterSkill(BaseSkill):
         paragraph-level replacement for matches that span multiple runs.
 
         Args:
-            doc: python-docx Document object
             find_text: Text to search for
             replace_text: Text to substitute
 
         Returns:
-            Number of replacements made
+            Visitor counting replacements made
         """
-        changes_count = 0
+        replaced_total = 0
+
+        def visit(ctx: ParagraphContext) -> int:
+            nonlocal replaced_total
+            changes_count = 0
 
-        for paragraph in doc.paragraphs:
             # Try run-level replacement first (preserves formatting)
-            for run in paragraph.runs:
-                if find_text in run.text:
-                    run.text = run.text.replace(find_text, replace_text)
-                    changes_count += run.text.count(replace_text)  # approximate
+            for run in ctx.runs:
+                run_text = run.text
+                if find_text in run_text:
+                    run_text = run_text.replace(find_text, replace_text)
+                    run.text = run_text
+                    changes_count += run_text.count(replace_text)  # approximate
+                    ctx.invalidate_text()
 
             # Fallback: check if the full paragraph text contains the target
             # (handles cases where find_text spans multiple runs)
-            full_text = paragraph.text
-            if find_text in full_text and changes_count == 0:
+            full_text = ctx.text
+            if find_text in full_text and replaced_total + changes_count == 0:
                 # Rebuild the paragraph: keep first run's formatting, clear others
-                if paragraph.runs:
+                if ctx.runs:
                     new_text = full_text.replace(find_text, replace_text)
                     # Clear all runs then set text on the first run
-                    first_run = paragraph.runs[0]
-                    for run in paragraph.runs[1:]:
+                    for run in ctx.runs[1:]:
                         run.text = ""
-                    first_run.text = new_text
+                    ctx.runs[0].text = new_text
+                    ctx.invalidate_text()
                     changes_count += new_text.count(replace_text)
 
-        logger.debug(f"Find/replace: '{find_text}' → '{replace_text}', {changes_count} replacement(s)")
-        return changes_count
+            replaced_total += changes_count
+            return changes_count
+
+        return visit
 
     def _resolve_color(self, color_input: str) -> Optional[tuple]:
         """
@@ -872,62 +1020,55 @@ class DocxFormatterSkill(BaseSkill):
         hex_val = hex_val.lstrip("#")
         return (int(hex_val[0:2], 16), int(hex_val[2:4], 16), int(hex_val[4:6], 16))
 
-    def _matches_scope(self, paragraph: Any, scope: str) -> bool:
+    def _matches_scope(self, ctx: "ParagraphContext", scope: str) -> bool:
         """Check if a paragraph matches the target scope."""
-        style_name = paragraph.style.name if paragraph.style else ""
-        is_heading = style_name.lower().startswith("heading")
-
         if scope == "all":
             return True
         elif scope == "headings":
-            return is_heading
+            return ctx.is_heading
         elif scope == "body":
-            return not is_heading
+            return not ctx.is_heading
         return True
 
-    def _set_font_color(self, doc: Any, font_color: str, target_scope: str = "all") -> int:
+    def _set_font_color(self, font_color: str, target_scope: str = "all") -> Optional["ParagraphVisitor"]:
         """
         Set font color on runs matching the target scope.
 
         Args:
-            doc: python-docx Document object
             font_color: Color as hex "#0000FF" or name "blue"
             target_scope: "all", "headings", or "body"
 
         Returns:
-            Number of runs changed
+            Visitor counting runs changed, or None for an unrecognized color
         """
         from docx.shared import RGBColor
 
         rgb = self._resolve_color(font_color)
         if rgb is None:
             logger.warning(f"Unrecognized color: {font_color}")
-            return 0
-
-        changes_count = 0
+            return None
 
-        for paragraph in doc.paragraphs:
-            if not self._matches_scope(paragraph, target_scope):
-                continue
+        color = RGBColor(*rgb)
 
-            for run in paragraph.runs:
-                run.font.color.rgb = RGBColor(*rgb)
-                changes_count += 1
+        def visit(ctx: ParagraphContext) -> int:
+            if not self._matches_scope(ctx, target_scope):
+                return 0
+            for run in ctx.runs:
+                run.font.color.rgb = color
+            return len(ctx.runs)
 
-        logger.debug(f"Set font color: {font_color} on {target_scope}, {changes_count} run(s)")
-        return changes_count
+        return visit
 
-    def _set_alignment(self, doc: Any, alignment: str, target_scope: str = "all") -> int:
+    def _set_alignment(self, alignment: str, target_scope: str = "all") -> Optional["ParagraphVisitor"]:
         """
         Set paragraph alignment on paragraphs matching the target scope.
 
         Args:
-            doc: python-docx Document object
             alignment: "left", "center", "right", or "justify"
             target_scope: "all", "headings", or "body"
 
         Returns:
-            Number of paragraphs changed
+            Visitor counting paragraphs changed, or None for an unknown alignment
         """
         from docx.enum.text import WD_ALIGN_PARAGRAPH
 
@@ -941,53 +1082,40 @@ class DocxFormatterSkill(BaseSkill):
         wd_align = align_map.get(alignment.lower())
         if wd_align is None:
             logger.warning(f"Unknown alignment: {alignment}")
-            return 0
-
-        changes_count = 0
-
-        for paragraph in doc.paragraphs:
-            if not self._matches_scope(paragraph, target_scope):
-                continue
+            return None
 
-            paragraph.alignment = wd_align
-            changes_count += 1
+        def visit(ctx: ParagraphContext) -> int:
+            if not self._matches_scope(ctx, target_scope):
+                return 0
+            ctx.paragraph.alignment = wd_align
+            return 1
 
-        logger.debug(f"Set alignment: {alignment} on {target_scope}, {changes_count} paragraph(s)")
-        return changes_count
+        return visit
 
-    def _set_indent(self, doc: Any, indent_inches: float) -> int:
+    def _set_indent(self, indent_inches: float) -> "ParagraphVisitor":
         """
         Set first-line indent on body paragraphs (non-heading, non-list).
 
         Args:
-            doc: python-docx Document object
             indent_inches: First-line indent in inches
 
         Returns:
-            Number of paragraphs changed
+            Visitor counting paragraphs changed
         """
         from docx.shared import Inches
 
-        changes_count = 0
-
-        for paragraph in doc.paragraphs:
-            style_name = paragraph.style.name if paragraph.style else ""
-            is_heading = style_name.lower().startswith("heading")
-            is_list = "List" in style_name
-
-            # Only indent body paragraphs
-            if is_heading or is_list:
-                continue
-
-            # Skip empty paragraphs
-            if not paragraph.text.strip():
-                continue
+        indent = Inches(indent_inches)
 
-            paragraph.paragraph_format.first_line_indent = Inches(indent_inches)
-            changes_count += 1
+        def visit(ctx: ParagraphContext) -> int:
+            # Only indent non-empty body paragraphs
+            if ctx.is_heading or ctx.is_list:
+                return 0
+            if not ctx.text.strip():
+                return 0
+            ctx.paragraph_format.first_line_indent = indent
+            return 1
 
-        logger.debug(f"Set indent: {indent_inches}\" on {changes_count} body paragraph(s)")
-        return changes_count
+        return visit
 
     # ------------------------------------------------------------------
     # File-lock helpers
@@ -1457,3 +1585,46 @@ class DocxFormatterSkill(BaseSkill):
     async def on_error(self, result: SkillResult) -> None:
         """Log document formatting failure."""
         logger.warning(f"Document formatter failed: {result.error}")
+
+
+def format_document(
+    file_path: str,
+    operations: List[str],
+    parameters: Dict[str, Any],
+    output_path: str,
+) -> Tuple[bool, str, str]:
+    """
+    Format one document synchronously and save it to ``output_path``.
+
+    Entry point for Document Studio batch workers, including worker
+    processes, so it takes and returns only picklable values.
+
+    Args:
+        file_path: DOCX file to format
+        operations: Operations to apply
+        parameters: Recipe parameter overrides
+        output_path: Where to save the formatted copy
+
+    Returns:
+        (success, message, formatted_path) tuple
+    """
+    import asyncio
+
+    params = dict(parameters)
+    params["file_path"] = file_path
+    params["operations"] = list(operations)
+    params["_output_path"] = output_path
+
+    try:
+        result = asyncio.run(DocxFormatterSkill().execute(**params))
+    except Exception as e:
+        logger.error(f"Formatting {file_path} failed: {e}", exc_info=True)
+        return False, str(e) or "Unknown error", ""
+
+    if not result.success:
+        return False, result.error or result.message, ""
+
+    formatted_path = ""
+    if result.data and isinstance(result.data, dict):
+        formatted_path = result.data.get("formatted_path", "")
+    return True, "Formatted successfully", formatted_path
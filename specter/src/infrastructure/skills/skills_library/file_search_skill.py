@@ -57,6 +57,7 @@ class FileSearchSkill(BaseSkill):
             enabled_by_default=True,
             requires_confirmation=False,  # Safe read-only operation
             permissions_required=[PermissionType.FILE_READ],
+            parallel_safe=True,
             version="1.0.0",
             author="Specter"
         )
@@ -50,6 +50,7 @@ class OutlookEmailSkill(BaseSkill):
             requires_confirmation=False,
             permissions_required=[PermissionType.OUTLOOK_ACCESS],
             ai_callable=True,
+            interactive=True,  # Outlook may hold the call on a security prompt
             version="1.0.0",
         )
 
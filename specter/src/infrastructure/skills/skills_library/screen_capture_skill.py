@@ -59,6 +59,7 @@ class ScreenCaptureSkill(BaseSkill):
             enabled_by_default=True,
             requires_confirmation=False,  # Safe operation
             permissions_required=[PermissionType.SCREEN_CAPTURE],
+            interactive=True,  # Overlay waits for the user to pick a region
             version="1.0.0",
             author="Specter"
         )
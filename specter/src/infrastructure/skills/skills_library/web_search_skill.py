@@ -63,6 +63,9 @@ class WebSearchSkill(BaseSkill):
             requires_confirmation=False,
             permissions_required=[PermissionType.NETWORK_ACCESS],
             ai_callable=True,
+            parallel_safe=True,
+            max_concurrency=3,
+            timeout_seconds=45,
             version="2.0.0",
             author="Specter",
         )
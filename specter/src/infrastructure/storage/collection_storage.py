@@ -9,12 +9,39 @@ Follows the SettingsManager pattern for singleton infrastructure services.
 import hashlib
 import logging
 import mimetypes
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger("specter.collection_storage")
 
+# Read size for hashing; large reads keep hashlib (which releases the GIL)
+# busy instead of the interpreter loop
+HASH_READ_SIZE = 1024 * 1024
+
+
+@dataclass
+class FileIntegrityResult:
+    """Outcome of verifying a single file against its recorded checksum."""
+    file_path: str
+    status: str  # 'unchanged', 'verified', 'modified', 'missing' or 'error'
+    checksum: Optional[str] = None  # Current checksum, when it was computed
+    hashed: bool = False  # Whether the file contents had to be read
+    error: Optional[str] = None
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the file matches its recorded checksum."""
+        return self.status in ('unchanged', 'verified')
+
+
+IntegrityProgressCallback = Callable[[int, int, FileIntegrityResult], None]
+
 
 class CollectionStorageService:
     """
@@ -50,6 +77,11 @@ class CollectionStorageService:
         if self._initialized:
             return
 
+        # Resolved path -> (size, mtime_ns, inode, checksum) for files hashed
+        # this session, so repeat verifications can skip unchanged files
+        self._fingerprints: Dict[str, Tuple[int, int, int, str]] = {}
+        self._fingerprint_lock = threading.Lock()
+
         self._initialized = True
         logger.debug("CollectionStorageService initialized")
 
@@ -59,7 +91,7 @@ class CollectionStorageService:
         """
         Calculate SHA256 checksum of a file.
 
-        Uses 8KB chunks for efficient processing of large files.
+        Reads in 1MB chunks for efficient processing of large files.
         Matches the pattern used in RAG pipeline and FileCollectionItem.
 
         Args:
@@ -87,14 +119,27 @@ class CollectionStorageService:
                 logger.error(f"✗ Path is not a file: {file_path}")
                 return None
 
+            before = path.stat()
             sha256 = hashlib.sha256()
 
-            # Read in 8KB chunks (same as FileCollectionItem pattern)
-            with open(path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    sha256.update(chunk)
+            # Reuse one buffer for all reads
+            buffer = bytearray(HASH_READ_SIZE)
+            view = memoryview(buffer)
+            with open(path, 'rb', buffering=0) as f:
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    sha256.update(view[:read])
 
             checksum = sha256.hexdigest()
+
+            # Only remember the fingerprint if the file didn't change while
+            # it was being read
+            after = path.stat()
+            if self._stat_key(before) == self._stat_key(after):
+                self._remember_fingerprint(path, after, checksum)
+
             logger.debug(f"✓ Checksum calculated: {checksum[:16]}...")
             return checksum
 
@@ -415,6 +460,167 @@ class CollectionStorageService:
             logger.error(f"✗ Error verifying file integrity {file_path}: {e}")
             return False
 
+    @staticmethod
+    def _stat_key(file_stat: os.stat_result) -> Tuple[int, int, int]:
+        """(size, mtime_ns, inode) fingerprint of a stat result."""
+        return file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino
+
+    def _remember_fingerprint(self, path: Path, file_stat: os.stat_result, checksum: str) -> None:
+        """Record the stat fingerprint a checksum was computed from."""
+        try:
+            key = str(path.resolve())
+        except OSError:
+            key = str(path)
+        with self._fingerprint_lock:
+            self._fingerprints[key] = (*self._stat_key(file_stat), checksum)
+
+    def recorded_fingerprint(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the fingerprint recorded when a file was last hashed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Dict with checksum, file_size, mtime_ns and inode, or None if the
+            file hasn't been hashed this session (or changed while hashing)
+        """
+        path = Path(file_path)
+        try:
+            key = str(path.resolve())
+        except OSError:
+            key = str(path)
+        with self._fingerprint_lock:
+            recorded = self._fingerprints.get(key)
+        if recorded is None:
+            return None
+        file_size, mtime_ns, inode, checksum = recorded
+        return {'checksum': checksum, 'file_size': file_size, 'mtime_ns': mtime_ns, 'inode': inode}
+
+    def _known_checksum(self, file_item: Any, path: Path, file_stat: os.stat_result) -> Optional[str]:
+        """
+        Return the checksum of a file without reading it, if it is known.
+
+        Uses the fingerprint stored on the item when available, falling back
+        to fingerprints recorded by this service during the session. Returns
+        None if the file may have changed since either was taken.
+        """
+        current = self._stat_key(file_stat)
+
+        mtime_ns = getattr(file_item, 'mtime_ns', None)
+        inode = getattr(file_item, 'inode', None)
+        if mtime_ns is not None and inode is not None:
+            if (getattr(file_item, 'file_size', None), mtime_ns, inode) == current:
+                return file_item.checksum
+
+        try:
+            key = str(path.resolve())
+        except OSError:
+            key = str(path)
+        with self._fingerprint_lock:
+            recorded = self._fingerprints.get(key)
+        if recorded is not None and recorded[:3] == current:
+            return recorded[3]
+        return None
+
+    def verify_files_integrity(
+        self,
+        files: List[Any],
+        progress_callback: Optional[IntegrityProgressCallback] = None,
+        max_workers: Optional[int] = None
+    ) -> List[FileIntegrityResult]:
+        """
+        Verify many files against their recorded checksums.
+
+        Files whose (size, mtime_ns, inode) match the fingerprint recorded with
+        a checksum are classified from that checksum without being read. The rest are
+        hashed in a thread pool, so the cost scales with the files that
+        actually changed.
+
+        Args:
+            files: FileCollectionItem-like objects (file_path, checksum,
+                file_size and optionally mtime_ns/inode)
+            progress_callback: Optional callback(done, total, result) invoked
+                as each file finishes; called from worker threads
+            max_workers: Hashing threads (defaults to min(8, cpu_count))
+
+        Returns:
+            List of FileIntegrityResult in the same order as files
+        """
+        total = len(files)
+        results: List[Optional[FileIntegrityResult]] = [None] * total
+        done = 0
+        done_lock = threading.Lock()
+
+        def report(index: int, result: FileIntegrityResult) -> None:
+            nonlocal done
+            results[index] = result
+            with done_lock:
+                done += 1
+                count = done
+            if progress_callback:
+                try:
+                    progress_callback(count, total, result)
+                except Exception as e:
+                    logger.error(f"✗ Integrity progress callback failed: {e}")
+
+        def hash_file(file_item: Any) -> FileIntegrityResult:
+            checksum = self.calculate_file_checksum(file_item.file_path)
+            if checksum is None:
+                return FileIntegrityResult(
+                    file_item.file_path, 'error', hashed=True,
+                    error="failed to calculate checksum"
+                )
+            status = 'verified' if checksum == file_item.checksum else 'modified'
+            if status == 'modified':
+                logger.warning(f"⚠ File integrity check FAILED: {file_item.file_path}")
+            return FileIntegrityResult(file_item.file_path, status, checksum, hashed=True)
+
+        # Cheap stat pass first; only changed or unknown files get hashed
+        to_hash: List[Tuple[int, Any]] = []
+        for index, file_item in enumerate(files):
+            path = Path(file_item.file_path)
+            try:
+                file_stat = path.stat()
+            except FileNotFoundError:
+                report(index, FileIntegrityResult(file_item.file_path, 'missing'))
+                continue
+            except OSError as e:
+                report(index, FileIntegrityResult(file_item.file_path, 'error', error=str(e)))
+                continue
+
+            if not stat.S_ISREG(file_stat.st_mode):
+                report(index, FileIntegrityResult(file_item.file_path, 'missing'))
+                continue
+
+            known = self._known_checksum(file_item, path, file_stat)
+            if known is None:
+                to_hash.append((index, file_item))
+            elif known == file_item.checksum:
+                report(index, FileIntegrityResult(file_item.file_path, 'unchanged', known))
+            else:
+                report(index, FileIntegrityResult(file_item.file_path, 'modified', known))
+
+        if to_hash:
+            workers = max_workers or min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="IntegrityHash") as executor:
+                futures = {
+                    executor.submit(hash_file, file_item): (index, file_item)
+                    for index, file_item in to_hash
+                }
+                for future in as_completed(futures):
+                    index, file_item = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = FileIntegrityResult(file_item.file_path, 'error', hashed=True, error=str(e))
+                    report(index, result)
+
+        logger.debug(
+            f"✓ Verified {total} file(s), hashed {len(to_hash)}"
+        )
+        return results
+
     def find_missing_files(self, collection: Any) -> List[str]:
         """
         Find missing files in a collection.
@@ -7,7 +7,11 @@ with dot notation access and automatic encryption of sensitive data.
 
 import os
 import json
+import atexit
 import logging
+import tempfile
+import threading
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
 from pathlib import Path
 try:  # Optional import; during early bootstrap PyQt may be absent
@@ -21,6 +25,13 @@ import base64
 
 logger = logging.getLogger("specter.settings")
 
+_MISSING = object()
+
+
+class _Encrypted(str):
+    """Marks an encrypted value in the read snapshot (holds the ciphertext)."""
+    __slots__ = ()
+
 
 class SettingsManager:
     """
@@ -31,6 +42,8 @@ class SettingsManager:
     - Automatic encryption of sensitive keys (API keys, tokens)
     - Secure storage in user directory without admin permissions
     - Default value handling
+    - Debounced write-behind persistence with atomic file replacement
+    - Flattened read snapshot and decrypted-secret cache for O(1) get()
     """
     
     SENSITIVE_KEYS = {
@@ -74,6 +87,8 @@ class SettingsManager:
             'api_key': '',
             'temperature': 0.7,
             'max_tokens': 16384,
+            'prompt_caching': True,  # Stable prompt prefix + provider cache hints
+            'stream_flush_interval_ms': 30,  # Coalesce streamed text into UI updates
             'system_prompt': '',
             'user_prompt': 'Your name is Spector, a friendly ghost AI assistant that helps with anything - be friendly, courteous, and a tadbit sassy!'
         },
@@ -88,7 +103,9 @@ class SettingsManager:
             'enable_debug_commands': False,
             'enable_ai_intent_classification': False,  # AI-powered skill detection fallback
             'ai_intent_confidence_threshold': 0.65,    # Minimum confidence for AI classification (0.0-1.0)
-            'ai_intent_timeout_seconds': 5             # Timeout for AI classification requests
+            'ai_intent_timeout_seconds': 5,            # Timeout for AI classification requests
+            'ai_intent_cache_ttl_seconds': 300,        # How long AI classifications are reused
+            'debug_channels': '',                      # Comma-separated structured debug channels (e.g. "faiss,context")
         },
         'fonts': {
             'ai_response': {
@@ -158,6 +175,8 @@ class SettingsManager:
         'tools': {
             'enabled': True,                    # Master toggle for AI tool calling
             'max_tool_iterations': 5,           # Max tool-call loop iterations per message
+            'max_parallel_tool_calls': 4,       # Parallel-safe tool calls run at once
+            'execution_timeout_seconds': 120,   # Default per-call timeout
             'web_search': {
                 'enabled': True,
                 'max_results': 5,
@@ -194,6 +213,10 @@ class SettingsManager:
     APP_DIR_NAME = "Specter"
     CONFIG_SUBDIR = "configs"
 
+    # Delay before changes made through set()/delete() are written to disk;
+    # further changes within the window restart it
+    SAVE_DEBOUNCE_SECONDS = 0.5
+
     def __init__(self):
         # Resolve preferred settings directory (AppData/Specter/configs)
         self.settings_dir = self._determine_settings_dir()
@@ -204,12 +227,25 @@ class SettingsManager:
         self._encryption_key = None
         self._change_callbacks = []  # Observer callbacks for settings changes
 
+        # Write-behind state: set()/delete() mark settings dirty and a timer
+        # (or flush()/batch()/exit) writes them out
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+
+        # Read path: flattened dotted-path -> value map, rebuilt lazily after
+        # changes, and plaintexts of encrypted values keyed by ciphertext
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._decrypted: Dict[str, str] = {}
+
         self._ensure_settings_dir()
         # Clean up any nested path issues
         self._cleanup_nested_paths()
         self._initialize_encryption()
         self.load()
         self._log_paths()
+        atexit.register(self.flush)
 
     # --- Observer pattern for settings changes ------------------------------------
 
@@ -597,6 +633,7 @@ class SettingsManager:
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
             self._settings = self.DEFAULT_SETTINGS.copy()
+        self._invalidate_snapshot()
     
     def save(self):
         """
@@ -615,17 +652,27 @@ class SettingsManager:
 
         All settings are validated against DEFAULT_SETTINGS structure.
         Sensitive values (API keys) remain encrypted with 'enc:' prefix.
+
+        The file is replaced atomically (temp file + rename), so a crash
+        mid-write never leaves a truncated settings file. Any pending
+        debounced write is superseded.
         """
         try:
-            # Ensure all default top-level keys exist (but don't overwrite existing values)
-            for key in self.DEFAULT_SETTINGS.keys():
-                if key not in self._settings:
-                    logger.debug(f"Adding missing default key to settings before save: {key}")
-                    self._settings[key] = self.DEFAULT_SETTINGS[key].copy() if isinstance(self.DEFAULT_SETTINGS[key], dict) else self.DEFAULT_SETTINGS[key]
-
-            # Write to file with pretty formatting
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                self._cancel_save_timer()
+                # Ensure all default top-level keys exist (but don't overwrite existing values)
+                for key in self.DEFAULT_SETTINGS.keys():
+                    if key not in self._settings:
+                        logger.debug(f"Adding missing default key to settings before save: {key}")
+                        self._settings[key] = self.DEFAULT_SETTINGS[key].copy() if isinstance(self.DEFAULT_SETTINGS[key], dict) else self.DEFAULT_SETTINGS[key]
+
+                # Serialize with pretty formatting; written while still holding the
+                # lock so concurrent saves land in order
+                payload = json.dumps(self._settings, indent=2, ensure_ascii=False)
+                # Callers may have edited the tree directly before saving
+                self._invalidate_snapshot()
+                self._write_atomic(payload)
+                self._dirty = False
 
             logger.debug(f"Settings saved successfully to {self.settings_file}")
             logger.debug(f"Total top-level keys saved: {len(self._settings)}")
@@ -634,6 +681,77 @@ class SettingsManager:
             logger.error(f"Failed to save settings: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
+
+    def _write_atomic(self, payload: str):
+        """Write the settings file via a temp file in the same directory and a rename."""
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.settings_dir), prefix=".settings-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.settings_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    # --- Write-behind persistence -------------------------------------------------
+
+    def _mark_dirty(self):
+        """Record an in-memory change and schedule a debounced save."""
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth:
+                return  # Written once when the outermost batch ends
+            self._cancel_save_timer()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _cancel_save_timer(self):
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Whether there are changes not yet written to disk."""
+        return self._dirty
+
+    def flush(self):
+        """Write pending changes to disk now (no-op if nothing changed)."""
+        with self._lock:
+            if not self._dirty:
+                self._cancel_save_timer()
+                return
+            self.save()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several changes into a single write.
+
+        Change notifications still fire as each value is set; the settings
+        file is written once when the outermost batch exits.
+
+        Example:
+            >>> with settings.batch():
+            ...     for category, values in config.items():
+            ...         settings.set(category, values)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self.flush()
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -646,23 +764,98 @@ class SettingsManager:
         Returns:
             Setting value, with automatic decryption for sensitive keys
         """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._build_snapshot()
+
+        value = snapshot.get(key_path, _MISSING)
+        if value is _MISSING:
+            return default
+        if type(value) is _Encrypted:
+            return self._reveal(value)
+        return value
+
+    def get_bool(self, key_path: str, default: bool = False) -> bool:
+        """Get a setting as a bool (accepts true/false/yes/no/on/off/1/0 strings)."""
+        value = self.get(key_path, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ('true', 'yes', 'on', '1'):
+                return True
+            if lowered in ('false', 'no', 'off', '0', ''):
+                return False
+            return default
+        return bool(value)
+
+    def get_int(self, key_path: str, default: int = 0) -> int:
+        """Get a setting as an int, or `default` if it is missing or not numeric."""
+        value = self.get(key_path, _MISSING)
+        if value is _MISSING or isinstance(value, bool):
+            return default
         try:
-            parent_dict, final_key = self._get_nested_dict(self._settings, key_path)
-            
-            if parent_dict is None or final_key not in parent_dict:
-                return default
-            
-            value = parent_dict[final_key]
-            
-            # Decrypt sensitive values
-            if self._is_sensitive_key(key_path) and isinstance(value, str) and value.startswith('enc:'):
-                return self._decrypt_value(value[4:])  # Remove 'enc:' prefix
-            
-            return value
-            
-        except Exception as e:
-            logger.error(f"Failed to get setting '{key_path}': {e}")
+            return int(value)
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key_path: str, default: float = 0.0) -> float:
+        """Get a setting as a float, or `default` if it is missing or not numeric."""
+        value = self.get(key_path, _MISSING)
+        if value is _MISSING or isinstance(value, bool):
             return default
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
+
+    def get_str(self, key_path: str, default: str = "") -> str:
+        """Get a setting as a string, or `default` if it is missing or None."""
+        value = self.get(key_path, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        return value if isinstance(value, str) else str(value)
+
+    # --- Read snapshot ------------------------------------------------------------
+
+    def _invalidate_snapshot(self):
+        self._snapshot = None
+
+    def _build_snapshot(self) -> Dict[str, Any]:
+        """Flatten the settings tree into a dotted-path -> value map."""
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+
+            snapshot: Dict[str, Any] = {}
+            ciphertexts = set()
+            stack = [("", self._settings)]
+            while stack:
+                prefix, node = stack.pop()
+                for key, value in node.items():
+                    path = f"{prefix}{key}"
+                    if isinstance(value, dict):
+                        stack.append((f"{path}.", value))
+                    elif (isinstance(value, str) and value.startswith('enc:')
+                          and self._is_sensitive_key(path)):
+                        value = _Encrypted(value[4:])  # Remove 'enc:' prefix
+                        ciphertexts.add(value)
+                    snapshot[path] = value
+
+            # Drop plaintexts of values that have since been replaced or deleted
+            if len(self._decrypted) > len(ciphertexts):
+                self._decrypted = {c: p for c, p in self._decrypted.items() if c in ciphertexts}
+            self._snapshot = snapshot
+            return snapshot
+
+    def _reveal(self, ciphertext: str) -> str:
+        """Decrypt a sensitive value once and serve later reads from memory."""
+        plaintext = self._decrypted.get(ciphertext)
+        if plaintext is None:
+            plaintext = self._decrypt_value(ciphertext)
+            if plaintext:
+                self._decrypted[str(ciphertext)] = plaintext
+        return plaintext
     
     def set(self, key_path: str, value: Any):
         """
@@ -671,16 +864,27 @@ class SettingsManager:
         Args:
             key_path: Dot-separated path (e.g., 'ui.window_opacity')
             value: Value to set, with automatic encryption for sensitive keys
+
+        Change callbacks fire immediately; the file is written after
+        SAVE_DEBOUNCE_SECONDS (see flush() and batch()).
         """
         try:
-            parent_dict, final_key = self._get_nested_dict(self._settings, key_path, create_missing=True)
-            
             # Encrypt sensitive values
             if self._is_sensitive_key(key_path) and value:
-                value = f"enc:{self._encrypt_value(str(value))}"
-            
-            parent_dict[final_key] = value
-            self.save()
+                plaintext = str(value)
+                ciphertext = self._encrypt_value(plaintext)
+                value = f"enc:{ciphertext}"
+            else:
+                ciphertext = None
+
+            with self._lock:
+                parent_dict, final_key = self._get_nested_dict(self._settings, key_path, create_missing=True)
+                parent_dict[final_key] = value
+                if ciphertext:
+                    # Reading it back needs no decrypt
+                    self._decrypted[ciphertext] = plaintext
+                self._invalidate_snapshot()
+                self._mark_dirty()
             logger.debug(f"Setting '{key_path}' updated")
             self._notify_change(key_path)
 
@@ -690,11 +894,15 @@ class SettingsManager:
     def delete(self, key_path: str):
         """Delete a setting using dot notation."""
         try:
-            parent_dict, final_key = self._get_nested_dict(self._settings, key_path)
-            
-            if parent_dict is not None and final_key in parent_dict:
-                del parent_dict[final_key]
-                self.save()
+            with self._lock:
+                parent_dict, final_key = self._get_nested_dict(self._settings, key_path)
+                deleted = parent_dict is not None and final_key in parent_dict
+                if deleted:
+                    del parent_dict[final_key]
+                    self._invalidate_snapshot()
+                    self._mark_dirty()
+
+            if deleted:
                 logger.debug(f"Setting '{key_path}' deleted")
                 self._notify_change(key_path)
                 
@@ -11,7 +11,7 @@ import argparse
 import signal
 import atexit
 import faulthandler
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QIcon
@@ -22,7 +22,10 @@ sys.path.insert(0, project_root)
 
 from specter.__version__ import __version__
 from specter.src.infrastructure.logging.logging_config import setup_logging, get_performance_logger
-from specter.src.application.app_coordinator import AppCoordinator
+from specter.src.application.startup_scheduler import initialize_startup_scheduler
+
+if TYPE_CHECKING:
+    from specter.src.application.app_coordinator import AppCoordinator
 
 logger = logging.getLogger("specter.main")
 perf_logger = get_performance_logger()
@@ -33,9 +36,10 @@ class SpecterApplication:
     Main application class that manages the Qt application lifecycle.
     """
     
-    def __init__(self):
+    def __init__(self, profile_startup: bool = False):
         self.app: Optional[QApplication] = None
-        self.coordinator: Optional[AppCoordinator] = None
+        self.coordinator: Optional["AppCoordinator"] = None
+        self.startup = initialize_startup_scheduler(profile=profile_startup)
         self._setup_signal_handlers()
     
     def setup_qt_application(self) -> QApplication:
@@ -153,6 +157,10 @@ class SpecterApplication:
     def initialize_coordinator(self) -> bool:
         """Initialize the application coordinator."""
         try:
+            # Imported here so its cost shows up as a startup stage
+            with self.startup.stage("imports"):
+                from specter.src.application.app_coordinator import AppCoordinator
+
             self.coordinator = AppCoordinator()
             
             # Connect application shutdown signal
@@ -166,6 +174,12 @@ class SpecterApplication:
 
             logger.info("App coordinator initialized successfully")
 
+            if self.startup.profile:
+                if self.startup.is_finished():
+                    self._report_startup_profile()
+                else:
+                    self.startup.deferred_finished.connect(self._report_startup_profile)
+
             # Close splash screen
             if getattr(self, '_splash', None):
                 self._splash.finish()
@@ -177,6 +191,12 @@ class SpecterApplication:
             logger.error(f"Error initializing coordinator: {e}")
             return False
     
+    def _report_startup_profile(self):
+        """Print and log the --profile-startup report."""
+        report = self.startup.report()
+        print(report, flush=True)
+        perf_logger.info(report)
+
     def run(self) -> int:
         """
         Run the Specter application.
@@ -201,17 +221,19 @@ class SpecterApplication:
             sys.excepthook = _ghost_excepthook
 
             # Setup Qt application
-            self.app = self.setup_qt_application()
+            with self.startup.stage("qt"):
+                self.app = self.setup_qt_application()
 
             # Show branded splash screen during startup
             self._splash = None
-            try:
-                from specter.src.presentation.widgets.splash_screen import SplashScreen
-                self._splash = SplashScreen()
-                self._splash.show()
-                self.app.processEvents()
-            except Exception as e:
-                logger.debug(f"Could not show splash screen: {e}")
+            with self.startup.stage("splash"):
+                try:
+                    from specter.src.presentation.widgets.splash_screen import SplashScreen
+                    self._splash = SplashScreen()
+                    self._splash.show()
+                    self.app.processEvents()
+                except Exception as e:
+                    logger.debug(f"Could not show splash screen: {e}")
 
             # Initialize coordinator
             if not self.initialize_coordinator():
@@ -344,6 +366,11 @@ def parse_arguments():
         action="store_true",
         help="Erase all local data and start fresh (removes AppData/~ files)"
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report per-stage startup wall time and import cost"
+    )
     return parser.parse_args()
 
 
@@ -365,6 +392,7 @@ def main():
     debug_mode = args.debug
     log_retention_days = 10  # default
     custom_log_dir = None
+    trace_channels = []
     try:
         from specter.src.infrastructure.storage.settings_manager import settings
         log_mode = settings.get("advanced.log_level", "Standard")
@@ -380,6 +408,9 @@ def main():
         config_log_location = settings.get("advanced.log_location", "").strip()
         if config_log_location and not args.log_dir:  # Only use config if CLI not specified
             custom_log_dir = config_log_location
+
+        # Structured debug channels for hot paths (see debug_channel.py)
+        trace_channels = settings.get_str("advanced.debug_channels", "").split(",")
             
     except Exception:
         pass  # Use defaults if settings unavailable
@@ -387,7 +418,8 @@ def main():
     # Use CLI log_dir if specified, otherwise use config log location, otherwise use default
     final_log_dir = args.log_dir or custom_log_dir
     
-    setup_logging(debug=debug_mode, log_dir=final_log_dir, retention_days=log_retention_days)
+    setup_logging(debug=debug_mode, log_dir=final_log_dir, retention_days=log_retention_days,
+                  trace_channels=trace_channels)
 
     # Enable faulthandler to log C-level crashes (segfaults) to a file
     _log_dir = final_log_dir or os.path.join(
@@ -409,7 +441,7 @@ def main():
     logger.info(f"Debug mode: {debug_mode} (CLI: {args.debug})")
     
     # Create and run application
-    app = SpecterApplication()
+    app = SpecterApplication(profile_startup=args.profile_startup)
     exit_code = app.run()
     
     logger.info("=" * 60)
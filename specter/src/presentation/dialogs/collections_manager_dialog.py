@@ -21,6 +21,7 @@ from PyQt6.QtWidgets import (
 
 from ...application.services.collection_service import CollectionService
 from ...infrastructure.conversation_management.repositories.database import DatabaseManager
+from ...infrastructure.storage.collection_storage import collection_storage_service
 from ...infrastructure.storage.settings_manager import settings
 from ...ui.themes.improved_preset_themes import get_improved_preset_themes, ColorSystem
 
@@ -85,6 +86,10 @@ class FileUploadWorker(QThread):
                 timestamp = datetime.now().timestamp()
                 file_id = f"file_{Path(file_path).stem}_{int(timestamp)}"
 
+                # Checksum and stat fingerprint for later integrity checks
+                checksum = collection_storage_service.calculate_file_checksum(file_path)
+                fingerprint = collection_storage_service.recorded_fingerprint(file_path) or {}
+
                 # Process through RAG
                 try:
                     metadata_override = {
@@ -92,6 +97,8 @@ class FileUploadWorker(QThread):
                         'conversation_id': self.conversation_id,
                         'collection_tag': self.collection_tag  # CRITICAL: Add collection tag to FAISS metadata
                     }
+                    if checksum:
+                        metadata_override['checksum'] = checksum
 
                     document_id = self.rag_session.ingest_document(
                         file_path=str(file_path),
@@ -134,7 +141,10 @@ class FileUploadWorker(QThread):
                             processing_status='completed',
                             chunk_count=chunk_count,
                             is_enabled=True,
-                            collection_tag=self.collection_tag
+                            collection_tag=self.collection_tag,
+                            checksum=checksum,
+                            mtime_ns=fingerprint.get('mtime_ns'),
+                            inode=fingerprint.get('inode')
                         )
                         session.add(file_record)
                         session.commit()
@@ -0,0 +1,366 @@
+"""
+Conversation list model for the conversation browser.
+
+A lazily populated table model: conversations are fetched one keyset page
+at a time through ``canFetchMore``/``fetchMore`` as the view scrolls, file
+and collection badges are filled in only for rows the view asks about, and
+sorting is delegated to the database (a new sort order reloads from the
+first page).
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+try:
+    from ...infrastructure.conversation_management.models.conversation import Conversation
+    from ...infrastructure.conversation_management.models.enums import ConversationStatus, SortOrder
+except ImportError:
+    Conversation = None
+    ConversationStatus = None
+    SortOrder = None
+
+logger = logging.getLogger("specter.conversation_table_model")
+
+# (conversations, cursor for the next page or None at the end)
+PageFetcher = Callable[[Any, Optional[Tuple[Any, str]], int], Tuple[List["Conversation"], Optional[Tuple[Any, str]]]]
+
+
+class ConversationTableModel(QAbstractTableModel):
+    """
+    Table model over the conversations database.
+
+    In paged mode rows come from `fetch_page(sort_order, cursor, limit)`;
+    in result mode (search) the caller supplies the rows with
+    set_conversations()/append_conversations() and sorting happens in memory
+    over that bounded set.
+    """
+
+    HEADERS = ["☑", "Title", "Status", "Messages", "Files", "Collections", "Updated"]
+    CHECK_COLUMN, TITLE_COLUMN, STATUS_COLUMN, MESSAGES_COLUMN, FILES_COLUMN, COLLECTIONS_COLUMN, UPDATED_COLUMN = range(7)
+
+    PAGE_SIZE = 200
+
+    check_state_changed = pyqtSignal()
+
+    def __init__(self, fetch_page: Optional[PageFetcher] = None, parent=None):
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._rows: List[Conversation] = []
+        self._row_of: Dict[str, int] = {}
+        self._cursor: Optional[Tuple[Any, str]] = None
+        self._exhausted = True
+        self._paged = False
+        self._checked: Set[str] = set()
+        self._file_info: Dict[str, List[Dict[str, Any]]] = {}
+        self._collection_tags: Dict[str, List[str]] = {}
+        self._badges_loaded: Set[str] = set()
+        self.sort_column = self.UPDATED_COLUMN
+        self.sort_order = Qt.SortOrder.DescendingOrder
+        self.search_query = ""
+
+    # --- Population ---
+
+    def reload(self):
+        """Restart paged mode from the first page in the current sort order."""
+        self.beginResetModel()
+        self._clear()
+        self._paged = self._fetch_page is not None
+        self._exhausted = not self._paged
+        self.endResetModel()
+        if self._paged:
+            self.fetchMore(QModelIndex())
+
+    def set_conversations(self, conversations: Iterable[Conversation]):
+        """Switch to result mode showing exactly `conversations`."""
+        self.beginResetModel()
+        self._clear()
+        self._paged = False
+        self._exhausted = True
+        self._add_rows(list(conversations))
+        self.endResetModel()
+
+    def append_conversations(self, conversations: Iterable[Conversation]):
+        """Append rows (result mode); conversations already shown are skipped."""
+        new_rows = [c for c in conversations if c.id not in self._row_of]
+        if not new_rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._add_rows(new_rows)
+        self.endInsertRows()
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and self._paged and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+        try:
+            page, self._cursor = self._fetch_page(self.db_sort_order(), self._cursor, self.PAGE_SIZE)
+        except Exception as e:
+            logger.error(f"Failed to fetch conversation page: {e}")
+            page, self._cursor = [], None
+        if self._cursor is None:
+            self._exhausted = True
+        self.append_conversations(page)
+
+    def _clear(self):
+        self._rows = []
+        self._row_of = {}
+        self._cursor = None
+        self._checked.clear()
+        self._file_info.clear()
+        self._collection_tags.clear()
+        self._badges_loaded.clear()
+
+    def _add_rows(self, conversations: List[Conversation]):
+        for conversation in conversations:
+            self._row_of[conversation.id] = len(self._rows)
+            self._rows.append(conversation)
+
+    # --- Access ---
+
+    @property
+    def paged(self) -> bool:
+        return self._paged
+
+    @property
+    def fully_loaded(self) -> bool:
+        return self._exhausted
+
+    def conversation_at(self, row: int) -> Optional[Conversation]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def conversations(self) -> List[Conversation]:
+        return list(self._rows)
+
+    def row_of(self, conversation_id: str) -> int:
+        return self._row_of.get(conversation_id, -1)
+
+    def update_title(self, conversation_id: str, title: str):
+        row = self.row_of(conversation_id)
+        if row >= 0:
+            self._rows[row].title = title
+            index = self.index(row, self.TITLE_COLUMN)
+            self.dataChanged.emit(index, index)
+
+    # --- Checked rows ---
+
+    def checked_conversations(self) -> List[Conversation]:
+        return [c for c in self._rows if c.id in self._checked]
+
+    def has_checked(self) -> bool:
+        return bool(self._checked)
+
+    def set_all_checked(self, checked: bool):
+        """Check or uncheck every loaded row."""
+        if checked:
+            self._checked = set(self._row_of)
+        else:
+            self._checked.clear()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, self.CHECK_COLUMN), self.index(len(self._rows) - 1, self.CHECK_COLUMN),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+        self.check_state_changed.emit()
+
+    # --- Lazy badges ---
+
+    def ids_missing_badges(self, first_row: int, last_row: int) -> List[str]:
+        """Conversation ids in [first_row, last_row] whose badges are not loaded yet."""
+        first_row = max(first_row, 0)
+        last_row = min(last_row, len(self._rows) - 1)
+        return [self._rows[row].id for row in range(first_row, last_row + 1)
+                if self._rows[row].id not in self._badges_loaded]
+
+    def set_badges(self, conversation_ids: List[str], file_info: Dict[str, List[Dict[str, Any]]],
+                   collection_tags: Dict[str, List[str]]):
+        """Store file and collection badges for the given conversations."""
+        rows = []
+        for conversation_id in conversation_ids:
+            self._badges_loaded.add(conversation_id)
+            self._file_info[conversation_id] = file_info.get(conversation_id, [])
+            self._collection_tags[conversation_id] = collection_tags.get(conversation_id, [])
+            row = self._row_of.get(conversation_id)
+            if row is not None:
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), self.FILES_COLUMN), self.index(max(rows), self.COLLECTIONS_COLUMN)
+            )
+
+    # --- Sorting ---
+
+    def is_sortable(self, column: int) -> bool:
+        return column in (self.TITLE_COLUMN, self.MESSAGES_COLUMN, self.UPDATED_COLUMN)
+
+    def db_sort_order(self):
+        """The repository SortOrder for the current sort column and direction."""
+        ascending = self.sort_order == Qt.SortOrder.AscendingOrder
+        if self.sort_column == self.TITLE_COLUMN:
+            return SortOrder.TITLE_ASC if ascending else SortOrder.TITLE_DESC
+        if self.sort_column == self.MESSAGES_COLUMN:
+            return SortOrder.MESSAGE_COUNT_ASC if ascending else SortOrder.MESSAGE_COUNT_DESC
+        return SortOrder.UPDATED_ASC if ascending else SortOrder.UPDATED_DESC
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        if not self.is_sortable(column):
+            return
+        self.sort_column = column
+        self.sort_order = order
+        if self._paged:
+            self.reload()
+            return
+
+        # Result mode: a bounded set, sorted in memory
+        keys = {
+            self.TITLE_COLUMN: lambda c: (c.title or "").lower(),
+            self.MESSAGES_COLUMN: lambda c: c.get_message_count(),
+            self.UPDATED_COLUMN: lambda c: c.updated_at or datetime.min,
+        }
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=keys[column], reverse=order == Qt.SortOrder.DescendingOrder)
+        self._row_of = {c.id: row for row, c in enumerate(self._rows)}
+        self.layoutChanged.emit()
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.CHECK_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != self.CHECK_COLUMN or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        conversation_id = self._rows[index.row()].id
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(conversation_id)
+        else:
+            self._checked.discard(conversation_id)
+        self.dataChanged.emit(index, index, [role])
+        self.check_state_changed.emit()
+        return True
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        conversation = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.CheckStateRole and column == self.CHECK_COLUMN:
+            return Qt.CheckState.Checked if conversation.id in self._checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(conversation, column)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._tooltip(conversation, column)
+        return None
+
+    def _display_text(self, conversation: Conversation, column: int) -> Optional[str]:
+        if column == self.TITLE_COLUMN:
+            return self._highlight_search_text(conversation.title)
+        if column == self.STATUS_COLUMN:
+            return status_text(conversation.status)
+        if column == self.MESSAGES_COLUMN:
+            return str(conversation.get_message_count())
+        if column == self.FILES_COLUMN:
+            if conversation.id not in self._badges_loaded:
+                return ""
+            return files_text(self._file_info.get(conversation.id, []))
+        if column == self.COLLECTIONS_COLUMN:
+            if conversation.id not in self._badges_loaded:
+                return ""
+            tags = self._collection_tags.get(conversation.id, [])
+            return ", ".join(tags) if tags else "—"
+        if column == self.UPDATED_COLUMN:
+            return format_datetime(conversation.updated_at)
+        return None
+
+    def _tooltip(self, conversation: Conversation, column: int) -> Optional[str]:
+        if column == self.TITLE_COLUMN and self.search_query:
+            return f"Search result for: {self.search_query}"
+        if conversation.id not in self._badges_loaded:
+            return None
+        if column == self.FILES_COLUMN:
+            files = self._file_info.get(conversation.id, [])
+            if not files:
+                return "No files attached to this conversation"
+            tooltip_lines = ["Files attached to this conversation:"]
+            for f in files[:5]:  # Show first 5 files in tooltip
+                status = f.get('processing_status', '')
+                status_suffix = f" ({status})" if status and status != 'completed' else ""
+                tooltip_lines.append(f"• {f['filename']}{status_suffix}")
+            if len(files) > 5:
+                tooltip_lines.append(f"... and {len(files) - 5} more")
+            return "\n".join(tooltip_lines)
+        if column == self.COLLECTIONS_COLUMN:
+            tags = self._collection_tags.get(conversation.id, [])
+            return f"Collection tags used: {', '.join(tags)}" if tags else "No collection tags used"
+        return None
+
+    def _highlight_search_text(self, text: str) -> str:
+        """Mark titles containing the search text (plain items cannot show rich text)."""
+        if not self.search_query or len(self.search_query) < 2 or not text:
+            return text
+        if self.search_query.lower() in text.lower():
+            return f"🔍 {text}"
+        return text
+
+
+def status_text(status) -> str:
+    """Get human-readable status text."""
+    if not ConversationStatus:
+        return str(status)
+
+    status_map = {
+        ConversationStatus.ACTIVE: "Active",
+        ConversationStatus.PINNED: "Saved",
+        ConversationStatus.ARCHIVED: "Saved",
+        ConversationStatus.DELETED: "Deleted"
+    }
+    return status_map.get(status, str(status))
+
+
+def format_datetime(dt: datetime) -> str:
+    """Format datetime for display - always show full date and time."""
+    if not isinstance(dt, datetime):
+        return str(dt)
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def files_text(files: List[Dict[str, Any]]) -> str:
+    """Files column text - shows actual file names."""
+    if not files:
+        return "—"
+    if len(files) == 1:
+        # Single file - show the filename
+        filename = files[0].get('filename', 'unknown')
+        status = files[0].get('processing_status', '')
+        if status and status != 'completed':
+            return f"{filename} ({status})"
+        return filename
+    if len(files) <= 2:
+        # Two files - show both names
+        return ", ".join(f.get('filename', 'unknown') for f in files[:2])
+    # Multiple files - show first file + count
+    return f"{files[0].get('filename', 'unknown')} +{len(files) - 1} more"
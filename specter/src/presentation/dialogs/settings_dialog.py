@@ -4589,14 +4589,16 @@ class SettingsDialog(QDialog):
             logger.info("💾 SAVING SETTINGS TO STORAGE")
             # Save to settings manager using nested structure for proper persistence
             saved_count = 0
-            for category, settings in config.items():
-                try:
-                    # Save the entire category as a nested structure
-                    self.settings_manager.set(category, settings)
-                    logger.info(f"  ✓ Saved category: {category} ({len(settings)} items)")
-                    saved_count += 1
-                except Exception as e:
-                    logger.error(f"  ✗ Failed to save category {category}: {e}")
+            # One file write for the whole dialog
+            with self.settings_manager.batch():
+                for category, settings in config.items():
+                    try:
+                        # Save the entire category as a nested structure
+                        self.settings_manager.set(category, settings)
+                        logger.info(f"  ✓ Saved category: {category} ({len(settings)} items)")
+                        saved_count += 1
+                    except Exception as e:
+                        logger.error(f"  ✗ Failed to save category {category}: {e}")
             logger.info(f"💾 Settings storage complete: {saved_count} categories saved")
         else:
             logger.warning("⚠  No settings manager available - settings not persisted")
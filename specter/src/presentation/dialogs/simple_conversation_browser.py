@@ -6,11 +6,14 @@ Clean, uncluttered interface for browsing, restoring, and exporting conversation
 
 import logging
 import asyncio
+import re
+import threading
+import time
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QLabel, QMessageBox, QProgressBar,
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QHeaderView, QLabel, QMessageBox, QProgressBar,
     QFileDialog, QWidget, QAbstractItemView, QLineEdit, QCheckBox,
     QMenu, QInputDialog
 )
@@ -24,6 +27,7 @@ try:
     from ...infrastructure.conversation_management.services.export_service import ExportService
     from ...infrastructure.conversation_management.models.enums import ConversationStatus, ExportFormat
     from ...infrastructure.conversation_management.models.search import SearchQuery, SearchResults, SearchResult
+    from ...infrastructure.conversation_management.repositories.search_engine import ConversationSearchEngine
 except ImportError:
     ConversationManager = None
     Conversation = None
@@ -33,6 +37,9 @@ except ImportError:
     SearchQuery = None
     SearchResults = None
     SearchResult = None
+    ConversationSearchEngine = None
+
+from .conversation_table_model import ConversationTableModel
 
 # Import theme system
 try:
@@ -47,49 +54,22 @@ except ImportError:
 logger = logging.getLogger("specter.simple_conversation_browser")
 
 
-class ConversationLoader(QObject):
-    """Background conversation loader."""
-    
-    conversations_loaded = pyqtSignal(list)
-    error_occurred = pyqtSignal(str)
-    
-    def __init__(self, conversation_manager: ConversationManager):
-        super().__init__()
-        self.conversation_manager = conversation_manager
-    
-    def load_conversations(self):
-        """Load conversations in background."""
-        try:
-            # Get all conversations except deleted ones
-            conversations = []
-            
-            # Create new event loop for this thread
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # Get non-deleted conversations from database using service-level filtering
-                conversations = loop.run_until_complete(
-                    self.conversation_manager.list_conversations(limit=100, include_deleted=False)
-                )
-                
-                logger.debug(f"Loaded {len(conversations)} active conversations (deleted conversations excluded by service)")
-                
-                self.conversations_loaded.emit(conversations)
-                
-            finally:
-                loop.close()
-            
-        except Exception as e:
-            self.error_occurred.emit(str(e))
-
-
 class ConversationSearchWorker(QObject):
-    """Background conversation search worker."""
+    """
+    Background conversation search worker.
+
+    Streams matches from the SQL-side search engine and delivers them in
+    batches as they arrive. cancel() may be called from any thread; the
+    running query is interrupted and no further results are emitted.
+    """
     
+    results_ready = pyqtSignal(list)  # List[Tuple[SearchResult, Conversation]]
     search_completed = pyqtSignal(object)  # SearchResults
     search_error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    BATCH_INTERVAL_SECONDS = 0.15  # Minimum time between result batches
+    RESULT_LIMIT = 500  # Maximum conversations per search
     
     def __init__(self, conversation_manager: ConversationManager, search_query: str, use_regex: bool = False, case_sensitive: bool = False):
         super().__init__()
@@ -97,114 +77,86 @@ class ConversationSearchWorker(QObject):
         self.search_query = search_query
         self.use_regex = use_regex
         self.case_sensitive = case_sensitive
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Stop the search (thread-safe)."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
     
     def perform_search(self):
         """Perform search in background thread."""
+        start_time = time.perf_counter()
+        # Event loop for the repository's batched conversation lookups
+        loop = asyncio.new_event_loop()
         try:
-            if not SearchQuery:
+            if not SearchResults or not ConversationSearchEngine:
                 self.search_error.emit("Search functionality not available")
                 return
-            
-            # Create new event loop for this thread
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                if self.use_regex:
-                    # Perform regex search across all conversations
-                    search_results = loop.run_until_complete(
-                        self._perform_regex_search()
-                    )
-                else:
-                    # Create search query - simple text search with reasonable limit
-                    query = SearchQuery.create_simple_text_search(
-                        text=self.search_query.strip(),
-                        limit=50
-                    )
-                    
-                    # Perform search using conversation service
-                    search_results = loop.run_until_complete(
-                        self.conversation_manager.conversation_service.search_conversations(query)
-                    )
-                
-                logger.debug(f"Search completed: {len(search_results.results)} results for '{self.search_query}' (regex: {self.use_regex})")
-                self.search_completed.emit(search_results)
-                
-            finally:
-                loop.close()
-            
+
+            engine = ConversationSearchEngine(self.conversation_manager.get_database_path())
+            results = engine.iter_results(
+                self.search_query.strip(),
+                regex=self.use_regex,
+                case_sensitive=self.case_sensitive,
+                cancel=self._cancel,
+                limit=self.RESULT_LIMIT
+            )
+
+            found = []
+            pending = []
+            last_emit = None
+            for result in results:
+                pending.append(result)
+                now = time.perf_counter()
+                # First match goes out immediately, later ones in batches
+                if last_emit is None or now - last_emit >= self.BATCH_INTERVAL_SECONDS:
+                    found.extend(self._emit_batch(loop, pending))
+                    pending = []
+                    last_emit = now
+            if pending:
+                found.extend(self._emit_batch(loop, pending))
+
+            if self.cancelled:
+                return
+
+            query_time = (time.perf_counter() - start_time) * 1000
+            logger.debug(f"Search completed: {len(found)} results for '{self.search_query}' (regex: {self.use_regex}) in {query_time:.1f}ms")
+            self.search_completed.emit(SearchResults(
+                results=found,
+                total_count=len(found),
+                query_time_ms=query_time,
+                offset=0,
+                limit=self.RESULT_LIMIT
+            ))
+
+        except re.error as e:
+            self.search_error.emit(f"Invalid regex pattern: {e}")
         except Exception as e:
             logger.error(f"Search failed: {e}")
             self.search_error.emit(str(e))
-    
-    async def _perform_regex_search(self):
-        """Perform regex search across all conversations."""
-        try:
-            import re
-            
-            # Validate regex pattern
-            flags = 0 if self.case_sensitive else re.IGNORECASE
-            try:
-                pattern = re.compile(self.search_query.strip(), flags)
-            except re.error as e:
-                raise Exception(f"Invalid regex pattern: {e}")
-            
-            # Get all conversations
-            all_conversations = await self.conversation_manager.list_conversations(limit=1000)
-            
-            # Search through conversations
-            matching_results = []
-            
-            for conversation in all_conversations:
-                match_found = False
-                match_count = 0
-                
-                # Search in title
-                if pattern.search(conversation.title):
-                    match_found = True
-                    match_count += len(pattern.findall(conversation.title))
-                
-                # Load conversation with messages for content search
-                if not match_found:
-                    full_conversation = await self.conversation_manager.get_conversation(
-                        conversation.id, include_messages=True
-                    )
-                    
-                    if full_conversation and full_conversation.messages:
-                        # Search in message content
-                        for message in full_conversation.messages:
-                            if pattern.search(message.content):
-                                match_found = True
-                                match_count += len(pattern.findall(message.content))
-                
-                if match_found:
-                    # Create search result
-                    result = SearchResult(
-                        conversation_id=conversation.id,
-                        title=conversation.title,
-                        match_count=match_count,
-                        relevance_score=match_count / len(conversation.title + " " + (conversation.summary or "")),
-                        matched_fields=["title", "content"] if match_count > 0 else ["title"]
-                    )
-                    matching_results.append(result)
-            
-            # Sort by relevance
-            matching_results.sort(key=lambda x: x.relevance_score or 0, reverse=True)
-            
-            # Create search results object
-            from ...infrastructure.conversation_management.models.search import SearchResults
-            return SearchResults(
-                results=matching_results,
-                total_count=len(matching_results),
-                query_time_ms=0.0,  # We're not tracking time for regex search
-                offset=0,
-                limit=len(matching_results)
+        finally:
+            loop.close()
+            self.finished.emit()
+
+    def _emit_batch(self, loop, results: List) -> List:
+        """Resolve conversations for a batch of results and emit them."""
+        if self.cancelled:
+            return []
+        conversations = loop.run_until_complete(
+            self.conversation_manager.repository.get_conversations_by_ids(
+                [result.conversation_id for result in results]
             )
-            
-        except Exception as e:
-            logger.error(f"Regex search failed: {e}")
-            raise
+        )
+        by_id = {conversation.id: conversation for conversation in conversations}
+        batch = [(result, by_id[result.conversation_id]) for result in results
+                 if result.conversation_id in by_id]
+        if batch and not self.cancelled:
+            self.results_ready.emit(batch)
+        return [result for result, _ in batch]
 
 
 class SimpleConversationBrowser(QDialog):
@@ -225,7 +177,6 @@ class SimpleConversationBrowser(QDialog):
         super().__init__(parent)
         self.conversation_manager: Optional[ConversationManager] = conversation_manager
         self.export_service: Optional[ExportService] = None
-        self.conversations: List[Conversation] = []
         self.current_conversation_id: Optional[str] = None
         
         # Initialize theme manager
@@ -318,13 +269,20 @@ class SimpleConversationBrowser(QDialog):
         self.search_debounce_ms = 500  # 500ms debounce
         self.current_search_query = ""
         self.is_searching = False
-        
-        # Conversations table
-        self.conversations_table = QTableWidget()
-        self.conversations_table.setColumnCount(7)
-        self.conversations_table.setHorizontalHeaderLabels([
-            "☑", "Title", "Status", "Messages", "Files", "Collections", "Updated"
-        ])
+        self.search_worker = None
+        self._search_threads = []
+        self._total_conversations: Optional[int] = None
+        
+        # Conversations table, paged in from the database as it scrolls
+        self.conversations_model = ConversationTableModel(self._fetch_page, self)
+        self.conversations_model.check_state_changed.connect(self._on_checkbox_changed)
+        self.conversations_model.modelReset.connect(self._schedule_badge_load)
+        self.conversations_model.rowsInserted.connect(self._schedule_badge_load)
+        self.conversations_model.rowsInserted.connect(self._update_loaded_status)
+        self.conversations_model.layoutChanged.connect(self._schedule_badge_load)
+
+        self.conversations_table = QTableView()
+        self.conversations_table.setModel(self.conversations_model)
 
         # Configure table
         header = self.conversations_table.horizontalHeader()
@@ -336,16 +294,27 @@ class SimpleConversationBrowser(QDialog):
         header.resizeSection(4, 90)   # Files column
         header.resizeSection(5, 120)  # Collections column
 
-        # Enable clickable column headers for sorting
-        self.conversations_table.setSortingEnabled(True)
+        # Clickable column headers sort on the database
+        header.setSectionsClickable(True)
         header.setSortIndicatorShown(True)
+        header.setSortIndicator(
+            self.conversations_model.sort_column, self.conversations_model.sort_order
+        )
         header.sectionClicked.connect(self._on_header_clicked)
-        self._current_sort_column = 6  # Default sort by Updated
-        self._current_sort_order = Qt.SortOrder.DescendingOrder
 
         self.conversations_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.conversations_table.setAlternatingRowColors(True)
         self.conversations_table.verticalHeader().setVisible(False)
+        # Uniform rows let the view skip measuring rows it is not showing
+        self.conversations_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.conversations_table.verticalHeader().setDefaultSectionSize(26)
+
+        # File and collection badges are loaded for visible rows only
+        self.badge_timer = QTimer(self)
+        self.badge_timer.setSingleShot(True)
+        self.badge_timer.setInterval(80)
+        self.badge_timer.timeout.connect(self._load_visible_badges)
+        self.conversations_table.verticalScrollBar().valueChanged.connect(self._schedule_badge_load)
 
         # Make table read-only - disable all editing
         self.conversations_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -516,175 +485,98 @@ class SimpleConversationBrowser(QDialog):
             self.status_label.setText(f"Error: {e}")
     
     def _load_conversations(self):
-        """Load conversations from database."""
+        """Show conversations from the database, one page at a time."""
         if not self.conversation_manager:
             return
         
-        self.status_label.setText("Loading conversations...")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setMaximum(0)  # Indeterminate
-        
-        # Load in background thread
-        self.loader_thread = QThread()
-        self.loader = ConversationLoader(self.conversation_manager)
-        self.loader.moveToThread(self.loader_thread)
-        
-        # Connect signals
-        self.loader.conversations_loaded.connect(self._on_conversations_loaded)
-        self.loader.error_occurred.connect(self._on_load_error)
-        self.loader_thread.started.connect(self.loader.load_conversations)
-        self.loader_thread.finished.connect(self.loader_thread.deleteLater)
-        
-        self.loader_thread.start()
-    
-    def _on_conversations_loaded(self, conversations: List[Conversation]):
-        """Handle conversations loaded."""
-        self.conversations = conversations
-        self._populate_table()
-        self.progress_bar.setVisible(False)
-        self.status_label.setText(f"Loaded {len(conversations)} conversations")
-        
-        # Clean up thread
-        self.loader_thread.quit()
-        self.loader_thread.wait()
-    
-    def _on_load_error(self, error: str):
-        """Handle loading error."""
-        self.progress_bar.setVisible(False)
-        self.status_label.setText(f"Error: {error}")
-        
-        QMessageBox.warning(self, "Error", f"Failed to load conversations:\n{error}")
-        
-        # Clean up thread
-        self.loader_thread.quit()
-        self.loader_thread.wait()
+        self._total_conversations = None
+        self.conversations_model.search_query = ""
+        self.conversations_model.reload()
+        self.select_all_btn.setText("Select All")
+        self._update_loaded_status()
+
+    def _fetch_page(self, sort_order, cursor, limit):
+        """Fetch one keyset page of conversations for the model."""
+        result = self._safe_run_async(
+            self.conversation_manager.repository.list_conversations_page(
+                sort_order=sort_order, after=cursor, limit=limit, include_deleted=False
+            )
+        )
+        if result is None:
+            raise RuntimeError("Timed out loading conversations")
+        return result
+
+    def _update_loaded_status(self, *args):
+        """Show how many conversations exist and how many are loaded."""
+        if not self.conversations_model.paged:
+            return
+        if self._total_conversations is None:
+            self._total_conversations = self._safe_run_async(
+                self.conversation_manager.repository.count_conversations(include_deleted=False)
+            )
+        loaded = self.conversations_model.rowCount()
+        if self._total_conversations is None or loaded >= self._total_conversations:
+            self.status_label.setText(f"Loaded {loaded} conversations")
+        else:
+            self.status_label.setText(f"Showing {loaded} of {self._total_conversations} conversations")
     
     def _on_header_clicked(self, logical_index: int):
         """Handle column header click for sorting."""
-        if logical_index == 0:
-            return  # Don't sort by checkbox column
+        model = self.conversations_model
+        header = self.conversations_table.horizontalHeader()
+        if not model.is_sortable(logical_index):
+            # Keep the indicator on the column that is actually sorted
+            header.setSortIndicator(model.sort_column, model.sort_order)
+            return
 
         # Toggle sort order if clicking the same column
-        if logical_index == self._current_sort_column:
-            if self._current_sort_order == Qt.SortOrder.AscendingOrder:
-                self._current_sort_order = Qt.SortOrder.DescendingOrder
+        if logical_index == model.sort_column:
+            if model.sort_order == Qt.SortOrder.AscendingOrder:
+                order = Qt.SortOrder.DescendingOrder
             else:
-                self._current_sort_order = Qt.SortOrder.AscendingOrder
+                order = Qt.SortOrder.AscendingOrder
         else:
-            self._current_sort_column = logical_index
-            self._current_sort_order = Qt.SortOrder.AscendingOrder
+            order = Qt.SortOrder.AscendingOrder
 
-        self.conversations_table.sortItems(logical_index, self._current_sort_order)
+        header.setSortIndicator(logical_index, order)
+        model.sort(logical_index, order)
 
-    def _populate_table(self):
-        """Populate conversations table with optional search highlighting and batch file loading."""
-        # Disable sorting while populating to avoid re-sort on each row insert
-        self.conversations_table.setSortingEnabled(False)
-        self.conversations_table.setRowCount(len(self.conversations))
+    def _schedule_badge_load(self, *args):
+        """Load badges for visible rows once scrolling settles."""
+        self.badge_timer.start()
 
-        # Batch load file info for all conversations to solve N+1 query problem
-        file_info = {}
-        collection_tags = {}
-        if self.conversations and self.conversation_manager:
-            conversation_ids = [conv.id for conv in self.conversations]
-            try:
-                file_info = self._safe_run_async(
-                    self.conversation_manager.get_conversations_with_file_info(conversation_ids)
-                )
-                if file_info is None:
-                    file_info = {}
-                logger.debug(f"Batch loaded file info for {len(file_info)} conversations")
-            except Exception as e:
-                logger.error(f"Failed to batch load file info: {e}")
-                file_info = {}
+    def _load_visible_badges(self):
+        """Batch load file info and collection tags for the rows on screen."""
+        model = self.conversations_model
+        if not self.conversation_manager or not model.rowCount():
+            return
 
-            # Batch load collection tags for all conversations
-            try:
-                collection_tags = self._batch_load_collection_tags(conversation_ids)
-                logger.debug(f"Batch loaded collection tags for {len(collection_tags)} conversations")
-            except Exception as e:
-                logger.error(f"Failed to batch load collection tags: {e}")
-                collection_tags = {}
-        
-        for row, conversation in enumerate(self.conversations):
-            # Checkbox column (column 0)
-            checkbox = QCheckBox()
-            checkbox.stateChanged.connect(self._on_checkbox_changed)
-            self.conversations_table.setCellWidget(row, 0, checkbox)
-            
-            # Title (with current indicator and search highlighting) - column 1
-            title = conversation.title
-            if self._is_current_conversation(conversation):
-                title = f"⭐ {title}"
-            
-            # Apply search highlighting if we have an active search
-            if self.current_search_query and len(self.current_search_query) >= 2:
-                title = self._highlight_search_text(title, self.current_search_query)
-            
-            title_item = QTableWidgetItem(title)
-            if self._is_current_conversation(conversation):
-                title_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            
-            # Add visual indicator for search results
-            if self.current_search_query:
-                title_item.setToolTip(f"Search result for: {self.current_search_query}")
-            
-            self.conversations_table.setItem(row, 1, title_item)
-            
-            # Status - column 2
-            status_text = self._get_status_text(conversation.status)
-            status_item = QTableWidgetItem(status_text)
-            self.conversations_table.setItem(row, 2, status_item)
-            
-            # Message count - column 3
-            count_item = QTableWidgetItem(str(conversation.get_message_count()))
-            self.conversations_table.setItem(row, 3, count_item)
-            
-            # Files - column 4 (using batch-loaded file info)
-            files_text = self._get_files_text_from_info(conversation.id, file_info)
-            files_item = QTableWidgetItem(files_text)
-            # Set detailed tooltip with file names if available
-            files = file_info.get(conversation.id, [])
-            if files:
-                tooltip_lines = ["Files attached to this conversation:"]
-                for f in files[:5]:  # Show first 5 files in tooltip
-                    status = f.get('processing_status', '')
-                    status_text = f" ({status})" if status and status != 'completed' else ""
-                    tooltip_lines.append(f"• {f['filename']}{status_text}")
-                if len(files) > 5:
-                    tooltip_lines.append(f"... and {len(files) - 5} more")
-                files_item.setToolTip("\n".join(tooltip_lines))
-            else:
-                files_item.setToolTip("No files attached to this conversation")
-            self.conversations_table.setItem(row, 4, files_item)
+        viewport = self.conversations_table.viewport()
+        first_row = max(self.conversations_table.rowAt(0), 0)
+        last_row = self.conversations_table.rowAt(viewport.height() - 1)
+        if last_row < 0:
+            last_row = model.rowCount() - 1
+        conversation_ids = model.ids_missing_badges(first_row, last_row)
+        if not conversation_ids:
+            return
 
-            # Collections - column 5
-            tags = collection_tags.get(conversation.id, [])
-            collections_text = ", ".join(tags) if tags else "—"
-            collections_item = QTableWidgetItem(collections_text)
-            if tags:
-                collections_item.setToolTip(f"Collection tags used: {', '.join(tags)}")
-            else:
-                collections_item.setToolTip("No collection tags used")
-            self.conversations_table.setItem(row, 5, collections_item)
+        file_info = {}
+        try:
+            file_info = self._safe_run_async(
+                self.conversation_manager.get_conversations_with_file_info(conversation_ids)
+            ) or {}
+        except Exception as e:
+            logger.error(f"Failed to batch load file info: {e}")
 
-            # Updated time - column 6
-            updated_text = self._format_datetime(conversation.updated_at)
-            updated_item = QTableWidgetItem(updated_text)
-            self.conversations_table.setItem(row, 6, updated_item)
+        collection_tags = {}
+        try:
+            collection_tags = self._batch_load_collection_tags(conversation_ids)
+        except Exception as e:
+            logger.error(f"Failed to batch load collection tags: {e}")
 
-        # Re-enable sorting and apply default sort
-        self.conversations_table.setSortingEnabled(True)
-        self.conversations_table.sortItems(self._current_sort_column, self._current_sort_order)
+        model.set_badges(conversation_ids, file_info, collection_tags)
+        logger.debug(f"Loaded badges for {len(conversation_ids)} visible conversations")
 
-    def _is_current_conversation(self, conversation: Conversation) -> bool:
-        """Check if this is the current active conversation."""
-        if not self.conversation_manager:
-            return False
-        
-        # For now, no specific current conversation highlighting
-        return False
-    
     def _get_files_text(self, conversation_id: str) -> str:
         """Get files count text for a conversation."""
         try:
@@ -789,69 +681,20 @@ class SimpleConversationBrowser(QDialog):
             logger.error(f"Failed to format file count for conversation {conversation_id}: {e}")
             return "—"
     
-    def _get_files_text_from_info(self, conversation_id: str, file_info: Dict[str, List[Dict[str, Any]]]) -> str:
-        """Get files text from batch-loaded file info - shows actual file names."""
-        try:
-            files = file_info.get(conversation_id, [])
-            if not files:
-                return "—"
-            
-            # Format file names for display
-            if len(files) == 1:
-                # Single file - show the filename
-                filename = files[0].get('filename', 'unknown')
-                status = files[0].get('processing_status', '')
-                if status and status != 'completed':
-                    return f"{filename} ({status})"
-                return filename
-            elif len(files) <= 2:
-                # Two files - show both names
-                names = [f.get('filename', 'unknown') for f in files[:2]]
-                return ", ".join(names)
-            else:
-                # Multiple files - show first file + count
-                first_file = files[0].get('filename', 'unknown')
-                return f"{first_file} +{len(files)-1} more"
-        except Exception as e:
-            logger.error(f"Failed to format file info for conversation {conversation_id}: {e}")
-            return "—"
-    
-    def _get_status_text(self, status) -> str:
-        """Get human-readable status text."""
-        if not ConversationStatus:
-            return str(status)
-        
-        status_map = {
-            ConversationStatus.ACTIVE: "Active",
-            ConversationStatus.PINNED: "Saved", 
-            ConversationStatus.ARCHIVED: "Saved",
-            ConversationStatus.DELETED: "Deleted"
-        }
-        return status_map.get(status, str(status))
-    
-    def _format_datetime(self, dt: datetime) -> str:
-        """Format datetime for display - always show full date and time."""
-        if not isinstance(dt, datetime):
-            return str(dt)
-        
-        # Always show full date and time as requested
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    
     def _on_checkbox_changed(self):
         """Handle checkbox state change."""
-        selected_conversations = self._get_selected_conversations()
-        has_selected = len(selected_conversations) > 0
-        self.mass_delete_btn.setEnabled(has_selected)
+        self.mass_delete_btn.setEnabled(self.conversations_model.has_checked())
     
     def _get_selected_conversations(self) -> List[Conversation]:
         """Get list of conversations that are checked."""
-        selected = []
-        for row in range(self.conversations_table.rowCount()):
-            checkbox = self.conversations_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                if row < len(self.conversations):
-                    selected.append(self.conversations[row])
-        return selected
+        return self.conversations_model.checked_conversations()
+
+    def _current_conversation(self) -> Optional[Conversation]:
+        """Get the conversation in the first selected row."""
+        selected_rows = self.conversations_table.selectionModel().selectedRows()
+        if not selected_rows:
+            return None
+        return self.conversations_model.conversation_at(selected_rows[0].row())
     
     def _on_mass_delete_clicked(self):
         """Handle mass delete button click."""
@@ -902,23 +745,13 @@ class SimpleConversationBrowser(QDialog):
     
     def _on_select_all_clicked(self):
         """Handle select all button click - toggles between select all and select none."""
-        if not self.conversations_table.rowCount():
+        model = self.conversations_model
+        if not model.rowCount():
             return
         
-        # Check if any checkboxes are currently checked
-        any_checked = False
-        for row in range(self.conversations_table.rowCount()):
-            checkbox = self.conversations_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                any_checked = True
-                break
-        
-        # If any are checked, uncheck all; otherwise check all
-        new_state = not any_checked
-        for row in range(self.conversations_table.rowCount()):
-            checkbox = self.conversations_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(new_state)
+        # If any are checked, uncheck all; otherwise check all loaded rows
+        new_state = not model.has_checked()
+        model.set_all_checked(new_state)
         
         # Update button text
         self.select_all_btn.setText("Select None" if new_state else "Select All")
@@ -932,21 +765,14 @@ class SimpleConversationBrowser(QDialog):
         self.export_btn.setEnabled(has_selection)
         
         # Also update mass delete button based on checkbox states
-        selected_conversations = self._get_selected_conversations()
-        self.mass_delete_btn.setEnabled(len(selected_conversations) > 0)
+        self.mass_delete_btn.setEnabled(self.conversations_model.has_checked())
     
     def _on_restore_clicked(self):
         """Handle restore button click."""
-        selected_rows = self.conversations_table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-        
-        row = selected_rows[0].row()
-        if row < 0 or row >= len(self.conversations):
+        conversation = self._current_conversation()
+        if not conversation:
             return
         
-        conversation = self.conversations[row]
-        
         # Confirm restore
         reply = QMessageBox.question(
             self,
@@ -1000,16 +826,10 @@ class SimpleConversationBrowser(QDialog):
     
     def _on_export_clicked(self):
         """Handle export button click."""
-        selected_rows = self.conversations_table.selectionModel().selectedRows()
-        if not selected_rows or not self.export_service:
-            return
-        
-        row = selected_rows[0].row()
-        if row < 0 or row >= len(self.conversations):
+        conversation = self._current_conversation()
+        if not conversation or not self.export_service:
             return
         
-        conversation = self.conversations[row]
-        
         # Show export format dialog
         self._show_export_dialog(conversation)
     
@@ -1142,75 +962,100 @@ class SimpleConversationBrowser(QDialog):
         if not self.conversation_manager or not self.current_search_query:
             return
         
-        if self.is_searching:
-            return  # Prevent concurrent searches
+        # A newer query supersedes the running search
+        self._cancel_search()
         
         self.is_searching = True
         self.status_label.setText(f"Searching for '{self.current_search_query}'...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(0)  # Indeterminate
         
+        # Results stream into an empty table as they are found
+        self.conversations_model.search_query = self.current_search_query
+        self.conversations_model.set_conversations([])
+        self.select_all_btn.setText("Select All")
+        
         # Perform search in background thread
-        self.search_thread = QThread()
-        self.search_worker = ConversationSearchWorker(
+        thread = QThread()
+        worker = ConversationSearchWorker(
             self.conversation_manager, 
             self.current_search_query,
             use_regex=self.regex_checkbox.isChecked(),
             case_sensitive=self.case_checkbox.isChecked()
         )
-        self.search_worker.moveToThread(self.search_thread)
-        
-        # Connect signals
-        self.search_worker.search_completed.connect(self._on_search_completed)
-        self.search_worker.search_error.connect(self._on_search_error)
-        self.search_thread.started.connect(self.search_worker.perform_search)
-        self.search_thread.finished.connect(self.search_thread.deleteLater)
+        worker.moveToThread(thread)
+        
+        # Connect signals (bound methods, so handlers run on the UI thread)
+        worker.results_ready.connect(self._on_search_results)
+        worker.search_completed.connect(self._on_search_completed)
+        worker.search_error.connect(self._on_search_error)
+        thread.started.connect(worker.perform_search)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(self._on_search_thread_finished)
+        
+        # Keep references until the thread has stopped
+        self._search_threads.append((thread, worker))
+        self.search_worker = worker
+        thread.start()
+    
+    def _cancel_search(self):
+        """Cancel the running search; its late results are ignored."""
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.search_worker = None
+        self.is_searching = False
+        self.progress_bar.setVisible(False)
+    
+    def _on_search_thread_finished(self):
+        """Release a search thread once it has stopped."""
+        thread = self.sender()
+        for entry in list(self._search_threads):
+            if entry[0] is thread:
+                self._search_threads.remove(entry)
+                entry[1].deleteLater()
+                thread.deleteLater()
+                break
+    
+    def _on_search_results(self, batch):
+        """Append a batch of streamed search results to the table."""
+        if self.sender() is not self.search_worker:
+            return  # Superseded search
         
-        self.search_thread.start()
+        self.conversations_model.append_conversations(conversation for _, conversation in batch)
+        self.status_label.setText(
+            f"Searching for '{self.current_search_query}'... {self.conversations_model.rowCount()} found"
+        )
     
     def _on_search_completed(self, search_results):
         """Handle search completion."""
+        if self.sender() is not self.search_worker:
+            return  # Superseded search
+        
+        self.search_worker = None
         self.is_searching = False
         self.progress_bar.setVisible(False)
         
-        # Convert search results to conversations for display
-        result_conversations = []
-        for result in search_results.results:
-            # Find the conversation in our current list
-            for conv in self.conversations:
-                if conv.id == result.conversation_id:
-                    result_conversations.append(conv)
-                    break
-        
-        # Update conversations list with search results
-        self.conversations = result_conversations
-        self._populate_table()
-        
         # Update status
-        result_count = len(result_conversations)
+        result_count = self.conversations_model.rowCount()
         query_time = search_results.query_time_ms or 0
         self.status_label.setText(
             f"Found {result_count} conversations in {query_time:.1f}ms"
         )
         
         logger.info(f"Search completed: {result_count} results")
-        
-        # Clean up thread
-        self.search_thread.quit()
-        self.search_thread.wait()
     
     def _on_search_error(self, error: str):
         """Handle search error."""
+        if self.sender() is not self.search_worker:
+            return  # Superseded search
+        
+        self.search_worker = None
         self.is_searching = False
         self.progress_bar.setVisible(False)
         self.status_label.setText(f"Search error: {error}")
         
         logger.error(f"Search failed: {error}")
         QMessageBox.warning(self, "Search Error", f"Search failed:\n{error}")
-        
-        # Clean up thread
-        self.search_thread.quit()
-        self.search_thread.wait()
     
     def _clear_search(self):
         """Clear search and reload all conversations."""
@@ -1218,28 +1063,17 @@ class SimpleConversationBrowser(QDialog):
         self.current_search_query = ""
         self.search_timer.stop()
         
-        if self.is_searching:
-            return  # Don't interfere with ongoing search
-        
+        self._cancel_search()
+
         # Reload all conversations
         self._load_conversations()
-    
-    def _highlight_search_text(self, text: str, search_query: str) -> str:
-        """Highlight search terms in text for visual feedback."""
-        if not search_query or not text:
-            return text
-        
-        # Simple case-insensitive highlighting
-        # Note: QTableWidgetItem doesn't support rich text, so we use a simple marker
-        # In a real implementation, you might want to use a custom delegate for rich text
-        import re
-        pattern = re.compile(re.escape(search_query), re.IGNORECASE)
-        
-        # For table items, we'll use a simple prefix marker
-        if pattern.search(text):
-            return f"🔍 {text}"
-        return text
-    
+
+    def closeEvent(self, event):
+        """Stop any running search when the browser closes."""
+        self.search_timer.stop()
+        self._cancel_search()
+        super().closeEvent(event)
+
     def _apply_styles(self):
         """Apply theme-aware styles to the conversation browser."""
         if self.theme_manager and THEME_SYSTEM_AVAILABLE:
@@ -1273,7 +1107,7 @@ class SimpleConversationBrowser(QDialog):
                     color: {colors.text_disabled};
                     border-color: {colors.border_secondary};
                 }}
-                QTableWidget {{
+                QTableView {{
                     background-color: {colors.background_tertiary};
                     alternate-background-color: {colors.background_secondary};
                     color: {colors.text_primary};
@@ -1291,7 +1125,7 @@ class SimpleConversationBrowser(QDialog):
                 QHeaderView::section:hover {{
                     background-color: {colors.interactive_hover};
                 }}
-                QTableWidget::item:selected {{
+                QTableView::item:selected {{
                     background-color: {colors.primary};
                     color: {colors.text_primary};
                 }}
@@ -1364,7 +1198,7 @@ class SimpleConversationBrowser(QDialog):
                     color: #666666;
                     border-color: #444444;
                 }
-                QTableWidget {
+                QTableView {
                     background-color: #1e1e1e;
                     alternate-background-color: #252525;
                     color: #ffffff;
@@ -1378,7 +1212,7 @@ class SimpleConversationBrowser(QDialog):
                     border: 1px solid #555555;
                     font-weight: bold;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #4CAF50;
                     color: #ffffff;
                 }
@@ -1423,19 +1257,15 @@ class SimpleConversationBrowser(QDialog):
     
     def _show_context_menu(self, position):
         """Show context menu for conversation table."""
-        if not self.conversations_table.itemAt(position):
+        index = self.conversations_table.indexAt(position)
+        if not index.isValid():
             return  # No item at this position
         
-        # Get the selected conversation
-        current_row = self.conversations_table.currentRow()
-        if current_row < 0:
-            return
-        
-        # Find conversation ID - it's stored in the row data or we need to get it from loaded conversations
-        if current_row >= len(self.conversations):
+        # Get the conversation under the cursor
+        current_row = index.row()
+        conversation = self.conversations_model.conversation_at(current_row)
+        if not conversation:
             return
-        
-        conversation = self.conversations[current_row]
         conversation_id = conversation.id
         
         # Create context menu
@@ -1510,8 +1340,8 @@ class SimpleConversationBrowser(QDialog):
         """Set a custom title for the conversation."""
         try:
             # Get current title
-            current_title_item = self.conversations_table.item(row, 0)
-            current_title = current_title_item.text() if current_title_item else ""
+            conversation = self.conversations_model.conversation_at(row)
+            current_title = conversation.title if conversation else ""
             
             # Show input dialog
             new_title, ok = QInputDialog.getText(
@@ -1549,7 +1379,7 @@ class SimpleConversationBrowser(QDialog):
                                 await self.conversation_manager.conversation_service.update_conversation_title(conversation_id, new_title)
                                 
                                 # Update UI on main thread
-                                QTimer.singleShot(0, lambda: self._update_table_title(row, new_title))
+                                QTimer.singleShot(0, lambda: self._update_table_title(conversation_id, new_title))
                             else:
                                 QTimer.singleShot(0, lambda: self._show_title_generation_failed("No title generated"))
                                 
@@ -1586,7 +1416,7 @@ class SimpleConversationBrowser(QDialog):
                             await self.conversation_manager.conversation_service.update_conversation_title(conversation_id, new_title)
                             
                             # Update UI on main thread
-                            QTimer.singleShot(0, lambda: self._update_table_title(row, new_title))
+                            QTimer.singleShot(0, lambda: self._update_table_title(conversation_id, new_title))
                             
                         except Exception as e:
                             logger.error(f"Title update failed: {e}")
@@ -1609,20 +1439,14 @@ class SimpleConversationBrowser(QDialog):
         # Run in background
         QTimer.singleShot(100, on_complete)
     
-    def _update_table_title(self, row: int, new_title: str):
-        """Update the title in the table at the specified row."""
+    def _update_table_title(self, conversation_id: str, new_title: str):
+        """Update the title shown for a conversation."""
         try:
-            title_item = self.conversations_table.item(row, 0)
-            if title_item:
-                title_item.setText(new_title)
+            self.conversations_model.update_title(conversation_id, new_title)
             
             self.progress_bar.setVisible(False)
             self.status_label.setText(f"Title updated successfully")
             
-            # Also update our local conversations list
-            if 0 <= row < len(self.conversations):
-                self.conversations[row].title = new_title
-            
         except Exception as e:
             logger.error(f"Failed to update table title: {e}")
             self.progress_bar.setVisible(False)
@@ -1643,6 +1467,4 @@ class SimpleConversationBrowser(QDialog):
     
     def set_current_conversation(self, conversation_id: Optional[str]):
         """Set the current conversation ID for highlighting."""
-        self.current_conversation_id = conversation_id
-        if hasattr(self, 'conversations_table'):
-            self._populate_table()
\ No newline at end of file
+        self.current_conversation_id = conversation_id
\ No newline at end of file
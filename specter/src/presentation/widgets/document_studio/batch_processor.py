@@ -1,18 +1,21 @@
 """
 Background batch processor for the Document Studio.
 
-Provides a QThread-based worker that processes multiple DOCX files
-sequentially using DocxFormatterSkill, emitting progress signals for
-thread-safe UI updates.
+Provides a QThread-based worker that formats multiple DOCX files with
+DocxFormatterSkill across a pool of worker processes, emitting progress
+signals for thread-safe UI updates.
 
 Classes:
-    BatchWorker  -- QObject that runs inside a QThread, processes files
+    BatchWorker  -- QObject that runs inside a QThread, dispatches files
     BatchProcessor -- High-level manager that creates/owns the thread
 """
 
-import asyncio
 import logging
-from typing import List, Optional
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
@@ -21,14 +24,61 @@ from .studio_state import DocumentStudioState, DocumentStatus, Recipe
 logger = logging.getLogger("specter.document_studio.batch_processor")
 
 
+def plan_output_paths(
+    file_paths: List[str], output_directory: Optional[str] = None
+) -> List[str]:
+    """
+    Choose the output path of every file before any is formatted.
+
+    Paths depend only on the input order, so parallel workers never race
+    for a name: ``report_formatted.docx``, then ``report_formatted_2.docx``
+    for a second ``report.docx``, and so on. Names locked by another
+    application (e.g. open in Word) are skipped.
+
+    Args:
+        file_paths: DOCX files in batch order.
+        output_directory: Target directory (defaults to the formatter's
+            temp directory).
+
+    Returns:
+        Output path for each input path, in the same order.
+    """
+    # Lazy import to avoid circular imports at module level
+    from specter.src.infrastructure.skills.skills_library.docx_formatter_skill import (
+        DocxFormatterSkill,
+    )
+
+    if output_directory:
+        directory = Path(output_directory)
+    else:
+        directory = DocxFormatterSkill._get_appdata_temp_dir()
+
+    used = set()
+    planned = []
+    for file_path in file_paths:
+        stem = Path(file_path).stem
+        candidate = directory / f"{stem}_formatted.docx"
+        suffix = 2
+        while (
+            str(candidate).lower() in used
+            or DocxFormatterSkill._is_file_locked(candidate)
+        ):
+            candidate = directory / f"{stem}_formatted_{suffix}.docx"
+            suffix += 1
+        used.add(str(candidate).lower())
+        planned.append(str(candidate))
+    return planned
+
+
 class BatchWorker(QObject):
     """
-    Background worker that processes files sequentially.
+    Background worker that formats files in parallel.
 
-    Runs inside a QThread. For each file, it creates a DocxFormatterSkill
-    instance, builds parameters from the active recipe, and executes the
-    formatting operation via ``asyncio.new_event_loop()`` (since
-    ``DocxFormatterSkill.execute()`` is async).
+    Runs inside a QThread. Files are handed to a pool of worker processes
+    (one per CPU core by default), keeping at most one file per process in
+    flight so ``file_started`` fires when a file actually begins. Each
+    file's output path is planned up front (see ``plan_output_paths``).
+    With a single worker, files are formatted in this thread instead.
 
     Signals:
         file_started(str)                -- file_path
@@ -49,18 +99,20 @@ class BatchWorker(QObject):
         file_paths: List[str],
         recipe: Recipe,
         output_directory: Optional[str] = None,
+        max_workers: Optional[int] = None,
         parent: Optional[QObject] = None,
     ):
         super().__init__(parent)
         self._file_paths = list(file_paths)
         self._recipe = recipe
         self._output_directory = output_directory
+        self._max_workers = max_workers
         self._cancelled = False
 
     # -- Public API --
 
     def cancel(self):
-        """Request cancellation. Checked between files."""
+        """Request cancellation. Files already being formatted finish; no new ones start."""
         self._cancelled = True
         logger.info("Batch cancellation requested")
 
@@ -68,42 +120,33 @@ class BatchWorker(QObject):
         """
         Main entry point invoked when the thread starts.
 
-        Iterates over file paths, calling ``_process_single_file()`` for
-        each. Emits ``batch_finished`` when all files are processed or
-        the batch is cancelled.
+        Formats every file, in worker processes when more than one worker
+        is available. Emits ``batch_finished`` when all files are processed
+        or the batch is cancelled.
         """
-        success_count = 0
         total = len(self._file_paths)
+        workers = self._worker_count()
         logger.info(
             f"Batch processing started: {total} file(s), "
-            f"recipe={self._recipe.name!r}"
+            f"recipe={self._recipe.name!r}, workers={workers}"
         )
 
-        for i, file_path in enumerate(self._file_paths):
-            if self._cancelled:
-                logger.info(
-                    f"Batch cancelled after {i} of {total} files"
-                )
-                break
-
-            self.file_started.emit(file_path)
-            self.file_progress.emit(file_path, 0.0)
-
-            try:
-                formatted_path = self._process_single_file(file_path)
-                success_count += 1
-                self.file_progress.emit(file_path, 1.0)
-                self.file_completed.emit(
-                    file_path, True, "Formatted successfully", formatted_path
-                )
-            except Exception as exc:
-                error_msg = str(exc) or "Unknown error"
-                logger.error(
-                    f"Error processing {file_path}: {error_msg}", exc_info=True
-                )
-                self.file_progress.emit(file_path, 1.0)
-                self.file_completed.emit(file_path, False, error_msg, "")
-                self.error_occurred.emit(file_path, error_msg)
+        success_count = 0
+        started = 0
+        try:
+            jobs = list(zip(
+                self._file_paths,
+                plan_output_paths(self._file_paths, self._output_directory),
+            ))
+            if workers > 1:
+                success_count, started = self._run_parallel(jobs, workers)
+            else:
+                success_count, started = self._run_sequential(jobs)
+        except Exception as exc:
+            logger.error(f"Batch processing aborted: {exc}", exc_info=True)
+
+        if self._cancelled:
+            logger.info(f"Batch cancelled after {started} of {total} files")
 
         self.batch_finished.emit(success_count, total)
         logger.info(
@@ -112,58 +155,126 @@ class BatchWorker(QObject):
 
     # -- Internal --
 
-    def _process_single_file(self, file_path: str) -> str:
-        """
-        Format a single file using DocxFormatterSkill.
+    def _worker_count(self) -> int:
+        """Number of worker processes: one per core, capped by the batch size."""
+        workers = self._max_workers or os.cpu_count() or 1
+        return max(1, min(workers, len(self._file_paths)))
+
+    def _run_sequential(self, jobs: List[Tuple[str, str]]) -> Tuple[int, int]:
+        """Format files one after another in this thread."""
+        success_count = 0
+        started = 0
+        for file_path, output_path in jobs:
+            if self._cancelled:
+                break
+            self._start_file(file_path)
+            started += 1
+            success_count += self._finish_file(
+                file_path, *self._process_single_file(file_path, output_path)
+            )
+        return success_count, started
 
-        Creates a fresh skill instance, builds keyword params from the
-        recipe (operations list + parameter overrides), and runs the
-        async ``execute()`` method in a dedicated event loop.
+    def _run_parallel(
+        self, jobs: List[Tuple[str, str]], workers: int
+    ) -> Tuple[int, int]:
+        """Format files in a process pool, refilling it as files complete."""
+        from specter.src.infrastructure.skills.skills_library.docx_formatter_skill import (
+            format_document,
+        )
+
+        success_count = 0
+        started = 0
+        queue: Iterator[Tuple[str, str]] = iter(jobs)
+        in_flight: Dict[Future, str] = {}
+        operations = list(self._recipe.operations)
+        parameters = dict(self._recipe.parameters)
+
+        # Spawn rather than fork: forking a process that runs Qt threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+
+            def submit_next() -> bool:
+                nonlocal started
+                if self._cancelled:
+                    return False
+                job = next(queue, None)
+                if job is None:
+                    return False
+                file_path, output_path = job
+                self._start_file(file_path)
+                started += 1
+                future = pool.submit(
+                    format_document, file_path, operations, parameters, output_path
+                )
+                in_flight[future] = file_path
+                return True
+
+            for _ in range(workers):
+                if not submit_next():
+                    break
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = in_flight.pop(future)
+                    try:
+                        success, message, formatted_path = future.result()
+                    except Exception as exc:
+                        # Worker process died or the job could not be pickled
+                        success, message, formatted_path = False, str(exc) or "Unknown error", ""
+                    success_count += self._finish_file(
+                        file_path, success, message, formatted_path
+                    )
+                    submit_next()
+
+        return success_count, started
+
+    def _start_file(self, file_path: str):
+        self.file_started.emit(file_path)
+        self.file_progress.emit(file_path, 0.0)
+
+    def _finish_file(
+        self, file_path: str, success: bool, message: str, formatted_path: str
+    ) -> int:
+        """Emit completion signals for a file. Returns 1 on success, else 0."""
+        self.file_progress.emit(file_path, 1.0)
+        if success:
+            self.file_completed.emit(file_path, True, message, formatted_path)
+            return 1
+
+        error_msg = message or "Unknown error"
+        logger.error(f"Error processing {file_path}: {error_msg}")
+        self.file_completed.emit(file_path, False, error_msg, "")
+        self.error_occurred.emit(file_path, error_msg)
+        return 0
+
+    def _process_single_file(
+        self, file_path: str, output_path: str
+    ) -> Tuple[bool, str, str]:
+        """
+        Format a single file in this thread using DocxFormatterSkill.
 
         Args:
             file_path: Absolute path to the DOCX file.
+            output_path: Planned path of the formatted copy.
 
         Returns:
-            Path to the formatted output file.
-
-        Raises:
-            RuntimeError: If skill execution fails.
+            (success, message, formatted_path) tuple.
         """
         # Lazy import to avoid circular imports at module level
         from specter.src.infrastructure.skills.skills_library.docx_formatter_skill import (
-            DocxFormatterSkill,
+            format_document,
         )
 
-        skill = DocxFormatterSkill()
-
-        # Build params from recipe
-        params = dict(self._recipe.parameters)  # copy overrides
-        params["file_path"] = file_path
-        params["operations"] = list(self._recipe.operations)
-
-        if self._output_directory:
-            params["output_directory"] = self._output_directory
-
         logger.debug(
-            f"Processing {file_path} with operations={params['operations']}"
+            f"Processing {file_path} with operations={self._recipe.operations}"
+        )
+        return format_document(
+            file_path,
+            list(self._recipe.operations),
+            dict(self._recipe.parameters),
+            output_path,
         )
-
-        # Run the async execute() in a new event loop
-        # (Qt threads cannot use asyncio.run() safely; create a dedicated loop)
-        loop = asyncio.new_event_loop()
-        try:
-            result = loop.run_until_complete(skill.execute(**params))
-        finally:
-            loop.close()
-
-        if not result.success:
-            raise RuntimeError(result.error or result.message)
-
-        formatted_path = ""
-        if result.data and isinstance(result.data, dict):
-            formatted_path = result.data.get("formatted_path", "")
-
-        return formatted_path
 
 
 class BatchProcessor(QObject):
@@ -254,7 +365,7 @@ class BatchProcessor(QObject):
         self._thread.start()
 
     def cancel(self):
-        """Cancel the running batch. Finishes current file then stops."""
+        """Cancel the running batch. Finishes files in progress then stops."""
         if self._worker:
             self._worker.cancel()
 
@@ -0,0 +1,371 @@
+"""
+Diff engine for the Document Studio diff view.
+
+Compares two documents paragraph by paragraph and produces a hunk index
+instead of rendered output, so the view can draw only what is on screen.
+
+Algorithm:
+    Common prefix and suffix are trimmed, then lines that occur exactly
+    once on both sides anchor a patience diff. Gaps between anchors
+    are diffed with Myers' linear-space bisection. A gap whose edit
+    distance exceeds ``MAX_EDIT_COST`` is reported as one replaced block,
+    which bounds the worst case on heavily rewritten documents.
+
+Intra-line (word level) diffs are computed on demand with ``word_diff``,
+only for changed lines that are actually rendered.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+# Opcode as produced by difflib: (tag, i1, i2, j1, j2)
+Opcode = Tuple[str, int, int, int, int]
+
+# Edit distance beyond which a gap is treated as wholly replaced
+MAX_EDIT_COST = 400
+
+_TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+# ---------------------------------------------------------------------------
+# Sequence diff
+# ---------------------------------------------------------------------------
+
+def diff_opcodes(a: Sequence[Hashable], b: Sequence[Hashable],
+                 max_cost: int = MAX_EDIT_COST) -> List[Opcode]:
+    """
+    Diff two sequences.
+
+    Parameters
+    ----------
+    a, b : sequence
+        Sequences of hashable items (e.g. paragraph strings).
+    max_cost : int
+        Edit distance above which a region is reported as one replacement.
+
+    Returns
+    -------
+    list[tuple]
+        difflib-style ``(tag, i1, i2, j1, j2)`` opcodes covering both
+        sequences, with tags ``equal``, ``replace``, ``delete``, ``insert``.
+    """
+    # Intern items as ints so comparisons are cheap
+    ids: Dict[Hashable, int] = {}
+    a_ids = [ids.setdefault(item, len(ids)) for item in a]
+    b_ids = [ids.setdefault(item, len(ids)) for item in b]
+
+    matches: List[Tuple[int, int, int]] = []  # (i, j, length) runs of equal items
+    _diff_range(a_ids, 0, len(a_ids), b_ids, 0, len(b_ids), max_cost, matches)
+    return _opcodes_from_matches(matches, len(a_ids), len(b_ids))
+
+
+def _diff_range(a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int,
+                max_cost: int, matches: List[Tuple[int, int, int]]) -> None:
+    """Append the equal runs between a[alo:ahi] and b[blo:bhi] to ``matches``, in order."""
+    # Common prefix
+    start = 0
+    while alo + start < ahi and blo + start < bhi and a[alo + start] == b[blo + start]:
+        start += 1
+    if start:
+        matches.append((alo, blo, start))
+        alo += start
+        blo += start
+
+    # Common suffix
+    end = 0
+    while ahi - end > alo and bhi - end > blo and a[ahi - end - 1] == b[bhi - end - 1]:
+        end += 1
+    suffix = (ahi - end, bhi - end, end) if end else None
+    ahi -= end
+    bhi -= end
+
+    if alo < ahi and blo < bhi:
+        anchors = _patience_anchors(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            i, j = alo, blo
+            for ai, bj in anchors:
+                _diff_range(a, i, ai, b, j, bj, max_cost, matches)
+                matches.append((ai, bj, 1))
+                i, j = ai + 1, bj + 1
+            _diff_range(a, i, ahi, b, j, bhi, max_cost, matches)
+        elif not set(a[alo:ahi]).isdisjoint(b[blo:bhi]):
+            _myers_range(a, alo, ahi, b, blo, bhi, max_cost, matches)
+        # Otherwise nothing in common: the whole gap is one replacement
+
+    if suffix:
+        matches.append(suffix)
+
+
+def _patience_anchors(a: List[int], alo: int, ahi: int, b: List[int], blo: int,
+                      bhi: int) -> List[Tuple[int, int]]:
+    """Longest increasing run of lines that are unique on both sides."""
+    counts: Dict[int, List[int]] = {}
+    for i in range(alo, ahi):
+        entry = counts.get(a[i])
+        if entry is None:
+            counts[a[i]] = [1, 0, i, -1]
+        else:
+            entry[0] += 1
+    for j in range(blo, bhi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            entry[3] = j
+
+    unique = sorted((entry[2], entry[3]) for entry in counts.values()
+                    if entry[0] == 1 and entry[1] == 1)
+    if not unique:
+        return []
+
+    # Patience sorting: longest increasing subsequence of b positions
+    tails: List[int] = []        # b position ending each pile
+    tail_index: List[int] = []   # index into ``unique`` of each pile top
+    back: List[int] = [-1] * len(unique)
+    for k, (_, bj) in enumerate(unique):
+        pile = bisect.bisect_left(tails, bj)
+        if pile:
+            back[k] = tail_index[pile - 1]
+        if pile == len(tails):
+            tails.append(bj)
+            tail_index.append(k)
+        else:
+            tails[pile] = bj
+            tail_index[pile] = k
+
+    anchors = []
+    k = tail_index[-1]
+    while k != -1:
+        anchors.append(unique[k])
+        k = back[k]
+    anchors.reverse()
+    return anchors
+
+
+def _myers_range(a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int,
+                 max_cost: int, matches: List[Tuple[int, int, int]]) -> None:
+    """Diff a gap with Myers' bisection; give up (no matches) beyond ``max_cost``."""
+    split = _middle_snake(a, alo, ahi, b, blo, bhi, max_cost)
+    if split is None:
+        return
+    x, y = split
+    _diff_range(a, alo, x, b, blo, y, max_cost, matches)
+    _diff_range(a, x, ahi, b, y, bhi, max_cost, matches)
+
+
+def _middle_snake(a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int,
+                  max_cost: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the point where forward and reverse Myers searches overlap.
+
+    Returns
+    -------
+    tuple or None
+        ``(x, y)`` split point in absolute indices, or None if the edit
+        distance exceeds ``max_cost`` or the ranges share nothing.
+    """
+    n = ahi - alo
+    m = bhi - blo
+    max_d = min((n + m + 1) // 2, max_cost)
+    offset = max_d + 1
+    size = 2 * offset + 1
+    v1 = [-1] * size
+    v2 = [-1] * size
+    v1[offset + 1] = 0
+    v2[offset + 1] = 0
+    delta = n - m
+    front = delta % 2 != 0
+    k1start = k1end = k2start = k2end = 0
+
+    for d in range(max_d):
+        # Forward search
+        for k1 in range(-d + k1start, d + 1 - k1end, 2):
+            k1_offset = offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1end += 2
+            elif y1 > m:
+                k1start += 2
+            elif front:
+                k2_offset = offset + delta - k1
+                if 0 <= k2_offset < size and v2[k2_offset] != -1:
+                    if x1 >= n - v2[k2_offset]:
+                        return alo + x1, blo + y1
+
+        # Reverse search
+        for k2 in range(-d + k2start, d + 1 - k2end, 2):
+            k2_offset = offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[ahi - x2 - 1] == b[bhi - y2 - 1]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2end += 2
+            elif y2 > m:
+                k2start += 2
+            elif not front:
+                k1_offset = offset + delta - k2
+                if 0 <= k1_offset < size and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    y1 = offset + x1 - k1_offset
+                    if x1 >= n - x2:
+                        return alo + x1, blo + y1
+    return None
+
+
+def _opcodes_from_matches(matches: List[Tuple[int, int, int]], n: int, m: int) -> List[Opcode]:
+    """Turn ordered equal runs into difflib-style opcodes."""
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for mi, mj, length in matches + [(n, m, 0)]:
+        if i < mi and j < mj:
+            opcodes.append(("replace", i, mi, j, mj))
+        elif i < mi:
+            opcodes.append(("delete", i, mi, j, j))
+        elif j < mj:
+            opcodes.append(("insert", i, i, j, mj))
+        if length:
+            if opcodes and opcodes[-1][0] == "equal":
+                _, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(("equal", i1, mi + length, j1, mj + length))
+            else:
+                opcodes.append(("equal", mi, mi + length, mj, mj + length))
+        i, j = mi + length, mj + length
+    return opcodes
+
+
+# ---------------------------------------------------------------------------
+# Hunk index
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class DiffHunk:
+    """A run of equal or changed lines and its position in the display."""
+    tag: str
+    i1: int
+    i2: int
+    j1: int
+    j2: int
+    row: int  # First display row
+
+    @property
+    def rows(self) -> int:
+        """Display rows taken; the shorter side of a change is padded."""
+        return max(self.i2 - self.i1, self.j2 - self.j1)
+
+
+@dataclass(frozen=True)
+class DiffRow:
+    """One display row: a line index on each side (None for padding)."""
+    tag: str
+    left: Optional[int]
+    right: Optional[int]
+
+
+class DiffIndex:
+    """
+    Hunk index over a side-by-side diff.
+
+    Rows are addressed by display position, so a view can ask for just
+    the rows it shows (``rows``) and navigate between changes
+    (``next_change`` / ``previous_change``) without rendering the rest.
+    """
+
+    def __init__(self, original_lines: Sequence[str], formatted_lines: Sequence[str],
+                 max_cost: int = MAX_EDIT_COST):
+        self.original_lines = list(original_lines)
+        self.formatted_lines = list(formatted_lines)
+
+        self.hunks: List[DiffHunk] = []
+        row = 0
+        for tag, i1, i2, j1, j2 in diff_opcodes(self.original_lines, self.formatted_lines, max_cost):
+            hunk = DiffHunk(tag, i1, i2, j1, j2, row)
+            self.hunks.append(hunk)
+            row += hunk.rows
+        self.row_count = row
+
+        self._hunk_rows = [hunk.row for hunk in self.hunks]
+        self._change_rows = [hunk.row for hunk in self.hunks if hunk.tag != "equal"]
+
+    @property
+    def change_count(self) -> int:
+        return len(self._change_rows)
+
+    def hunk_at_row(self, row: int) -> int:
+        """Index of the hunk containing display row ``row``."""
+        return max(0, bisect.bisect_right(self._hunk_rows, row) - 1)
+
+    def rows(self, start: int, count: int) -> Iterator[DiffRow]:
+        """Yield up to ``count`` display rows beginning at ``start``."""
+        if count <= 0 or start >= self.row_count:
+            return
+        index = self.hunk_at_row(max(0, start))
+        row = max(0, start)
+        end = min(self.row_count, row + count)
+        while row < end and index < len(self.hunks):
+            hunk = self.hunks[index]
+            offset = row - hunk.row
+            while offset < hunk.rows and row < end:
+                left = hunk.i1 + offset if hunk.i1 + offset < hunk.i2 else None
+                right = hunk.j1 + offset if hunk.j1 + offset < hunk.j2 else None
+                yield DiffRow(hunk.tag, left, right)
+                offset += 1
+                row += 1
+            index += 1
+
+    def next_change(self, row: int) -> Optional[int]:
+        """First row of the next change starting after ``row``, or None."""
+        k = bisect.bisect_right(self._change_rows, row)
+        return self._change_rows[k] if k < len(self._change_rows) else None
+
+    def previous_change(self, row: int) -> Optional[int]:
+        """First row of the closest change starting before ``row``, or None."""
+        k = bisect.bisect_left(self._change_rows, row)
+        return self._change_rows[k - 1] if k > 0 else None
+
+    def change_number(self, row: int) -> int:
+        """1-based number of the last change starting at or before ``row`` (0 if none)."""
+        return bisect.bisect_right(self._change_rows, row)
+
+
+# ---------------------------------------------------------------------------
+# Word diff
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=2048)
+def word_diff(old: str, new: str) -> Tuple[Tuple[Tuple[str, bool], ...], Tuple[Tuple[str, bool], ...]]:
+    """
+    Split a changed line pair into segments marked changed or unchanged.
+
+    Returns
+    -------
+    tuple
+        ``(old_segments, new_segments)``, each a tuple of ``(text, changed)``.
+    """
+    old_tokens = _TOKEN_RE.findall(old)
+    new_tokens = _TOKEN_RE.findall(new)
+    old_segments: List[Tuple[str, bool]] = []
+    new_segments: List[Tuple[str, bool]] = []
+
+    for tag, i1, i2, j1, j2 in diff_opcodes(old_tokens, new_tokens):
+        changed = tag != "equal"
+        if i1 < i2:
+            old_segments.append(("".join(old_tokens[i1:i2]), changed))
+        if j1 < j2:
+            new_segments.append(("".join(new_tokens[j1:j2]), changed))
+    return tuple(old_segments), tuple(new_segments)
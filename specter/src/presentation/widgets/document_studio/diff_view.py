@@ -2,35 +2,40 @@
 DiffView — side-by-side before/after comparison view for documents.
 
 Displays the original and formatted versions of a DOCX document with
-highlighted diffs (insertions, deletions, replacements) using
-``difflib.SequenceMatcher``.
+highlighted diffs (insertions, deletions, replacements). The diff is
+computed by ``diff_engine`` into a hunk index; only the rows in view are
+rendered, with word-level highlights for changed lines, so very large
+documents open quickly. Both panes share one scroll bar and the toolbar
+jumps between changes (F7 / Shift+F7).
 
 Layout:
 ┌─────────────────────────────────────────────────┐
-│  [← Back]            [Reject]  [Accept]         │
-├────────────────────┬────────────────────────────┤
-│  "Original"        │  "Formatted"               │
-├────────────────────┼────────────────────────────┤
-│  QTextBrowser      │  QTextBrowser              │
-│  (left pane)       │  (right pane)              │
-│                    │                            │
-│  deletions/        │  insertions/               │
-│  replacements      │  replacements              │
-│  highlighted       │  highlighted               │
-└────────────────────┴────────────────────────────┘
+│  [← Back] [▲] [▼] Change 1 of 9  [Reject] [Accept]│
+├────────────────────┬───────────────────────┬────┤
+│  "Original"        │  "Formatted"          │    │
+├────────────────────┼───────────────────────┤ ▲  │
+│  QTextBrowser      │  QTextBrowser         │ █  │
+│  (left pane)       │  (right pane)         │    │
+│                    │                       │    │
+│  deletions/        │  insertions/          │ ▼  │
+│  replacements      │  replacements         │    │
+│  highlighted       │  highlighted          │    │
+└────────────────────┴───────────────────────┴────┘
 """
 
-import difflib
 import html
 import logging
+import time
 from typing import List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QEvent, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QKeySequence
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
     QPushButton,
+    QScrollBar,
     QSizePolicy,
     QSplitter,
     QTextBrowser,
@@ -38,6 +43,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from .diff_engine import DiffIndex, word_diff
+
 # Theme imports — graceful fallback when running outside the full app.
 try:
     from ...ui.themes.color_system import ColorSystem
@@ -55,6 +62,16 @@ _DEFAULT_ADD_COLOR = "#2d6b2d"
 _DEFAULT_REMOVE_COLOR = "#6b2d2d"
 _DEFAULT_ADD_BG = "rgba(45,107,45,0.25)"
 _DEFAULT_REMOVE_BG = "rgba(107,45,45,0.25)"
+_DEFAULT_ADD_WORD_BG = "rgba(45,107,45,0.65)"
+_DEFAULT_REMOVE_WORD_BG = "rgba(107,45,45,0.65)"
+
+# Rows kept above a change when jumping to it
+_CONTEXT_ROWS = 2
+
+# Rows scrolled per wheel notch
+_WHEEL_ROWS = 3
+
+_BLANK_ROW = "<p style='margin:2px 0;'>&nbsp;</p>"
 
 
 # ---------------------------------------------------------------------------
@@ -65,7 +82,10 @@ def _extract_text_lines(file_path: str) -> List[str]:
     """
     Extract plain text lines from a DOCX file using python-docx.
 
-    Each paragraph becomes one string in the returned list.
+    Each body paragraph becomes one string in the returned list, with the
+    same text as python-docx's ``Paragraph.text`` (runs and hyperlinks;
+    tabs and line breaks as ``\\t`` and ``\\n``). The XML is walked directly
+    because building paragraph proxies dominates the cost on long documents.
     Returns an empty list if the file cannot be read.
 
     Parameters
@@ -80,117 +100,132 @@ def _extract_text_lines(file_path: str) -> List[str]:
     """
     try:
         from docx import Document as DocxDocument
+        from docx.oxml.ns import qn
     except ImportError:
         logger.warning("python-docx not available — cannot extract text from %s", file_path)
         return []
 
     try:
         doc = DocxDocument(file_path)
-        return [para.text for para in doc.paragraphs]
     except Exception as exc:
         logger.error("Failed to extract text from %s: %s", file_path, exc)
         return []
 
-
-def _build_diff_html(
-    original_lines: List[str],
-    formatted_lines: List[str],
+    w_p, w_r, w_hyperlink = qn("w:p"), qn("w:r"), qn("w:hyperlink")
+    w_t, w_br, w_type = qn("w:t"), qn("w:br"), qn("w:type")
+    run_chars = {qn("w:tab"): "\t", qn("w:ptab"): "\t", qn("w:cr"): "\n", qn("w:noBreakHyphen"): "-"}
+
+    def run_text(run, parts: List[str]) -> None:
+        for el in run:
+            tag = el.tag
+            if tag == w_t:
+                parts.append(el.text or "")
+            elif tag == w_br:
+                # Only text-wrapping breaks are line breaks; page/column breaks have no text
+                if el.get(w_type, "textWrapping") == "textWrapping":
+                    parts.append("\n")
+            elif tag in run_chars:
+                parts.append(run_chars[tag])
+
+    lines = []
+    for paragraph in doc.element.body.iterchildren(w_p):
+        parts: List[str] = []
+        for child in paragraph:
+            if child.tag == w_r:
+                run_text(child, parts)
+            elif child.tag == w_hyperlink:
+                for run in child.iterchildren(w_r):
+                    run_text(run, parts)
+        lines.append("".join(parts))
+    return lines
+
+
+def _line_html(text: str, segments=None, bg: Optional[str] = None,
+               border: Optional[str] = None, word_bg: Optional[str] = None) -> str:
+    """Render one pane row; ``segments`` adds word-level highlights."""
+    if segments:
+        escaped = "".join(
+            f"<span style='background:{word_bg};'>{html.escape(part)}</span>"
+            if changed else html.escape(part)
+            for part, changed in segments
+        )
+    else:
+        escaped = html.escape(text) if text else "&nbsp;"
+    if bg is None:
+        return f"<p style='margin:2px 0;'>{escaped}</p>"
+    return (
+        f"<p style='margin:2px 0; background:{bg}; "
+        f"border-left:3px solid {border}; "
+        f"padding-left:6px;'>{escaped}</p>"
+    )
+
+
+def _build_rows_html(
+    index: DiffIndex,
+    start: int,
+    count: int,
     add_color: str = _DEFAULT_ADD_COLOR,
     remove_color: str = _DEFAULT_REMOVE_COLOR,
     add_bg: str = _DEFAULT_ADD_BG,
     remove_bg: str = _DEFAULT_REMOVE_BG,
+    add_word_bg: str = _DEFAULT_ADD_WORD_BG,
+    remove_word_bg: str = _DEFAULT_REMOVE_WORD_BG,
 ) -> Tuple[str, str]:
     """
-    Compute a side-by-side diff and return highlighted HTML for both panes.
+    Render display rows ``start`` to ``start + count`` of a diff as HTML.
 
-    Uses ``difflib.SequenceMatcher`` to identify equal, replace, delete,
-    and insert blocks. All text content is HTML-escaped before insertion.
+    Changed lines that face each other in a replaced block get word-level
+    highlights, computed only for the rows rendered. All text content is
+    HTML-escaped before insertion.
 
     Parameters
     ----------
-    original_lines : list[str]
-        Lines from the original document.
-    formatted_lines : list[str]
-        Lines from the formatted document.
-    add_color : str
-        CSS colour for added-text left border.
-    remove_color : str
-        CSS colour for removed-text left border.
-    add_bg : str
-        CSS background colour for added blocks (right pane).
-    remove_bg : str
-        CSS background colour for removed blocks (left pane).
+    index : DiffIndex
+        Hunk index of the diff.
+    start, count : int
+        First display row and number of rows to render.
+    add_color, remove_color : str
+        CSS colours for the added/removed left border.
+    add_bg, remove_bg : str
+        CSS background colours for added (right) and removed (left) lines.
+    add_word_bg, remove_word_bg : str
+        CSS background colours for changed words.
 
     Returns
     -------
     tuple[str, str]
-        ``(original_html, formatted_html)`` with highlighted changes.
+        ``(original_html, formatted_html)`` for the rows.
     """
-    matcher = difflib.SequenceMatcher(None, original_lines, formatted_lines)
-
+    original = index.original_lines
+    formatted = index.formatted_lines
     left_parts: List[str] = []
     right_parts: List[str] = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == "equal":
-            for line in original_lines[i1:i2]:
-                escaped = html.escape(line) if line else "&nbsp;"
-                left_parts.append(f"<p style='margin:2px 0;'>{escaped}</p>")
-                right_parts.append(f"<p style='margin:2px 0;'>{escaped}</p>")
-
-        elif tag == "replace":
-            # Left pane: show removed lines with remove background
-            for line in original_lines[i1:i2]:
-                escaped = html.escape(line) if line else "&nbsp;"
-                left_parts.append(
-                    f"<p style='margin:2px 0; background:{remove_bg}; "
-                    f"border-left:3px solid {remove_color}; "
-                    f"padding-left:6px;'>{escaped}</p>"
-                )
-            # Right pane: show added lines with add background
-            for line in formatted_lines[j1:j2]:
-                escaped = html.escape(line) if line else "&nbsp;"
-                right_parts.append(
-                    f"<p style='margin:2px 0; background:{add_bg}; "
-                    f"border-left:3px solid {add_color}; "
-                    f"padding-left:6px;'>{escaped}</p>"
-                )
-            # Pad the shorter side so both panes stay visually aligned
-            diff_count = (i2 - i1) - (j2 - j1)
-            if diff_count > 0:
-                # More removed than added — pad right
-                for _ in range(diff_count):
-                    right_parts.append("<p style='margin:2px 0;'>&nbsp;</p>")
-            elif diff_count < 0:
-                # More added than removed — pad left
-                for _ in range(-diff_count):
-                    left_parts.append("<p style='margin:2px 0;'>&nbsp;</p>")
-
-        elif tag == "delete":
-            for line in original_lines[i1:i2]:
-                escaped = html.escape(line) if line else "&nbsp;"
-                left_parts.append(
-                    f"<p style='margin:2px 0; background:{remove_bg}; "
-                    f"border-left:3px solid {remove_color}; "
-                    f"padding-left:6px;'>{escaped}</p>"
-                )
-                # Blank placeholder on the right to keep alignment
-                right_parts.append("<p style='margin:2px 0;'>&nbsp;</p>")
-
-        elif tag == "insert":
-            for line in formatted_lines[j1:j2]:
-                escaped = html.escape(line) if line else "&nbsp;"
-                right_parts.append(
-                    f"<p style='margin:2px 0; background:{add_bg}; "
-                    f"border-left:3px solid {add_color}; "
-                    f"padding-left:6px;'>{escaped}</p>"
-                )
-                # Blank placeholder on the left to keep alignment
-                left_parts.append("<p style='margin:2px 0;'>&nbsp;</p>")
+    for row in index.rows(start, count):
+        left = original[row.left] if row.left is not None else None
+        right = formatted[row.right] if row.right is not None else None
+
+        if row.tag == "equal":
+            line = _line_html(left)
+            left_parts.append(line)
+            right_parts.append(line)
+            continue
+
+        left_segments = right_segments = None
+        if left and right:
+            left_segments, right_segments = word_diff(left, right)
 
-    original_html = "\n".join(left_parts)
-    formatted_html = "\n".join(right_parts)
-    return original_html, formatted_html
+        # Blank placeholder on the shorter side keeps both panes aligned
+        left_parts.append(
+            _line_html(left, left_segments, remove_bg, remove_color, remove_word_bg)
+            if left is not None else _BLANK_ROW
+        )
+        right_parts.append(
+            _line_html(right, right_segments, add_bg, add_color, add_word_bg)
+            if right is not None else _BLANK_ROW
+        )
+
+    return "\n".join(left_parts), "\n".join(right_parts)
 
 
 # ---------------------------------------------------------------------------
@@ -203,6 +238,8 @@ class DiffView(QWidget):
 
     Displays the original and formatted versions of a document with
     highlighted diffs in two QTextBrowser panes separated by a QSplitter.
+    The panes show only the rows in view; a shared scroll bar selects the
+    first visible row of the diff.
 
     Signals
     -------
@@ -227,6 +264,8 @@ class DiffView(QWidget):
         self._original_path: str = ""
         self._formatted_path: str = ""
         self._current_colors = None
+        self._index: Optional[DiffIndex] = None
+        self._focus_row = 0  # Row the change navigation counts from
 
         self._build_ui()
 
@@ -255,6 +294,26 @@ class DiffView(QWidget):
         self._back_btn.clicked.connect(self.back_requested.emit)
         tb_layout.addWidget(self._back_btn)
 
+        self._prev_change_btn = QPushButton("\u25b2")
+        self._prev_change_btn.setObjectName("DiffViewPrevChangeBtn")
+        self._prev_change_btn.setToolTip("Previous change (Shift+F7)")
+        self._prev_change_btn.setShortcut(QKeySequence("Shift+F7"))
+        self._prev_change_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._prev_change_btn.clicked.connect(self.previous_change)
+        tb_layout.addWidget(self._prev_change_btn)
+
+        self._next_change_btn = QPushButton("\u25bc")
+        self._next_change_btn.setObjectName("DiffViewNextChangeBtn")
+        self._next_change_btn.setToolTip("Next change (F7)")
+        self._next_change_btn.setShortcut(QKeySequence("F7"))
+        self._next_change_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._next_change_btn.clicked.connect(self.next_change)
+        tb_layout.addWidget(self._next_change_btn)
+
+        self._change_label = QLabel("")
+        self._change_label.setObjectName("DiffViewChangeLabel")
+        tb_layout.addWidget(self._change_label)
+
         tb_layout.addStretch()
 
         self._reject_btn = QPushButton("Reject")
@@ -311,41 +370,119 @@ class DiffView(QWidget):
         self._right_browser.setOpenExternalLinks(False)
         self._right_browser.setReadOnly(True)
 
+        # Panes hold only the visible rows; the shared scroll bar below
+        # moves through the whole diff
+        for browser in (self._left_browser, self._right_browser):
+            browser.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            browser.viewport().installEventFilter(self)
+            browser.installEventFilter(self)
+
         self._splitter.addWidget(self._left_browser)
         self._splitter.addWidget(self._right_browser)
 
         # Equal sizes for both panes
         self._splitter.setSizes([1, 1])
 
-        root.addWidget(self._splitter, 1)  # stretch factor 1
+        self._scrollbar = QScrollBar(Qt.Orientation.Vertical)
+        self._scrollbar.setObjectName("DiffViewScrollBar")
+        self._scrollbar.setRange(0, 0)
+        self._scrollbar.valueChanged.connect(self._on_scroll)
+
+        body = QHBoxLayout()
+        body.setContentsMargins(0, 0, 0, 0)
+        body.setSpacing(0)
+        body.addWidget(self._splitter, 1)
+        body.addWidget(self._scrollbar)
+        root.addLayout(body, 1)  # stretch factor 1
 
-        # Synchronise scrolling between the two panes (with guard flag
-        # to prevent infinite signal recursion)
-        self._syncing_scroll = False
-        left_sb = self._left_browser.verticalScrollBar()
-        right_sb = self._right_browser.verticalScrollBar()
-        left_sb.valueChanged.connect(self._sync_scroll_right)
-        right_sb.valueChanged.connect(self._sync_scroll_left)
+        # Coalesce re-renders from resizes and scrolling
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_visible)
 
     # ------------------------------------------------------------------
-    # Scroll synchronisation helpers
+    # Virtualised rendering
     # ------------------------------------------------------------------
 
-    def _sync_scroll_right(self, value: int) -> None:
-        """Propagate left pane scroll to right, guarded against recursion."""
-        if self._syncing_scroll:
+    def eventFilter(self, obj, event) -> bool:
+        """Route wheel and paging keys to the shared scroll bar; re-render on resize."""
+        event_type = event.type()
+        if event_type == QEvent.Type.Wheel:
+            notches = event.angleDelta().y() / 120
+            if notches:
+                self._scrollbar.setValue(
+                    self._scrollbar.value() - round(notches * _WHEEL_ROWS)
+                )
+            return True
+        if event_type == QEvent.Type.KeyPress:
+            key = event.key()
+            if key == Qt.Key.Key_PageDown:
+                self._scrollbar.setValue(self._scrollbar.value() + self._scrollbar.pageStep())
+                return True
+            if key == Qt.Key.Key_PageUp:
+                self._scrollbar.setValue(self._scrollbar.value() - self._scrollbar.pageStep())
+                return True
+        if event_type == QEvent.Type.Resize and self._index is not None:
+            self._render_timer.start()
+        return super().eventFilter(obj, event)
+
+    def _visible_row_count(self) -> int:
+        """Rows that fit in the panes (rows are at least one text line high)."""
+        viewport = self._left_browser.viewport()
+        row_height = self._left_browser.fontMetrics().lineSpacing() + 4
+        return max(1, viewport.height() // max(1, row_height) + 1)
+
+    def _on_scroll(self, value: int) -> None:
+        self._focus_row = value
+        self._render_timer.start()
+
+    def _render_visible(self) -> None:
+        """Render the rows currently in view into both panes."""
+        if self._index is None:
+            return
+        visible = self._visible_row_count()
+        self._scrollbar.setPageStep(visible)
+        original_html, formatted_html = _build_rows_html(
+            self._index, self._scrollbar.value(), visible
+        )
+        self._left_browser.setHtml(original_html)
+        self._right_browser.setHtml(formatted_html)
+        self._update_change_label()
+
+    def _update_change_label(self) -> None:
+        total = self._index.change_count if self._index else 0
+        self._prev_change_btn.setEnabled(total > 0)
+        self._next_change_btn.setEnabled(total > 0)
+        if not self._index:
+            self._change_label.setText("")
+        elif total == 0:
+            self._change_label.setText("No changes")
+        else:
+            current = max(1, self._index.change_number(self._focus_row))
+            self._change_label.setText(f"Change {current} of {total}")
+
+    def _jump_to_row(self, row: int) -> None:
+        self._scrollbar.setValue(max(0, row - _CONTEXT_ROWS))
+        # Set after scrolling: the scroll handler resets the focus to the top row
+        self._focus_row = row
+        self._update_change_label()
+
+    def next_change(self) -> None:
+        """Scroll to the next change after the current one."""
+        if self._index is None:
             return
-        self._syncing_scroll = True
-        self._right_browser.verticalScrollBar().setValue(value)
-        self._syncing_scroll = False
+        row = self._index.next_change(self._focus_row)
+        if row is not None:
+            self._jump_to_row(row)
 
-    def _sync_scroll_left(self, value: int) -> None:
-        """Propagate right pane scroll to left, guarded against recursion."""
-        if self._syncing_scroll:
+    def previous_change(self) -> None:
+        """Scroll to the change before the current one."""
+        if self._index is None:
             return
-        self._syncing_scroll = True
-        self._left_browser.verticalScrollBar().setValue(value)
-        self._syncing_scroll = False
+        row = self._index.previous_change(self._focus_row)
+        if row is not None:
+            self._jump_to_row(row)
 
     # ------------------------------------------------------------------
     # Public API
@@ -365,10 +502,14 @@ class DiffView(QWidget):
         self._original_path = original_path
         self._formatted_path = formatted_path
 
+        start = time.perf_counter()
         original_lines = _extract_text_lines(original_path)
         formatted_lines = _extract_text_lines(formatted_path)
 
         if not original_lines and not formatted_lines:
+            self._index = None
+            self._scrollbar.setRange(0, 0)
+            self._update_change_label()
             self._left_browser.setHtml(
                 "<p style='color:#888; font-style:italic;'>"
                 "Could not extract text from the document.</p>"
@@ -383,15 +524,20 @@ class DiffView(QWidget):
             )
             return
 
-        original_html, formatted_html = _build_diff_html(
-            original_lines, formatted_lines
-        )
-        self._left_browser.setHtml(original_html)
-        self._right_browser.setHtml(formatted_html)
+        self._index = DiffIndex(original_lines, formatted_lines)
+        self._focus_row = 0
+
+        # Scrolling stops with the last row at the top, so wrapped rows stay reachable
+        self._scrollbar.blockSignals(True)
+        self._scrollbar.setRange(0, max(0, self._index.row_count - 1))
+        self._scrollbar.setValue(0)
+        self._scrollbar.blockSignals(False)
+        self._render_visible()
 
         logger.debug(
-            "Diff loaded: %d original lines, %d formatted lines",
-            len(original_lines), len(formatted_lines),
+            "Diff loaded: %d original lines, %d formatted lines, %d changes in %.0f ms",
+            len(original_lines), len(formatted_lines), self._index.change_count,
+            (time.perf_counter() - start) * 1000,
         )
 
     # ------------------------------------------------------------------
@@ -457,6 +603,17 @@ class DiffView(QWidget):
                 }}
             """)
 
+        # Change navigation buttons — normal style
+        for nav_btn in (self._prev_change_btn, self._next_change_btn):
+            if THEME_AVAILABLE:
+                ButtonStyleManager.apply_unified_button_style(
+                    nav_btn, colors, "push", "small", "normal"
+                )
+            else:
+                nav_btn.setStyleSheet(self._back_btn.styleSheet().replace(
+                    "DiffViewBackBtn", nav_btn.objectName()
+                ))
+
         # Accept button — success state
         if THEME_AVAILABLE:
             ButtonStyleManager.apply_unified_button_style(
@@ -518,6 +675,10 @@ class DiffView(QWidget):
         )
         self._original_label.setStyleSheet(label_style)
         self._formatted_label.setStyleSheet(label_style)
+        self._change_label.setStyleSheet(
+            f"color: {text_secondary}; font-size: 12px; "
+            f"background: transparent; border: none;"
+        )
 
         # Splitter styling
         self._splitter.setStyleSheet(f"""
@@ -15,12 +15,15 @@ Layout:
 └─────────────────────────────────────────┘
 """
 
+import hashlib
 import html
 import logging
 import os
-from typing import Optional
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -57,6 +60,15 @@ _STYLE_TAG_MAP = {
     "list paragraph": "li",
 }
 
+# Paragraphs rendered per page; the first page is shown immediately and the
+# rest are appended from the event loop.
+PAGE_PARAGRAPHS = 150
+
+# Zero-width lead block for appended pages.  QTextCursor merges the first
+# block of inserted HTML into the current one; merging this placeholder
+# keeps the page's first real paragraph (and its heading level) intact.
+_PAGE_JOINER = "<p>&#8203;</p>"
+
 
 def _run_to_html(run) -> str:
     """Convert a single python-docx Run to an HTML span with inline styles."""
@@ -98,66 +110,150 @@ def _run_to_html(run) -> str:
     return text
 
 
-def docx_to_html(file_path: str) -> str:
-    """
-    Convert a DOCX file to styled HTML suitable for QTextBrowser rendering.
+def _error_html(message: str) -> str:
+    """Wrap an error message in the preview's error box."""
+    return f'<div style="color:#F44336;padding:16px;">{message}</div>'
 
-    Parameters
-    ----------
-    file_path : str
-        Absolute path to the ``.docx`` file.
 
-    Returns
-    -------
-    str
-        An HTML string wrapped in a ``<div>`` with a default font family.
-        On error, returns an HTML snippet describing the problem.
+def _wrap_page(body: str, first: bool) -> str:
+    """Wrap one page of paragraph HTML in the preview's font container."""
+    padding = "12px 12px 0" if first else "0 12px"
+    return (
+        '<div style="font-family:Calibri,Segoe UI,Arial,sans-serif;'
+        f'line-height:1.5;padding:{padding};">'
+        f"{body}"
+        "</div>"
+    )
+
+
+def _paragraph_inner_html(para) -> str:
+    """Render a paragraph's runs to inline HTML."""
+    inner = "".join(_run_to_html(run) for run in para.runs)
+
+    # If the paragraph has no runs (e.g. images-only), fall back to
+    # the plain text property.
+    if not inner and para.text:
+        inner = html.escape(para.text)
+    return inner
+
+
+class PreviewCache:
     """
-    # --- Guard: file existence -------------------------------------------
-    if not os.path.isfile(file_path):
-        return (
-            '<div style="color:#F44336;padding:16px;">'
-            f"<b>File not found:</b> {html.escape(file_path)}"
-            "</div>"
-        )
+    Bounded LRU cache of rendered DOCX previews.
 
-    # --- Lazy import of python-docx --------------------------------------
-    try:
-        from docx import Document  # type: ignore[import-untyped]
-    except ImportError:
-        return (
-            '<div style="color:#F44336;padding:16px;">'
-            "<b>python-docx is not installed.</b><br>"
-            "Run <code>pip install python-docx</code> to enable DOCX preview."
-            "</div>"
-        )
+    Whole documents are keyed by ``(path, mtime_ns, size)`` so an edited
+    file misses the cache.  Paragraph HTML is memoized separately by a
+    digest of the paragraph XML, so previewing a formatted copy only
+    renders the paragraphs the recipe actually changed.  Each map is
+    trimmed least-recently-used first to stay under its character budget.
+    """
 
-    # --- Parse the document ----------------------------------------------
-    try:
-        doc = Document(file_path)
-    except Exception as exc:
-        logger.warning("Failed to open DOCX '%s': %s", file_path, exc)
-        return (
-            '<div style="color:#F44336;padding:16px;">'
-            f"<b>Cannot open document:</b> {html.escape(str(exc))}"
-            "</div>"
-        )
+    def __init__(
+        self,
+        max_document_chars: int = 32 * 1024 * 1024,
+        max_paragraph_chars: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.max_document_chars = max_document_chars
+        self.max_paragraph_chars = max_paragraph_chars
+        self._documents: "OrderedDict[Tuple[str, int, int], List[str]]" = OrderedDict()
+        self._paragraphs: "OrderedDict[bytes, str]" = OrderedDict()
+        self._document_chars = 0
+        self._paragraph_chars = 0
+
+    @staticmethod
+    def document_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+        """Return the cache key for *file_path*, or ``None`` if it is not a file."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if not os.path.isfile(file_path):
+            return None
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def get_pages(self, key: Tuple[str, int, int]) -> Optional[List[str]]:
+        """Return the cached pages for *key*, marking them recently used."""
+        pages = self._documents.get(key)
+        if pages is not None:
+            self._documents.move_to_end(key)
+        return pages
+
+    def put_pages(self, key: Tuple[str, int, int], pages: List[str]) -> None:
+        """Cache a fully rendered document, replacing older renders of the same path."""
+        for stale in [k for k in self._documents if k[0] == key[0]]:
+            self._document_chars -= sum(map(len, self._documents.pop(stale)))
+
+        size = sum(map(len, pages))
+        if size > self.max_document_chars:
+            return
+        self._documents[key] = pages
+        self._document_chars += size
+        while self._document_chars > self.max_document_chars:
+            _, evicted = self._documents.popitem(last=False)
+            self._document_chars -= sum(map(len, evicted))
+
+    def get_paragraph(self, digest: bytes) -> Optional[str]:
+        """Return the memoized HTML for a paragraph digest."""
+        inner = self._paragraphs.get(digest)
+        if inner is not None:
+            self._paragraphs.move_to_end(digest)
+        return inner
+
+    def put_paragraph(self, digest: bytes, inner: str) -> None:
+        """Memoize a paragraph's HTML under its XML digest."""
+        if digest in self._paragraphs:
+            return
+        self._paragraphs[digest] = inner
+        self._paragraph_chars += len(inner)
+        while self._paragraph_chars > self.max_paragraph_chars:
+            _, evicted = self._paragraphs.popitem(last=False)
+            self._paragraph_chars -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached document and paragraph."""
+        self._documents.clear()
+        self._paragraphs.clear()
+        self._document_chars = 0
+        self._paragraph_chars = 0
+
+
+_preview_cache = PreviewCache()
+
+
+def get_preview_cache() -> PreviewCache:
+    """Return the process-wide preview cache."""
+    return _preview_cache
+
+
+def _render_pages(doc, page_size: int, cache: PreviewCache) -> Iterator[str]:
+    """Yield the document body as pages of roughly *page_size* paragraphs."""
+    from docx.enum.style import WD_STYLE_TYPE  # type: ignore[import-untyped]
+    from lxml import etree
+
+    # Resolve style ids to tags once rather than per paragraph.
+    tags = {
+        style.style_id: _STYLE_TAG_MAP.get((style.name or "").lower().strip(), "p")
+        for style in doc.styles
+        if style.type == WD_STYLE_TYPE.PARAGRAPH
+    }
+    default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    default_tag = _STYLE_TAG_MAP.get(
+        ((default_style.name if default_style else "") or "").lower().strip(), "p"
+    )
 
-    # --- Build HTML body -------------------------------------------------
     parts: list[str] = []
     in_list = False
+    count = 0
+    first = True
 
     for para in doc.paragraphs:
-        style_name = (para.style.name or "").lower().strip()
-        tag = _STYLE_TAG_MAP.get(style_name, "p")
+        tag = tags.get(para._p.style, default_tag)
 
-        # Build inline content from runs
-        inner = "".join(_run_to_html(run) for run in para.runs)
-
-        # If the paragraph has no runs (e.g. images-only), fall back to
-        # the plain text property.
-        if not inner and para.text:
-            inner = html.escape(para.text)
+        digest = hashlib.blake2b(etree.tostring(para._p), digest_size=16).digest()
+        inner = cache.get_paragraph(digest)
+        if inner is None:
+            inner = _paragraph_inner_html(para)
+            cache.put_paragraph(digest, inner)
 
         # Manage list wrapping — open/close <ul> around consecutive <li>.
         if tag == "li":
@@ -169,20 +265,104 @@ def docx_to_html(file_path: str) -> str:
             if in_list:
                 parts.append("</ul>")
                 in_list = False
+            # Only break pages outside lists so a list is never split.
+            if count >= page_size:
+                yield _wrap_page("\n".join(parts), first)
+                parts, count, first = [], 0, False
             parts.append(f"<{tag}>{inner}</{tag}>")
+        count += 1
 
     # Close any open list
     if in_list:
         parts.append("</ul>")
 
-    body = "\n".join(parts)
+    if parts or first:
+        yield _wrap_page("\n".join(parts), first)
 
-    return (
-        '<div style="font-family:Calibri,Segoe UI,Arial,sans-serif;'
-        'line-height:1.5;padding:12px;">'
-        f"{body}"
-        "</div>"
-    )
+
+def iter_preview_pages(
+    file_path: str,
+    page_size: Optional[int] = None,
+    cache: Optional[PreviewCache] = None,
+) -> Iterator[str]:
+    """
+    Yield a DOCX file as pages of styled HTML for QTextBrowser rendering.
+
+    The first page is produced as soon as its paragraphs are rendered so
+    callers can show it before the rest of the document is converted.
+    Once every page has been yielded the render is stored in the preview
+    cache; an unchanged file is then served without reopening it.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute path to the ``.docx`` file.
+    page_size : int, optional
+        Approximate number of paragraphs per page; defaults to
+        ``PAGE_PARAGRAPHS``.
+    cache : PreviewCache, optional
+        Cache to use instead of the process-wide one.
+
+    Yields
+    ------
+    str
+        HTML pages, each wrapped in a ``<div>`` with a default font family.
+        On error, a single HTML snippet describing the problem.
+    """
+    cache = cache or _preview_cache
+
+    # --- Guard: file existence -------------------------------------------
+    key = cache.document_key(file_path)
+    if key is None:
+        yield _error_html(f"<b>File not found:</b> {html.escape(file_path)}")
+        return
+
+    cached = cache.get_pages(key)
+    if cached is not None:
+        yield from cached
+        return
+
+    # --- Lazy import of python-docx --------------------------------------
+    try:
+        from docx import Document  # type: ignore[import-untyped]
+    except ImportError:
+        yield _error_html(
+            "<b>python-docx is not installed.</b><br>"
+            "Run <code>pip install python-docx</code> to enable DOCX preview."
+        )
+        return
+
+    # --- Parse the document ----------------------------------------------
+    try:
+        doc = Document(file_path)
+    except Exception as exc:
+        logger.warning("Failed to open DOCX '%s': %s", file_path, exc)
+        yield _error_html(f"<b>Cannot open document:</b> {html.escape(str(exc))}")
+        return
+
+    pages: list[str] = []
+    for page in _render_pages(doc, page_size or PAGE_PARAGRAPHS, cache):
+        pages.append(page)
+        yield page
+    cache.put_pages(key, pages)
+
+
+def docx_to_html(file_path: str) -> str:
+    """
+    Convert a DOCX file to styled HTML suitable for QTextBrowser rendering.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute path to the ``.docx`` file.
+
+    Returns
+    -------
+    str
+        The pages from :func:`iter_preview_pages` joined together.
+        On error, returns an HTML snippet describing the problem.
+    """
+    return "".join(iter_preview_pages(file_path))
 
 
 # ---------------------------------------------------------------------------
@@ -212,6 +392,14 @@ class DocumentPreviewView(QWidget):
         super().__init__(parent)
         self.setObjectName("DocumentPreviewView")
         self._current_file_path: str = ""
+        self._pending_pages: Optional[Iterator[str]] = None
+
+        # Appends the remaining pages one per event-loop turn.
+        self._page_timer = QTimer(self)
+        self._page_timer.setSingleShot(True)
+        self._page_timer.setInterval(0)
+        self._page_timer.timeout.connect(self._append_next_page)
+
         self._build_ui()
 
     # ------------------------------------------------------------------
@@ -282,10 +470,13 @@ class DocumentPreviewView(QWidget):
         self._filename_label.setText(filename)
         self._filename_label.setToolTip(file_path)
 
-        # Convert and display
+        # Show the first page now and append the rest from the event loop
         logger.debug("Loading document preview: %s", file_path)
-        html_content = docx_to_html(file_path)
-        self._browser.setHtml(html_content)
+        self._stop_paging()
+        pages = iter_preview_pages(file_path)
+        self._browser.setHtml(next(pages, ""))
+        self._pending_pages = pages
+        self._page_timer.start()
 
     def apply_theme(self, colors) -> None:
         """
@@ -362,6 +553,41 @@ class DocumentPreviewView(QWidget):
                     }}
                 """)
 
+    # ------------------------------------------------------------------
+    # Incremental rendering
+    # ------------------------------------------------------------------
+
+    def _stop_paging(self) -> None:
+        """Abandon any pages still pending from the previous document."""
+        self._page_timer.stop()
+        if self._pending_pages is not None:
+            self._pending_pages.close()
+            self._pending_pages = None
+
+    def _append_next_page(self) -> None:
+        """Render the next pending page and append it to the browser."""
+        if self._pending_pages is None:
+            return
+        page = next(self._pending_pages, None)
+        if page is None:
+            self._pending_pages = None
+            return
+
+        cursor = QTextCursor(self._browser.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        joint = cursor.position()
+        cursor.insertHtml(_PAGE_JOINER + page)
+
+        # Drop the placeholder character merged into the previous block.
+        cursor.setPosition(joint)
+        cursor.movePosition(
+            QTextCursor.MoveOperation.NextCharacter, QTextCursor.MoveMode.KeepAnchor
+        )
+        if cursor.selectedText() == "\u200b":
+            cursor.removeSelectedText()
+
+        self._page_timer.start()
+
     # ------------------------------------------------------------------
     # Slots
     # ------------------------------------------------------------------
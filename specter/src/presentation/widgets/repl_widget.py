@@ -41,6 +41,7 @@ from PyQt6.QtGui import QKeyEvent, QFont, QTextCursor, QTextCharFormat, QColor,
 
 # Import startup service for preamble
 from ...application.startup_service import startup_service
+from ...application.startup_scheduler import defer_startup_task, ensure_startup_task
 
 # Tab system imports - conditional availability
 try:
@@ -1386,7 +1387,9 @@ class REPLWidget(QWidget):
         self._rag_session_initializing = False
         self._rag_session_ready = False
         self._pending_files_queue = []  # Queue for files waiting for RAG initialization
-        self._init_rag_session()
+        # Created in idle time once the window is up; file drops and queries
+        # pull it forward if they need it first
+        defer_startup_task("rag_session", self._init_rag_session)
         
         # Startup task control
         self._startup_tasks_completed = False
@@ -4966,6 +4969,7 @@ class REPLWidget(QWidget):
             logger.info(f"🔍 DEBUG: _rag_session_initializing: {getattr(self, '_rag_session_initializing', 'NOT_SET')}")
             
             # Ensure we have a valid and ready RAG session
+            ensure_startup_task("rag_session")
             if not hasattr(self, 'rag_session') or not self.rag_session or not getattr(self, '_rag_session_ready', False):
                 # Check if RAG session is currently initializing
                 if hasattr(self, '_rag_session_initializing') and self._rag_session_initializing:
@@ -5685,6 +5689,7 @@ class REPLWidget(QWidget):
                         self.finished.emit()
             
             # Create and start processing thread
+            ensure_startup_task("rag_session")
             self.processing_thread = QThread()
             self.file_processor = FileProcessor(self.rag_session, file_paths)
             self.file_processor.moveToThread(self.processing_thread)
@@ -10806,6 +10811,8 @@ def test_theme():
         # Skip RAG context injection during skill sessions — the session
         # prompt already contains everything the AI needs and RAG chunks
         # from the document body would confuse the formatting instructions.
+        if not self._skill_session:
+            ensure_startup_task("rag_session")
         rag_session_to_use = None if self._skill_session else self.rag_session
 
         self.ai_worker = EnhancedAIWorker(
@@ -12164,6 +12171,7 @@ def test_theme():
                 theme_name = getattr(self.theme_manager.current_theme, 'name', 'professional_dark')
 
             # Create and show dialog
+            ensure_startup_task("rag_session")
             dialog = CollectionsManagerDialog(
                 parent=self,
                 db_manager=db_manager,
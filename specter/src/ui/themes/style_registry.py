@@ -543,8 +543,10 @@ class StyleRegistry(QObject):
             if style_name in self._custom_style_generators:
                 return self._custom_style_generators[style_name](colors)
             
-            # Use StyleTemplates for standard styles
-            return StyleTemplates.get_style(style_name, colors)
+            # Use StyleTemplates for standard styles (via the theme manager,
+            # which keeps the current theme's stylesheets in the theme bundle)
+            from .theme_manager import get_theme_manager
+            return get_theme_manager().render_style(style_name, colors)
             
         except ValueError:
             logger.error(f"Unknown style template: {style_name}")
@@ -0,0 +1,263 @@
+"""
+Compiled Theme Bundle for Specter Theme Framework.
+
+Caches every parsed theme file in a single JSON bundle so startup reads one
+file instead of opening and parsing each theme. Entries are invalidated by
+the source file's mtime and size. The bundle also keeps the rendered
+stylesheets of the active theme, keyed by a hash of its colors and of the
+style templates that rendered them, so they are not regenerated on the next
+start but are after an upgrade changes the templates.
+
+Themes are exposed through ``LazyThemeMap``, which builds each ColorSystem
+only when it is first looked up; at startup that is just the current theme.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import MutableMapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .color_system import ColorSystem
+
+logger = logging.getLogger("specter.theme_bundle")
+
+# Bump when the entry layout changes; older bundles are discarded
+BUNDLE_VERSION = 1
+
+# Modules whose source determines the rendered CSS
+_TEMPLATE_SOURCES = ("style_templates.py", "color_system.py")
+
+
+def theme_colors_key(colors: ColorSystem) -> str:
+    """Stable hash of a color system, used to key rendered stylesheets."""
+    payload = json.dumps(colors.to_dict(), sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def style_templates_key() -> str:
+    """
+    Hash of the app version and the style template source.
+
+    Changes whenever an upgrade (or a local edit) changes the templates, so
+    stylesheets rendered by an older version are not reused.
+    """
+    digest = hashlib.sha1()
+    try:
+        from ....__version__ import __version__
+        digest.update(__version__.encode("utf-8"))
+    except ImportError:
+        pass
+    for name in _TEMPLATE_SOURCES:
+        try:
+            digest.update((Path(__file__).parent / name).read_bytes())
+        except OSError:
+            # Frozen builds may ship without sources; the version still applies
+            pass
+    return digest.hexdigest()[:16]
+
+
+def stylesheet_cache_key(colors: ColorSystem) -> str:
+    """Key for stylesheets rendered from ``colors`` by the current templates."""
+    return f"{theme_colors_key(colors)}:{style_templates_key()}"
+
+
+def build_color_system(entry: Dict[str, Any]) -> ColorSystem:
+    """Create a ColorSystem, with its metadata, from a bundle entry."""
+    color_system = ColorSystem.from_dict(entry.get("colors", {}))
+    color_system._metadata = dict(entry.get("metadata", {}))
+    return color_system
+
+
+def parse_theme_data(theme_data: Dict[str, Any], fallback_name: str) -> Dict[str, Any]:
+    """Extract the bundle entry fields from a theme file's JSON."""
+    theme_name = theme_data.get("name", fallback_name)
+    return {
+        "name": theme_name,
+        "colors": theme_data.get("colors", {}),
+        "metadata": {
+            "display_name": theme_data.get("display_name", theme_name),
+            "description": theme_data.get("description", ""),
+            "author": theme_data.get("author", "Unknown"),
+            "version": theme_data.get("version", "1.0.0"),
+            "mode": theme_data.get("mode", "light"),
+        },
+    }
+
+
+class ThemeBundle:
+    """
+    On-disk cache of parsed theme files and the active theme's stylesheets.
+
+    Changes are held in memory until ``save``, which rewrites the bundle
+    atomically and only when something changed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._stylesheets: Dict[str, Any] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable theme bundle {self.path}: {e}")
+            return
+
+        if data.get("version") != BUNDLE_VERSION:
+            logger.info("Theme bundle version changed - rebuilding")
+            self._dirty = True
+            return
+        self._files = data.get("files", {})
+        self._stylesheets = data.get("stylesheets", {})
+
+    @staticmethod
+    def _signature(theme_file: Path):
+        stat = theme_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_entry(self, theme_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached entry for a theme file if it is still current.
+
+        Returns:
+            The entry, or None if the file is not cached or has changed
+        """
+        entry = self._files.get(str(theme_file))
+        if entry is None:
+            return None
+        try:
+            mtime_ns, size = self._signature(theme_file)
+        except OSError:
+            return None
+        if entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
+            return None
+        return entry
+
+    def put_entry(self, theme_file: Path, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a parsed theme file, stamped with its current mtime and size."""
+        mtime_ns, size = self._signature(theme_file)
+        entry = dict(entry, mtime_ns=mtime_ns, size=size)
+        self._files[str(theme_file)] = entry
+        self._dirty = True
+        return entry
+
+    def prune(self, directory: Path, live_files) -> None:
+        """Drop entries for files in ``directory`` that no longer exist."""
+        live = {str(path) for path in live_files}
+        prefix = str(directory)
+        stale = [key for key in self._files
+                 if os.path.dirname(key) == prefix and key not in live]
+        for key in stale:
+            del self._files[key]
+        if stale:
+            self._dirty = True
+
+    def get_stylesheets(self, colors_key: str) -> Dict[str, str]:
+        """Rendered stylesheets cached for the given colors, if any."""
+        if self._stylesheets.get("colors_key") != colors_key:
+            return {}
+        return dict(self._stylesheets.get("styles", {}))
+
+    def set_stylesheets(self, colors_key: str, styles: Dict[str, str]) -> None:
+        """Replace the cached stylesheets with those of the active theme."""
+        if (self._stylesheets.get("colors_key") == colors_key
+                and self._stylesheets.get("styles") == styles):
+            return
+        self._stylesheets = {"colors_key": colors_key, "styles": dict(styles)}
+        self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the bundle if it changed.
+
+        Returns:
+            True if the bundle was written
+        """
+        if not self._dirty:
+            return False
+        payload = json.dumps({
+            "version": BUNDLE_VERSION,
+            "files": self._files,
+            "stylesheets": self._stylesheets,
+        })
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=".theme_bundle-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write theme bundle {self.path}: {e}")
+            return False
+        self._dirty = False
+        logger.debug(f"Theme bundle written: {len(self._files)} themes")
+        return True
+
+
+class LazyThemeMap(MutableMapping):
+    """
+    Theme name to ColorSystem mapping that builds entries on first lookup.
+
+    Behaves like the plain dict it replaces: membership, iteration and
+    ``len`` never materialize a theme; indexing does, once.
+    """
+
+    def __init__(self):
+        self._themes: Dict[str, ColorSystem] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def add_entry(self, name: str, entry: Dict[str, Any]) -> None:
+        """Register a theme to be built from ``entry`` when first used."""
+        self._themes.pop(name, None)
+        self._entries[name] = entry
+
+    def is_materialized(self, name: str) -> bool:
+        return name in self._themes
+
+    def __getitem__(self, name: str) -> ColorSystem:
+        theme = self._themes.get(name)
+        if theme is not None:
+            return theme
+        entry = self._entries.pop(name)  # KeyError for unknown themes
+        theme = build_color_system(entry)
+        self._themes[name] = theme
+        return theme
+
+    def __setitem__(self, name: str, theme: ColorSystem) -> None:
+        self._entries.pop(name, None)
+        self._themes[name] = theme
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._themes.pop(name, None)
+        self._entries.pop(name, None)
+
+    def __contains__(self, name) -> bool:
+        return name in self._themes or name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._themes)
+        yield from [name for name in list(self._entries) if name not in self._themes]
+
+    def __len__(self) -> int:
+        return len(self._themes) + sum(1 for name in self._entries if name not in self._themes)
@@ -17,6 +17,7 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtWidgets import QApplication
 
 from .color_system import ColorSystem, ColorUtils
+from .theme_bundle import ThemeBundle, LazyThemeMap, parse_theme_data, stylesheet_cache_key
 from ...infrastructure.storage.settings_manager import settings
 
 logger = logging.getLogger("specter.theme_manager")
@@ -46,8 +47,8 @@ class ThemeManager(QObject):
         super().__init__()
         self._current_theme: Optional[ColorSystem] = None
         self._current_theme_name: str = "cyber"
-        self._preset_themes: Dict[str, ColorSystem] = {}
-        self._custom_themes: Dict[str, ColorSystem] = {}
+        self._preset_themes: Dict[str, ColorSystem] = LazyThemeMap()
+        self._custom_themes: Dict[str, ColorSystem] = LazyThemeMap()
         self._theme_history: List[ColorSystem] = []
         self._max_history_size: int = 20
 
@@ -58,6 +59,12 @@ class ThemeManager(QObject):
         # Performance optimization: Cache theme color dictionary
         self._theme_color_dict_cache: Optional[Dict[str, str]] = None
 
+        # Rendered stylesheets of the current theme, persisted in the bundle
+        self._style_cache: Dict[str, str] = {}
+        self._style_cache_key: Optional[str] = None
+        self._style_cache_theme: Optional[ColorSystem] = None
+        self._style_save_timer: Optional[QTimer] = None
+
         # Theme switch debouncing to prevent notification spam
         self._theme_switch_debounce_timer = None
         self._is_switching_theme = False
@@ -75,6 +82,9 @@ class ThemeManager(QObject):
         # Load current theme from settings
         self._load_current_theme()
 
+        # Persist any theme files parsed during this start
+        self._bundle.save()
+
         logger.info("ThemeManager initialized")
     
     def _init_theme_directories(self):
@@ -87,12 +97,19 @@ class ThemeManager(QObject):
             self._themes_dir = Path.cwd() / "themes"
         
         self._themes_dir.mkdir(exist_ok=True)
+
+        try:
+            from ...utils.config_paths import get_cache_dir
+            bundle_path = get_cache_dir() / "theme_bundle.json"
+        except ImportError:
+            bundle_path = self._themes_dir.parent / "cache" / "theme_bundle.json"
+        self._bundle = ThemeBundle(bundle_path)
         
         logger.debug(f"Theme directories initialized: {self._themes_dir}")
     
     def _load_preset_themes(self, progress_callback=None):
         """Load built-in preset themes from JSON files."""
-        self._preset_themes = {}
+        self._preset_themes = LazyThemeMap()
 
         # Get the built-in themes directory (relative to this file)
         builtin_themes_dir = Path(__file__).parent / "json"
@@ -100,39 +117,20 @@ class ThemeManager(QObject):
         if not builtin_themes_dir.exists():
             logger.warning(f"Built-in themes directory not found: {builtin_themes_dir}")
             # Fall back to a default theme
-            self._preset_themes = {"cyber": ColorSystem()}
+            self._preset_themes["cyber"] = ColorSystem()
             return
 
         # Collect theme files upfront so we know the total count
         theme_files = sorted(builtin_themes_dir.glob("*.json"))
         total = len(theme_files)
 
-        # Load all JSON theme files from the built-in directory
+        # Register every theme file; only the ones actually used get built
         for idx, theme_file in enumerate(theme_files):
             try:
-                with open(theme_file, 'r', encoding='utf-8') as f:
-                    theme_data = json.load(f)
-
-                # Use 'name' field from JSON if available, otherwise use filename
-                theme_name = theme_data.get('name', theme_file.stem)
-
-                # Create ColorSystem from colors data
-                color_system = ColorSystem.from_dict(theme_data.get('colors', {}))
-
-                # Store additional metadata including theme mode
-                if not hasattr(color_system, '_metadata'):
-                    color_system._metadata = {}
-                color_system._metadata.update({
-                    'display_name': theme_data.get('display_name', theme_name),
-                    'description': theme_data.get('description', ''),
-                    'author': theme_data.get('author', 'Unknown'),
-                    'version': theme_data.get('version', '1.0.0'),
-                    'mode': theme_data.get('mode', 'light')  # Store theme mode
-                })
-
-                # Add to preset themes
-                self._preset_themes[theme_name] = color_system
-                logger.debug(f"Loaded built-in theme: {theme_name} (mode: {theme_data.get('mode', 'light')})")
+                entry = self._read_theme_entry(theme_file)
+                theme_name = entry['name']
+                self._preset_themes.add_entry(theme_name, entry)
+                logger.debug(f"Loaded built-in theme: {theme_name} (mode: {entry['metadata']['mode']})")
 
                 # Report per-theme progress to splash screen
                 if progress_callback:
@@ -141,11 +139,12 @@ class ThemeManager(QObject):
             except Exception as e:
                 logger.error(f"Failed to load built-in theme {theme_file}: {e}")
 
+        self._bundle.prune(builtin_themes_dir, theme_files)
         logger.info(f"Loaded {len(self._preset_themes)} preset themes")
     
     def _load_custom_themes(self, progress_callback=None):
         """Load custom themes from disk (themes folder)."""
-        self._custom_themes = {}
+        self._custom_themes = LazyThemeMap()
 
         if not self._themes_dir.exists():
             return
@@ -156,31 +155,13 @@ class ThemeManager(QObject):
 
         for idx, theme_file in enumerate(theme_files):
             try:
-                with open(theme_file, 'r', encoding='utf-8') as f:
-                    theme_data = json.load(f)
-
-                # Use 'name' field from JSON if available, otherwise use filename
-                theme_name = theme_data.get('name', theme_file.stem)
-
-                # Create ColorSystem from colors data
-                color_system = ColorSystem.from_dict(theme_data.get('colors', {}))
-
-                # Store additional metadata including theme mode
-                if not hasattr(color_system, '_metadata'):
-                    color_system._metadata = {}
-                color_system._metadata.update({
-                    'display_name': theme_data.get('display_name', theme_name),
-                    'description': theme_data.get('description', ''),
-                    'author': theme_data.get('author', 'Unknown'),
-                    'version': theme_data.get('version', '1.0.0'),
-                    'mode': theme_data.get('mode', 'light')  # Store theme mode
-                })
-
-                # Validate theme (but allow loading with warnings for custom themes)
-                is_valid, issues = color_system.validate()
-                self._custom_themes[theme_name] = color_system
-
-                if is_valid:
+                entry = self._read_theme_entry(theme_file, validate=True)
+                theme_name = entry['name']
+                self._custom_themes.add_entry(theme_name, entry)
+
+                # Validation result is cached with the entry (allow loading with warnings)
+                issues = entry.get('issues', [])
+                if not issues:
                     logger.debug(f"Loaded custom theme: {theme_name} from {theme_file}")
                 else:
                     logger.warning(f"Loaded custom theme with accessibility warnings {theme_name}: {issues}")
@@ -192,9 +173,36 @@ class ThemeManager(QObject):
 
             except Exception as e:
                 logger.error(f"Failed to load custom theme {theme_file}: {e}")
+
+        self._bundle.prune(self._themes_dir, theme_files)
         
         logger.info(f"Loaded {len(self._custom_themes)} custom themes")
     
+    def _read_theme_entry(self, theme_file: Path, validate: bool = False) -> Dict[str, Any]:
+        """
+        Get the parsed form of a theme file, from the bundle when it is current.
+
+        Args:
+            theme_file: Theme JSON file
+            validate: Also record the theme's validation issues
+
+        Returns:
+            Bundle entry with the theme's name, colors and metadata
+        """
+        entry = self._bundle.get_entry(theme_file)
+        if entry is not None and (not validate or 'issues' in entry):
+            return entry
+
+        with open(theme_file, 'r', encoding='utf-8') as f:
+            theme_data = json.load(f)
+
+        # Use 'name' field from JSON if available, otherwise use filename
+        entry = parse_theme_data(theme_data, theme_file.stem)
+        if validate:
+            _, issues = ColorSystem.from_dict(entry['colors']).validate()
+            entry['issues'] = issues
+        return self._bundle.put_entry(theme_file, entry)
+
     def _load_current_theme(self):
         """Load the current theme from settings."""
         try:
@@ -808,6 +816,57 @@ class ThemeManager(QObject):
         """Get the appropriate icon suffix for the current theme."""
         return self.get_icon_suffix_for_theme()
     
+    def render_style(self, template_name: str, colors: Optional[ColorSystem] = None) -> str:
+        """
+        Render a style template, reusing stylesheets already rendered for the current theme.
+
+        Stylesheets rendered for the current theme are kept in the theme bundle,
+        so the next start with the same theme and style templates skips
+        generating them.
+
+        Args:
+            template_name: StyleTemplates template name
+            colors: Color system to render with (defaults to the current theme)
+
+        Returns:
+            CSS string for the requested template
+
+        Raises:
+            ValueError: If the template name is not found
+        """
+        from .style_templates import StyleTemplates
+
+        if colors is not None and colors is not self._current_theme:
+            return StyleTemplates.get_style(template_name, colors)
+
+        colors = self.current_theme
+        if self._style_cache_theme is not colors:
+            # Theme switched since the last render
+            self._style_cache_theme = colors
+            self._style_cache_key = stylesheet_cache_key(colors)
+            self._style_cache = self._bundle.get_stylesheets(self._style_cache_key)
+
+        style = self._style_cache.get(template_name)
+        if style is None:
+            style = StyleTemplates.get_style(template_name, colors)
+            self._style_cache[template_name] = style
+            self._schedule_style_save()
+        return style
+
+    def _schedule_style_save(self):
+        """Write newly rendered stylesheets to the bundle once rendering settles."""
+        if self._style_save_timer is None:
+            self._style_save_timer = QTimer(self)
+            self._style_save_timer.setSingleShot(True)
+            self._style_save_timer.timeout.connect(self._save_rendered_styles)
+        self._style_save_timer.start(2000)
+
+    def _save_rendered_styles(self):
+        if self._style_cache_key is None:
+            return
+        self._bundle.set_stylesheets(self._style_cache_key, self._style_cache)
+        self._bundle.save()
+
     def apply_theme_to_widget(self, widget, style_template: str = None):
         """
         Apply current theme to a widget using style templates.
@@ -818,8 +877,7 @@ class ThemeManager(QObject):
         """
         if style_template:
             try:
-                from .style_templates import StyleTemplates
-                style = StyleTemplates.get_style(style_template, self.current_theme)
+                style = self.render_style(style_template)
                 widget.setStyleSheet(style)
             except ImportError:
                 logger.warning("Style templates not available")
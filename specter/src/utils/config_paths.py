@@ -91,6 +91,12 @@ def get_db_dir() -> Path:
     db_dir.mkdir(parents=True, exist_ok=True)
     return db_dir
 
+def get_cache_dir() -> Path:
+    """Get the cache directory."""
+    cache_dir = get_user_data_dir() / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
 def cleanup_old_files():
     """Clean up old/unused configuration files."""
     data_dir = get_user_data_dir()
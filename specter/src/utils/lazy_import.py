@@ -0,0 +1,69 @@
+"""
+Lazy import utilities for Specter.
+
+Heavy optional dependencies (faiss, tiktoken, pdfplumber, python-docx) are
+only needed once a document is ingested or searched. Importing them through
+``lazy_import`` registers the module immediately but defers executing it
+until an attribute is first accessed, so availability checks at module import
+time no longer cost a full import.
+"""
+
+import importlib.util
+import logging
+import sys
+from types import ModuleType
+from typing import Optional
+
+logger = logging.getLogger("specter.lazy_import")
+
+
+def is_available(name: str) -> bool:
+    """
+    Check whether a module can be imported without importing it.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        True if the module is already loaded or can be found on the path
+    """
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Import a module lazily.
+
+    The returned module is registered in ``sys.modules`` straight away; its
+    body runs on first attribute access. A broken installation therefore
+    raises at first use rather than here.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The (possibly not yet executed) module, or None if it is not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or spec.loader is None:
+        logger.debug(f"Optional module not installed: {name}")
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
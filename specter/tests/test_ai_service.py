@@ -26,8 +26,29 @@ from specter.src.infrastructure.ai.ai_service import (
     AIService, 
     ConversationContext, 
     ConversationMessage,
-    AIConfigurationError
+    AIConfigurationError,
+    count_tokens
 )
+from specter.src.infrastructure.ai.prompt_composer import PromptCacheStats, PromptComposer
+
+
+class FakeOrchestrator:
+    """MemGPT orchestrator stand-in with a fixed core memory prompt."""
+    
+    def __init__(self, core_memory):
+        self.core_memory = core_memory
+        self.checked = []
+    
+    def build_system_prompt(self, base_prompt=""):
+        return self.core_memory
+    
+    def should_evict(self, messages, max_tokens=None):
+        self.checked.append(messages)
+        return False
+
+
+def memgpt_settings(key, default=None):
+    return {'memgpt.enabled': True, 'tools.enabled': False}.get(key, default)
 
 
 class TestOpenAICompatibleClient:
@@ -246,6 +267,125 @@ class TestConversationContext:
         self.context.clear()
         
         assert len(self.context.messages) == 0
+    
+    def test_token_counts_are_cached(self):
+        """Test per-message token counts are computed once."""
+        message = self.context.add_message("user", "Hello there")
+        
+        assert message.token_count is None
+        count = message.get_token_count()
+        assert count > 0
+        assert message.token_count == count
+    
+    def test_to_api_format_respects_token_budget(self):
+        """Test newest-first selection within budget, folding older turns."""
+        context = ConversationContext(max_messages=500, max_tokens=1000)
+        context.add_message("system", "You are helpful")
+        for i in range(40):
+            context.add_message("user", f"Question {i} " + "detail " * 30)
+            context.add_message("assistant", f"Answer {i} " + "reply " * 30)
+        
+        api_format = context.to_api_format(reserved_tokens=100)
+        
+        assert api_format[0] == {"role": "system", "content": "You are helpful"}
+        assert api_format[1]["content"].startswith("Summary of earlier conversation:")
+        assert api_format[-1]["content"].startswith("Answer 39")
+        assert len(api_format) < 20
+        total = sum(
+            ConversationMessage(role=m["role"], content=m["content"]).get_token_count()
+            for m in api_format
+        )
+        assert total <= 900
+    
+    def test_window_is_stable_across_turns(self):
+        """Test the oldest sent message changes rarely as the chat grows."""
+        context = ConversationContext(max_messages=500, max_tokens=2000)
+        context.add_message("system", "You are helpful")
+        firsts = set()
+        for i in range(60):
+            context.add_message("user", f"Question {i} " + "detail " * 30)
+            context.add_message("assistant", f"Answer {i} " + "reply " * 30)
+            firsts.add(context.to_api_format()[2]["content"])
+        
+        assert len(firsts) < 15
+    
+    def test_latest_message_always_sent(self):
+        """Test an oversized latest message is still sent."""
+        context = ConversationContext(max_tokens=50)
+        context.add_message("user", "long " * 500)
+        
+        api_format = context.to_api_format()
+        
+        assert api_format[-1]["role"] == "user"
+        assert len(api_format[-1]["content"]) == len("long " * 500)
+
+
+class TestPromptComposer:
+    """Test cases for stable-prefix request composition and cache hints."""
+    
+    def setup_method(self):
+        self.messages = [
+            {"role": "system", "content": "You are helpful"},
+            {"role": "user", "content": "Hello"},
+        ]
+    
+    def test_plain_providers_get_joined_system_prompt(self):
+        composer = PromptComposer("http://localhost:11434/v1", "llama3")
+        composed = composer.compose(self.messages, ["Tools: web_search"], ["Memory: stats"], "You are helpful")
+        
+        assert composed[0] == {
+            "role": "system",
+            "content": "You are helpful\n\nTools: web_search\n\nMemory: stats"
+        }
+        assert composed[1] == {"role": "user", "content": "Hello"}
+        assert composer.request_params() == {}
+        assert self.messages[0]["content"] == "You are helpful"
+    
+    def test_anthropic_models_get_cache_breakpoints(self):
+        composer = PromptComposer("https://openrouter.ai/api/v1", "anthropic/claude-sonnet-4")
+        composed = composer.compose(self.messages, ["Tools: web_search"], ["Memory: stats"], "You are helpful")
+        
+        system_blocks = composed[0]["content"]
+        assert [block["text"] for block in system_blocks] == [
+            "You are helpful", "Tools: web_search", "Memory: stats"
+        ]
+        assert "cache_control" in system_blocks[1]
+        assert "cache_control" not in system_blocks[2]
+        assert composed[1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    
+    def test_openai_cache_key_ignores_volatile_content(self):
+        composer = PromptComposer("https://api.openai.com/v1", "gpt-4o")
+        composer.compose(self.messages, ["Tools"], ["Memory turn 1"], "You are helpful")
+        first = composer.request_params()
+        composer.compose(self.messages, ["Tools"], ["Memory turn 2"], "You are helpful")
+        
+        assert first["prompt_cache_key"] == composer.request_params()["prompt_cache_key"]
+    
+    def test_summary_not_part_of_stable_prefix(self):
+        """Without a configured system prompt the folded summary stays volatile."""
+        composer = PromptComposer("https://api.openai.com/v1", "gpt-4o")
+        keys = []
+        for summary in ("user: first", "user: first\nuser: second"):
+            messages = [
+                {"role": "system", "content": "Summary of earlier conversation:\n" + summary},
+                {"role": "user", "content": "Hello"},
+            ]
+            composed = composer.compose(messages, ["Tools"], ["Memory"], system_prompt="")
+            keys.append(composer.request_params()["prompt_cache_key"])
+        
+        assert keys[0] == keys[1]
+        assert composed[0] == {"role": "system", "content": "Tools\n\nMemory"}
+        assert composed[1]["content"].startswith("Summary of earlier conversation:")
+    
+    def test_cache_stats_record_both_usage_shapes(self):
+        stats = PromptCacheStats()
+        stats.record({"prompt_tokens": 2000, "prompt_tokens_details": {"cached_tokens": 1500}})
+        stats.record({"input_tokens": 100, "cache_read_input_tokens": 900, "cache_creation_input_tokens": 0})
+        
+        assert stats.requests == 2
+        assert stats.prompt_tokens == 3000
+        assert stats.cached_tokens == 2400
+        assert stats.hit_rate == 0.8
 
 
 class TestAIService:
@@ -349,6 +489,60 @@ class TestAIService:
         assert self.service.conversation.messages[-1].role == "assistant"
         assert self.service.conversation.messages[-1].content == "Hello back!"
     
+    @patch('specter.src.infrastructure.ai.ai_service.OpenAICompatibleClient')
+    def test_stateless_max_tokens_overrides_title_cap(self, mock_client_class):
+        """Summaries ask for more tokens than the nano title cap allows."""
+        mock_client = Mock()
+        mock_client.chat_completion.return_value = APIResponse(
+            success=True, data={'choices': [{'message': {'content': '{}'}}]}
+        )
+        mock_client_class.return_value = mock_client
+        self.service.initialize(dict(self.test_config, model_name='gpt-5-nano'))
+        
+        self.service.send_message_without_system_prompt("Title this")
+        assert mock_client.chat_completion.call_args.kwargs['max_tokens'] == 100
+        
+        self.service.send_message_without_system_prompt("Summarize this", max_tokens=1024)
+        assert mock_client.chat_completion.call_args.kwargs['max_tokens'] == 1024
+    
+    def test_growing_workers_keeps_fetched_executor_usable(self):
+        """An executor fetched before ensure_async_workers still accepts work."""
+        executor = self.service._get_async_executor()
+        
+        self.service.ensure_async_workers(6)
+        
+        assert executor.submit(lambda: 42).result(timeout=5) == 42
+        replacement = self.service._get_async_executor()
+        assert replacement is not executor
+        assert replacement._max_workers == 6
+    
+    @patch('specter.src.infrastructure.ai.ai_service.settings')
+    @patch('specter.src.infrastructure.ai.ai_service.OpenAICompatibleClient')
+    def test_core_memory_reserved_in_history_budget(self, mock_client_class, mock_settings):
+        """History sent alongside MemGPT core memory fits the context budget."""
+        mock_settings.get.side_effect = memgpt_settings
+        mock_client = Mock()
+        mock_client.chat_completion.return_value = APIResponse(
+            success=True, data={'choices': [{'message': {'content': 'ok'}}]}
+        )
+        mock_client_class.return_value = mock_client
+        self.service.initialize(self.test_config)
+        self.service.conversation.max_tokens = 1000
+        self.service.conversation.summary_max_tokens = 100
+        for i in range(10):
+            self.service.conversation.add_message('user' if i % 2 == 0 else 'assistant', f"turn {i} " + "word " * 80)
+        self.service._memgpt_orchestrator = FakeOrchestrator("core " * 400)
+        
+        result = self.service.send_message("Hello")
+        
+        assert result['success'] is True
+        sent = mock_client.chat_completion.call_args.kwargs['messages']
+        assert "core core" in sent[0]['content']
+        assert sum(count_tokens(m['content']) for m in sent) <= 1000
+        assert sent[-1] == {'role': 'user', 'content': 'Hello'}
+        # Eviction is judged on the request as sent, core memory included
+        assert self.service._memgpt_orchestrator.checked == [sent]
+    
     @patch('specter.src.infrastructure.ai.ai_service.OpenAICompatibleClient')
     def test_send_message_api_error(self, mock_client_class):
         """Test message sending with API error."""
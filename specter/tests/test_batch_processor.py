@@ -0,0 +1,91 @@
+"""
+Tests for Document Studio batch formatting.
+
+Covers planned output paths, parallel formatting in worker processes with
+per-file signals, and cancellation.
+"""
+
+import sys
+
+# Add project root to path for imports
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from specter.src.presentation.widgets.document_studio.batch_processor import (
+    BatchWorker,
+    plan_output_paths,
+)
+from specter.src.presentation.widgets.document_studio.studio_state import Recipe
+
+
+def make_docx(path, text="hELLO wORLD"):
+    doc = docx.Document()
+    doc.add_paragraph(text)
+    doc.save(str(path))
+    return str(path)
+
+
+def make_recipe():
+    return Recipe(recipe_id="test", name="Test", description="",
+                  operations=["standardize_fonts", "fix_case"])
+
+
+class RecordingWorker:
+    """Collects a BatchWorker's signals."""
+
+    def __init__(self, worker):
+        self.events = []
+        worker.file_started.connect(lambda f: self.events.append(("started", f)))
+        worker.file_completed.connect(
+            lambda f, ok, msg, out: self.events.append(("completed", f, ok, out)))
+        worker.batch_finished.connect(lambda ok, total: self.events.append(("finished", ok, total)))
+
+
+class TestBatchProcessor:
+    """Test cases for BatchWorker."""
+
+    def test_output_paths_are_unique_and_ordered(self, tmp_path):
+        paths = plan_output_paths(
+            ["/a/report.docx", "/b/report.docx", "/a/notes.docx", "/c/REPORT.docx"],
+            str(tmp_path),
+        )
+        assert [os.path.basename(p) for p in paths] == [
+            "report_formatted.docx",
+            "report_formatted_2.docx",
+            "notes_formatted.docx",
+            "REPORT_formatted_3.docx",
+        ]
+
+    def test_parallel_batch_formats_every_file(self, qtbot, tmp_path):
+        inputs = [make_docx(tmp_path / f"doc{i}.docx") for i in range(3)]
+        inputs.append(str(tmp_path / "missing.docx"))
+        out_dir = tmp_path / "out"
+
+        worker = BatchWorker(inputs, make_recipe(), output_directory=str(out_dir), max_workers=2)
+        recorder = RecordingWorker(worker)
+        worker.run()
+
+        completed = {e[1]: e for e in recorder.events if e[0] == "completed"}
+        assert len([e for e in recorder.events if e[0] == "started"]) == 4
+        assert recorder.events[-1] == ("finished", 3, 4)
+        assert completed[inputs[3]][2] is False
+
+        for i in range(3):
+            expected = str(out_dir / f"doc{i}_formatted.docx")
+            assert completed[inputs[i]][2:] == (True, expected)
+            assert docx.Document(expected).paragraphs[0].text == "hello world"
+
+    def test_cancel_stops_before_next_file(self, qtbot, tmp_path):
+        inputs = [make_docx(tmp_path / f"doc{i}.docx") for i in range(3)]
+        worker = BatchWorker(inputs, make_recipe(), output_directory=str(tmp_path / "out"), max_workers=1)
+        recorder = RecordingWorker(worker)
+        worker.file_completed.connect(lambda *args: worker.cancel())
+        worker.run()
+
+        assert [e[0] for e in recorder.events] == ["started", "completed", "finished"]
+        assert recorder.events[-1] == ("finished", 1, 3)
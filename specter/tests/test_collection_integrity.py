@@ -0,0 +1,171 @@
+"""
+Tests for collection file integrity fingerprints.
+
+Covers existing databases gaining newer model columns and indexes on
+startup and tag-based collections skipping re-hashing of files that are unchanged
+since their fingerprint was saved.
+"""
+
+import asyncio
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from specter.src.application.services.collection_service import CollectionService
+from specter.src.infrastructure.conversation_management.models.database_models import (
+    Base,
+    ConversationFileModel,
+    ConversationModel,
+)
+from specter.src.infrastructure.conversation_management.repositories.database import DatabaseManager
+from specter.src.infrastructure.storage.collection_storage import collection_storage_service
+
+
+class FileDatabase:
+    """Minimal DatabaseManager stand-in backed by a temporary SQLite file."""
+
+    is_initialized = True
+
+    def __init__(self, path):
+        self.engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(self.engine)
+        self._sessions = sessionmaker(bind=self.engine)
+
+    @contextmanager
+    def get_session(self):
+        session = self._sessions()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+
+@pytest.fixture
+def fresh_manager():
+    """Construct DatabaseManager outside the process-wide singleton."""
+    previous = DatabaseManager._instance
+    DatabaseManager._instance = None
+    try:
+        yield DatabaseManager
+    finally:
+        if DatabaseManager._instance is not None and DatabaseManager._instance is not previous:
+            DatabaseManager._instance.close_all_connections()
+        DatabaseManager._instance = previous
+
+
+def add_file(db, row_id, path, checksum=None, fingerprint=None):
+    fingerprint = fingerprint or {}
+    with db.get_session() as session:
+        session.add(ConversationFileModel(
+            id=row_id, conversation_id="lib", file_id=f"file_{row_id}",
+            filename=path.name, file_path=str(path), file_size=path.stat().st_size,
+            file_type="txt", upload_timestamp=datetime(2024, 1, 1),
+            processing_status="completed", collection_tag="docs", checksum=checksum,
+            mtime_ns=fingerprint.get("mtime_ns"), inode=fingerprint.get("inode"),
+        ))
+
+
+@pytest.fixture
+def library(tmp_path):
+    db = FileDatabase(tmp_path / "conversations.db")
+    with db.get_session() as session:
+        session.add(ConversationModel(id="lib", title="Collections Library", status="active",
+                                      created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1)))
+    return db
+
+
+def hashed_count(service, tag):
+    results = []
+    valid, errors = asyncio.run(service.verify_tag_integrity(
+        tag, progress_callback=lambda done, total, result: results.append(result)))
+    return valid, errors, len([r for r in results if r.hashed])
+
+
+class TestSchemaUpgrade:
+    """Existing databases get model columns and indexes added after they were created."""
+
+    def test_initialize_adds_fingerprint_columns(self, tmp_path, fresh_manager):
+        path = tmp_path / "old.db"
+        Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+        with sqlite3.connect(path) as conn:
+            for column in ("checksum", "mtime_ns", "inode"):
+                conn.execute(f"ALTER TABLE conversation_files DROP COLUMN {column}")
+
+        manager = fresh_manager(path)
+        assert manager.initialize()
+
+        with sqlite3.connect(path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(conversation_files)")}
+        assert {"checksum", "mtime_ns", "inode"} <= columns
+
+
+    def test_initialize_creates_keyset_indexes(self, tmp_path, fresh_manager):
+        path = tmp_path / "old.db"
+        Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+        keyset_indexes = {"idx_conversations_updated_id", "idx_conversations_created_id",
+                          "idx_conversations_title_id", "idx_conversations_message_count_id"}
+        with sqlite3.connect(path) as conn:
+            for name in keyset_indexes:
+                conn.execute(f"DROP INDEX {name}")
+
+        manager = fresh_manager(path)
+        assert manager.initialize()
+
+        with sqlite3.connect(path) as conn:
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(conversations)")}
+            plan = " ".join(str(row[-1]) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM conversations "
+                "ORDER BY message_count DESC, id DESC LIMIT 200"))
+        assert keyset_indexes <= indexes
+        assert "idx_conversations_message_count_id" in plan and "TEMP B-TREE" not in plan
+
+
+class TestTagIntegrity:
+    """Test cases for CollectionService.verify_tag_integrity."""
+
+    def test_saved_fingerprints_skip_hashing(self, library, tmp_path):
+        tracked = tmp_path / "tracked.txt"
+        legacy = tmp_path / "legacy.txt"
+        tracked.write_text("tracked content")
+        legacy.write_text("uploaded before checksums")
+        checksum = collection_storage_service.calculate_file_checksum(str(tracked))
+        add_file(library, "a", tracked, checksum)  # Checksum but no fingerprint yet
+        add_file(library, "b", legacy)
+        service = CollectionService(library)
+
+        valid, errors, hashed = hashed_count(service, "docs")
+        assert valid and not errors
+
+        files = {f["id"]: f for f in asyncio.run(service.get_files_by_tag("docs"))}
+        assert files["b"]["checksum"] == collection_storage_service.calculate_file_checksum(str(legacy))
+        assert all(f["mtime_ns"] and f["inode"] for f in files.values())
+
+        # Only the saved fingerprints are left to skip re-hashing
+        collection_storage_service._fingerprints.clear()
+        valid, errors, hashed = hashed_count(service, "docs")
+        assert valid and hashed == 0
+
+    def test_modified_file_reported(self, library, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("original")
+        checksum = collection_storage_service.calculate_file_checksum(str(path))
+        add_file(library, "a", path, checksum, collection_storage_service.recorded_fingerprint(str(path)))
+        path.write_text("changed, and longer")
+
+        valid, errors = asyncio.run(CollectionService(library).verify_tag_integrity("docs"))
+
+        assert not valid
+        assert errors == ["notes.txt: File has been modified"]
@@ -0,0 +1,116 @@
+"""
+Tests for reusing embeddings when collection files are uploaded.
+
+Covers identical content in another collection being copied from stored
+vectors, re-uploads into the same collection, and chunking changes
+forcing a fresh embedding.
+"""
+
+import logging
+import tempfile
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.rag_pipeline.config.rag_config import (
+    RAGPipelineConfig,
+    TextProcessingConfig,
+    TextSplitterType,
+    VectorStoreConfig,
+)
+from specter.src.infrastructure.rag_pipeline.text_processing.text_splitter import TextSplitterFactory
+from specter.src.infrastructure.rag_pipeline.threading.simple_faiss_session import SimpleFAISSSession
+from specter.src.infrastructure.rag_pipeline.vector_store import faiss_client as faiss_module
+
+
+class CountingEmbeddings:
+    """Returns random vectors and counts the texts embedded."""
+
+    def __init__(self, dimension):
+        self.dimension = dimension
+        self.texts = 0
+
+    def create_batch_embeddings(self, texts):
+        self.texts += len(texts)
+        return [np.random.rand(self.dimension).astype(np.float32) + 0.5 for _ in texts]
+
+
+def make_session(client, chunk_size=400):
+    """SimpleFAISSSession over a shared FAISS client, without API setup."""
+    session = SimpleFAISSSession.__new__(SimpleFAISSSession)
+    session.config = RAGPipelineConfig()
+    session.config.text_processing = TextProcessingConfig(
+        splitter_type=TextSplitterType.SENTENCE, chunk_size=chunk_size, chunk_overlap=40
+    )
+    session.logger = logging.getLogger("test.collection_reuse")
+    session.faiss_client = client
+    session.embedding_service = CountingEmbeddings(client._dimension)
+    session.text_splitter = TextSplitterFactory.create_splitter(session.config.text_processing)
+    session._is_ready = True
+    return session
+
+
+@pytest.fixture
+def client():
+    return faiss_module.FaissClient(VectorStoreConfig(persist_directory=tempfile.mkdtemp()))
+
+
+@pytest.fixture
+def notes(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("\n\n".join(f"Paragraph {i} about collections and reuse." * 8 for i in range(12)))
+    return path
+
+
+def stored_documents(client, document_id):
+    return [meta for _, _, meta in client._documents if meta.get("document_id") == document_id]
+
+
+@pytest.mark.skipif(not faiss_module.FAISS_AVAILABLE, reason="faiss not installed")
+class TestCollectionUploadReuse:
+    """Test cases for SimpleFAISSSession checksum reuse."""
+
+    def test_other_collection_copies_stored_vectors(self, client, notes, tmp_path):
+        session = make_session(client)
+        first = session.ingest_document(notes, {"conversation_id": "lib", "collection_tag": "a"})
+        embedded = session.embedding_service.texts
+        assert first and embedded > 0
+
+        copy = tmp_path / "copy.txt"
+        copy.write_bytes(notes.read_bytes())
+        second = session.ingest_document(copy, {"conversation_id": "lib", "collection_tag": "b"})
+
+        assert second and second != first
+        assert session.embedding_service.texts == embedded
+        copied = stored_documents(client, second)
+        assert len(copied) == len(stored_documents(client, first))
+        assert {meta["collection_tag"] for meta in copied} == {"b"}
+        assert {meta["filename"] for meta in copied} == {"copy.txt"}
+
+    def test_same_collection_returns_existing_document(self, client, notes):
+        session = make_session(client)
+        first = session.ingest_document(notes, {"conversation_id": "lib", "collection_tag": "a"})
+        chunks = client._index.ntotal
+
+        again = session.ingest_document(notes, {"conversation_id": "lib", "collection_tag": "a"})
+
+        assert again == first
+        assert client._index.ntotal == chunks
+
+    def test_changed_chunking_embeds_again(self, client, notes):
+        make_session(client, chunk_size=400).ingest_document(notes, {"collection_tag": "a"})
+
+        session = make_session(client, chunk_size=250)
+        document_id = session.ingest_document(notes, {"collection_tag": "b"})
+
+        assert document_id
+        assert session.embedding_service.texts > 0
+        assert {meta["chunk_config"] for meta in stored_documents(client, document_id)} == {
+            session.config.text_processing.chunking_key()
+        }
@@ -0,0 +1,139 @@
+"""
+Tests for SQL-side conversation search.
+
+Covers plain, case-sensitive and regex matching, match spans and snippets,
+per-conversation grouping and ordering, and cancellation.
+"""
+
+import re
+import sqlite3
+import threading
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.conversation_management.repositories.search_engine import (
+    ConversationSearchEngine,
+    sqlite_regexp,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "conversations.db"
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE conversations (id TEXT PRIMARY KEY, title TEXT, status TEXT, updated_at TEXT);
+        CREATE TABLE messages (id TEXT PRIMARY KEY, conversation_id TEXT, content TEXT, timestamp TEXT);
+    """)
+    connection.executemany("INSERT INTO conversations VALUES (?, ?, ?, ?)", [
+        ("c1", "Python tips", "active", "2024-01-03"),
+        ("c2", "Shopping list", "active", "2024-01-02"),
+        ("c3", "Old python notes", "deleted", "2024-01-01"),
+    ])
+    connection.executemany("INSERT INTO messages VALUES (?, ?, ?, ?)", [
+        ("m1", "c1", "Use def main(): to start, then def helper(x):", "2024-01-03T10:00"),
+        ("m2", "c1", "PYTHON is case insensitive here", "2024-01-03T10:01"),
+        ("m3", "c2", "Milk, eggs and 100% juice", "2024-01-02T09:00"),
+        ("m4", "c2", "Ask about python_snake toys", "2024-01-02T09:05"),
+        ("m5", "c3", "python 2 is gone", "2024-01-01T08:00"),
+    ])
+    connection.commit()
+    connection.close()
+    return path
+
+
+class TestConversationSearchEngine:
+    """Test cases for ConversationSearchEngine."""
+
+    def test_plain_search_groups_by_conversation(self, db_path):
+        results = list(ConversationSearchEngine(db_path).iter_results("python"))
+
+        assert [r.conversation_id for r in results] == ["c1", "c2"]
+        assert results[0].match_count == 2
+        assert results[0].matched_fields == ["title", "content"]
+        assert results[1].matched_fields == ["content"]
+        assert "python_snake" in results[1].snippet
+
+    def test_case_sensitive_search(self, db_path):
+        results = list(ConversationSearchEngine(db_path).iter_results("PYTHON", case_sensitive=True))
+        assert [r.conversation_id for r in results] == ["c1"]
+        assert results[0].match_count == 1
+
+    def test_like_wildcards_are_literal(self, db_path):
+        engine = ConversationSearchEngine(db_path)
+        assert [r.conversation_id for r in engine.iter_results("100%")] == ["c2"]
+        assert list(engine.iter_results("o_t")) == []  # "about" only matches as a wildcard
+
+    def test_regex_spans(self, db_path):
+        matches = list(ConversationSearchEngine(db_path).iter_matches(r"def \w+\(", regex=True))
+
+        assert len(matches) == 1
+        match = matches[0]
+        assert match.message_id == "m1"
+        assert [match.text[start:end] for start, end in match.spans] == ["def main(", "def helper("]
+
+    def test_deleted_conversations(self, db_path):
+        engine = ConversationSearchEngine(db_path)
+        assert "c3" not in [r.conversation_id for r in engine.iter_results("python")]
+        assert "c3" in [r.conversation_id for r in engine.iter_results("python", include_deleted=True)]
+
+    def test_limit(self, db_path):
+        results = list(ConversationSearchEngine(db_path).iter_results("python", limit=1))
+        assert [r.conversation_id for r in results] == ["c1"]
+
+    def test_cancelled_search_yields_nothing(self, db_path):
+        cancel = threading.Event()
+        cancel.set()
+        assert list(ConversationSearchEngine(db_path).iter_results("python", cancel=cancel)) == []
+
+    def test_no_full_sort_over_matches(self, tmp_path, monkeypatch):
+        sqlalchemy = pytest.importorskip("sqlalchemy")
+        from specter.src.infrastructure.conversation_management.models.database_models import Base
+
+        path = tmp_path / "schema.db"
+        Base.metadata.create_all(sqlalchemy.create_engine(f"sqlite:///{path}"))
+        setup = sqlite3.connect(path)
+        setup.execute("INSERT INTO conversations (id, title, status, created_at, updated_at) "
+                      "VALUES ('c1', 'Python', 'active', '2024-01-01', '2024-01-01')")
+        setup.execute("INSERT INTO messages (id, conversation_id, role, content, timestamp) "
+                      "VALUES ('m1', 'c1', 'user', 'python here', '2024-01-01')")
+        setup.commit()
+        setup.close()
+
+        engine = ConversationSearchEngine(path)
+        statements = []
+        connect = engine._connect
+
+        def tracing_connect(cancel):
+            connection = connect(cancel)
+            connection.set_trace_callback(statements.append)
+            return connection
+
+        monkeypatch.setattr(engine, "_connect", tracing_connect)
+        list(engine.iter_results("python"))
+
+        plan_connection = sqlite3.connect(path)
+        plans = [row[3] for sql in statements
+                 for row in plan_connection.execute("EXPLAIN QUERY PLAN " + sql)]
+        plan_connection.close()
+        assert len(statements) == 2
+        assert not any("TEMP B-TREE" in step for step in plans)
+
+    def test_invalid_regex(self, db_path):
+        with pytest.raises(re.error):
+            list(ConversationSearchEngine(db_path).iter_results("def (", regex=True))
+
+
+class TestSqliteRegexp:
+    """Test cases for the REGEXP function."""
+
+    def test_null_and_invalid_patterns(self):
+        assert sqlite_regexp(r"a+", "caat") is True
+        assert sqlite_regexp(r"a+", None) is False
+        assert sqlite_regexp("(", "text") is False
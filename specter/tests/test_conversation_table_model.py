@@ -0,0 +1,132 @@
+"""
+Tests for the conversation browser's table model.
+
+Covers keyset paging through fetchMore, database-side sort reloads, lazy
+badges, checked rows and result (search) mode.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from PyQt6.QtCore import QModelIndex, Qt
+
+from specter.src.infrastructure.conversation_management.models.conversation import Conversation
+from specter.src.infrastructure.conversation_management.models.enums import ConversationStatus, SortOrder
+from specter.src.presentation.dialogs.conversation_table_model import ConversationTableModel
+
+
+def make_conversations(count):
+    base = datetime(2024, 1, 1)
+    return [
+        Conversation(id=f"c{i:04d}", title=f"Conversation {i}", status=ConversationStatus.ACTIVE,
+                     created_at=base, updated_at=base + timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+
+class FakeRepository:
+    """Keyset pages over an in-memory list, recording each request."""
+
+    def __init__(self, conversations):
+        self.conversations = conversations
+        self.requests = []
+
+    def fetch_page(self, sort_order, cursor, limit):
+        self.requests.append((sort_order, cursor))
+        descending = sort_order.value.endswith("desc")
+        key = (lambda c: (c.title, c.id)) if sort_order.value.startswith("title") else (lambda c: (c.updated_at, c.id))
+        rows = sorted(self.conversations, key=key, reverse=descending)
+        if cursor is not None:
+            rows = [c for c in rows if (key(c) < cursor if descending else key(c) > cursor)]
+        page = rows[:limit]
+        next_cursor = key(page[-1]) if len(page) == limit else None
+        return page, next_cursor
+
+
+@pytest.fixture
+def repository():
+    return FakeRepository(make_conversations(450))
+
+
+@pytest.fixture
+def model(repository):
+    model = ConversationTableModel(repository.fetch_page)
+    model.reload()
+    return model
+
+
+class TestConversationTableModel:
+    """Test cases for ConversationTableModel."""
+
+    def test_pages_in_with_fetch_more(self, model, repository):
+        assert model.rowCount() == ConversationTableModel.PAGE_SIZE
+        assert model.canFetchMore(QModelIndex())
+
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+
+        ids = [c.id for c in model.conversations()]
+        assert len(ids) == len(set(ids)) == 450
+        assert ids[0] == "c0449"  # Most recently updated first
+        assert len(repository.requests) == 3
+        assert repository.requests[1][1] is not None
+
+    def test_sort_reloads_from_database(self, model, repository):
+        model.sort(ConversationTableModel.TITLE_COLUMN, Qt.SortOrder.AscendingOrder)
+
+        assert repository.requests[-1] == (SortOrder.TITLE_ASC, None)
+        assert model.rowCount() == ConversationTableModel.PAGE_SIZE
+        assert model.data(model.index(0, ConversationTableModel.TITLE_COLUMN)) == "Conversation 0"
+
+    def test_unsortable_column_is_ignored(self, model, repository):
+        model.sort(ConversationTableModel.FILES_COLUMN, Qt.SortOrder.AscendingOrder)
+        assert len(repository.requests) == 1
+
+    def test_badges_load_lazily(self, model):
+        files_index = model.index(0, ConversationTableModel.FILES_COLUMN)
+        assert model.data(files_index) == ""
+        assert model.ids_missing_badges(0, 2) == ["c0449", "c0448", "c0447"]
+
+        model.set_badges(["c0449", "c0448"], {"c0449": [{"filename": "notes.md"}]}, {"c0449": ["docs"]})
+
+        assert model.data(files_index) == "notes.md"
+        assert model.data(model.index(0, ConversationTableModel.COLLECTIONS_COLUMN)) == "docs"
+        assert model.data(model.index(1, ConversationTableModel.FILES_COLUMN)) == "—"
+        assert model.ids_missing_badges(0, 2) == ["c0447"]
+
+    def test_checked_rows(self, model):
+        changes = []
+        model.check_state_changed.connect(lambda: changes.append(True))
+
+        model.setData(model.index(1, 0), Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole)
+        assert [c.id for c in model.checked_conversations()] == ["c0448"]
+        assert model.data(model.index(1, 0), Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+        model.set_all_checked(True)
+        assert len(model.checked_conversations()) == model.rowCount()
+        model.set_all_checked(False)
+        assert not model.has_checked()
+        assert len(changes) == 3
+
+    def test_result_mode(self, model):
+        results = make_conversations(3)
+        model.set_conversations([])
+        model.append_conversations(results[:2])
+        model.append_conversations(results[1:])
+
+        assert not model.canFetchMore(QModelIndex())
+        assert [c.id for c in model.conversations()] == ["c0000", "c0001", "c0002"]
+
+        model.sort(ConversationTableModel.UPDATED_COLUMN, Qt.SortOrder.DescendingOrder)
+        assert [c.id for c in model.conversations()] == ["c0002", "c0001", "c0000"]
+        assert model.row_of("c0000") == 2
+
+        model.update_title("c0000", "Renamed")
+        assert model.data(model.index(2, ConversationTableModel.TITLE_COLUMN)) == "Renamed"
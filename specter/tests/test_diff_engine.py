@@ -0,0 +1,136 @@
+"""
+Tests for the Document Studio diff engine and virtualised diff view.
+
+Covers opcode correctness against random edits, the hunk index (row
+addressing, padding and change navigation), word-level diffs and
+rendering only the requested rows.
+"""
+
+import random
+import sys
+
+# Add project root to path for imports
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.presentation.widgets.document_studio.diff_engine import (
+    DiffIndex,
+    diff_opcodes,
+    word_diff,
+)
+from specter.src.presentation.widgets.document_studio.diff_view import DiffView, _build_rows_html
+
+
+def apply_opcodes(a, b, opcodes):
+    """Rebuild ``b`` from ``a`` and the opcodes, checking they are contiguous."""
+    i = j = 0
+    rebuilt = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        rebuilt.extend(b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return rebuilt
+
+
+class TestDiffOpcodes:
+    """Test cases for diff_opcodes."""
+
+    def test_random_edits_round_trip(self):
+        rnd = random.Random(7)
+        for _ in range(500):
+            a = [rnd.choice("abcde") for _ in range(rnd.randint(0, 25))]
+            b = list(a)
+            for _ in range(rnd.randint(0, 6)):
+                pos = rnd.randint(0, len(b))
+                if rnd.random() < 0.5 and b:
+                    del b[min(pos, len(b) - 1)]
+                else:
+                    b.insert(pos, rnd.choice("abcdef"))
+            for max_cost in (400, 1):
+                assert apply_opcodes(a, b, diff_opcodes(a, b, max_cost)) == b
+
+    def test_minimal_edit_around_unique_lines(self):
+        a = ["title", "one", "two", "three", "end"]
+        b = ["title", "one", "2", "three", "added", "end"]
+        assert diff_opcodes(a, b) == [
+            ("equal", 0, 2, 0, 2),
+            ("replace", 2, 3, 2, 3),
+            ("equal", 3, 4, 3, 4),
+            ("insert", 4, 4, 4, 5),
+            ("equal", 4, 5, 5, 6),
+        ]
+
+
+class TestDiffIndex:
+    """Test cases for DiffIndex."""
+
+    def setup_method(self):
+        original = [f"line {i}" for i in range(10)]
+        formatted = list(original)
+        formatted[2:4] = ["changed 2"]            # replace 2 lines with 1
+        formatted.insert(7, "inserted")           # after original line 7
+        self.index = DiffIndex(original, formatted)
+
+    def test_rows_pad_the_shorter_side(self):
+        rows = list(self.index.rows(0, self.index.row_count))
+        assert len(rows) == self.index.row_count == 11
+        assert [(r.tag, r.left, r.right) for r in rows[2:4]] == [
+            ("replace", 2, 2), ("replace", 3, None)
+        ]
+        assert [(r.tag, r.left, r.right) for r in self.index.rows(8, 1)] == [("insert", None, 7)]
+
+    def test_change_navigation(self):
+        assert self.index.change_count == 2
+        assert self.index.next_change(0) == 2
+        assert self.index.next_change(2) == 8
+        assert self.index.next_change(8) is None
+        assert self.index.previous_change(8) == 2
+        assert self.index.change_number(9) == 2
+
+    def test_word_diff_marks_changed_words(self):
+        old, new = word_diff("The DRAFT numbers", "The Final numbers")
+        assert old == (("The ", False), ("DRAFT", True), (" numbers", False))
+        assert new == (("The ", False), ("Final", True), (" numbers", False))
+
+    def test_renders_only_requested_rows(self):
+        left, right = _build_rows_html(self.index, 2, 2)
+        assert left.count("<p") == right.count("<p") == 2
+        assert "line 3" in left and "changed" in right
+        assert "line 0" not in left and "line 4" not in left
+
+
+class TestDiffView:
+    """Test cases for the DiffView widget."""
+
+    def test_jump_between_changes(self, qtbot, monkeypatch):
+        original = [f"paragraph {i}" for i in range(500)]
+        formatted = list(original)
+        formatted[100] = "PARAGRAPH 100"
+        formatted[400] = "PARAGRAPH 400"
+        lines = {"a.docx": original, "b.docx": formatted}
+        monkeypatch.setattr(
+            "specter.src.presentation.widgets.document_studio.diff_view._extract_text_lines",
+            lines.__getitem__,
+        )
+
+        view = DiffView()
+        qtbot.addWidget(view)
+        view.resize(800, 400)
+        view.load_diff("a.docx", "b.docx")
+
+        assert view._change_label.text() == "Change 1 of 2"
+        assert view._left_browser.toPlainText().startswith("paragraph 0")
+        assert "paragraph 499" not in view._left_browser.toPlainText()
+
+        view.next_change()
+        view.next_change()
+        qtbot.waitUntil(lambda: "PARAGRAPH 400" in view._right_browser.toPlainText())
+        assert view._change_label.text() == "Change 2 of 2"
+
+        view.previous_change()
+        qtbot.waitUntil(lambda: "PARAGRAPH 100" in view._right_browser.toPlainText())
+        assert view._change_label.text() == "Change 1 of 2"
@@ -0,0 +1,106 @@
+"""
+Tests for the DOCX formatter's single-pass operation pipeline.
+
+Covers several operations applied in one pass, the paragraph list being read
+once, and a failing operation not stopping the others.
+"""
+
+import asyncio
+import sys
+
+# Add project root to path for imports
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+import pytest
+
+docx = pytest.importorskip("docx")
+from docx.shared import Inches, Pt
+
+from specter.src.infrastructure.skills.skills_library.docx_formatter_skill import (
+    DocxFormatterSkill,
+    FormattingPipeline,
+)
+
+
+def build_document(path):
+    doc = docx.Document()
+    doc.add_heading("Quarterly REPORT", level=1)
+    doc.add_paragraph("The DRAFT numbers are below.")
+    doc.add_paragraph("First item", style="List Bullet 2")
+    doc.add_paragraph("")
+    doc.save(str(path))
+
+
+class TestFormattingPipeline:
+    """Test cases for single-pass DOCX formatting."""
+
+    def test_operations_applied_in_one_pass(self, tmp_path):
+        path = tmp_path / "report.docx"
+        build_document(path)
+
+        result = asyncio.run(DocxFormatterSkill().execute(
+            file_path=str(path),
+            operations=["standardize_fonts", "normalize_spacing", "fix_bullets", "fix_case",
+                        "normalize_headings", "find_replace", "set_alignment", "set_indent"],
+            font_name="Arial",
+            font_size=10,
+            find_text="Draft",
+            replace_text="Final",
+            alignment="center",
+            target_scope="headings",
+            indent_inches=0.25,
+            _session_mode=True,
+        ))
+
+        assert result.success, result.error
+        changes = result.data["changes"]
+        assert list(changes) == ["standardize_fonts", "normalize_spacing", "fix_bullets", "fix_case",
+                                 "normalize_headings", "find_replace", "set_alignment", "set_indent"]
+        assert changes["fix_case"] == 2  # REPORT, DRAFT
+        assert changes["find_replace"] == 1  # Sees fix_case's output
+        assert changes["set_indent"] == 1
+
+        heading, body, bullet, empty = docx.Document(str(path)).paragraphs
+        assert heading.text == "Quarterly Report"
+        assert heading.runs[0].font.size == Pt(16)  # Headings applied after fonts
+        assert heading.alignment is not None
+        assert body.text == "The Final numbers are below."
+        assert body.runs[0].font.name == "Arial"
+        assert body.paragraph_format.first_line_indent == Inches(0.25)
+        assert bullet.paragraph_format.left_indent == Inches(1.0)
+        assert empty.paragraph_format.first_line_indent is None
+
+    def test_paragraph_list_read_once(self):
+        reads = []
+
+        class FakeDoc:
+            @property
+            def paragraphs(self):
+                reads.append(True)
+                return ["a", "b", "c"]
+
+        pipeline = FormattingPipeline()
+        pipeline.add("first", lambda ctx: 1)
+        pipeline.add("second", lambda ctx: 2)
+
+        assert pipeline.run(FakeDoc()) == {"first": 3, "second": 6}
+        assert len(reads) == 1
+
+    def test_failing_operation_is_dropped(self):
+        calls = []
+
+        def broken(ctx):
+            calls.append(ctx.paragraph)
+            raise ValueError("bad run")
+
+        class FakeDoc:
+            paragraphs = ["a", "b"]
+
+        pipeline = FormattingPipeline()
+        pipeline.add("broken", broken)
+        pipeline.add("count", lambda ctx: 1)
+
+        assert pipeline.run(FakeDoc()) == {"broken": "error: bad run", "count": 2}
+        assert calls == ["a"]
@@ -0,0 +1,120 @@
+"""
+Tests for the RAG embedding scheduler.
+
+Covers cross-document batching, executor offloading, per-request
+progress reporting, and the token-rate limiter.
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.rag_pipeline.services.embedding_scheduler import (
+    EmbeddingBatcher,
+    TokenRateLimiter,
+)
+
+
+class FakeEmbeddingService:
+    """Blocking embedding service that records the batches it receives."""
+
+    def __init__(self, delay=0.05, fail_texts=()):
+        self.delay = delay
+        self.fail_texts = set(fail_texts)
+        self.batches = []
+        self.threads = set()
+
+    def create_batch_embeddings(self, texts, model=None, batch_size=20):
+        self.batches.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [
+            None if text in self.fail_texts else np.full(3, len(text), dtype=np.float32)
+            for text in texts
+        ]
+
+
+class TestEmbeddingBatcher:
+    """Test cases for EmbeddingBatcher."""
+
+    def test_batches_across_concurrent_callers(self):
+        """Texts from concurrent documents share batches."""
+        service = FakeEmbeddingService()
+        batcher = EmbeddingBatcher(service, batch_size=8, max_concurrent_requests=2)
+
+        async def run():
+            docs = [[f"doc{d}-{i}" for i in range(3)] for d in range(4)]
+            return docs, await asyncio.gather(*(batcher.embed(doc) for doc in docs))
+
+        docs, results = asyncio.run(run())
+
+        assert sorted(len(batch) for batch in service.batches) == [4, 8]
+        for doc, embeddings in zip(docs, results):
+            assert [int(e[0]) for e in embeddings] == [len(text) for text in doc]
+        assert all(name.startswith("Embedding") for name in service.threads)
+
+    def test_event_loop_not_blocked(self):
+        """Blocking embedding calls run off the event loop."""
+        service = FakeEmbeddingService(delay=0.2)
+        batcher = EmbeddingBatcher(service, batch_size=4)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        async def run():
+            task = asyncio.create_task(ticker())
+            await batcher.embed(["a", "b", "c"])
+            task.cancel()
+
+        asyncio.run(run())
+        assert ticks >= 10
+
+    def test_progress_and_failures(self):
+        """Progress is reported per request and failures come back as None."""
+        service = FakeEmbeddingService(fail_texts={"bad"})
+        batcher = EmbeddingBatcher(service, batch_size=2)
+        progress = []
+
+        results = asyncio.run(
+            batcher.embed(["ok", "bad", "fine"], lambda done, total: progress.append((done, total)))
+        )
+
+        assert results[1] is None
+        assert results[0] is not None and results[2] is not None
+        assert progress[-1] == (3, 3)
+        assert [done for done, _ in progress] == [1, 2, 3]
+        assert batcher.get_stats()['texts_embedded'] == 2
+
+
+class TestTokenRateLimiter:
+    """Test cases for TokenRateLimiter."""
+
+    def test_unlimited_by_default(self):
+        limiter = TokenRateLimiter(0)
+        start = time.monotonic()
+        asyncio.run(limiter.acquire(10_000_000))
+        assert time.monotonic() - start < 0.05
+
+    def test_waits_for_refill(self):
+        """Spending beyond the bucket waits for tokens to refill."""
+        limiter = TokenRateLimiter(tokens_per_minute=600)  # 10 tokens/second
+
+        async def run():
+            await limiter.acquire(600)
+            start = time.monotonic()
+            await limiter.acquire(2)
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.15
@@ -0,0 +1,101 @@
+"""
+Tests for EmbeddingService batch requests.
+
+Covers falling back to per-text requests only when the endpoint rejects
+list input, and leaving texts unembedded after network or server failures.
+"""
+
+import requests
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.rag_pipeline.services import embedding_service as embedding_module
+from specter.src.infrastructure.rag_pipeline.services.embedding_service import EmbeddingService
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+        self.text = ""
+
+    def json(self):
+        return self._data
+
+
+class FakeSessionManager:
+    """Answers embedding requests from a script keyed by input type."""
+
+    is_configured = True
+
+    def __init__(self, batch_status=200, single_status=200, batch_error=None):
+        self.batch_status = batch_status
+        self.single_status = single_status
+        self.batch_error = batch_error
+        self.requests = []
+
+    def make_request(self, method, url, json, headers, timeout):
+        inputs = json['input']
+        self.requests.append(inputs)
+        if isinstance(inputs, list):
+            if self.batch_error is not None:
+                raise self.batch_error
+            if self.batch_status != 200:
+                return FakeResponse(self.batch_status)
+            return FakeResponse(200, {'data': [
+                {'index': i, 'embedding': [float(len(text))]} for i, text in enumerate(inputs)
+            ]})
+        if self.single_status != 200:
+            return FakeResponse(self.single_status)
+        return FakeResponse(200, {'data': [{'embedding': [float(len(inputs))]}]})
+
+
+def make_service(monkeypatch, session_manager):
+    monkeypatch.setattr(embedding_module.time, "sleep", lambda seconds: None)
+    service = EmbeddingService("http://localhost/v1", rate_limit_delay=0)
+    service.session_manager = session_manager
+    return service
+
+
+class TestBatchEmbeddings:
+    """Test cases for EmbeddingService.create_batch_embeddings."""
+
+    def test_batch_request_per_batch(self, monkeypatch):
+        manager = FakeSessionManager()
+        service = make_service(monkeypatch, manager)
+
+        embeddings = service.create_batch_embeddings(["a", "bb", "ccc"], batch_size=2)
+
+        assert [float(e[0]) for e in embeddings] == [1.0, 2.0, 3.0]
+        assert manager.requests == [["a", "bb"], ["ccc"]]
+
+    def test_rejected_list_input_falls_back_per_text(self, monkeypatch):
+        manager = FakeSessionManager(batch_status=400)
+        service = make_service(monkeypatch, manager)
+
+        embeddings = service.create_batch_embeddings(["a", "bb", "ccc", "dddd"], batch_size=2)
+
+        assert [float(e[0]) for e in embeddings] == [1.0, 2.0, 3.0, 4.0]
+        # Only the first batch is tried as a list; later ones go straight per text
+        assert manager.requests == [["a", "bb"], "a", "bb", "ccc", "dddd"]
+
+    def test_network_failure_not_retried_per_text(self, monkeypatch):
+        manager = FakeSessionManager(batch_error=requests.exceptions.ConnectionError("down"))
+        service = make_service(monkeypatch, manager)
+
+        embeddings = service.create_batch_embeddings(["a", "bb"])
+
+        assert embeddings == [None, None]
+        assert all(isinstance(inputs, list) for inputs in manager.requests)
+
+    def test_server_and_auth_errors_not_retried_per_text(self, monkeypatch):
+        for status in (401, 429, 503):
+            manager = FakeSessionManager(batch_status=status)
+            service = make_service(monkeypatch, manager)
+
+            assert service.create_batch_embeddings(["a", "bb"]) == [None, None]
+            assert all(isinstance(inputs, list) for inputs in manager.requests)
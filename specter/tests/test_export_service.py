@@ -0,0 +1,206 @@
+"""
+Tests for streaming conversation exports.
+
+Covers batched repository reads, the streamed JSON document matching the
+previous json.dump layout, JSON Lines, compressed output, writing several
+formats in one pass, and memory staying flat as the export grows.
+"""
+
+import asyncio
+import gzip
+import json
+import tracemalloc
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from specter.src.infrastructure.conversation_management.models.conversation import (
+    Conversation,
+    ConversationMetadata,
+    Message,
+)
+from specter.src.infrastructure.conversation_management.models.database_models import (
+    Base,
+    ConversationModel,
+    MessageModel,
+)
+from specter.src.infrastructure.conversation_management.models.enums import (
+    ConversationStatus,
+    MessageRole,
+)
+from specter.src.infrastructure.conversation_management.repositories.conversation_repository import (
+    ConversationRepository,
+)
+from specter.src.infrastructure.conversation_management.services.export_service import ExportService
+from specter.src.infrastructure.conversation_management.services.export_writers import JsonExportWriter
+
+
+class FileDatabase:
+    """Minimal DatabaseManager stand-in backed by a temporary SQLite file."""
+
+    is_initialized = True
+
+    def __init__(self, path):
+        self.engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(self.engine)
+        self._sessions = sessionmaker(bind=self.engine)
+
+    @contextmanager
+    def get_session(self):
+        session = self._sessions()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+
+def populate(db, conversations, messages_per_conversation=3):
+    start = datetime(2024, 1, 1, 9, 0)
+    with db.get_session() as session:
+        for c in range(conversations):
+            conv_id = f"c{c:05d}"
+            conv = ConversationModel(id=conv_id, title=f"Chat {c}", status="active",
+                                     created_at=start, updated_at=start, message_count=messages_per_conversation)
+            conv.conversation_metadata = {"tags": ["demo"], "category": "tests"}
+            session.add(conv)
+            for m in range(messages_per_conversation):
+                session.add(MessageModel(
+                    id=f"{conv_id}-m{m}", conversation_id=conv_id,
+                    role="user" if m % 2 == 0 else "assistant",
+                    content=f"Message {m} of chat {c} **bold**",
+                    timestamp=start + timedelta(minutes=messages_per_conversation - m),
+                ))
+
+
+@pytest.fixture
+def repository(tmp_path):
+    db = FileDatabase(tmp_path / "conversations.db")
+    populate(db, 5)
+    return ConversationRepository(db_manager=db)
+
+
+class TestConversationExport:
+    """Test cases for ExportService streaming exports."""
+
+    def test_repository_streams_in_requested_order(self, repository):
+        conversations = list(repository.iter_conversations_with_messages(
+            ["c00003", "missing", "c00001", "c00004"], batch_size=2))
+
+        assert [c.id for c in conversations] == ["c00003", "c00001", "c00004"]
+        messages = conversations[0].messages
+        assert [m.content.split()[1] for m in messages] == ["2", "1", "0"]  # Timestamp order
+        assert all(m.conversation_id == "c00003" for m in messages)
+
+    def test_streamed_json_matches_document_layout(self, repository, tmp_path):
+        service = ExportService(repository, batch_size=2)
+        path = tmp_path / "export.json"
+        ids = ["c00002", "c00000", "nope"]
+
+        assert asyncio.run(service.export_conversations(ids, "json", str(path), include_metadata=False))
+
+        text = path.read_text(encoding="utf-8")
+        data = json.loads(text)
+        assert data["export_info"]["conversation_count"] == 2
+        assert [c["id"] for c in data["conversations"]] == ["c00002", "c00000"]
+        assert "metadata" not in data["conversations"][0]
+        assert "metadata" not in data["conversations"][0]["messages"][0]
+        assert text == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_empty_json_document_is_valid(self, tmp_path):
+        path = tmp_path / "empty.json"
+        with open(path, "w", encoding="utf-8") as stream:
+            writer = JsonExportWriter(stream)
+            writer.begin(0)
+            writer.end()
+        text = path.read_text(encoding="utf-8")
+        assert json.loads(text)["conversations"] == []
+        assert text == json.dumps(json.loads(text), indent=2)
+
+    def test_compressed_outputs(self, repository, tmp_path):
+        service = ExportService(repository)
+        ids = ["c00000", "c00001"]
+
+        assert asyncio.run(service.export_conversations(ids, "jsonl", str(tmp_path / "out.jsonl.gz")))
+        with gzip.open(tmp_path / "out.jsonl.gz", "rt", encoding="utf-8") as f:
+            assert [json.loads(line)["id"] for line in f] == ids
+
+        assert asyncio.run(service.export_conversations(ids, "md", str(tmp_path / "out.md"), compression="zip"))
+        with zipfile.ZipFile(tmp_path / "out.md") as archive:
+            (member,) = archive.namelist()
+            assert "## 2. Chat 1" in archive.read(member).decode("utf-8")
+
+    def test_several_formats_in_one_pass(self, repository, tmp_path, monkeypatch):
+        loads = []
+        original = repository.iter_conversations_with_messages
+
+        def counting(ids, **kwargs):
+            loads.append(list(ids))
+            return original(ids, **kwargs)
+
+        monkeypatch.setattr(repository, "iter_conversations_with_messages", counting)
+        service = ExportService(repository, batch_size=2)
+        ids = [f"c{i:05d}" for i in range(5)]
+        targets = {fmt: str(tmp_path / f"out.{fmt}") for fmt in ("json", "jsonl", "txt", "markdown", "html")}
+
+        results = asyncio.run(service.export_conversations_to_formats(ids, targets))
+
+        assert results == {fmt: True for fmt in targets}
+        assert loads == [ids]
+        assert len(json.loads((tmp_path / "out.json").read_text())["conversations"]) == 5
+        assert (tmp_path / "out.txt").read_text().count("CONVERSATION ") == 5
+        html = (tmp_path / "out.html").read_text()
+        assert html.count('class="conversation-separator"') == 4
+        assert html.rstrip().endswith("</html>")
+
+    def test_single_conversation_object_export(self, tmp_path):
+        conversation = Conversation(
+            id="solo", title="Solo <chat>", status=ConversationStatus.ACTIVE,
+            created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1),
+            metadata=ConversationMetadata(),
+        )
+        conversation.messages = [Message(id="m", conversation_id="solo", role=MessageRole.USER,
+                                          content="hi", timestamp=datetime(2024, 1, 1))]
+        path = tmp_path / "solo.html"
+        assert asyncio.run(ExportService().export_conversation(conversation, str(path), "html"))
+        assert "Solo &lt;chat&gt;" in path.read_text(encoding="utf-8")
+
+
+class TestExportMemory:
+    """Memory use must not grow with the number of conversations."""
+
+    @staticmethod
+    def peak_export_memory(tmp_path, conversations):
+        db = FileDatabase(tmp_path / f"db_{conversations}.db")
+        populate(db, conversations, messages_per_conversation=4)
+        service = ExportService(ConversationRepository(db_manager=db), batch_size=25)
+        ids = [f"c{i:05d}" for i in range(conversations)]
+        targets = {"jsonl": str(tmp_path / f"{conversations}.jsonl"),
+                   "txt": str(tmp_path / f"{conversations}.txt")}
+
+        tracemalloc.start()
+        try:
+            results = asyncio.run(service.export_conversations_to_formats(ids, targets))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert all(results.values())
+        return peak
+
+    def test_peak_memory_flat(self, tmp_path):
+        small = self.peak_export_memory(tmp_path, 200)
+        large = self.peak_export_memory(tmp_path, 1000)
+        # Only the id list grows with the export; batches are fixed size
+        assert large < small * 1.5
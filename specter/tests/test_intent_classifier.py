@@ -0,0 +1,174 @@
+"""
+Tests for the skill intent classifier.
+
+Covers the compiled pattern index, literal prefilter, match cache, and
+AI classification cache.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.skills.core.intent_classifier import (
+    IntentClassifier,
+    _LiteralAutomaton,
+    _pattern_literals,
+)
+
+
+class TestPatternLiterals:
+    """Test prefilter literal extraction from regex patterns."""
+
+    def test_plain_keyword(self):
+        """A bare keyword is its own required literal."""
+        assert _pattern_literals("screenshot") == frozenset({"screenshot"})
+
+    def test_alternation_unions_branches(self):
+        """A mandatory group contributes the literals of every branch."""
+        literals = _pattern_literals(r"(find|search|look\s+for)\s+(my\s+)?(email|message)")
+        assert literals == frozenset({"email", "message"})
+
+    def test_optional_parts_are_ignored(self):
+        """Optional suffixes don't become part of the required literal."""
+        assert _pattern_literals(r"show\s+(my\s+)?tasks") == frozenset({"tasks"})
+        assert "meeting" in _pattern_literals(r"(schedule|add)\s+(a\s+)?(meetings?|events?)")
+
+    def test_unprovable_pattern_returns_none(self):
+        """Patterns without mandatory literals must always be evaluated."""
+        assert _pattern_literals(r"\d+") is None
+        assert _pattern_literals(r"(?i)screenshot") is None
+
+
+class TestLiteralAutomaton:
+    """Test the Aho-Corasick literal scanner."""
+
+    def test_finds_overlapping_literals(self):
+        automaton = _LiteralAutomaton(["task", "tasks", "ask", "manager"])
+        assert automaton.find_all("show tasks") == {"task", "tasks", "ask"}
+        assert automaton.find_all("task manager") == {"task", "ask", "manager"}
+
+    def test_no_match(self):
+        automaton = _LiteralAutomaton(["email", "calendar"])
+        assert automaton.find_all("hello there") == set()
+
+
+class TestIntentClassifier:
+    """Test cases for pattern-based intent detection."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.classifier = IntentClassifier()
+
+    def test_default_pattern_match(self):
+        """Built-in skills are detected from their patterns."""
+        intent = asyncio.run(self.classifier.detect_intent("take a screenshot"))
+        assert intent is not None
+        assert intent.skill_id == "screen_capture"
+        assert intent.confidence >= 0.85
+
+    def test_extractors_run_only_for_matched_skills(self):
+        """Skills without a pattern hit are not scored from extractors alone."""
+        calls = []
+
+        def extractor(text):
+            calls.append(text)
+            return "value"
+
+        self.classifier.register_patterns("custom_skill", [r"frobnicate\s+widgets"], {"x": extractor})
+
+        assert self.classifier._pattern_match("hello there") is None
+        assert calls == []
+
+        intent = self.classifier._pattern_match("please frobnicate widgets")
+        assert intent.skill_id == "custom_skill"
+        assert intent.parameters == {"x": "value"}
+        assert calls == ["please frobnicate widgets"]
+
+    def test_results_cached_per_normalized_input(self):
+        """Repeated inputs are served from the match cache."""
+        first = self.classifier._pattern_match("show my tasks")
+        second = self.classifier._pattern_match("  show my tasks  ")
+
+        stats = self.classifier.get_statistics()["match_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert second.skill_id == first.skill_id
+        assert second.raw_input == "  show my tasks  "
+
+        # Mutating a returned intent must not leak into the cache
+        second.parameters["action"] = "mutated"
+        assert self.classifier._pattern_match("show my tasks").parameters["action"] == "show"
+
+    def test_registration_invalidates_cache(self):
+        """Registering or unregistering patterns clears cached results."""
+        assert self.classifier._pattern_match("launch rockets") is None
+
+        self.classifier.register_patterns("rockets", [r"launch\s+rockets?"])
+        intent = self.classifier._pattern_match("launch rockets")
+        assert intent is not None
+        assert intent.skill_id == "rockets"
+
+        self.classifier.unregister_patterns("rockets")
+        assert self.classifier._pattern_match("launch rockets") is None
+
+    def test_invalid_pattern_rejected_at_registration(self):
+        """Malformed regexes fail fast instead of on the next message."""
+        import re
+        with pytest.raises(re.error):
+            self.classifier.register_patterns("broken", [r"(unclosed"])
+
+    def test_confidence_scores_only_for_matches(self):
+        """Confidence scores are reported only for skills whose patterns matched."""
+        scores = self.classifier.get_confidence_scores("take a screenshot")
+        assert set(scores) == {"screen_capture"}
+        assert scores["screen_capture"] == 1.0
+
+
+class TestAIClassificationCache:
+    """Test memoization of AI fallback classifications."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.classifier = IntentClassifier(use_ai_fallback=True)
+        self.settings_values = {
+            'advanced.enable_ai_intent_classification': True,
+            'advanced.ai_intent_cache_ttl_seconds': 300,
+        }
+
+    def _classify(self, text):
+        from specter.src.infrastructure.storage.settings_manager import settings
+        ai_service = Mock(is_initialized=True)
+        response = '{"skill_id": "file_search", "confidence": 0.95, "reasoning": "files", "parameters": {}}'
+
+        with patch.object(settings, 'get', side_effect=lambda k, d=None: self.settings_values.get(k, d)), \
+             patch('specter.src.infrastructure.ai.ai_service.ai_service', ai_service, create=True), \
+             patch.object(self.classifier, '_call_ai_service', AsyncMock(return_value=response)) as call:
+            intent = asyncio.run(self.classifier._ai_classify(text))
+        return intent, call.await_count
+
+    def test_equivalent_inputs_reuse_classification(self):
+        """Case/punctuation variants hit the cache instead of the AI."""
+        intent, calls = self._classify("Could you dig up the Q3 report?")
+        assert intent.skill_id == "file_search"
+        assert calls == 1
+
+        intent, calls = self._classify("could you dig up the q3 report")
+        assert intent.skill_id == "file_search"
+        assert calls == 0
+
+    def test_expired_entries_are_refreshed(self):
+        """Entries older than the TTL trigger a new AI round-trip."""
+        self._classify("dig up the report")
+        self.settings_values['advanced.ai_intent_cache_ttl_seconds'] = 0
+
+        with patch('specter.src.infrastructure.skills.core.intent_classifier.time.monotonic',
+                   return_value=time.monotonic() + 1):
+            _, calls = self._classify("dig up the report")
+        assert calls == 1
@@ -0,0 +1,136 @@
+"""
+Tests for the BM25 lexical index and hybrid retrieval.
+
+Covers identifier-aware tokenization, BM25 ranking, reciprocal rank
+fusion, and FaissClient lexical/hybrid search over stored chunks.
+"""
+
+import asyncio
+import tempfile
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.rag_pipeline.config.rag_config import VectorStoreConfig
+from specter.src.infrastructure.rag_pipeline.document_loaders.base_loader import Document, DocumentMetadata
+from specter.src.infrastructure.rag_pipeline.text_processing.text_splitter import TextChunk
+from specter.src.infrastructure.rag_pipeline.vector_store import faiss_client as faiss_module
+from specter.src.infrastructure.rag_pipeline.vector_store.lexical_index import (
+    BM25Index,
+    identifier_terms,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+class TestTokenize:
+    """Test identifier-aware tokenization."""
+
+    def test_compound_identifiers_kept_whole_and_split(self):
+        tokens = tokenize("Call parseHttpError on ERR-4012 in config.load_file")
+        assert "parsehttperror" in tokens
+        assert {"parse", "http", "error"} <= set(tokens)
+        assert "err-4012" in tokens
+        assert "config.load_file" in tokens
+        assert {"config", "load", "file"} <= set(tokens)
+
+    def test_identifier_terms(self):
+        assert identifier_terms("what does ERR-4012 mean") == ["err-4012"]
+        assert identifier_terms('where is "retry budget" set') == ["retry", "budget"]
+        assert identifier_terms("how do I reset my password") == []
+
+    def test_numbers_and_hyphenated_words_are_prose(self):
+        assert identifier_terms("what changed in the 2023 release") == []
+        assert identifier_terms("top 10 state-of-the-art models") == []
+        assert identifier_terms("python 3.12 e.g. and/or") == []
+        assert identifier_terms("call os.path.join with MAX_RETRIES") == ["os.path.join", "max_retries"]
+        assert identifier_terms("crash at 0x1F3A in std::vector") == ["0x1f3a", "std::vector"]
+
+
+class TestBM25Index:
+    """Test cases for BM25Index."""
+
+    def test_ranks_rare_terms_first(self):
+        index = BM25Index()
+        index.add(0, "the cache stores the values")
+        index.add(1, "the handler raises ERR-4012 when the cache is stale")
+        index.add(2, "the values are written to disk")
+
+        assert index.search("ERR-4012 cache", top_k=3)[0][0] == 1
+
+    def test_remove_and_accept(self):
+        index = BM25Index()
+        index.add(0, "alpha beta")
+        index.add(1, "alpha gamma")
+        index.remove(0)
+
+        assert [row for row, _ in index.search("alpha", top_k=5)] == [1]
+        assert index.search("alpha", top_k=5, accept=lambda row: row != 1) == []
+        assert index.has_terms(1, ["alpha", "gamma"])
+        assert not index.has_terms(1, ["beta"])
+
+
+def test_reciprocal_rank_fusion_prefers_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]], k=60)
+    assert fused[0][0] == "b"
+    assert {item_id for item_id, _ in fused} == {"a", "b", "c", "d"}
+
+
+@pytest.mark.skipif(not faiss_module.FAISS_AVAILABLE, reason="faiss not installed")
+class TestFaissHybridSearch:
+    """Test lexical and hybrid search on FaissClient."""
+
+    def setup_method(self):
+        self.client = faiss_module.FaissClient(VectorStoreConfig(persist_directory=tempfile.mkdtemp()))
+        texts = [
+            "Connection pooling keeps sockets open between requests.",
+            "ERR-4012 is raised by parseHttpError when the upstream times out.",
+            "Retries use exponential backoff with jitter.",
+        ]
+        chunks = [
+            TextChunk(content=text, metadata={}, chunk_index=i, start_char=0, end_char=len(text))
+            for i, text in enumerate(texts)
+        ]
+        vectors = [np.random.rand(self.client._dimension).astype(np.float32) + 0.5 for _ in texts]
+        document = Document(content="\n".join(texts), metadata=DocumentMetadata(source="errors.md", source_type="file"))
+        asyncio.run(self.client.store_document(document, chunks, vectors))
+        self.query_vector = vectors[0]
+
+    def test_lexical_search_matches_required_terms(self):
+        results = asyncio.run(self.client.lexical_search("ERR-4012", top_k=3, required_terms=["err-4012"]))
+        assert len(results) == 1
+        assert "parseHttpError" in results[0].content
+
+        assert asyncio.run(self.client.lexical_search("ERR-9999", top_k=3, required_terms=["err-9999"])) == []
+
+    def test_lexical_search_respects_filters_and_deletes(self):
+        results = asyncio.run(self.client.lexical_search("backoff", top_k=3, filters={"source": "other.md"}))
+        assert results == []
+
+        document_id = asyncio.run(self.client.lexical_search("backoff", top_k=1))[0].document_id
+        asyncio.run(self.client.delete_document(document_id))
+        assert asyncio.run(self.client.lexical_search("backoff", top_k=3)) == []
+
+    def test_hybrid_search_fuses_both_rankings(self):
+        results = asyncio.run(self.client.hybrid_search("parseHttpError timeout", self.query_vector, top_k=2))
+        assert len(results) == 2
+        assert len({r.chunk_id for r in results}) == 2
+        assert any("parseHttpError" in r.content for r in results)
+
+    def test_scores_stay_normalized(self):
+        lexical = asyncio.run(self.client.lexical_search("backoff jitter upstream", top_k=3))
+        assert lexical[0].score == 1.0
+        assert all(0.0 < r.score <= 1.0 and r.rank_score > 0 for r in lexical)
+
+        dense = asyncio.run(self.client.similarity_search(self.query_vector, top_k=3))
+        hybrid = asyncio.run(self.client.hybrid_search("backoff jitter", self.query_vector, top_k=3))
+        similarity = {r.chunk_id: r.score for r in dense}
+        for result in hybrid:
+            assert result.score == pytest.approx(similarity[result.chunk_id])
+            assert result.rank_score < 0.1  # Fused reciprocal rank
@@ -0,0 +1,160 @@
+"""
+Tests for the logging pipeline.
+
+Covers the queue-based writer thread, per-logger rate limiting, and
+structured debug channels.
+"""
+
+import json
+import logging
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.logging import logging_config
+from specter.src.infrastructure.logging.debug_channel import (
+    configure_debug_channels,
+    debug_channel,
+)
+from specter.src.infrastructure.logging.logging_config import (
+    RateLimitFilter,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(name="specter.test", level=logging.INFO, msg="message"):
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+@pytest.fixture
+def restore_root_logging():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    specter_level = logging.getLogger("specter").level
+    yield
+    shutdown_logging()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    logging.getLogger("specter").setLevel(specter_level)
+    configure_debug_channels()
+
+
+class TestRateLimitFilter:
+    """Test cases for RateLimitFilter."""
+
+    def test_burst_then_suppression_is_reported(self):
+        limiter = RateLimitFilter({"": (0.001, 3)})
+        passed = [limiter.filter(make_record()) for _ in range(10)]
+        assert passed == [True] * 3 + [False] * 7
+
+        limiter._buckets["specter.test"][0] = 1.0  # Refill one token
+        record = make_record()
+        assert limiter.filter(record)
+        assert "7 more messages" in record.getMessage()
+
+    def test_errors_always_pass(self):
+        limiter = RateLimitFilter({"": (0.001, 1)})
+        assert limiter.filter(make_record())
+        assert not limiter.filter(make_record())
+        assert limiter.filter(make_record(level=logging.ERROR))
+
+    def test_longest_prefix_wins_and_unlisted_loggers_pass(self):
+        limiter = RateLimitFilter({"specter.rag": (0.001, 1), "specter.rag.faiss": (0.001, 2)})
+        assert [limiter.filter(make_record("specter.rag.faiss.client")) for _ in range(3)] == [True, True, False]
+        assert [limiter.filter(make_record("specter.rag.selector")) for _ in range(2)] == [True, False]
+        assert all(limiter.filter(make_record("other")) for _ in range(10))
+
+    def test_rag_loggers_get_stricter_default_limit(self):
+        limiter = RateLimitFilter()
+        assert limiter._limit_for("specter.rag_pipeline") == (10.0, 50)
+        assert limiter._limit_for("specter.embedding_service") == (10.0, 50)
+        assert limiter._limit_for("specter.conversation_search") == (50.0, 200)
+
+        passed = [limiter.filter(make_record("specter.rag_pipeline")) for _ in range(60)]
+        assert passed.count(True) == 50
+
+
+class TestSyncPipeline:
+    """Test cases for logging without the writer thread."""
+
+    def test_rate_limit_applied_once_per_record(self, tmp_path, restore_root_logging):
+        setup_logging(log_dir=str(tmp_path), async_logging=False,
+                      rate_limits={"specter.sync_test": (0.001, 4)})
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+
+        log = logging.getLogger("specter.sync_test")
+        for i in range(6):
+            log.info("line %d", i)
+        for handler in root.handlers:
+            handler.flush()
+
+        messages = [json.loads(line)["message"]
+                    for line in (tmp_path / "specter.log").read_text(encoding="utf-8").splitlines()]
+        assert [m for m in messages if m.startswith("line")] == [f"line {i}" for i in range(4)]
+
+
+class TestAsyncPipeline:
+    """Test cases for the queue-based writer thread."""
+
+    def test_records_reach_file_after_shutdown(self, tmp_path, restore_root_logging):
+        setup_logging(log_dir=str(tmp_path))
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+
+        log = logging.getLogger("specter.pipeline_test")
+        log.info("hello %s", "world", extra={"request_id": 7})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("failed")
+        shutdown_logging()
+
+        entries = [json.loads(line) for line in (tmp_path / "specter.log").read_text(encoding="utf-8").splitlines()]
+        by_message = {entry["message"]: entry for entry in entries}
+        assert by_message["hello world"]["request_id"] == 7
+        assert "ValueError: boom" in by_message["failed"]["exception"]
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        import queue
+        handler = logging_config._QueueHandler(queue.Queue(1))
+        handler.handle(make_record())
+        handler.handle(make_record())
+        assert handler.dropped == 1
+
+
+class TestDebugChannel:
+    """Test cases for structured debug channels."""
+
+    def test_disabled_by_default_even_at_debug_level(self, restore_root_logging):
+        logging.getLogger("specter").setLevel(logging.DEBUG)
+        configure_debug_channels()
+        channel = debug_channel("unit")
+        assert not channel
+
+    def test_enabled_channel_emits_fields(self, restore_root_logging):
+        channel = debug_channel("unit")
+        configure_debug_channels(["unit"])
+        assert channel
+
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        channel.logger.addHandler(handler)
+        try:
+            channel("search", top_k=5)
+        finally:
+            channel.logger.removeHandler(handler)
+
+        assert records[0].getMessage() == "search top_k=5"
+        assert records[0].fields == {"top_k": 5}
+        assert records[0].funcName == "test_enabled_channel_emits_fields"
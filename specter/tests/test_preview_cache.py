@@ -0,0 +1,118 @@
+"""
+Tests for the Document Studio preview cache and paged preview rendering.
+
+Covers cache hits keyed on path/mtime/size, formatted copies reusing the
+original's paragraph HTML, the memory bound, and the preview widget showing
+the first page before appending the rest.
+"""
+
+import sys
+
+# Add project root to path for imports
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from specter.src.presentation.widgets.document_studio import preview_view
+from specter.src.presentation.widgets.document_studio.preview_view import (
+    DocumentPreviewView,
+    PreviewCache,
+    iter_preview_pages,
+)
+
+
+def make_docx(path, paragraphs):
+    doc = docx.Document()
+    doc.add_heading("Report", level=1)
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    doc.add_paragraph("Closing item", style="List Bullet")
+    doc.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def counted_runs(monkeypatch):
+    """Count runs converted to HTML, i.e. paragraphs not served from cache."""
+    calls = []
+    original = preview_view._run_to_html
+
+    def counting(run):
+        calls.append(run.text)
+        return original(run)
+
+    monkeypatch.setattr(preview_view, "_run_to_html", counting)
+    return calls
+
+
+class TestPreviewCache:
+    """Test cases for PreviewCache and iter_preview_pages."""
+
+    def test_unchanged_file_served_from_cache(self, tmp_path, counted_runs):
+        cache = PreviewCache()
+        path = make_docx(tmp_path / "a.docx", [f"Paragraph {i}" for i in range(10)])
+
+        first = list(iter_preview_pages(path, page_size=4, cache=cache))
+        assert len(first) == 3
+        assert "<h1>Report</h1>" in first[0] and "<li>Closing item</li>\n</ul>" in first[-1]
+
+        counted_runs.clear()
+        assert list(iter_preview_pages(path, page_size=4, cache=cache)) == first
+        assert counted_runs == []
+
+        make_docx(path, ["Edited"])
+        assert "Edited" in "".join(iter_preview_pages(path, page_size=4, cache=cache))
+
+    def test_formatted_copy_reuses_unchanged_paragraphs(self, tmp_path, counted_runs):
+        cache = PreviewCache()
+        text = [f"Paragraph {i}" for i in range(20)]
+        original = make_docx(tmp_path / "a.docx", text)
+        text[5] = "PARAGRAPH 5"
+        formatted = make_docx(tmp_path / "a_formatted.docx", text)
+
+        list(iter_preview_pages(original, cache=cache))
+        counted_runs.clear()
+        html = "".join(iter_preview_pages(formatted, cache=cache))
+
+        assert counted_runs == ["PARAGRAPH 5"]
+        assert "PARAGRAPH 5" in html and "Paragraph 6" in html
+
+    def test_documents_evicted_beyond_budget(self, tmp_path):
+        cache = PreviewCache(max_document_chars=800)
+        paths = [make_docx(tmp_path / f"d{i}.docx", [f"Body {i} " * 20]) for i in range(4)]
+        for path in paths:
+            list(iter_preview_pages(path, cache=cache))
+
+        assert cache.get_pages(cache.document_key(paths[0])) is None
+        assert cache.get_pages(cache.document_key(paths[-1])) is not None
+
+    def test_missing_file_reports_error(self, tmp_path):
+        pages = list(iter_preview_pages(str(tmp_path / "missing.docx"), cache=PreviewCache()))
+        assert len(pages) == 1 and "File not found" in pages[0]
+
+
+class TestDocumentPreviewView:
+    """Test cases for paged rendering in DocumentPreviewView."""
+
+    def test_first_page_shown_then_rest_appended(self, qtbot, tmp_path, monkeypatch):
+        monkeypatch.setattr(preview_view, "_preview_cache", PreviewCache())
+        monkeypatch.setattr(preview_view, "PAGE_PARAGRAPHS", 10)
+        path = make_docx(tmp_path / "long.docx", [f"Paragraph {i}" for i in range(35)])
+
+        view = DocumentPreviewView()
+        qtbot.addWidget(view)
+        view.load_document(path)
+
+        assert "Paragraph 5" in view._browser.toPlainText()
+        assert "Paragraph 34" not in view._browser.toPlainText()
+
+        qtbot.waitUntil(lambda: view._pending_pages is None)
+        text = view._browser.toPlainText()
+        assert "\u200b" not in text
+        assert text.splitlines()[:3] == ["Report", "Paragraph 0", "Paragraph 1"]
+        assert "Paragraph 9\nParagraph 10" in text
+        assert text.rstrip().endswith("Closing item")
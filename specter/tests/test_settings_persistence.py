@@ -0,0 +1,161 @@
+"""
+Tests for SettingsManager persistence and reads.
+
+Covers debounced writes, batched changes, immediate change notifications,
+atomic file replacement, the flattened read snapshot, the decrypted-secret
+cache, and typed accessors.
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.storage.settings_manager import SettingsManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    with patch.object(SettingsManager, "_determine_settings_dir", return_value=tmp_path):
+        mgr = SettingsManager()
+    mgr.SAVE_DEBOUNCE_SECONDS = 0.05
+    yield mgr
+    mgr.flush()
+
+
+def read_file(mgr):
+    return json.loads(mgr.settings_file.read_text(encoding="utf-8"))
+
+
+class TestWriteBehind:
+    """Test cases for debounced settings persistence."""
+
+    def test_set_is_written_after_debounce(self, manager):
+        manager.set("interface.opacity", 42)
+        assert manager.has_pending_changes
+        assert read_file(manager)["interface"].get("opacity") != 42
+
+        time.sleep(0.3)
+        assert not manager.has_pending_changes
+        assert read_file(manager)["interface"]["opacity"] == 42
+
+    def test_rapid_changes_coalesce_into_one_write(self, manager):
+        with patch.object(manager, "_write_atomic", wraps=manager._write_atomic) as write:
+            for value in range(30, 60):
+                manager.set("interface.opacity", value)
+            time.sleep(0.3)
+        assert write.call_count == 1
+        assert read_file(manager)["interface"]["opacity"] == 59
+
+    def test_notifications_fire_immediately(self, manager):
+        changed = []
+        manager.on_change(changed.append)
+        manager.set("interface.opacity", 55)
+        manager.delete("interface.opacity")
+        assert changed == ["interface.opacity", "interface.opacity"]
+
+    def test_flush_writes_pending_changes(self, manager):
+        manager.set("app.auto_start", True)
+        manager.flush()
+        assert not manager.has_pending_changes
+        assert read_file(manager)["app"]["auto_start"] is True
+
+
+class TestBatch:
+    """Test cases for batched settings changes."""
+
+    def test_batch_writes_once_on_exit(self, manager):
+        with patch.object(manager, "_write_atomic", wraps=manager._write_atomic) as write:
+            with manager.batch():
+                manager.set("interface.opacity", 70)
+                with manager.batch():
+                    manager.set("app.auto_start", True)
+                time.sleep(0.2)
+                assert write.call_count == 0
+            assert write.call_count == 1
+
+        data = read_file(manager)
+        assert data["interface"]["opacity"] == 70
+        assert data["app"]["auto_start"] is True
+
+
+class TestAtomicWrite:
+    """Test cases for atomic settings file replacement."""
+
+    def test_failed_write_keeps_previous_file(self, manager):
+        manager.set("interface.opacity", 80)
+        manager.flush()
+
+        manager.set("interface.opacity", 20)
+        with patch("os.replace", side_effect=OSError("disk full")):
+            manager.flush()
+
+        assert read_file(manager)["interface"]["opacity"] == 80
+        assert not list(manager.settings_dir.glob(".settings-*.tmp"))
+
+
+class TestReadSnapshot:
+    """Test cases for snapshot-backed get()."""
+
+    def test_reads_follow_set_and_delete(self, manager):
+        assert manager.get("interface.opacity") == manager.get("interface")["opacity"]
+        manager.set("custom.nested.value", 3)
+        assert manager.get("custom.nested.value") == 3
+        assert manager.get("custom.nested") == {"value": 3}
+        manager.delete("custom.nested.value")
+        assert manager.get("custom.nested.value", "gone") == "gone"
+
+    def test_replacing_a_category_updates_leaf_reads(self, manager):
+        assert manager.get("interface.opacity") is not None
+        manager.set("interface", {"opacity": 33})
+        assert manager.get("interface.opacity") == 33
+
+    def test_missing_and_non_dict_paths_return_default(self, manager):
+        assert manager.get("nope.nothing", 7) == 7
+        assert manager.get("interface.opacity.deeper", 7) == 7
+
+    def test_secret_is_decrypted_once(self, manager):
+        manager.set("ai_model.api_key", "sk-secret")
+        assert manager.get_all()["ai_model"]["api_key"].startswith("enc:")
+
+        with patch.object(manager, "_decrypt_value", wraps=manager._decrypt_value) as decrypt:
+            for _ in range(5):
+                assert manager.get("ai_model.api_key") == "sk-secret"
+        assert decrypt.call_count == 0
+
+        manager._decrypted.clear()
+        with patch.object(manager, "_decrypt_value", wraps=manager._decrypt_value) as decrypt:
+            for _ in range(5):
+                assert manager.get("ai_model.api_key") == "sk-secret"
+        assert decrypt.call_count == 1
+
+    def test_secret_cache_follows_set(self, manager):
+        manager.set("ai_model.api_key", "first")
+        assert manager.get("ai_model.api_key") == "first"
+        manager.set("ai_model.api_key", "second")
+        assert manager.get("ai_model.api_key") == "second"
+        assert list(manager._decrypted.values()) == ["second"]
+
+
+class TestTypedAccessors:
+    """Test cases for typed settings accessors."""
+
+    def test_coercion_and_defaults(self, manager):
+        manager.set("custom.flag", "yes")
+        manager.set("custom.count", "12")
+        manager.set("custom.ratio", 2)
+        manager.set("custom.name", None)
+
+        assert manager.get_bool("custom.flag") is True
+        assert manager.get_int("custom.count") == 12
+        assert manager.get_float("custom.ratio") == 2.0
+        assert manager.get_str("custom.name", "unset") == "unset"
+        assert manager.get_int("custom.flag", 5) == 5
+        assert manager.get_bool("custom.missing", True) is True
@@ -0,0 +1,159 @@
+"""
+Tests for SSE stream parsing.
+
+Covers incremental framing across read boundaries, the delta.content fast
+path, tool-call and usage assembly, and coalesced callback delivery.
+"""
+
+import json
+import time
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.ai.sse_stream import (
+    CallbackBatcher,
+    ChatStreamParser,
+    SSEFramer,
+    fast_content_delta,
+)
+
+
+def openai_chunk(delta, finish_reason=None, **extra):
+    return {
+        "id": "chatcmpl-1", "object": "chat.completion.chunk", "model": "gpt-test",
+        "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": finish_reason}],
+        **extra,
+    }
+
+
+def sse(events, newline="\n"):
+    body = "".join(
+        f"data: {json.dumps(event, separators=(',', ':'))}{newline}{newline}" for event in events
+    )
+    return (body + f"data: [DONE]{newline}{newline}").encode("utf-8")
+
+
+def feed_in_pieces(parser, data, size):
+    for i in range(0, len(data), size):
+        if parser.feed(data[i:i + size]):
+            break
+    return parser.finish()
+
+
+class TestSSEFramer:
+    """Test cases for SSEFramer."""
+
+    def test_events_split_across_reads(self):
+        framer = SSEFramer()
+        data = b'data: {"a":1}\n\ndata: {"b":2}\n\n: keep-alive\n\ndata: [DONE]\n\n'
+        events = []
+        for i in range(len(data)):
+            events.extend(framer.feed(data[i:i + 1]))
+        assert events == [b'{"a":1}', b'{"b":2}', b"[DONE]"]
+
+    def test_crlf_and_multiline_data(self):
+        framer = SSEFramer()
+        events = framer.feed(b'event: message\r\ndata: {"a":\r\ndata: 1}\r\n\r\n')
+        assert events == [b'{"a":\n1}']
+
+    def test_missing_blank_lines(self):
+        framer = SSEFramer()
+        events = framer.feed(b'data: {"a":1}\ndata: {"b":2}\n')
+        events += framer.close()
+        assert events == [b'{"a":1}', b'{"b":2}']
+
+    def test_single_newline_events_stream_before_close(self):
+        framer = SSEFramer()
+        assert framer.feed(b'data: {"a":0}\n') == []
+        assert framer.feed(b'data: {"a":1}\n') == [b'{"a":0}']
+        assert framer.feed(b'data: {"a":2}\ndata: [DONE]\n') == [b'{"a":1}', b'{"a":2}']
+        assert framer.close() == [b"[DONE]"]
+
+
+class TestFastContentDelta:
+    """Test the delta.content fast path agrees with a full JSON parse."""
+
+    def test_matches_json_for_plain_and_escaped_content(self):
+        for text in ["hello", " café 🚀", 'say "hi"', "line\nbreak", "back\\slash\\", "}{\"}"]:
+            payload = json.dumps(openai_chunk({"content": text}), separators=(",", ":")).encode()
+            result = fast_content_delta(payload)
+            assert result is None or result == text
+
+        plain = json.dumps(openai_chunk({"content": "hello"}), separators=(",", ":")).encode()
+        assert fast_content_delta(plain) == "hello"
+
+    def test_other_chunks_use_full_parse(self):
+        for chunk in [
+            openai_chunk({"content": "x"}, finish_reason="stop"),
+            openai_chunk({"content": "x", "reasoning_content": "y"}),
+            openai_chunk({"content": "x"}, usage={"prompt_tokens": 1}),
+        ]:
+            assert fast_content_delta(json.dumps(chunk, separators=(",", ":")).encode()) is None
+
+
+class TestChatStreamParser:
+    """Test cases for ChatStreamParser."""
+
+    def test_assembles_content_tool_calls_and_usage(self):
+        events = [
+            openai_chunk({"role": "assistant", "content": ""}),
+            openai_chunk({"content": "Hello"}),
+            openai_chunk({"content": ", \"world\""}),
+            openai_chunk({"reasoning_content": "thinking"}),
+            openai_chunk({"tool_calls": [{"index": 0, "id": "call_1", "function": {"name": "web_search", "arguments": '{"que'}}]}),
+            openai_chunk({"tool_calls": [{"index": 0, "function": {"arguments": 'ry":"x"}'}}]}),
+            openai_chunk({}, finish_reason="tool_calls"),
+            {"id": "chatcmpl-1", "choices": [], "usage": {"prompt_tokens": 10, "completion_tokens": 5}},
+        ]
+        data = feed_in_pieces(ChatStreamParser("gpt-test"), sse(events), 7)
+
+        message = data["choices"][0]["message"]
+        assert message["content"] == 'Hello, "world"'
+        assert message["reasoning_content"] == "thinking"
+        assert message["tool_calls"][0]["function"] == {"name": "web_search", "arguments": '{"query":"x"}'}
+        assert data["choices"][0]["finish_reason"] == "tool_calls"
+        assert data["usage"] == {"prompt_tokens": 10, "completion_tokens": 5}
+
+    def test_anthropic_events(self):
+        events = [
+            {"type": "content_block_delta", "delta": {"type": "thinking_delta", "thinking": "hmm"}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 1}},
+        ]
+        data = feed_in_pieces(ChatStreamParser("claude"), sse(events, "\r\n"), 16)
+
+        assert data["choices"][0]["message"]["content"] == "Hi"
+        assert data["choices"][0]["message"]["reasoning_content"] == "hmm"
+        assert data["choices"][0]["finish_reason"] == "end_turn"
+
+    def test_callbacks_are_coalesced(self):
+        deliveries = []
+        parser = ChatStreamParser("gpt-test", stream_callback=deliveries.append, flush_interval=10)
+        events = [openai_chunk({"content": ""})] + [openai_chunk({"content": f"t{i} "}) for i in range(200)]
+        data = feed_in_pieces(parser, sse(events), 512)
+
+        assert "".join(deliveries) == data["choices"][0]["message"]["content"]
+        assert len(deliveries) <= 2
+
+
+class TestCallbackBatcher:
+    """Test cases for CallbackBatcher."""
+
+    def test_zero_interval_delivers_each_piece(self):
+        deliveries = []
+        batcher = CallbackBatcher(deliveries.append, 0)
+        for piece in ["a", "b", "c"]:
+            batcher.add(piece)
+        assert deliveries == ["a", "b", "c"]
+
+    def test_pending_text_delivered_after_pause(self):
+        deliveries = []
+        batcher = CallbackBatcher(deliveries.append, 0.05)
+        batcher.add("first")
+        batcher.add("second")
+        time.sleep(0.2)
+        assert "".join(deliveries) == "firstsecond"
@@ -0,0 +1,155 @@
+"""
+Tests for staged startup.
+
+Covers stage timing and import accounting, deferred stages running in order
+after start, pulling a deferred stage forward, lazy imports and the deferred
+skill loader.
+"""
+
+import sys
+from types import ModuleType
+
+# Add project root to path for imports
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.application.startup_scheduler import StartupScheduler
+from specter.src.infrastructure.skills.core.skill_manager import SkillManager
+from specter.src.infrastructure.skills.interfaces.base_skill import (
+    BaseSkill,
+    SkillCategory,
+    SkillMetadata,
+    SkillResult,
+)
+from specter.src.utils.lazy_import import is_available, lazy_import
+
+
+class EchoSkill(BaseSkill):
+    """Minimal skill for registry tests."""
+
+    @property
+    def metadata(self):
+        return SkillMetadata(skill_id="echo", name="Echo", description="test skill",
+                             category=SkillCategory.CUSTOM, icon="x")
+
+    @property
+    def parameters(self):
+        return []
+
+    async def execute(self, **params):
+        return SkillResult(success=True, message="echo")
+
+
+class TestStartupScheduler:
+    """Test cases for StartupScheduler."""
+
+    def test_deferred_stages_run_in_order_after_start(self, qtbot):
+        scheduler = StartupScheduler()
+        calls = []
+        scheduler.defer("rag", lambda: calls.append("rag"))
+        scheduler.defer("skills", lambda: calls.append("skills"))
+
+        with scheduler.stage("ui"):
+            calls.append("ui")
+        assert calls == ["ui"]
+
+        with qtbot.waitSignal(scheduler.deferred_finished, timeout=2000):
+            scheduler.start()
+
+        assert calls == ["ui", "rag", "skills"]
+        assert [(t.name, t.deferred) for t in scheduler.timings()] == [
+            ("ui", False), ("rag", True), ("skills", True)
+        ]
+        assert scheduler.interactive_after is not None
+
+    def test_ensure_runs_pending_stage_once(self, qtbot):
+        scheduler = StartupScheduler()
+        calls = []
+        scheduler.defer("rag_session", lambda: calls.append("rag_session"))
+
+        assert scheduler.ensure("rag_session") is True
+        assert scheduler.ensure("rag_session") is False
+        assert not scheduler.is_pending("rag_session")
+
+        with qtbot.waitSignal(scheduler.deferred_finished, timeout=2000):
+            scheduler.start()
+        assert calls == ["rag_session"]
+
+    def test_failing_deferred_stage_does_not_stop_the_rest(self, qtbot):
+        scheduler = StartupScheduler()
+        calls = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        scheduler.defer("broken", fail)
+        scheduler.defer("skills", lambda: calls.append("skills"))
+
+        with qtbot.waitSignal(scheduler.deferred_finished, timeout=2000):
+            scheduler.start()
+
+        assert calls == ["skills"]
+        assert scheduler.timings()[0].error == "boom"
+
+    def test_profile_records_import_cost(self, tmp_path, monkeypatch):
+        (tmp_path / "startup_probe_module.py").write_text("import time\ntime.sleep(0.02)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        scheduler = StartupScheduler(profile=True)
+        try:
+            with scheduler.stage("imports"):
+                import startup_probe_module  # noqa: F401
+        finally:
+            scheduler._finish()
+            sys.modules.pop("startup_probe_module", None)
+
+        timing = scheduler.timings()[0]
+        assert timing.modules_imported == 1
+        assert timing.import_time >= 0.02
+        assert startup_probe_module.__loader__.__class__.__name__ != "_TimedLoader"
+
+        report = scheduler.report()
+        assert "imports" in report
+        assert "startup_probe_module" in report
+
+
+class TestLazyImport:
+    """Test cases for the lazy import helpers."""
+
+    def test_module_body_runs_on_first_attribute_access(self, tmp_path, monkeypatch):
+        (tmp_path / "lazy_probe_module.py").write_text("LOADED = True\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        try:
+            module = lazy_import("lazy_probe_module")
+            assert type(module) is not ModuleType  # Body not executed yet
+
+            assert module.LOADED is True
+            assert type(module) is ModuleType
+        finally:
+            sys.modules.pop("lazy_probe_module", None)
+
+    def test_missing_module(self):
+        assert lazy_import("specter_no_such_module") is None
+        assert not is_available("specter_no_such_module")
+        assert is_available("json")
+
+
+class TestDeferredSkillLoader:
+    """Test cases for SkillManager's deferred skill loader."""
+
+    def test_loader_runs_once_on_first_registry_use(self):
+        manager = SkillManager(use_ai_fallback=False)
+        calls = []
+
+        def load():
+            calls.append(True)
+            manager.register_skill(EchoSkill)
+
+        manager.set_skill_loader(load)
+        assert calls == []
+
+        assert manager.get_skill("echo") is not None
+        manager.ensure_skills_loaded()
+        assert manager.list_skills()
+        assert calls == [True]
@@ -0,0 +1,184 @@
+"""
+Tests for concurrent summary backfill.
+
+Covers the concurrency limit, the bulk skip-existing query, honoring
+Retry-After, resuming from a checkpoint, and token bucket pacing.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.ai.api_client import parse_retry_after, retry_after_from_headers
+from specter.src.infrastructure.conversation_management.services import summary_backfill
+from specter.src.infrastructure.conversation_management.services.summary_backfill import (
+    SummaryBackfill,
+    TokenBucket,
+)
+from specter.src.infrastructure.conversation_management.services.summary_service import SummaryService
+
+
+class FakeRepository:
+    """Records bulk summary lookups."""
+
+    def __init__(self, summarized=()):
+        self.summarized = set(summarized)
+        self.lookups = []
+
+    async def get_summarized_conversation_ids(self, conversation_ids):
+        self.lookups.append(list(conversation_ids))
+        return self.summarized & set(conversation_ids)
+
+
+class FakeAIService:
+    def __init__(self):
+        self.async_workers = 2
+
+    def ensure_async_workers(self, workers):
+        self.async_workers = max(self.async_workers, workers)
+
+
+class FakeSummaryService(SummaryService):
+    """SummaryService whose generation step is scripted per conversation."""
+
+    def __init__(self, repository, delay=0.02, outcomes=None):
+        super().__init__(repository)
+        self.ai = FakeAIService()
+        self.delay = delay
+        self.outcomes = outcomes or {}
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _get_ai_service(self):
+        return self.ai
+
+    async def _generate_summary(self, conversation_id):
+        self.calls.append((conversation_id, time.monotonic()))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        scripted = self.outcomes.get(conversation_id)
+        if scripted:
+            return scripted.pop(0)
+        return True, None
+
+
+def ids(count):
+    return [f"c{i}" for i in range(count)]
+
+
+class TestSummaryBackfill:
+    """Test cases for SummaryService.batch_generate_summaries."""
+
+    def test_concurrency_is_bounded(self):
+        service = FakeSummaryService(FakeRepository(), delay=0.05)
+
+        start = time.monotonic()
+        results = asyncio.run(service.batch_generate_summaries(
+            ids(12), concurrency=4, requests_per_minute=60_000))
+        elapsed = time.monotonic() - start
+
+        assert results == {cid: True for cid in ids(12)}
+        assert service.max_in_flight == 4
+        assert service.ai.async_workers == 4
+        assert elapsed < 12 * 0.05 * 0.6  # Far faster than one at a time
+
+    def test_existing_summaries_skipped_with_one_lookup(self):
+        repository = FakeRepository(summarized={"c1", "c3"})
+        service = FakeSummaryService(repository)
+
+        results = asyncio.run(service.batch_generate_summaries(ids(5), requests_per_minute=60_000))
+
+        assert repository.lookups == [ids(5)]
+        assert sorted(cid for cid, _ in service.calls) == ["c0", "c2", "c4"]
+        assert list(results) == ids(5) and all(results.values())
+
+    def test_retry_after_pauses_every_worker(self):
+        service = FakeSummaryService(FakeRepository(), delay=0.01,
+                                     outcomes={"c0": [(False, 0.3), (True, None)]})
+
+        results = asyncio.run(service.batch_generate_summaries(
+            ids(4), concurrency=2, requests_per_minute=60_000, skip_existing=False))
+
+        assert all(results.values())
+        attempts = [t for cid, t in service.calls if cid == "c0"]
+        assert len(attempts) == 2
+        assert attempts[1] - attempts[0] >= 0.3
+        # Nothing else was sent while the provider asked us to wait
+        limited_at = attempts[0] + 0.01
+        assert not [t for _, t in service.calls if limited_at < t < limited_at + 0.25]
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        checkpoint = tmp_path / "backfill.json"
+        progress = []
+
+        async def interrupted_run():
+            service = FakeSummaryService(FakeRepository(), delay=0.01)
+            task = asyncio.ensure_future(service.batch_generate_summaries(
+                ids(10), concurrency=1, requests_per_minute=60_000,
+                checkpoint_path=str(checkpoint), progress_callback=lambda done, total: progress.append(done)))
+            while len(progress) < 4:
+                await asyncio.sleep(0.005)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(interrupted_run())
+        saved = json.loads(checkpoint.read_text())["results"]
+        assert len(saved) >= 4
+
+        service = FakeSummaryService(FakeRepository())
+        results = asyncio.run(service.batch_generate_summaries(
+            ids(10), requests_per_minute=60_000, checkpoint_path=str(checkpoint)))
+
+        assert all(results.values())
+        assert not set(saved) & {cid for cid, _ in service.calls}
+        assert len(service.calls) == 10 - len(saved)
+        assert not checkpoint.exists()
+
+
+    def test_failed_checkpoint_write_keeps_original_error(self, tmp_path, monkeypatch):
+        backfill = SummaryBackfill(FakeSummaryService(FakeRepository()),
+                                   checkpoint_path=str(tmp_path / "backfill.json"))
+
+        def failing_replace(src, dst):
+            os.unlink(src)  # Temp file already gone when cleanup runs
+            raise RuntimeError("interrupted")
+
+        monkeypatch.setattr(summary_backfill.os, "replace", failing_replace)
+        with pytest.raises(RuntimeError, match="interrupted"):
+            backfill._save_checkpoint()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket and Retry-After parsing."""
+
+    def test_paces_to_rate(self):
+        async def take(count):
+            bucket = TokenBucket(rate=20, capacity=1)
+            start = time.monotonic()
+            for _ in range(count):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        assert 0.18 <= asyncio.run(take(5)) < 0.5
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert retry_after_from_headers({"Retry-After": "2"}) == 2.0
+        assert retry_after_from_headers(None) is None
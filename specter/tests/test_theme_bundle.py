@@ -0,0 +1,127 @@
+"""
+Tests for the compiled theme bundle.
+
+Covers bundle hits and invalidation when a theme file changes, lazy
+materialization of themes and the rendered stylesheet round trip.
+"""
+
+import json
+import os
+import sys
+
+# Add project root to path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.ui.themes import theme_bundle as theme_bundle_module
+from specter.src.ui.themes.color_system import ColorSystem
+from specter.src.ui.themes.theme_bundle import (
+    LazyThemeMap,
+    ThemeBundle,
+    parse_theme_data,
+    style_templates_key,
+    stylesheet_cache_key,
+    theme_colors_key,
+)
+
+
+def write_theme(path, name, primary="#112233"):
+    path.write_text(json.dumps({
+        "name": name,
+        "mode": "dark",
+        "colors": {"primary": primary},
+    }))
+
+
+class TestThemeBundle:
+    """Test cases for ThemeBundle."""
+
+    def test_entry_survives_reload_until_file_changes(self, tmp_path):
+        theme_file = tmp_path / "ocean.json"
+        write_theme(theme_file, "ocean")
+        bundle_path = tmp_path / "cache" / "theme_bundle.json"
+
+        bundle = ThemeBundle(bundle_path)
+        assert bundle.get_entry(theme_file) is None
+        bundle.put_entry(theme_file, parse_theme_data(json.loads(theme_file.read_text()), "ocean"))
+        assert bundle.save() is True
+        assert bundle.save() is False  # Nothing changed since
+
+        reloaded = ThemeBundle(bundle_path)
+        entry = reloaded.get_entry(theme_file)
+        assert entry["name"] == "ocean"
+        assert entry["metadata"]["mode"] == "dark"
+
+        write_theme(theme_file, "ocean", primary="#445566aa")
+        assert reloaded.get_entry(theme_file) is None
+
+    def test_prune_drops_deleted_files(self, tmp_path):
+        kept, removed = tmp_path / "kept.json", tmp_path / "removed.json"
+        write_theme(kept, "kept")
+        write_theme(removed, "removed")
+        bundle = ThemeBundle(tmp_path / "bundle.json")
+        for theme_file in (kept, removed):
+            bundle.put_entry(theme_file, parse_theme_data({}, theme_file.stem))
+
+        bundle.prune(tmp_path, [kept])
+
+        assert bundle.get_entry(kept) is not None
+        assert bundle.get_entry(removed) is None
+
+    def test_stylesheets_keyed_by_colors(self, tmp_path):
+        bundle = ThemeBundle(tmp_path / "bundle.json")
+        key = theme_colors_key(ColorSystem())
+        bundle.set_stylesheets(key, {"main_window": "QMainWindow {}"})
+        bundle.save()
+
+        reloaded = ThemeBundle(tmp_path / "bundle.json")
+        assert reloaded.get_stylesheets(key) == {"main_window": "QMainWindow {}"}
+        assert reloaded.get_stylesheets(theme_colors_key(ColorSystem(primary="#000000"))) == {}
+
+    def test_stylesheets_invalidated_by_template_changes(self, tmp_path, monkeypatch):
+        bundle = ThemeBundle(tmp_path / "bundle.json")
+        colors = ColorSystem()
+        bundle.set_stylesheets(stylesheet_cache_key(colors), {"main_window": "QMainWindow {}"})
+        bundle.save()
+
+        templates = tmp_path / "style_templates.py"
+        templates.write_text("# upgraded templates")
+        monkeypatch.setattr(theme_bundle_module, "__file__", str(tmp_path / "theme_bundle.py"))
+        style_templates_key.cache_clear()
+        try:
+            upgraded = stylesheet_cache_key(colors)
+        finally:
+            monkeypatch.undo()
+            style_templates_key.cache_clear()
+
+        assert upgraded.split(":")[0] == theme_colors_key(colors)
+        assert upgraded != stylesheet_cache_key(colors)
+        assert ThemeBundle(tmp_path / "bundle.json").get_stylesheets(upgraded) == {}
+
+    def test_unreadable_bundle_is_ignored(self, tmp_path):
+        bundle_path = tmp_path / "bundle.json"
+        bundle_path.write_text("{not json")
+        assert ThemeBundle(bundle_path).get_stylesheets("anything") == {}
+
+
+class TestLazyThemeMap:
+    """Test cases for LazyThemeMap."""
+
+    def test_theme_built_on_first_lookup(self):
+        themes = LazyThemeMap()
+        themes.add_entry("ocean", parse_theme_data({"mode": "dark", "colors": {"primary": "#112233"}}, "ocean"))
+        themes["cyber"] = ColorSystem()
+
+        assert "ocean" in themes
+        assert sorted(themes) == ["cyber", "ocean"]
+        assert len(themes) == 2
+        assert not themes.is_materialized("ocean")
+
+        ocean = themes["ocean"]
+        assert ocean.primary == "#112233"
+        assert ocean._metadata["mode"] == "dark"
+        assert themes["ocean"] is ocean
+
+        del themes["ocean"]
+        assert "ocean" not in themes
+        assert len(themes) == 1
@@ -0,0 +1,164 @@
+"""
+Tests for the tool execution engine.
+
+Covers concurrent execution of parallel-safe tool calls, barriers for
+other skills, result ordering, per-skill concurrency limits, timeouts,
+cancelling timed-out skills and exempting interactive ones.
+"""
+
+import asyncio
+import threading
+import time
+
+# Add project root to path for imports
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from specter.src.infrastructure.skills.core.tool_execution import ToolExecutionEngine
+from specter.src.infrastructure.skills.interfaces.base_skill import (
+    SkillCategory,
+    SkillMetadata,
+    SkillResult,
+)
+
+
+class FakeSkillManager:
+    """Skill manager whose skills block for a configurable time."""
+
+    def __init__(self, skills, awaiting=()):
+        self.skills = skills  # skill_id -> (metadata kwargs, delay)
+        self.awaiting = set(awaiting)  # Skills that await instead of blocking
+        self.cancelled = []
+        self.running = 0
+        self.max_running = {}
+        self.events = []
+        self._lock = threading.Lock()
+
+    def get_skill_metadata(self, skill_id):
+        if skill_id not in self.skills:
+            return None
+        options, _ = self.skills[skill_id]
+        return SkillMetadata(
+            skill_id=skill_id, name=skill_id, description="test skill",
+            category=SkillCategory.CUSTOM, icon="x", **options
+        )
+
+    async def execute_skill(self, skill_id, skip_confirmation=False, **params):
+        _, delay = self.skills[skill_id]
+        with self._lock:
+            self.running += 1
+            self.max_running[skill_id] = max(self.max_running.get(skill_id, 0), self.running)
+            self.events.append(("start", skill_id))
+        try:
+            if skill_id in self.awaiting:
+                await asyncio.sleep(delay)
+            else:
+                time.sleep(delay)  # Skills block inside execute
+        except asyncio.CancelledError:
+            self.cancelled.append(skill_id)
+            raise
+        finally:
+            with self._lock:
+                self.running -= 1
+        with self._lock:
+            self.events.append(("end", skill_id))
+        return SkillResult(success=True, message=f"{skill_id}:{params.get('n')}")
+
+
+def calls(*skill_ids):
+    return [
+        {"id": f"call_{i}", "skill_id": skill_id, "arguments": {"n": i}}
+        for i, skill_id in enumerate(skill_ids)
+    ]
+
+
+class TestToolExecutionEngine:
+    """Test cases for ToolExecutionEngine."""
+
+    def teardown_method(self):
+        self.engine.shutdown()
+
+    def test_parallel_safe_calls_run_concurrently_in_order(self):
+        manager = FakeSkillManager({"search": ({"parallel_safe": True}, 0.2)})
+        self.engine = ToolExecutionEngine(manager, max_workers=4)
+
+        start = time.monotonic()
+        results = self.engine.execute(calls("search", "search", "search", "search"))
+
+        assert time.monotonic() - start < 0.6
+        assert [result.message for _, result in results] == [f"search:{i}" for i in range(4)]
+        assert [call["id"] for call, _ in results] == [f"call_{i}" for i in range(4)]
+
+    def test_unsafe_calls_are_barriers(self):
+        manager = FakeSkillManager({
+            "search": ({"parallel_safe": True}, 0.05),
+            "write": ({}, 0.05),
+        })
+        self.engine = ToolExecutionEngine(manager)
+
+        self.engine.execute(calls("search", "search", "write", "search"))
+
+        write_start = manager.events.index(("start", "write"))
+        write_end = manager.events.index(("end", "write"))
+        assert manager.events[:write_start].count(("end", "search")) == 2
+        assert manager.events[write_end + 1:] == [("start", "search"), ("end", "search")]
+
+    def test_per_skill_concurrency_limit(self):
+        manager = FakeSkillManager({"search": ({"parallel_safe": True, "max_concurrency": 2}, 0.05)})
+        self.engine = ToolExecutionEngine(manager, max_workers=6)
+
+        self.engine.execute(calls(*["search"] * 6))
+
+        assert manager.max_running["search"] == 2
+
+    def test_timeout_and_status_callback(self):
+        manager = FakeSkillManager({"slow": ({"timeout_seconds": 0.05}, 0.3)})
+        self.engine = ToolExecutionEngine(manager)
+        statuses = []
+
+        results = self.engine.execute(
+            calls("slow"), lambda status, skill_id, details: statuses.append((status, skill_id))
+        )
+
+        assert not results[0][1].success
+        assert results[0][1].error == "timeout"
+        assert statuses == [("executing", "slow"), ("completed", "slow")]
+
+    def test_timed_out_skill_is_cancelled_and_frees_worker(self):
+        manager = FakeSkillManager({
+            "slow": ({"timeout_seconds": 0.05}, 5.0),
+            "quick": ({}, 0.01),
+        }, awaiting={"slow"})
+        self.engine = ToolExecutionEngine(manager, max_workers=1)
+
+        start = time.monotonic()
+        results = self.engine.execute(calls("slow", "quick"))
+
+        assert results[0][1].error == "timeout"
+        assert results[1][1].success
+        assert time.monotonic() - start < 1.0
+        assert manager.cancelled == ["slow"]
+
+    def test_interactive_skill_not_timed_out(self):
+        manager = FakeSkillManager({"capture": ({"interactive": True}, 0.2)})
+        self.engine = ToolExecutionEngine(manager, default_timeout=0.05)
+
+        results = self.engine.execute(calls("capture"))
+
+        assert results[0][1].success
+
+    def test_timed_out_blocking_skill_keeps_barrier(self):
+        manager = FakeSkillManager({
+            "stuck": ({"timeout_seconds": 0.05}, 0.3),
+            "write": ({}, 0.01),
+        })
+        self.engine = ToolExecutionEngine(manager, max_workers=2)
+
+        results = self.engine.execute(calls("stuck", "write"))
+
+        assert results[0][1].error == "timeout"
+        assert results[1][1].success
+        assert manager.events == [("start", "stuck"), ("end", "stuck"),
+                                  ("start", "write"), ("end", "write")]